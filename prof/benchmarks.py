@@ -0,0 +1,537 @@
+"""Reproducible benchmarks of interpreters and agents.
+
+A benchmark runs one operation (see `OPERATIONS`) on one game with one interpreter, and for the operation step, one
+agent. Each benchmark is first warmed up and then measured repeatedly, every run with a fresh interpreter and agent and
+the same seeds. By default, each benchmark runs in its own process, such that its peak memory is not shadowed by
+previous benchmarks. Results are written as JSON, two result files can be compared to detect regressions.
+
+Usage:
+    python -m prof run -g tic_tac_toe -o step -o playout --output results.json
+    python -m prof compare baseline.json results.json
+
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import datetime
+import json
+import multiprocessing
+import os
+import pathlib
+import platform
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+import pyggp.game_description_language as gdl
+from pyggp._version import __version__
+from pyggp.agents import InterpreterAgent
+from pyggp.agents.tree_agents.evaluators import final_goal_normalized_utility_evaluator
+from pyggp.agents.tree_agents.mcts.evaluators import LightPlayoutEvaluator
+from pyggp.agents.tree_agents.nodes import VisibleInformationSetNode
+from pyggp.books import BookBuilder
+from pyggp.cli.argument_specification import ArgumentSpecification
+from pyggp.engine_primitives import Role, State, Turn
+from pyggp.gameclocks import GameClock
+from pyggp.interpreters import Interpreter
+from pyggp.records import ImperfectInformationRecord
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+RESULTS_FORMAT_VERSION = 1
+
+DEFAULT_GAMES: Sequence[str] = ("tic_tac_toe", "kalaha(4,3)", "phantom_connect(4,4,4)", "dark_split_corridor(3,4)")
+DEFAULT_INTERPRETERS: Sequence[str] = (
+    "pyggp.interpreters.ClingoInterpreter",
+    "pyggp.interpreters.ClingoRegroundingInterpreter",
+)
+DEFAULT_AGENTS: Sequence[str] = ("pyggp.agents.MCTSAgent", "pyggp.agents.SOISMCTSAgent", "pyggp.agents.MOISMCTSAgent")
+DEFAULT_SIZES: Mapping[str, int] = {"step": 200, "develop": 8, "fill": 4, "book": 500, "playout": 20}
+"Default amount of work per run by operation, see `OPERATIONS` for the respective units."
+
+_NO_TIMEOUT_NS = 3_600_000_000_000
+
+
+def get_games_directory() -> pathlib.Path:
+    return pathlib.Path(__file__).resolve().parent.parent / "src" / "games"
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    game: str
+    "Name of the game, the stem of a file in the games directory."
+    interpreter: str
+    "Specification of the interpreter."
+    operation: str
+    "Name of the operation."
+    size: int
+    "Amount of work per run."
+    agent: Optional[str] = None
+    "Specification of the agent, only for the operation step."
+
+    @property
+    def name(self) -> str:
+        parts = (self.game, self.interpreter.rsplit(".", 1)[-1], self.agent.rsplit(".", 1)[-1] if self.agent else "-")
+        return f"{'/'.join(parts)}/{self.operation}"
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: Benchmark
+    "Benchmark that was run."
+    unit: str
+    "Unit of the work done."
+    work: List[int] = field(default_factory=list)
+    "Work done per measured run."
+    times_s: List[float] = field(default_factory=list)
+    "Wall time per measured run in seconds."
+    peak_rss_bytes: Optional[int] = None
+    "Peak resident set size of the process that ran the benchmark, if available."
+
+    @property
+    def throughputs(self) -> List[float]:
+        return [work / time_s if time_s > 0 else float("inf") for work, time_s in zip(self.work, self.times_s)]
+
+    def as_dict(self) -> Mapping[str, Any]:
+        throughputs = self.throughputs
+        return {
+            "name": self.benchmark.name,
+            **dataclasses.asdict(self.benchmark),
+            "unit": self.unit,
+            "work": self.work,
+            "times_s": self.times_s,
+            "throughput_median": statistics.median(throughputs) if throughputs else None,
+            "throughput_mean": statistics.mean(throughputs) if throughputs else None,
+            "throughput_stdev": statistics.stdev(throughputs) if len(throughputs) > 1 else 0.0,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+@dataclass
+class _Context:
+    ruleset: gdl.Ruleset
+    interpreter_factory: Callable[..., Interpreter]
+    interpreter: Interpreter
+    role: Role
+    seed: int
+    size: int
+    agent: Optional[str]
+    rng: random.Random = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because:
+        # Benchmarks need reproducibility, not security.
+        self.rng = random.Random(self.seed)  # noqa: S311
+
+
+def _get_trace(interpreter: Interpreter, length: int, rng: random.Random) -> Tuple[Sequence[State], Sequence[Turn]]:
+    states = [interpreter.get_init_state()]
+    turns = []
+    while len(turns) < length and not interpreter.is_terminal(states[-1]):
+        state = states[-1]
+        turn = Turn(
+            {
+                role: rng.choice(sorted(interpreter.get_legal_moves_by_role(state, role), key=str))
+                for role in sorted(interpreter.get_roles_in_control(state), key=str)
+            },
+        )
+        turns.append(turn)
+        states.append(interpreter.get_next_state(state, turn))
+    return states, turns
+
+
+def _prepare_step(context: _Context) -> Callable[[], int]:
+    assert context.agent is not None, "Requirement: the operation step needs an agent"
+    agent = ArgumentSpecification.get_factory_from_str(context.agent)()
+    agent.interpreter = context.interpreter
+    agent.skip_book = True
+    agent.rng.seed(context.seed)
+    init_state = context.interpreter.get_init_state()
+    clock_config = GameClock.Configuration(total_time=3600.0, delay=3600.0)
+    agent.set_up()
+    agent.prepare_match(context.role, context.ruleset, clock_config, clock_config)
+    agent.update(0, context.interpreter.get_sees_by_role(init_state, context.role), _NO_TIMEOUT_NS)
+
+    def step() -> int:
+        for _ in range(context.size):
+            agent.step()
+        return context.size
+
+    return step
+
+
+def _prepare_develop(context: _Context) -> Callable[[], int]:
+    scratch_interpreter = _get_scratch_interpreter(context)
+    states, turns = _get_trace(scratch_interpreter, context.size, context.rng)
+    if turns and scratch_interpreter.is_terminal(states[-1]):
+        # Developing assumes that the game goes on.
+        states, turns = states[:-1], turns[:-1]
+    interpreter = context.interpreter
+    role = context.role
+
+    def develop() -> int:
+        tree = VisibleInformationSetNode(
+            possible_states={states[0]},
+            view=interpreter.get_sees_by_role(states[0], role),
+            role=role,
+            fully_enumerated=True,
+        )
+        developments = 0
+        for ply, (turn, state) in enumerate(zip(turns, states[1:]), start=1):
+            if role in turn:
+                tree.move = turn[role]
+            if role in interpreter.get_roles_in_control(state):
+                tree = tree.develop(interpreter, ply, interpreter.get_sees_by_role(state, role))
+                developments += 1
+        return developments
+
+    return develop
+
+
+def _prepare_fill(context: _Context) -> Callable[[], int]:
+    interpreter = _get_scratch_interpreter(context)
+    states, turns = _get_trace(interpreter, context.size, context.rng)
+    role = context.role
+    record = ImperfectInformationRecord(
+        possible_states={0: frozenset({states[0]})},
+        views={ply: {role: interpreter.get_sees_by_role(state, role)} for ply, state in enumerate(states)},
+        role_move_map={ply: {role: turn[role]} for ply, turn in enumerate(turns) if role in turn},
+    )
+
+    def fill() -> int:
+        return len(set(context.interpreter.get_possible_states(record, len(turns))))
+
+    return fill
+
+
+def _prepare_book(context: _Context) -> Callable[[], int]:
+    builder = BookBuilder(
+        interpreter=context.interpreter,
+        role=context.role,
+        evaluator=final_goal_normalized_utility_evaluator,
+        min_value=0.0,
+        max_value=1.0,
+        rng=context.rng,
+    )
+
+    def build_book() -> int:
+        steps = 0
+        while steps < context.size and not builder.done:
+            builder.step()
+            steps += 1
+        return steps
+
+    return build_book
+
+
+def _prepare_playout(context: _Context) -> Callable[[], int]:
+    evaluator = LightPlayoutEvaluator(
+        role=context.role,
+        final_state_evaluator=final_goal_normalized_utility_evaluator,
+        rng=context.rng,
+    )
+    init_state = context.interpreter.get_init_state()
+
+    def playout() -> int:
+        for _ in range(context.size):
+            evaluator(init_state, context.interpreter)
+        return context.size
+
+    return playout
+
+
+OPERATIONS: Mapping[str, Tuple[str, Callable[[_Context], Callable[[], int]]]] = {
+    "step": ("steps", _prepare_step),
+    "develop": ("developments", _prepare_develop),
+    "fill": ("states", _prepare_fill),
+    "book": ("steps", _prepare_book),
+    "playout": ("playouts", _prepare_playout),
+}
+"Operations by name, as pairs of unit and preparation. Preparations return a function that does and counts the work."
+
+
+def _get_scratch_interpreter(context: _Context) -> Interpreter:
+    # Preparations use their own interpreter, such that they do not warm the caches of the measured one.
+    return context.interpreter_factory(ruleset=context.ruleset)
+
+
+def _get_peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes elsewhere.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def run_benchmark(benchmark: Benchmark, *, warmup: int = 1, repeat: int = 5, seed: int = 0) -> BenchmarkResult:
+    """Run a benchmark in the current process.
+
+    Args:
+        benchmark: Benchmark to run
+        warmup: Number of runs before measuring
+        repeat: Number of measured runs
+        seed: Seed of the random number generators
+
+    Returns:
+        Result of the benchmark
+
+    """
+    unit, prepare = OPERATIONS[benchmark.operation]
+    ruleset = gdl.parse((get_games_directory() / f"{benchmark.game}.gdl").read_text())
+    interpreter_factory = InterpreterAgent.interpreter_factory_from_spec_str(benchmark.interpreter)
+    result = BenchmarkResult(benchmark=benchmark, unit=unit)
+    for run in range(warmup + repeat):
+        interpreter = interpreter_factory(ruleset=ruleset)
+        init_state = interpreter.get_init_state()
+        role = min(interpreter.get_roles_in_control(init_state) or interpreter.get_roles(), key=str)
+        context = _Context(
+            ruleset=ruleset,
+            interpreter_factory=interpreter_factory,
+            interpreter=interpreter,
+            role=role,
+            seed=seed,
+            size=benchmark.size,
+            agent=benchmark.agent,
+        )
+        func = prepare(context)
+        random.seed(seed)
+        start = time.perf_counter()
+        work = func()
+        elapsed_s = time.perf_counter() - start
+        if run >= warmup:
+            result.work.append(work)
+            result.times_s.append(elapsed_s)
+    result.peak_rss_bytes = _get_peak_rss_bytes()
+    return result
+
+
+@contextlib.contextmanager
+def _fixed_hash_seed(seed: int) -> Iterator[None]:
+    # The order of iteration over sets depends on the hash seed, which spawned processes take from the environment.
+    previous = os.environ.get("PYTHONHASHSEED")
+    os.environ["PYTHONHASHSEED"] = str(seed)
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["PYTHONHASHSEED"]
+        else:
+            os.environ["PYTHONHASHSEED"] = previous
+
+
+def run_benchmark_isolated(
+    benchmark: Benchmark,
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """Run a benchmark in a fresh process.
+
+    Args:
+        benchmark: Benchmark to run
+        warmup: Number of runs before measuring
+        repeat: Number of measured runs
+        seed: Seed of the random number generators, also used as hash seed
+
+    Returns:
+        Result of the benchmark
+
+    """
+    context = multiprocessing.get_context("spawn")
+    with _fixed_hash_seed(seed), context.Pool(processes=1, maxtasksperchild=1) as pool:
+        return pool.apply(run_benchmark, (benchmark,), {"warmup": warmup, "repeat": repeat, "seed": seed})
+
+
+def get_benchmarks(
+    games: Sequence[str] = DEFAULT_GAMES,
+    interpreters: Sequence[str] = DEFAULT_INTERPRETERS,
+    agents: Sequence[str] = DEFAULT_AGENTS,
+    operations: Sequence[str] = tuple(OPERATIONS),
+    sizes: Optional[Mapping[str, int]] = None,
+) -> Iterator[Benchmark]:
+    """Yield the cross product of games, interpreters, operations and (for the operation step) agents.
+
+    Perfect information agents are skipped for games with incomplete information, filling is skipped for games with
+    perfect information.
+
+    Args:
+        games: Names of the games
+        interpreters: Specifications of the interpreters
+        agents: Specifications of the agents
+        operations: Names of the operations
+        sizes: Amount of work per run by operation, defaults to `DEFAULT_SIZES`
+
+    Yields:
+        Benchmarks
+
+    """
+    sizes = {**DEFAULT_SIZES, **(sizes or {})}
+    for game in games:
+        ruleset = gdl.parse((get_games_directory() / f"{game}.gdl").read_text())
+        for interpreter in interpreters:
+            for operation in operations:
+                if operation == "fill" and not ruleset.sees_rules:
+                    continue
+                if operation != "step":
+                    yield Benchmark(game=game, interpreter=interpreter, operation=operation, size=sizes[operation])
+                    continue
+                for agent in agents:
+                    if ruleset.sees_rules and agent.rsplit(".", 1)[-1] in ("MCTSAgent", "MonteCarloTreeSearchAgent"):
+                        continue
+                    yield Benchmark(
+                        game=game,
+                        interpreter=interpreter,
+                        operation=operation,
+                        size=sizes[operation],
+                        agent=agent,
+                    )
+
+
+def get_results_document(
+    results: Sequence[BenchmarkResult],
+    *,
+    seed: int,
+    warmup: int,
+    repeat: int,
+) -> Mapping[str, Any]:
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "timestamp": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "pyggp": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "warmup": warmup,
+        "repeat": repeat,
+        "results": [result.as_dict() for result in results],
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    "Name of the benchmark."
+    throughput_ratio: Optional[float]
+    "Median throughput of the candidate relative to the baseline."
+    peak_rss_ratio: Optional[float]
+    "Peak memory of the candidate relative to the baseline."
+    is_regression: bool
+    "Whether the candidate is worse than the baseline beyond the tolerance."
+
+
+def compare(
+    baseline: Mapping[str, Any],
+    candidate: Mapping[str, Any],
+    *,
+    tolerance: float = 0.1,
+    memory_tolerance: float = 0.1,
+) -> Sequence[Comparison]:
+    """Compare the results of benchmarks present in both documents.
+
+    Args:
+        baseline: Results document of the baseline
+        candidate: Results document of the candidate
+        tolerance: Tolerated relative loss of median throughput
+        memory_tolerance: Tolerated relative gain of peak memory
+
+    Returns:
+        Comparisons by benchmark, in the order of the candidate
+
+    """
+    baseline_by_name = {result["name"]: result for result in baseline["results"]}
+    comparisons = []
+    for result in candidate["results"]:
+        reference = baseline_by_name.get(result["name"])
+        if reference is None:
+            continue
+        throughput_ratio = _get_ratio(result["throughput_median"], reference["throughput_median"])
+        peak_rss_ratio = _get_ratio(result["peak_rss_bytes"], reference["peak_rss_bytes"])
+        is_regression = (throughput_ratio is not None and throughput_ratio < 1.0 - tolerance) or (
+            peak_rss_ratio is not None and peak_rss_ratio > 1.0 + memory_tolerance
+        )
+        comparisons.append(Comparison(result["name"], throughput_ratio, peak_rss_ratio, is_regression))
+    return comparisons
+
+
+def _get_ratio(value: Optional[float], reference: Optional[float]) -> Optional[float]:
+    if value is None or not reference:
+        return None
+    return value / reference
+
+
+def _format_ratio(ratio: Optional[float]) -> str:
+    return f"{ratio:8.3f}" if ratio is not None else f"{'n/a':>8}"
+
+
+def _parse_sizes(size_strs: Sequence[str]) -> MutableMapping[str, int]:
+    sizes = {}
+    for size_str in size_strs:
+        operation, _, size = size_str.partition("=")
+        sizes[operation] = int(size)
+    return sizes
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m prof", description="Reproducible benchmarks of pyggp.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks and write their results.")
+    run_parser.add_argument("-g", "--game", action="append", dest="games", help="Name of a game (repeatable).")
+    run_parser.add_argument("-i", "--interpreter", action="append", dest="interpreters", help="Interpreter spec.")
+    run_parser.add_argument("-a", "--agent", action="append", dest="agents", help="Agent spec (for step).")
+    run_parser.add_argument("-o", "--operation", action="append", dest="operations", choices=tuple(OPERATIONS))
+    run_parser.add_argument("-s", "--size", action="append", dest="sizes", default=[], help="OPERATION=SIZE")
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--in-process", action="store_true", help="Do not isolate benchmarks in processes.")
+    run_parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark-results.json"))
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files.")
+    compare_parser.add_argument("baseline", type=pathlib.Path)
+    compare_parser.add_argument("candidate", type=pathlib.Path)
+    compare_parser.add_argument("--tolerance", type=float, default=0.1, help="Tolerated loss of throughput.")
+    compare_parser.add_argument("--memory-tolerance", type=float, default=0.1, help="Tolerated gain of memory.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        benchmarks = get_benchmarks(
+            games=args.games or DEFAULT_GAMES,
+            interpreters=args.interpreters or DEFAULT_INTERPRETERS,
+            agents=args.agents or DEFAULT_AGENTS,
+            operations=args.operations or tuple(OPERATIONS),
+            sizes=_parse_sizes(args.sizes),
+        )
+        run = run_benchmark if args.in_process else run_benchmark_isolated
+        results = []
+        for benchmark in benchmarks:
+            result = run(benchmark, warmup=args.warmup, repeat=args.repeat, seed=args.seed)
+            throughput = result.as_dict()["throughput_median"]
+            print(f"{benchmark.name:<80} {throughput:12.2f} {result.unit}/s")
+            results.append(result)
+        document = get_results_document(results, seed=args.seed, warmup=args.warmup, repeat=args.repeat)
+        args.output.write_text(json.dumps(document, indent=2))
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    comparisons = compare(baseline, candidate, tolerance=args.tolerance, memory_tolerance=args.memory_tolerance)
+    print(f"{'benchmark':<80} {'speed':>8} {'memory':>8}")
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison.is_regression else ""
+        print(
+            f"{comparison.name:<80} "
+            f"{_format_ratio(comparison.throughput_ratio)} "
+            f"{_format_ratio(comparison.peak_rss_ratio)}{flag}",
+        )
+    return 1 if any(comparison.is_regression for comparison in comparisons) else 0
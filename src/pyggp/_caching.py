@@ -142,7 +142,6 @@ goal_sizeof: Callable[[Mapping[Any, Optional[int]]], int] = functools.partial(
     value_factor=INT_SIZE,
 )
 terminal_sizeof: _ConstProtocol[int] = functools.partial(const, BOOL_SIZE)
-get_roles_in_control_sizeof: Callable[[Sized], int] = functools.partial(weighted_len, factor=SUBRELATION_SIZE)
 from_clingo_symbol_sizeof: _ConstProtocol[int] = functools.partial(const, SUBRELATION_SIZE)
 
 as_clingo_symbol_sizeof: _ConstProtocol[int] = functools.partial(const, CLINGO_SYMBOL_SIZE)
@@ -235,6 +235,24 @@ EXTERNAL_DOES_ROLE_LEGAL = create_external(
 EXTERNALS_TRUE = (EXTERNAL_TRUE_INIT, EXTERNAL_TRUE_NEXT)
 EXTERNALS = (EXTERNAL_TRUE_INIT, EXTERNAL_TRUE_NEXT, EXTERNAL_DOES_ROLE_LEGAL)
 
+# 1 { does(Role, Move) : legal(Role, Move) } 1 :- role(Role), true(control(Role)).
+CHOOSE_DOES_RULE = create_rule(
+    head=create_aggregate(
+        left_guard=PICK_MOVE_GUARD_LEFT,
+        elements=(
+            create_conditional_literal(
+                literal=create_literal(atom=create_atom(create_function(name="does", arguments=(Role, Move)))),
+                condition=(create_literal(atom=create_atom(create_function(name="legal", arguments=(Role, Move)))),),
+            ),
+        ),
+        right_guard=PICK_MOVE_GUARD_RIGHT,
+    ),
+    body=(
+        ROLE_R_LIT,
+        create_literal(atom=create_atom(create_function(name="true", arguments=(CONTROL_R_FUNC,)))),
+    ),
+)
+
 
 def create_show_signature(name: str, arity: int = 0, positive=1) -> clingo_ast.AST:
     return clingo_ast.ShowSignature(location=_loc, name=name, arity=arity, positive=positive)
@@ -247,6 +265,7 @@ SHOW_SEES = create_show_signature(name="sees", arity=2)
 SHOW_LEGAL = create_show_signature(name="legal", arity=2)
 SHOW_GOAL = create_show_signature(name="goal", arity=2)
 SHOW_TERMINAL = create_show_signature(name="terminal", arity=0)
+SHOW_DOES = create_show_signature(name="does", arity=2)
 HIDE = create_show_signature(name="", arity=0)
 
 
@@ -1,4 +1,8 @@
-from typing import Callable, Iterable, Iterator, Optional
+import contextlib
+import contextvars
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, TypeVar
 
 import clingo
 from clingo import ast as clingo_ast
@@ -12,6 +16,75 @@ from pyggp.exceptions.interpreter_exceptions import (
     UnsatInterpreterError,
 )
 
+_T = TypeVar("_T")
+
+_BASE_PARTS: Sequence[Tuple[str, Sequence[clingo.Symbol]]] = (("base", ()),)
+
+
+@dataclass
+class SolverStatistics:
+    """Time spent in clingo while probing."""
+
+    grounding_s: float = field(default=0.0)
+    "Wall time spent grounding in seconds."
+    solving_s: float = field(default=0.0)
+    "Time spent solving in seconds, as reported by clingo."
+    solves: int = field(default=0)
+    "Number of solve calls."
+
+
+_solver_probe: contextvars.ContextVar[Optional[SolverStatistics]] = contextvars.ContextVar(
+    "_solver_probe",
+    default=None,
+)
+
+
+@contextlib.contextmanager
+def probe_solver(statistics: Optional[SolverStatistics] = None) -> Iterator[SolverStatistics]:
+    """Accumulate the time spent grounding and solving within the context.
+
+    While no probe is active, grounding and solving are not measured at all. Probes may be nested, the enclosing
+    probe also accumulates what the nested probe measured.
+
+    Args:
+        statistics: Statistics to accumulate into, fresh statistics if None
+
+    Yields:
+        Statistics, updated as grounding and solving happen
+
+    """
+    if statistics is None:
+        statistics = SolverStatistics()
+    grounding_s, solving_s, solves = statistics.grounding_s, statistics.solving_s, statistics.solves
+    token = _solver_probe.set(statistics)
+    try:
+        yield statistics
+    finally:
+        _solver_probe.reset(token)
+        enclosing = _solver_probe.get()
+        if enclosing is not None:
+            enclosing.grounding_s += statistics.grounding_s - grounding_s
+            enclosing.solving_s += statistics.solving_s - solving_s
+            enclosing.solves += statistics.solves - solves
+
+
+def _ground(ctl: clingo.Control, parts: Sequence[Tuple[str, Sequence[clingo.Symbol]]] = _BASE_PARTS) -> None:
+    probe = _solver_probe.get()
+    if probe is None:
+        ctl.ground(parts)
+        return
+    start = time.perf_counter()
+    ctl.ground(parts)
+    probe.grounding_s += time.perf_counter() - start
+
+
+def _record_solve(ctl: clingo.Control) -> None:
+    probe = _solver_probe.get()
+    if probe is None:
+        return
+    probe.solving_s += ctl.statistics["summary"]["times"]["solve"]
+    probe.solves += 1
+
 
 def _get_shows(ruleset: gdl.Ruleset) -> Iterator[clingo_ast.AST]:
     if ruleset.role_rules:
@@ -74,6 +147,15 @@ def _get_model(ctl: clingo.Control, timeout: Optional[float] = None) -> Iterator
         model = handle.model()
         if model is not None:
             raise MoreThanOneModelInterpreterError
+    _record_solve(ctl)
+
+
+def _get_models(ctl: clingo.Control) -> Iterator[Sequence[clingo.Symbol]]:
+    # Models are yielded while solving. Abandoning the iterator cancels the search.
+    with ctl.solve(yield_=True) as handle:
+        for model in handle:
+            yield model.symbols(shown=True)
+    _record_solve(ctl)
 
 
 def _transform_model(
@@ -93,3 +175,22 @@ def _transform(symbol: clingo.Symbol, unpack: Optional[int] = None) -> gdl.Subre
     if unpack is None:
         return subrelation
     return subrelation.symbol.arguments[unpack]
+
+
+def _transform_pair(symbol: clingo.Symbol) -> Tuple[gdl.Subrelation, gdl.Subrelation]:
+    subrelation = _transform(symbol)
+    assert isinstance(subrelation.symbol, gdl.Relation), "Assumption: symbol is a function."
+    return subrelation.symbol.arguments[0], subrelation.symbol.arguments[1]
+
+
+def _translate_model(
+    symbols: Iterable[clingo.Symbol],
+    symbol_to_value: Mapping[clingo.Symbol, _T],
+    fallback: Callable[[clingo.Symbol], _T],
+) -> Iterator[_T]:
+    lookup = symbol_to_value.get
+    for symbol in symbols:
+        value = lookup(symbol)
+        if value is None:
+            value = fallback(symbol)
+        yield value
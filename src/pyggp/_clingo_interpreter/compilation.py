@@ -0,0 +1,461 @@
+"""Compilation of rulesets to specialized Python code.
+
+The rules each query depends on are grounded, as for the controls of the clingo interpreter. GDL is stratified, hence
+the ground program has a unique model, which is computed in the order of the strongly connected components of the
+ground dependencies: each atom is the disjunction of the bodies of its rules, and recursive components are iterated to
+a fixpoint. The compiler emits this computation as straight-line Python code over integer bitsets of fluents and
+moves, one function per query.
+
+Generated modules are cached on disk, keyed by the ruleset, and imported instead of compiled again.
+
+"""
+
+import collections
+import contextlib
+import hashlib
+import importlib.util
+import itertools
+import logging
+import os
+import pathlib
+import tempfile
+import types
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+import clingo
+from clingo import ast as clingo_ast
+from typing_extensions import Self
+
+from pyggp import _clingo as clingo_helper
+from pyggp import game_description_language as gdl
+from pyggp._clingo_interpreter.control_containers import GroundProgram, get_dependencies, get_ground_externals
+from pyggp._version import __version__
+from pyggp.engine_primitives import Move, Role, State, View
+from pyggp.exceptions.interpreter_exceptions import UncompilableInterpreterError, UnsupportedRulesInterpreterError
+from pyggp.ruleset_cache import get_default_cache_directory
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+_T = TypeVar("_T")
+
+_COMPILER_VERSION = 1
+# Operands per generated expression. Python's compiler recurses on nested expressions, hence long conjunctions and
+# disjunctions are split into several statements.
+_MAX_OPERANDS = 32
+
+
+def _ground(sentences: Sequence[gdl.Sentence], rules: Iterable[clingo_ast.AST]) -> GroundProgram:
+    try:
+        return GroundProgram.from_rules(sentences, rules)
+    except UnsupportedRulesInterpreterError as error:
+        raise UncompilableInterpreterError(error.reason) from error
+
+
+def compile_ruleset(ruleset: gdl.Ruleset) -> str:
+    """Compile a ruleset to the source code of a Python module.
+
+    The module defines the tables `FLUENTS`, `ACTIONS`, `LEGAL`, `GOALS`, and `SEES` of strings of clingo terms, and
+    the functions `next_state(s, a)`, `legal(s)`, `terminal(s)`, `goal(s)`, and `sees(s)`. Their arguments and
+    results are bitsets, where bit `i` stands for entry `i` of the respective table, `s` over `FLUENTS`, and `a` over
+    `ACTIONS`. The functions return None if the query is unsatisfiable.
+
+    Args:
+        ruleset: Ruleset to compile
+
+    Returns:
+        Source code of the module
+
+    Raises:
+        UncompilableInterpreterError: The ruleset uses constructs that cannot be compiled
+
+    """
+    next_program = _ground(
+        get_dependencies(ruleset, ruleset.next_rules, ruleset.init_rules, ruleset.role_rules, ruleset.legal_rules),
+        clingo_helper.EXTERNALS,
+    )
+    externals = (
+        *get_ground_externals(next_program.ctl, name="true", arity=1),
+        *get_ground_externals(next_program.ctl, name="does", arity=2),
+    )
+    true_atoms = tuple(next_program.get_atoms("true", 1))
+    next_atoms = tuple(next_program.get_atoms("next", 1))
+    does_atoms = tuple(next_program.get_atoms("does", 2))
+
+    fluents = list(dict.fromkeys(symbol.arguments[0] for symbol, _ in (*true_atoms, *next_atoms)))
+    fluent_to_bit = {fluent: bit for bit, fluent in enumerate(fluents)}
+    actions = tuple(symbol.arguments for symbol, _ in does_atoms)
+
+    lines = [
+        '"""Generated by pyggp, do not edit."""',
+        "",
+        f"FLUENTS = {_format_table(str(fluent) for fluent in fluents)}",
+        f"ACTIONS = {_format_table((str(role), str(move)) for role, move in actions)}",
+    ]
+
+    next_inputs = {
+        **{literal: f"s >> {fluent_to_bit[symbol.arguments[0]]} & 1" for symbol, literal in true_atoms if literal},
+        **{literal: f"a >> {bit} & 1" for bit, (_, literal) in enumerate(does_atoms) if literal},
+    }
+    next_outputs = tuple((fluent_to_bit[symbol.arguments[0]], literal) for symbol, literal in next_atoms)
+    lines.extend(_compile_function("next_state", ("s", "a"), next_program, next_inputs, next_outputs))
+
+    for name, table_name, arity, rules in (
+        ("legal", "LEGAL", 2, ruleset.legal_rules),
+        ("terminal", None, 0, ruleset.terminal_rules),
+        ("goal", "GOALS", 2, ruleset.goal_rules),
+        ("sees", "SEES", 2, ruleset.sees_rules),
+    ):
+        program = _ground(rules, externals)
+        # The clingo interpreter does not assign moves in these queries, hence does atoms are false.
+        inputs = {
+            literal: f"s >> {fluent_to_bit[symbol.arguments[0]]} & 1"
+            for symbol, literal in program.get_atoms("true", 1)
+            if literal and symbol.arguments[0] in fluent_to_bit
+        }
+        atoms = tuple(program.get_atoms(name, arity))
+        if table_name is not None:
+            table = tuple(tuple(str(argument) for argument in symbol.arguments) for symbol, _ in atoms)
+            lines.extend(("", "", f"{table_name} = {_format_table(table)}"))
+        outputs = tuple((bit, literal) for bit, (_, literal) in enumerate(atoms))
+        lines.extend(_compile_function(name, ("s",), program, inputs, outputs))
+    return "\n".join(lines) + "\n"
+
+
+def _format_table(entries: Iterable[object]) -> str:
+    entries = tuple(entries)
+    if not entries:
+        return "()"
+    return "(\n" + "".join(f"    {entry!r},\n" for entry in entries) + ")"
+
+
+def _compile_function(
+    name: str,
+    parameters: Sequence[str],
+    program: GroundProgram,
+    inputs: Mapping[int, str],
+    outputs: Sequence[Tuple[int, Optional[int]]],
+) -> List[str]:
+    roots = [literal for _, literal in outputs if literal is not None]
+    roots.extend(abs(literal) for body in program.constraints for literal in body)
+    lines = ["", "", f"def {name}({', '.join(parameters)}):"]
+    for component in _get_components(roots, lambda atom: _get_dependencies(program, atom)):
+        lines.extend(_compile_component(program, inputs, component))
+    for body in program.constraints:
+        lines.extend(_compile_disjunction("c", (body,), indent=1))
+        lines.extend(("    if c:", "        return None"))
+    constant = sum(1 << bit for bit, literal in outputs if literal is None)
+    lines.append(f"    r = {constant}")
+    lines.extend(f"    r |= x{literal} << {bit}" for bit, literal in outputs if literal is not None)
+    lines.append("    return r")
+    return lines
+
+
+def _get_dependencies(program: GroundProgram, atom: int) -> Iterator[int]:
+    for body in program.rules.get(atom, ()):
+        for literal in body:
+            yield abs(literal)
+
+
+def _compile_component(program: GroundProgram, inputs: Mapping[int, str], component: Sequence[int]) -> List[str]:
+    members = frozenset(component)
+    is_recursive = len(component) > 1 or any(
+        abs(literal) in members for body in program.rules.get(component[0], ()) for literal in body
+    )
+    if not is_recursive:
+        (atom,) = component
+        if atom in inputs:
+            return [f"    x{atom} = {inputs[atom]}"]
+        return _compile_disjunction(f"x{atom}", program.rules.get(atom, ()), indent=1)
+    if any(-literal in members for atom in component for body in program.rules.get(atom, ()) for literal in body):
+        message = "unstratified negation"
+        raise UncompilableInterpreterError(message)
+    # Positive recursion is iterated from all atoms false to the least fixpoint.
+    lines = [f"    x{atom} = 0" for atom in component]
+    lines.append("    while True:")
+    lines.append("        c = 0")
+    for atom in component:
+        lines.extend(_compile_disjunction("n", program.rules.get(atom, ()), indent=2))
+        lines.append(f"        c |= n ^ x{atom}")
+        lines.append(f"        x{atom} = n")
+    lines.extend(("        if not c:", "            break"))
+    return lines
+
+
+def _compile_disjunction(target: str, bodies: Sequence[Sequence[int]], indent: int) -> List[str]:
+    prefix = "    " * indent
+    if not bodies:
+        return [f"{prefix}{target} = 0"]
+    lines = []
+    for index, body in enumerate(bodies):
+        operator = "=" if index == 0 else "|="
+        terms = [f"x{literal}" if literal > 0 else f"(x{-literal} ^ 1)" for literal in body] or ["1"]
+        if len(terms) <= _MAX_OPERANDS:
+            lines.append(f"{prefix}{target} {operator} {' & '.join(terms)}")
+            continue
+        lines.append(f"{prefix}t = {' & '.join(terms[:_MAX_OPERANDS])}")
+        for start in range(_MAX_OPERANDS, len(terms), _MAX_OPERANDS):
+            lines.append(f"{prefix}t &= {' & '.join(terms[start:start + _MAX_OPERANDS])}")
+        lines.append(f"{prefix}{target} {operator} t")
+    return lines
+
+
+def _get_components(roots: Iterable[int], get_successors: Callable[[int], Iterable[int]]) -> Iterator[Sequence[int]]:
+    # Tarjan's algorithm, yields each strongly connected component after all components it depends on.
+    indices: Dict[int, int] = {}
+    lowlinks: Dict[int, int] = {}
+    stack: List[int] = []
+    on_stack: Set[int] = set()
+    for root in roots:
+        if root in indices:
+            continue
+        indices[root] = lowlinks[root] = len(indices)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(get_successors(root)))]
+        while work:
+            atom, successors = work[-1]
+            for successor in successors:
+                if successor not in indices:
+                    indices[successor] = lowlinks[successor] = len(indices)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(get_successors(successor))))
+                    break
+                if successor in on_stack:
+                    lowlinks[atom] = min(lowlinks[atom], indices[successor])
+            else:
+                work.pop()
+                if work:
+                    parent, _ = work[-1]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[atom])
+                if lowlinks[atom] == indices[atom]:
+                    component: List[int] = []
+                    while not component or component[-1] != atom:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                    yield component
+
+
+def get_key(ruleset: gdl.Ruleset) -> str:
+    """Get the key of the compiled module of a ruleset.
+
+    Args:
+        ruleset: Ruleset
+
+    Returns:
+        Key of the compiled module
+
+    """
+    digest = hashlib.sha256()
+    digest.update(f"pyggp {__version__} compiler {_COMPILER_VERSION}\n".encode())
+    for rule in ruleset.rules:
+        digest.update(f"{rule}\n".encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    """Compiled queries of a ruleset, translating between pyggp's representations and bitsets."""
+
+    module: types.ModuleType
+    "Compiled module, see `compile_ruleset`."
+    fluents: Sequence[gdl.Subrelation]
+    "Fluent of each bit of states."
+    fluent_to_bit: Mapping[gdl.Subrelation, int]
+    "Bit of each fluent, as a power of two."
+    action_to_bit: Mapping[Tuple[Role, Move], int]
+    "Bit of each action, as a power of two."
+    legal: Sequence[Tuple[Role, Move]]
+    "Action of each bit of legal moves."
+    goals: Sequence[Tuple[Role, Optional[int]]]
+    "Role and goal value of each bit of goals, None if the value is not an integer."
+    sees: Sequence[Tuple[Role, gdl.Subrelation]]
+    "Role and fluent of each bit of percepts."
+
+    # region Constructors
+
+    @classmethod
+    def from_module(cls, module: types.ModuleType) -> Self:
+        """Create a compiled program from a compiled module.
+
+        Args:
+            module: Module created from the source returned by `compile_ruleset`
+
+        Returns:
+            Compiled program
+
+        """
+        fluents = tuple(_parse(fluent) for fluent in module.FLUENTS)
+        actions = tuple((Role(_parse(role)), Move(_parse(move))) for role, move in module.ACTIONS)
+        goals = []
+        for role_str, value_str in module.GOALS:
+            value = _parse(value_str).symbol
+            goals.append((Role(_parse(role_str)), value.number if isinstance(value, gdl.Number) else None))
+        return cls(
+            module=module,
+            fluents=fluents,
+            fluent_to_bit={fluent: 1 << bit for bit, fluent in enumerate(fluents)},
+            action_to_bit={action: 1 << bit for bit, action in enumerate(actions)},
+            legal=tuple((Role(_parse(role)), Move(_parse(move))) for role, move in module.LEGAL),
+            goals=tuple(goals),
+            sees=tuple((Role(_parse(role)), _parse(fluent)) for role, fluent in module.SEES),
+        )
+
+    @classmethod
+    def from_ruleset(cls, ruleset: gdl.Ruleset, directory: Optional[pathlib.Path] = None) -> Self:
+        """Compile a ruleset, or load its compiled module from the cache.
+
+        Modules are stored atomically. If the cache cannot be read or written, the module is compiled in memory.
+
+        Args:
+            ruleset: Ruleset to compile
+            directory: Directory of the cache, `compiled` in the default cache directory if None
+
+        Returns:
+            Compiled program
+
+        Raises:
+            UncompilableInterpreterError: The ruleset uses constructs that cannot be compiled
+
+        """
+        if directory is None:
+            directory = get_default_cache_directory() / "compiled"
+        key = get_key(ruleset)
+        path = directory / f"pyggp_compiled_{key}.py"
+        if path.exists():
+            module = _import(path)
+            if module is not None:
+                log.debug("Loaded compiled ruleset %s", path)
+                return cls.from_module(module)
+        source = compile_ruleset(ruleset)
+        if _store(path, source):
+            module = _import(path)
+            if module is not None:
+                return cls.from_module(module)
+        module = types.ModuleType(path.stem)
+        # Disables S102 (Use of exec). Because: The source was generated from the ruleset by the compiler itself.
+        exec(compile(source, str(path), "exec"), module.__dict__)  # noqa: S102
+        return cls.from_module(module)
+
+    # endregion
+
+    # region Methods
+
+    def encode_state(self, current: Iterable[gdl.Subrelation]) -> int:
+        """Encode a state or view as a bitset, ignoring fluents that do not occur in the ruleset.
+
+        Args:
+            current: State or view
+
+        Returns:
+            Bitset of the fluents
+
+        """
+        # The bits are distinct, hence their sum is their union.
+        return sum(map(self.fluent_to_bit.get, current, itertools.repeat(0)))
+
+    def get_next_state(self, current: Iterable[gdl.Subrelation], turn: Mapping[Role, Move]) -> Optional[State]:
+        """Compute the next state, None if unsatisfiable."""
+        actions = sum(map(self.action_to_bit.get, turn.items(), itertools.repeat(0)))
+        bits = self.module.next_state(self.encode_state(current), actions)
+        if bits is None:
+            return None
+        return State(frozenset(_decode(bits, self.fluents)))
+
+    def get_legal_moves(self, current: Iterable[gdl.Subrelation]) -> Optional[Mapping[Role, FrozenSet[Move]]]:
+        """Compute the legal moves of all roles with at least one, None if unsatisfiable."""
+        bits = self.module.legal(self.encode_state(current))
+        if bits is None:
+            return None
+        legal_moves: MutableMapping[Role, Set[Move]] = collections.defaultdict(set)
+        for role, move in _decode(bits, self.legal):
+            legal_moves[role].add(move)
+        return {role: frozenset(moves) for role, moves in legal_moves.items()}
+
+    def get_goals(self, current: Iterable[gdl.Subrelation]) -> Optional[Sequence[Tuple[Role, Optional[int]]]]:
+        """Compute the pairs of roles and goal values that hold, None if unsatisfiable."""
+        bits = self.module.goal(self.encode_state(current))
+        if bits is None:
+            return None
+        return tuple(_decode(bits, self.goals))
+
+    def is_terminal(self, current: Iterable[gdl.Subrelation]) -> Optional[bool]:
+        """Compute whether the state is terminal, None if unsatisfiable."""
+        bits = self.module.terminal(self.encode_state(current))
+        if bits is None:
+            return None
+        return bool(bits)
+
+    def get_sees(self, current: Iterable[gdl.Subrelation]) -> Optional[Mapping[Role, View]]:
+        """Compute the percepts of all roles with at least one, None if unsatisfiable."""
+        bits = self.module.sees(self.encode_state(current))
+        if bits is None:
+            return None
+        sees: MutableMapping[Role, Set[gdl.Subrelation]] = collections.defaultdict(set)
+        for role, fluent in _decode(bits, self.sees):
+            sees[role].add(fluent)
+        return {role: View(State(frozenset(fluents))) for role, fluents in sees.items()}
+
+    # endregion
+
+
+def _parse(term: str) -> gdl.Subrelation:
+    return gdl.Subrelation.from_clingo_symbol(clingo.parse_term(term))
+
+
+def _decode(bits: int, table: Sequence[_T]) -> Iterator[_T]:
+    while bits:
+        bit = bits & -bits
+        bits ^= bit
+        yield table[bit.bit_length() - 1]
+
+
+def _import(path: pathlib.Path) -> Optional[types.ModuleType]:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    # Disables BLE001 (Blind except). Because: Whatever is wrong with the cache, the ruleset can be compiled again.
+    except Exception:  # noqa: BLE001
+        log.warning("Ignoring corrupt compiled ruleset %s", path, exc_info=True)
+        return None
+    return module
+
+
+def _store(path: pathlib.Path, source: str) -> bool:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".py")
+    except OSError:
+        log.warning("Could not store compiled ruleset %s", path, exc_info=True)
+        return False
+    tmp_path = pathlib.Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(source)
+        tmp_path.replace(path)
+    except OSError:
+        log.warning("Could not store compiled ruleset %s", path, exc_info=True)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        return False
+    log.debug("Stored compiled ruleset %s", path)
+    return True
@@ -1,9 +1,25 @@
 import collections
+import concurrent.futures
 import contextlib
 import functools
 import logging
+import queue
+import threading
 from dataclasses import dataclass, field
-from typing import Iterable, Iterator, Mapping, MutableMapping, Union
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import clingo
 from clingo import ast as clingo_ast
@@ -12,13 +28,21 @@ from typing_extensions import Self
 from pyggp import _clingo as clingo_helper
 from pyggp import game_description_language as gdl
 from pyggp._clingo_interpreter.base import _get_ctl
+from pyggp._clingo_interpreter.latches import get_latch_rules, get_latches, get_unread_fluents
 from pyggp.engine_primitives import Move, Role, State, View
+from pyggp.exceptions.interpreter_exceptions import UnsupportedRulesInterpreterError
 
 log = logging.getLogger("pyggp")
 
 MutableStateLiteralMapping = MutableMapping[gdl.Subrelation, int]
 MutableActionLiteralMapping = MutableMapping[Role, MutableMapping[Move, int]]
 
+if TYPE_CHECKING:
+    # TODO: Remove this when python 3.8 is no longer supported.
+    ControlContainerQueue = queue.SimpleQueue["ControlContainer"]
+else:
+    ControlContainerQueue = queue.SimpleQueue
+
 
 @dataclass(frozen=True)
 class ControlContainer:
@@ -29,6 +53,8 @@ class ControlContainer:
     next_action_to_literal: MutableActionLiteralMapping = field(
         default_factory=functools.partial(collections.defaultdict, dict),
     )
+    all_next: clingo.Control = field(default_factory=clingo.Control)
+    all_next_state_to_literal: MutableStateLiteralMapping = field(default_factory=dict)
     sees: clingo.Control = field(default_factory=clingo.Control)
     sees_state_to_literal: MutableStateLiteralMapping = field(default_factory=dict)
     legal: clingo.Control = field(default_factory=clingo.Control)
@@ -37,9 +63,28 @@ class ControlContainer:
     goal_state_to_literal: MutableStateLiteralMapping = field(default_factory=dict)
     terminal: clingo.Control = field(default_factory=clingo.Control)
     terminal_state_to_literal: MutableStateLiteralMapping = field(default_factory=dict)
+    latches: FrozenSet[gdl.Subrelation] = field(default_factory=frozenset)
+    "Fluents that are kept in the next state whenever they hold, the next controls leave them out."
+    all_next_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    "Held while the all next control enumerates, which may be suspended in between models."
 
     @classmethod
     def from_ruleset(cls, ruleset: gdl.Ruleset) -> Self:
+        """Create the controls of a ruleset.
+
+        Each control is grounded from the rules its query depends on only. The domains of the externals depend on the
+        init, next and legal rules, hence they are grounded along in the next control, and declared ground in all
+        other controls. Frame axioms of latches are left out of the next controls, the latches are carried over by
+        the interpreter instead. Fluents that the next rules do not read are mapped to the literal 0, such that no
+        external is assigned for them.
+
+        Args:
+            ruleset: Ruleset to create the controls from
+
+        Returns:
+            Control container of the ruleset
+
+        """
         role_ctl = ControlContainer.get_ctl(
             sentences=ruleset.role_rules,
             rules=(clingo_helper.SHOW_ROLE,),
@@ -50,41 +95,69 @@ class ControlContainer:
             rules=(clingo_helper.SHOW_INIT,),
             context="init",
         )
+        latch_rules = frozenset(get_latch_rules(ruleset))
+        next_rules = tuple(rule for rule in ruleset.next_rules if rule not in latch_rules)
         next_ctl = ControlContainer.get_ctl(
-            sentences=ruleset.rules,
+            sentences=get_dependencies(
+                ruleset,
+                next_rules,
+                ruleset.init_rules,
+                ruleset.role_rules,
+                ruleset.legal_rules,
+            ),
             rules=(
                 *clingo_helper.EXTERNALS,
                 clingo_helper.SHOW_NEXT,
             ),
             context="next",
         )
-        sees_sentences = ruleset.rules if ruleset.sees_rules else ()
-        sees_rules = (*clingo_helper.EXTERNALS, clingo_helper.SHOW_SEES) if ruleset.sees_rules else ()
+        true_externals = tuple(get_ground_externals(next_ctl, name="true", arity=1))
+        does_externals = tuple(get_ground_externals(next_ctl, name="does", arity=2))
+        latches = get_latches(ruleset, tuple(latch_rules), (*true_externals, *does_externals))
+        unread_fluents = get_unread_fluents(
+            next_rules,
+            (_get_fluent(symbolic_atom.symbol) for symbolic_atom in next_ctl.symbolic_atoms.by_signature("true", 1)),
+        )
+        # Chooses one legal move for each role in control, such that each model corresponds to a turn.
+        all_next_ctl = ControlContainer.get_ctl(
+            sentences=get_dependencies(ruleset, next_rules, ruleset.role_rules, ruleset.legal_rules),
+            rules=(
+                *true_externals,
+                clingo_helper.CHOOSE_DOES_RULE,
+                clingo_helper.SHOW_NEXT,
+                clingo_helper.SHOW_DOES,
+            ),
+            context="all_next",
+            models=0,
+        )
         sees_ctl = ControlContainer.get_ctl(
-            sentences=sees_sentences,
-            rules=sees_rules,
+            sentences=ruleset.sees_rules,
+            rules=(*true_externals, *does_externals, clingo_helper.SHOW_SEES),
             context="sees",
         )
         legal_ctl = ControlContainer.get_ctl(
-            sentences=ruleset.rules,
+            sentences=ruleset.legal_rules,
             rules=(
-                *clingo_helper.EXTERNALS,
+                *true_externals,
+                *does_externals,
                 clingo_helper.SHOW_LEGAL,
             ),
             context="legal",
         )
         goal_ctl = ControlContainer.get_ctl(
-            sentences=ruleset.rules,
+            sentences=ruleset.goal_rules,
             rules=(
-                *clingo_helper.EXTERNALS,
+                *true_externals,
+                *does_externals,
                 clingo_helper.SHOW_GOAL,
             ),
             context="goal",
         )
         terminal_ctl = ControlContainer.get_ctl(
-            sentences=ruleset.rules,
+            sentences=ruleset.terminal_rules,
             rules=(
-                *clingo_helper.EXTERNALS,
+                *true_externals,
+                *does_externals,
                 clingo_helper.SHOW_TERMINAL,
             ),
             context="terminal",
@@ -93,10 +166,13 @@ class ControlContainer:
             role=role_ctl,
             init=init_ctl,
             next=next_ctl,
+            next_state_to_literal=dict.fromkeys(unread_fluents, 0),
+            all_next=all_next_ctl,
             sees=sees_ctl,
             legal=legal_ctl,
             goal=goal_ctl,
             terminal=terminal_ctl,
+            latches=latches,
         )
 
     @staticmethod
@@ -142,6 +218,221 @@ class ControlContainer:
             log.debug("%s: %s", context, message)
 
 
+@dataclass(frozen=True)
+class ControlContainerPool:
+    """Replicas of a control container, each of which is used by at most one thread at a time.
+
+    Checking out is reentrant, a thread that already holds a replica keeps using it. Otherwise, a thread waits until a
+    replica is checked in.
+
+    """
+
+    replicas: ControlContainerQueue = field(default_factory=ControlContainerQueue, repr=False)
+    "Replicas that are not checked out."
+    size: int = 0
+    "Number of replicas."
+    _held: threading.local = field(default_factory=threading.local, repr=False, compare=False)
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        size: int,
+        control_containers: Sequence[ControlContainer] = (),
+    ) -> Self:
+        """Create a pool of replicas of the control container of a ruleset.
+
+        Missing replicas are grounded in parallel, as clingo releases the GIL while grounding.
+
+        Args:
+            ruleset: Ruleset to create the control containers from
+            size: Number of replicas
+            control_containers: Replicas that already exist
+
+        Returns:
+            Pool of replicas
+
+        """
+        missing = max(0, size - len(control_containers))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, missing)) as executor:
+            grounded = executor.map(lambda _: ControlContainer.from_ruleset(ruleset), range(missing))
+            replicas = (*control_containers, *grounded)
+        pool = cls(size=len(replicas))
+        for replica in replicas:
+            pool.replicas.put(replica)
+        return pool
+
+    @contextlib.contextmanager
+    def checkout(self) -> Iterator[ControlContainer]:
+        """Check out a replica for the duration of the context.
+
+        Yields:
+            Replica that is used by no other thread
+
+        """
+        held = getattr(self._held, "control_container", None)
+        if held is not None:
+            yield held
+            return
+        control_container = self.replicas.get()
+        self._held.control_container = control_container
+        try:
+            yield control_container
+        finally:
+            self._held.control_container = None
+            self.replicas.put(control_container)
+
+
+def get_dependencies(ruleset: gdl.Ruleset, *rules: Iterable[gdl.Sentence]) -> Sequence[gdl.Sentence]:
+    """Get the rules of a ruleset that are in any of the given subsequences.
+
+    Args:
+        ruleset: Ruleset
+        rules: Subsequences of the rules of the ruleset, e.g. `ruleset.next_rules`
+
+    Returns:
+        Rules in the original order
+
+    """
+    selected = {rule for subsequence in rules for rule in subsequence}
+    return tuple(rule for rule in ruleset.rules if rule in selected)
+
+
+MAX_GROUND_RULES: int = 1_000_000
+"""Maximal number of ground rules of a ground program.
+
+Larger programs, e.g. of games with arithmetic over large ranges, take longer to analyze than the clingo interpreter
+takes to answer the queries of a full match.
+
+"""
+
+
+class _AbortGroundingError(Exception):
+    pass
+
+
+class _GroundProgramObserver(clingo.Observer):
+    def __init__(self, max_rules: int) -> None:
+        self.max_rules = max_rules
+        self.rules: List[Tuple[int, Sequence[int]]] = []
+        self.unsupported: Optional[str] = None
+
+    def rule(self, choice: bool, head: Sequence[int], body: Sequence[int]) -> None:  # noqa: FBT001
+        if choice:
+            self._abort("choice rules")
+        if len(head) > 1:
+            self._abort("disjunctive rules")
+        if len(self.rules) >= self.max_rules:
+            self._abort(f"more than {self.max_rules} ground rules")
+        # Integrity constraints have no head, they are recorded with the head 0.
+        self.rules.append((head[0] if head else 0, tuple(body)))
+
+    def weight_rule(
+        self,
+        choice: bool,  # noqa: ARG002, FBT001
+        head: Sequence[int],  # noqa: ARG002
+        lower_bound: int,  # noqa: ARG002
+        body: Sequence[Tuple[int, int]],  # noqa: ARG002
+    ) -> None:
+        self._abort("aggregates")
+
+    def _abort(self, reason: str) -> None:
+        # Raising aborts grounding, hence unsupported rules fail fast.
+        self.unsupported = reason
+        raise _AbortGroundingError
+
+
+@dataclass(frozen=True)
+class GroundProgram:
+    """Normal rules and integrity constraints of a grounded program, over the literals of its control."""
+
+    ctl: clingo.Control
+    "Grounded control."
+    rules: Mapping[int, Sequence[Sequence[int]]]
+    "Bodies of the rules by their head."
+    constraints: Sequence[Sequence[int]]
+    "Bodies of the integrity constraints."
+
+    @classmethod
+    def from_rules(
+        cls,
+        sentences: Sequence[gdl.Sentence],
+        rules: Iterable[clingo_ast.AST],
+        *,
+        max_rules: int = MAX_GROUND_RULES,
+    ) -> Self:
+        """Ground sentences and rules, and record the ground program.
+
+        Args:
+            sentences: Sentences to ground
+            rules: Further rules to ground, e.g. external statements
+            max_rules: Maximal number of ground rules
+
+        Returns:
+            Ground program
+
+        Raises:
+            UnsupportedRulesInterpreterError: The rules use choices, disjunctions, or aggregates, or ground to more
+                than max_rules rules
+
+        """
+        ctl = _get_ctl(sentences=sentences, rules=rules)
+        observer = _GroundProgramObserver(max_rules)
+        ctl.register_observer(observer)
+        try:
+            ctl.ground((("base", ()),))
+        except _AbortGroundingError:
+            raise UnsupportedRulesInterpreterError(observer.unsupported) from None
+        head_to_bodies: DefaultDict[int, List[Sequence[int]]] = collections.defaultdict(list)
+        constraints = []
+        for head, body in observer.rules:
+            if head:
+                head_to_bodies[head].append(body)
+            else:
+                constraints.append(body)
+        return cls(ctl=ctl, rules=head_to_bodies, constraints=constraints)
+
+    def get_atoms(self, name: str, arity: int) -> Iterator[Tuple[clingo.Symbol, Optional[int]]]:
+        """Get the ground atoms of a signature.
+
+        Args:
+            name: Name of the signature
+            arity: Arity of the signature
+
+        Yields:
+            Ground atoms ordered by their string representation, with their literal, or None if they are facts
+
+        """
+        for symbolic_atom in sorted(self.ctl.symbolic_atoms.by_signature(name=name, arity=arity), key=_get_key):
+            yield symbolic_atom.symbol, None if symbolic_atom.is_fact else symbolic_atom.literal
+
+
+def _get_key(symbolic_atom: clingo.SymbolicAtom) -> str:
+    return str(symbolic_atom.symbol)
+
+
+def get_ground_externals(ctl: clingo.Control, name: str, arity: int) -> Iterator[clingo_ast.AST]:
+    """Get external statements for the ground atoms of a signature.
+
+    Args:
+        ctl: Grounded control
+        name: Name of the signature
+        arity: Arity of the signature
+
+    Yields:
+        External statement for each ground atom
+
+    """
+    for symbolic_atom in ctl.symbolic_atoms.by_signature(name=name, arity=arity):
+        yield clingo_helper.create_external(
+            atom=clingo_helper.create_atom(clingo_helper.create_symbolic_term(symbolic_atom.symbol)),
+        )
+
+
+def _get_fluent(symbol: clingo.Symbol) -> gdl.Subrelation:
+    return gdl.Subrelation.from_clingo_symbol(symbol.arguments[0])
+
+
 def lookup_state_literal(
     ctl: clingo.Control,
     subrelation: gdl.Subrelation,
@@ -164,7 +455,9 @@ def _set_state(
     state_to_literal: MutableStateLiteralMapping,
     current: Union[State, View],
 ) -> Iterator[clingo.Control]:
-    ground_literals = tuple(lookup_state_literal(ctl, subrelation, state_to_literal) for subrelation in current)
+    literals = (lookup_state_literal(ctl, subrelation, state_to_literal) for subrelation in current)
+    # Literal 0 stands for fluents that are unknown to or not read by the control.
+    ground_literals = tuple(literal for literal in literals if literal)
     try:
         for ground_literal in ground_literals:
             ctl.assign_external(external=ground_literal, truth=True)
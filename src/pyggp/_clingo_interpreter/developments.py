@@ -7,7 +7,7 @@ from clingo import ast as clingo_ast
 
 from pyggp import _clingo as clingo_helper
 from pyggp import game_description_language as gdl
-from pyggp._clingo_interpreter.base import _get_ctl, _transform_model
+from pyggp._clingo_interpreter.base import _get_ctl, _ground, _record_solve, _transform_model
 from pyggp._clingo_interpreter.control_containers import ControlContainer
 from pyggp._clingo_interpreter.shape_containers import ShapeContainer
 from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
@@ -55,7 +55,8 @@ def _get_developments_models(
     *,
     timeout: Optional[float] = None,
 ) -> Iterator[Sequence[clingo.Symbol]]:
-    ctl.ground(
+    _ground(
+        ctl,
         (
             ("base", ()),
             ("static", ()),
@@ -81,6 +82,7 @@ def _get_developments_models(
                 handle.cancel()
                 raise ModelTimeoutInterpreterError
             model = handle.model()
+    _record_solve(ctl)
 
 
 def transform_developments_model(symbols: Iterable[clingo.Symbol], offset: int, horizon: int) -> Development:
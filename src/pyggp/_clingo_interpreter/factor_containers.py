@@ -0,0 +1,281 @@
+"""Factoring of games into independent groups of fluents.
+
+Some games consist of sub-boards that never interact, e.g. the corridors of the split corridor games. The fluents of a
+sub-board only depend on fluents of the same sub-board and on the moves of the turn. The factoring analysis grounds the
+rules each query depends on, records the ground dependencies between atoms, and groups the fluents into factors, i.e.
+the connected components of the relation "the next value of a fluent depends on the value of another fluent". The next
+state of a factor is then a function of the factor's part of the state and the moves it depends on only.
+
+For the other queries, the analysis records their support, i.e. the fluents they depend on. Their results are
+functions of the support's part of the state only.
+
+"""
+
+import collections
+from dataclasses import dataclass, field
+from typing import (
+    AbstractSet,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import clingo
+from clingo import ast as clingo_ast
+from typing_extensions import Self
+
+from pyggp import _clingo as clingo_helper
+from pyggp import game_description_language as gdl
+from pyggp._clingo_interpreter.base import _get_ctl
+from pyggp._clingo_interpreter.control_containers import get_dependencies, get_ground_externals
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp.engine_primitives import Move, Role
+
+Action = Tuple[Role, Move]
+
+
+class _DependencyObserver(clingo.Observer):
+    def __init__(self) -> None:
+        self.dependencies: DefaultDict[int, Set[int]] = collections.defaultdict(set)
+
+    def rule(self, choice: bool, head: Sequence[int], body: Sequence[int]) -> None:  # noqa: ARG002, FBT001
+        for atom in head:
+            self.dependencies[atom].update(abs(literal) for literal in body)
+
+    def weight_rule(
+        self,
+        choice: bool,  # noqa: ARG002, FBT001
+        head: Sequence[int],
+        lower_bound: int,  # noqa: ARG002
+        body: Sequence[Tuple[int, int]],
+    ) -> None:
+        for atom in head:
+            self.dependencies[atom].update(abs(literal) for literal, _ in body)
+
+
+@dataclass(frozen=True)
+class FactorContainer:
+    """Factors of a game, and the supports of its queries.
+
+    Fluents and actions that do not occur in the shapes of the game are not part of any factor or support.
+
+    """
+
+    factors: Sequence[FrozenSet[gdl.Subrelation]] = field(default_factory=tuple)
+    "Independent groups of fluents."
+    factor_actions: Sequence[FrozenSet[Action]] = field(default_factory=tuple)
+    "Actions the next state of each factor depends on."
+    terminal_support: FrozenSet[gdl.Subrelation] = field(default_factory=frozenset)
+    "Fluents terminality depends on."
+    goal_supports: Mapping[Role, FrozenSet[gdl.Subrelation]] = field(default_factory=dict)
+    "Fluents the goal of each role depends on."
+    legal_supports: Mapping[Role, FrozenSet[gdl.Subrelation]] = field(default_factory=dict)
+    "Fluents the legal moves of each role depend on."
+    sees_supports: Mapping[Role, FrozenSet[gdl.Subrelation]] = field(default_factory=dict)
+    "Fluents the percepts of each role depend on."
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(cls, ruleset: gdl.Ruleset, shape_container: ShapeContainer) -> Self:
+        """Analyse the dependencies of a ruleset.
+
+        Args:
+            ruleset: Ruleset
+            shape_container: Shapes of the ruleset
+
+        Returns:
+            Factors of the ruleset
+
+        """
+        next_analysis = _Analysis.from_rules(
+            get_dependencies(ruleset, ruleset.next_rules, ruleset.init_rules, ruleset.role_rules, ruleset.legal_rules),
+            clingo_helper.EXTERNALS,
+            shape_container,
+        )
+        externals = (
+            *get_ground_externals(next_analysis.ctl, name="true", arity=1),
+            *get_ground_externals(next_analysis.ctl, name="does", arity=2),
+        )
+        next_fluents: Dict[gdl.Subrelation, FrozenSet[gdl.Subrelation]] = {}
+        next_actions: Dict[gdl.Subrelation, FrozenSet[Action]] = {}
+        for symbolic_atom in next_analysis.ctl.symbolic_atoms.by_signature(name="next", arity=1):
+            fluent = gdl.Subrelation.from_clingo_symbol(symbolic_atom.symbol.arguments[0])
+            next_fluents[fluent], next_actions[fluent] = next_analysis.get_support(symbolic_atom.literal)
+
+        factors = _get_components(shape_container.state_shape, next_fluents)
+        factor_actions = tuple(
+            frozenset(action for fluent in factor for action in next_actions.get(fluent, ())) for factor in factors
+        )
+        terminal_analysis = _Analysis.from_rules(ruleset.terminal_rules, externals, shape_container)
+        goal_analysis = _Analysis.from_rules(ruleset.goal_rules, externals, shape_container)
+        legal_analysis = _Analysis.from_rules(ruleset.legal_rules, externals, shape_container)
+        sees_analysis = _Analysis.from_rules(ruleset.sees_rules, externals, shape_container)
+        return cls(
+            factors=factors,
+            factor_actions=factor_actions,
+            terminal_support=terminal_analysis.get_signature_support("terminal", 0),
+            goal_supports=goal_analysis.get_role_supports("goal"),
+            legal_supports=legal_analysis.get_role_supports("legal"),
+            sees_supports=sees_analysis.get_role_supports("sees"),
+        )
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def is_factored(self) -> bool:
+        """Whether there is more than one factor."""
+        return len(self.factors) > 1
+
+    # endregion
+
+
+@dataclass
+class _Analysis:
+    ctl: clingo.Control
+    dependencies: Mapping[int, AbstractSet[int]]
+    fluents: Sequence[gdl.Subrelation]
+    actions: Sequence[Action]
+    atom_to_mask: Mapping[int, int]
+    # Supports are bitmasks over the fluents, followed by the actions, as unions of sets are too slow for large games.
+    _masks: MutableMapping[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_rules(
+        cls,
+        sentences: Sequence[gdl.Sentence],
+        rules: Iterable[clingo_ast.AST],
+        shape_container: ShapeContainer,
+    ) -> Self:
+        ctl = _get_ctl(sentences=sentences, rules=rules)
+        observer = _DependencyObserver()
+        ctl.register_observer(observer)
+        ctl.ground((("base", ()),))
+        fluent_atoms: List[Tuple[int, gdl.Subrelation]] = []
+        for symbolic_atom in ctl.symbolic_atoms.by_signature(name="true", arity=1):
+            fluent = gdl.Subrelation.from_clingo_symbol(symbolic_atom.symbol.arguments[0])
+            if fluent in shape_container.state_shape:
+                fluent_atoms.append((symbolic_atom.literal, fluent))
+        action_atoms: List[Tuple[int, Action]] = []
+        for symbolic_atom in ctl.symbolic_atoms.by_signature(name="does", arity=2):
+            role_symbol, move_symbol = symbolic_atom.symbol.arguments
+            role = Role(gdl.Subrelation.from_clingo_symbol(role_symbol))
+            action_atoms.append((symbolic_atom.literal, (role, Move(gdl.Subrelation.from_clingo_symbol(move_symbol)))))
+        atoms = (*(atom for atom, _ in fluent_atoms), *(atom for atom, _ in action_atoms))
+        return cls(
+            ctl=ctl,
+            dependencies=observer.dependencies,
+            fluents=tuple(fluent for _, fluent in fluent_atoms),
+            actions=tuple(action for _, action in action_atoms),
+            atom_to_mask={atom: 1 << index for index, atom in enumerate(atoms)},
+        )
+
+    def get_support(self, atom: int) -> Tuple[FrozenSet[gdl.Subrelation], FrozenSet[Action]]:
+        if atom not in self._masks:
+            self._add_masks(atom)
+        mask = self._masks[atom]
+        fluents: Set[gdl.Subrelation] = set()
+        actions: Set[Action] = set()
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            index = bit.bit_length() - 1
+            if index < len(self.fluents):
+                fluents.add(self.fluents[index])
+            else:
+                actions.add(self.actions[index - len(self.fluents)])
+        return frozenset(fluents), frozenset(actions)
+
+    def _add_masks(self, root: int) -> None:
+        # Tarjan's algorithm, such that the supports of all dependencies of a strongly connected component are known
+        # before the support of the component itself.
+        indices: Dict[int, int] = {root: 0}
+        lowlinks: Dict[int, int] = {root: 0}
+        stack: List[int] = [root]
+        on_stack: Set[int] = {root}
+        work: List[Tuple[int, Iterator[int]]] = [(root, iter(self.dependencies.get(root, ())))]
+        while work:
+            atom, dependencies = work[-1]
+            for dependency in dependencies:
+                if dependency in self._masks:
+                    continue
+                if dependency not in indices:
+                    indices[dependency] = lowlinks[dependency] = len(indices)
+                    stack.append(dependency)
+                    on_stack.add(dependency)
+                    work.append((dependency, iter(self.dependencies.get(dependency, ()))))
+                    break
+                if dependency in on_stack:
+                    lowlinks[atom] = min(lowlinks[atom], indices[dependency])
+            else:
+                work.pop()
+                if work:
+                    parent, _ = work[-1]
+                    lowlinks[parent] = min(lowlinks[parent], lowlinks[atom])
+                if lowlinks[atom] == indices[atom]:
+                    component = []
+                    while not component or component[-1] != atom:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                    self._add_component_mask(component)
+
+    def _add_component_mask(self, component: Sequence[int]) -> None:
+        mask = 0
+        for atom in component:
+            mask |= self.atom_to_mask.get(atom, 0)
+            for dependency in self.dependencies.get(atom, ()):
+                mask |= self._masks.get(dependency, 0)
+        for atom in component:
+            self._masks[atom] = mask
+
+    def get_signature_support(self, name: str, arity: int) -> FrozenSet[gdl.Subrelation]:
+        return frozenset(
+            fluent
+            for symbolic_atom in self.ctl.symbolic_atoms.by_signature(name=name, arity=arity)
+            for fluent in self.get_support(symbolic_atom.literal)[0]
+        )
+
+    def get_role_supports(self, name: str) -> Mapping[Role, FrozenSet[gdl.Subrelation]]:
+        supports: DefaultDict[Role, Set[gdl.Subrelation]] = collections.defaultdict(set)
+        for symbolic_atom in self.ctl.symbolic_atoms.by_signature(name=name, arity=2):
+            role = Role(gdl.Subrelation.from_clingo_symbol(symbolic_atom.symbol.arguments[0]))
+            supports[role].update(self.get_support(symbolic_atom.literal)[0])
+        return {role: frozenset(support) for role, support in supports.items()}
+
+
+def _get_components(
+    fluents: Iterable[gdl.Subrelation],
+    dependencies: Mapping[gdl.Subrelation, Iterable[gdl.Subrelation]],
+) -> Sequence[FrozenSet[gdl.Subrelation]]:
+    parents: Dict[gdl.Subrelation, gdl.Subrelation] = {fluent: fluent for fluent in fluents}
+
+    def find(fluent: gdl.Subrelation) -> gdl.Subrelation:
+        while parents[fluent] != fluent:
+            parents[fluent] = parents[parents[fluent]]
+            fluent = parents[fluent]
+        return fluent
+
+    for fluent, dependency_fluents in dependencies.items():
+        if fluent not in parents:
+            continue
+        for dependency_fluent in dependency_fluents:
+            if dependency_fluent in parents:
+                parents[find(fluent)] = find(dependency_fluent)
+
+    components: DefaultDict[gdl.Subrelation, List[gdl.Subrelation]] = collections.defaultdict(list)
+    for fluent in parents:
+        components[find(fluent)].append(fluent)
+    return tuple(
+        sorted((frozenset(component) for component in components.values()), key=lambda factor: min(map(str, factor))),
+    )
@@ -0,0 +1,108 @@
+"""Detection of latches, i.e. fluents that once true stay true.
+
+Many games keep fluents by frame axioms of the form `next(F) :- true(F), ...`, where all other literals of the body are
+static, such as placed pieces in the Connect games. Such fluents are latches: whenever they hold, they hold in every
+next state. Hence, they can be carried over without solving, and their frame axioms can be left out of the next
+controls.
+
+"""
+
+from typing import AbstractSet, Collection, FrozenSet, Iterable, Sequence
+
+from clingo import ast as clingo_ast
+
+from pyggp import _clingo as clingo_helper
+from pyggp import game_description_language as gdl
+from pyggp._clingo_interpreter.base import _get_ctl, _get_model, _transform
+from pyggp._clingo_interpreter.temporal_rule_containers import (
+    TemporalRuleContainer,
+    next_signature,
+    true_signature,
+)
+
+
+def get_latch_rules(ruleset: gdl.Ruleset) -> Sequence[gdl.Sentence]:
+    """Get the frame axioms of latches.
+
+    A frame axiom of a latch is a next rule whose head is `next(F)`, whose body contains `true(F)` for the same term
+    `F`, and whose remaining body literals are static.
+
+    Args:
+        ruleset: Ruleset
+
+    Returns:
+        Frame axioms of latches, in the original order
+
+    """
+    static_categorization, _ = TemporalRuleContainer.categorize_signatures(ruleset.rules)
+    return tuple(
+        rule
+        for rule in ruleset.next_rules
+        if rule.head.signature == next_signature and _is_latch_rule(rule, static_categorization.keys())
+    )
+
+
+def get_latches(
+    ruleset: gdl.Ruleset,
+    latch_rules: Sequence[gdl.Sentence],
+    externals: Iterable[clingo_ast.AST],
+) -> FrozenSet[gdl.Subrelation]:
+    """Get the ground fluents that are kept by frame axioms of latches.
+
+    The static literals of a frame axiom do not depend on the state, hence a ground fluent is kept in any state if it
+    is kept in the state in which all fluents are true.
+
+    Args:
+        ruleset: Ruleset
+        latch_rules: Frame axioms of latches
+        externals: Ground external statements of all fluents and moves
+
+    Returns:
+        Ground fluents that are latches
+
+    """
+    if not latch_rules:
+        return frozenset()
+    static_categorization, _ = TemporalRuleContainer.categorize_signatures(ruleset.rules)
+    latch_rule_set = frozenset(latch_rules)
+    sentences = tuple(
+        rule for rule in ruleset.next_rules if rule in latch_rule_set or rule.head.signature in static_categorization
+    )
+    ctl = _get_ctl(sentences=sentences, rules=(*externals, clingo_helper.SHOW_NEXT), models=2)
+    ctl.ground((("base", ()),))
+    for symbolic_atom in ctl.symbolic_atoms.by_signature(name="true", arity=1):
+        ctl.assign_external(symbolic_atom.literal, truth=True)
+    return frozenset(_transform(symbol, unpack=0) for symbol in _get_model(ctl))
+
+
+def get_unread_fluents(
+    rules: Iterable[gdl.Sentence],
+    state_shape: Collection[gdl.Subrelation],
+) -> FrozenSet[gdl.Subrelation]:
+    """Get the ground fluents that do not occur in any body of the given rules.
+
+    Args:
+        rules: Rules
+        state_shape: Ground fluents
+
+    Returns:
+        Ground fluents whose truth does not matter to the rules
+
+    """
+    patterns = tuple(
+        literal.atom.arguments[0] for rule in rules for literal in rule.body if literal.atom.signature == true_signature
+    )
+    return frozenset(fluent for fluent in state_shape if not any(pattern.unifies(fluent) for pattern in patterns))
+
+
+def _is_latch_rule(rule: gdl.Sentence, static_signatures: AbstractSet[gdl.Relation.Signature]) -> bool:
+    (fluent,) = rule.head.arguments
+    keeps_fluent = False
+    for literal in rule.body:
+        if literal.atom.signature == true_signature:
+            if literal.sign != gdl.Literal.Sign.NOSIGN or literal.atom.arguments[0] != fluent or keeps_fluent:
+                return False
+            keeps_fluent = True
+        elif literal.atom.signature not in static_signatures:
+            return False
+    return keeps_fluent
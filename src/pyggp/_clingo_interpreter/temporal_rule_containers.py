@@ -1,6 +1,6 @@
 import collections
 from dataclasses import dataclass
-from typing import Iterator, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Union
+from typing import Iterator, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Union
 
 import clingo
 from clingo import ast as clingo_ast
@@ -77,6 +77,13 @@ def create_temporal_function(
     return clingo_helper.create_function(name=name, arguments=(*arguments, time_ast))
 
 
+def _parse_rule_strs(rule_strs: Sequence[str]) -> Tuple[clingo_ast.AST, ...]:
+    rules: List[clingo_ast.AST] = []
+    clingo_ast.parse_string("\n".join(rule_strs), rules.append)
+    # clingo starts every parsed program with an implicit '#program base.'.
+    return tuple(rules[1:])
+
+
 @dataclass(frozen=True)
 class TemporalRuleContainer:
     static: Sequence[clingo_ast.AST]
@@ -98,6 +105,19 @@ class TemporalRuleContainer:
             dynamic_categorization=dynamic_categorization,
         )
 
+    @classmethod
+    def from_strs(cls, static: Sequence[str], dynamic: Sequence[str], statemachine: Sequence[str]) -> Self:
+        """Create a temporal rule container from the string representations of its rules.
+
+        Inverse of :meth:`as_strs`.
+
+        """
+        return cls(
+            static=_parse_rule_strs(static),
+            dynamic=_parse_rule_strs(dynamic),
+            statemachine=_parse_rule_strs(statemachine),
+        )
+
     @classmethod
     def transform_sentences(
         cls,
@@ -137,6 +157,14 @@ class TemporalRuleContainer:
         )
         return TemporalRuleContainer(static=static, dynamic=dynamic, statemachine=statemachine)
 
+    def as_strs(self) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+        """String representations of the static, dynamic, and statemachine rules."""
+        return (
+            tuple(str(rule) for rule in self.static),
+            tuple(str(rule) for rule in self.dynamic),
+            tuple(str(rule) for rule in self.statemachine),
+        )
+
     @staticmethod
     def categorize_signatures(
         sentences: Sequence[gdl.Sentence],
@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from typing import Mapping, Tuple
+
+import clingo
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp.engine_primitives import Move, Role
+
+
+@dataclass(frozen=True)
+class TranslationContainer:
+    """Translation tables from shown clingo symbols to prebuilt objects.
+
+    The tables are captured once from the shapes of a ruleset. Translating a model is then a lookup per symbol,
+    instead of a (recursive) transformation of each symbol.
+
+    """
+
+    next_symbol_to_state: Mapping[clingo.Symbol, gdl.Subrelation] = field(default_factory=dict)
+    "Maps symbols of the form next(F) to the subrelation F."
+    sees_symbol_to_view: Mapping[clingo.Symbol, Tuple[Role, gdl.Subrelation]] = field(default_factory=dict)
+    "Maps symbols of the form sees(R, F) to the pair (R, F)."
+    legal_symbol_to_action: Mapping[clingo.Symbol, Tuple[Role, Move]] = field(default_factory=dict)
+    "Maps symbols of the form legal(R, M) to the pair (R, M)."
+    does_symbol_to_action: Mapping[clingo.Symbol, Tuple[Role, Move]] = field(default_factory=dict)
+    "Maps symbols of the form does(R, M) to the pair (R, M)."
+
+    @classmethod
+    def from_shape_container(cls, shape_container: ShapeContainer) -> Self:
+        next_symbol_to_state = {
+            clingo.Function("next", (subrelation.as_clingo_symbol(),)): subrelation
+            for subrelation in shape_container.state_shape
+        }
+        sees_symbol_to_view = {
+            clingo.Function("sees", (role.as_clingo_symbol(), subrelation.as_clingo_symbol())): (role, subrelation)
+            for role, subrelations in shape_container.sees_shape.items()
+            for subrelation in subrelations
+        }
+        legal_symbol_to_action = {
+            clingo.Function("legal", (role.as_clingo_symbol(), move.as_clingo_symbol())): (role, move)
+            for role, moves in shape_container.action_shape.items()
+            for move in moves
+        }
+        does_symbol_to_action = {
+            clingo.Function("does", (role.as_clingo_symbol(), move.as_clingo_symbol())): (role, move)
+            for role, moves in shape_container.action_shape.items()
+            for move in moves
+        }
+        return cls(
+            next_symbol_to_state=next_symbol_to_state,
+            sees_symbol_to_view=sees_symbol_to_view,
+            legal_symbol_to_action=legal_symbol_to_action,
+            does_symbol_to_action=does_symbol_to_action,
+        )
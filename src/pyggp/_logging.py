@@ -1,13 +1,16 @@
 import base64
 import contextlib
+import copy
 import datetime
 import inspect
 import logging
+import logging.handlers
 import math
+import queue
 import time
 from dataclasses import dataclass, field
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Mapping, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Final, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, Union
 
 import inflection
 from typing_extensions import ParamSpec
@@ -202,6 +205,7 @@ class TimeLogger(NoneContextManager):
     stop_time: Optional[float] = field(default=None)
     delta: Optional[float] = field(default=None)
     args: Tuple[Any, ...] = field(default=())
+    enabled: bool = field(default=True)
 
     def get_begin_msg(self) -> Optional[str]:
         return self.begin_msg() if callable(self.begin_msg) else self.begin_msg
@@ -234,8 +238,10 @@ class TimeLogger(NoneContextManager):
         self.log.log(self.level, abort_msg, *self.args)
 
     def __enter__(self) -> None:
+        self.enabled = self.log.isEnabledFor(self.level)
         self.start_time = time.monotonic()
-        self.log_begin()
+        if self.enabled:
+            self.log_begin()
 
     def __exit__(
         self,
@@ -246,10 +252,11 @@ class TimeLogger(NoneContextManager):
         assert self.start_time is not None, "Assumption: start_time is not None (__enter__ was called)"
         self.stop_time: float = time.monotonic()
         self.delta = self.stop_time - self.start_time
-        if exc_val is not None:
-            self.log_abort()
-        else:
-            self.log_end()
+        if self.enabled:
+            if exc_val is not None:
+                self.log_abort()
+            else:
+                self.log_end()
 
         self.start_time = None
         self.stop_time = None
@@ -266,6 +273,111 @@ def log_time(
     return TimeLogger(log=log, level=level, begin_msg=begin_msg, end_msg=end_msg, abort_msg=abort_msg, args=args)
 
 
+@dataclass(frozen=True)
+class Lazy:
+    """Argument of a log message that is only computed if the message is emitted.
+
+    Logging formats arguments with `%s` only when a record is handled, hence wrapping expensive arguments defers them
+    until then, and skips them entirely if the level is disabled.
+
+    """
+
+    func: Callable[..., Any]
+    "Function computing the argument."
+    args: Tuple[Any, ...] = field(default=())
+    "Arguments of the function."
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
+
+def lazy(func: Callable[..., Any], *args: Any) -> Lazy:
+    """Defer computing an argument of a log message.
+
+    Args:
+        func: Function computing the argument
+        args: Arguments of the function
+
+    Returns:
+        Deferred argument
+
+    Examples:
+        >>> str(lazy(format_amount, 1500))
+        '1.5k'
+
+    """
+    return Lazy(func, args)
+
+
+def lazy_rich(obj: Any) -> Lazy:
+    """Defer rendering an object as argument of a log message.
+
+    Args:
+        obj: Object to render
+
+    Returns:
+        Deferred rendering of the object
+
+    """
+    return Lazy(rich, (obj,))
+
+
+class _PreformattingQueueHandler(logging.handlers.QueueHandler):
+    # Merges the message with its arguments on the calling thread, as arguments may be mutated (e.g. trees during
+    # search) before the listener gets to them. Unlike the default, exception information is kept for the handlers.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _get_effective_handlers(logger: logging.Logger) -> List[logging.Handler]:
+    handlers: List[logging.Handler] = []
+    current: Optional[logging.Logger] = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
+
+
+@contextlib.contextmanager
+def background_logging(logger: logging.Logger = log) -> Iterator[None]:
+    """Handle the records of the logger on a background thread.
+
+    Messages are still merged with their arguments on the calling thread, but only for enabled levels. Rendering and
+    writing them, which is comparatively slow for rich output, happens on the background thread. On exit, all pending
+    records are handled and the handlers of the logger are restored.
+
+    Args:
+        logger: Logger whose records are handled in the background
+
+    Yields:
+        Nothing
+
+    """
+    handlers = _get_effective_handlers(logger)
+    if not handlers:
+        yield
+        return
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    queue_handler = _PreformattingQueueHandler(records)
+    propagate = logger.propagate
+    original_handlers = list(logger.handlers)
+    logger.handlers = [queue_handler]
+    logger.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        logger.handlers = original_handlers
+        logger.propagate = propagate
+
+
 def rich(obj: Any) -> str:
     if inspect.isclass(obj):
         return obj.__name__
@@ -8,7 +8,7 @@ import logging
 import random
 from dataclasses import dataclass, field
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Final, MutableSequence, Optional, Protocol, Sequence, Type
+from typing import TYPE_CHECKING, Any, Callable, Final, MutableSequence, Optional, Protocol, Sequence, Type, Union
 
 import rich.console as rich_console
 import rich.prompt as rich_prompt
@@ -16,7 +16,7 @@ from rich import print
 from typing_extensions import ParamSpec, Self
 
 import pyggp.game_description_language as gdl
-from pyggp._logging import format_id, rich
+from pyggp._logging import format_id, lazy_rich, rich
 from pyggp.cli.argument_specification import ArgumentSpecification
 from pyggp.engine_primitives import Move, Role, View
 from pyggp.gameclocks import GameClock
@@ -113,12 +113,12 @@ class _AbstractAgent(Agent, abc.ABC):
     def set_up(self) -> None:
         """Sets up the agent and all its required resources."""
         # Disables coverage. Because this not really testable.
-        log.debug("Setting up %s", rich(self))  # pragma: no cover
+        log.debug("Setting up %s", lazy_rich(self))  # pragma: no cover
 
     def tear_down(self) -> None:
         """Destroys all resources of the agent."""
         # Disables coverage. Because this not really testable.
-        log.debug("Tearing down %s", rich(self))  # pragma: no cover
+        log.debug("Tearing down %s", lazy_rich(self))  # pragma: no cover
 
     def prepare_match(
         self,
@@ -139,17 +139,17 @@ class _AbstractAgent(Agent, abc.ABC):
         # Disables coverage. Because this not really testable.
         log.debug(  # pragma: no cover
             "Preparing %s for match, role=%s, ruleset=%s, startclock_config=%s, playclock_config=%s",
-            rich(self),
-            rich(role),
-            rich(ruleset),
-            rich(startclock_config),
-            rich(playclock_config),
+            lazy_rich(self),
+            lazy_rich(role),
+            lazy_rich(ruleset),
+            lazy_rich(startclock_config),
+            lazy_rich(playclock_config),
         )
 
     def abort_match(self) -> None:
         """Aborts the current match."""
         # Disables coverage. Because this not really testable.
-        log.debug("Aborting match for %s", rich(self))  # pragma: no cover
+        log.debug("Aborting match for %s", lazy_rich(self))  # pragma: no cover
 
     def conclude_match(self, view: View) -> None:
         """Concludes the current match.
@@ -159,7 +159,7 @@ class _AbstractAgent(Agent, abc.ABC):
 
         """
         # Disables coverage. Because this not really testable.
-        log.debug("Concluding match for %s, view=%s", rich(self), rich(view))  # pragma: no cover
+        log.debug("Concluding match for %s, view=%s", lazy_rich(self), lazy_rich(view))  # pragma: no cover
 
     # endregion
 
@@ -179,9 +179,22 @@ class InterpreterAgent(_AbstractAgent, abc.ABC):
     playclock_config: Optional[GameClock.Configuration] = None
     interpreter: Optional[Interpreter] = field(default=None, repr=False)
     interpreter_factory: Callable[_P, Interpreter] = field(default=ClingoInterpreter.from_ruleset, repr=False)
+    seed: Optional[int] = field(default=None)
+    "Seed of the random number generator, None for a nondeterministic seed. Reproducible if PYTHONHASHSEED is set."
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    "Random number generator of the agent, from which all its stochastic components derive theirs."
 
     # endregion
 
+    def __post_init__(self) -> None:
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+
+    @classmethod
+    # Disables ARG003 (Unused class method argument). Because: Arguments other than seed are ignored, as in the base.
+    def from_cli(cls, *args: str, seed: Union[str, int, None] = None, **kwargs: str) -> Self:  # noqa: ARG003
+        return cls(seed=int(seed) if seed is not None else None)
+
     def __rich__(self) -> str:
         id_str = f"id={format_id(self)}"
         interpreter_str = f"interpreter={rich(self.interpreter)}"
@@ -189,6 +202,19 @@ class InterpreterAgent(_AbstractAgent, abc.ABC):
         attributes_str = f"{id_str}, {interpreter_str}, {interpreter_factory_str}"
         return f"{self.__class__.__name__}({attributes_str})"
 
+    def spawn_rng(self) -> random.Random:
+        """Derive a random number generator from the one of the agent.
+
+        Derived generators are seeded from the generator of the agent. Hence, they are reproducible if the agent is
+        seeded, and yield independent streams for components that are used independently of each other (e.g. in
+        different threads).
+
+        Returns:
+            Derived random number generator
+
+        """
+        return random.Random(self.rng.getrandbits(64))
+
     def prepare_match(
         self,
         role: Role,
@@ -206,7 +232,7 @@ class InterpreterAgent(_AbstractAgent, abc.ABC):
 
         """
         super().prepare_match(role, ruleset, startclock_config, playclock_config)
-        log.debug("Setting role, ruleset, startclock_config, playclock_config, and interpreter for %s", rich(self))
+        log.debug("Setting role, ruleset, startclock_config, playclock_config, and interpreter for %s", lazy_rich(self))
         self.role = role
         self.ruleset = ruleset
         self.startclock_config = startclock_config
@@ -222,7 +248,10 @@ class InterpreterAgent(_AbstractAgent, abc.ABC):
 
         """
         super().conclude_match(view)
-        log.debug("Deleting role, ruleset, startclock_config, playclock_config, and interpreter for %s", rich(self))
+        log.debug(
+            "Deleting role, ruleset, startclock_config, playclock_config, and interpreter for %s",
+            lazy_rich(self),
+        )
         self.role = None
         self.ruleset = None
         self.startclock_config = None
@@ -259,7 +288,7 @@ class ArbitraryAgent(InterpreterAgent):
         ), "Assumption: interpreter is not None (should have been set in prepare_match)"
         assert self.role is not None, "Assumption: role is not None (should have been set in prepare_match)"
         moves = self.interpreter.get_legal_moves_by_role(view, self.role)
-        return random.choice(tuple(moves))
+        return self.rng.choice(tuple(moves))
 
 
 @dataclass
@@ -288,7 +317,7 @@ class RandomAgent(InterpreterAgent):
         ), "Assumption: interpreter is not None (should have been set in prepare_match)"
         assert self.role is not None, "Assumption: role is not None (should have been set in prepare_match)"
         moves = self.interpreter.get_legal_moves_by_role(view, self.role)
-        return random.choice(tuple(moves))
+        return self.rng.choice(tuple(moves))
 
 
 MAX_DISPLAYED_OPTIONS: Final[int] = 10
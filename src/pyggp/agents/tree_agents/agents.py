@@ -4,6 +4,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Final, Generic, Mapping, Optional, Protocol, TypeVar
 
+from pyggp import metrics
 from pyggp._logging import format_ns, inflect_without_count, log_time
 from pyggp.agents import Agent, InterpreterAgent
 from pyggp.engine_primitives import Move, View
@@ -17,7 +18,7 @@ _E = TypeVar("_E")
 class TreeAgent(Agent, Protocol[_K, _E]):
     def update(self, ply: int, view: View, total_time_ns: int) -> None: ...
 
-    def search(self, search_time_ns: int) -> None: ...
+    def search(self, search_time_ns: int, max_search_time_ns: Optional[int] = None) -> None: ...
 
     def descend(self, key: _K) -> None: ...
 
@@ -38,7 +39,7 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         raise NotImplementedError
 
     @abc.abstractmethod
-    def search(self, search_time_ns: int) -> None:
+    def search(self, search_time_ns: int, max_search_time_ns: Optional[int] = None) -> None:
         raise NotImplementedError
 
     @abc.abstractmethod
@@ -50,29 +51,31 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         raise NotImplementedError
 
     def calculate_move(self, ply: int, total_time_ns: int, view: View) -> Move:
-        used_time = time.monotonic_ns()
+        start_ns = time.monotonic_ns()
+        used_time = start_ns
         with log_time(
             log,
             logging.DEBUG,
             inflect_without_count("tree", count=int(hasattr(self, "tree"))),
-            begin_msg=f"Updating %s",
-            end_msg=f"Updated %s",
-            abort_msg=f"Aborted updating %s",
+            begin_msg="Updating %s",
+            end_msg="Updated %s",
+            abort_msg="Aborted updating %s",
         ):
             self.update(ply, view, total_time_ns)
 
         used_time = time.monotonic_ns() - used_time
 
         search_time_ns = self._get_timeout_ns(total_time_ns, used_time)
+        max_search_time_ns = max(search_time_ns, self._get_max_timeout_ns(total_time_ns, used_time))
 
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg=f"Searching for at most {format_ns(search_time_ns)}",
+            begin_msg=lambda: f"Searching for at most {format_ns(search_time_ns)}",
             end_msg="Searched",
             abort_msg="Aborted searching",
         ):
-            self.search(search_time_ns)
+            self.search(search_time_ns, max_search_time_ns=max_search_time_ns)
 
         key_to_evaluation = self.get_key_to_evaluation()
 
@@ -90,8 +93,20 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         self._log_choice(best_move, move_to_aggregation, filtered_keys)
 
         self.descend(key)
+        if metrics.registry is not None:
+            self._record_move_metrics(ply, total_time_ns, time.monotonic_ns() - start_ns)
+            metrics.registry.flush()
         return best_move
 
+    def _record_move_metrics(self, ply: int, total_time_ns: int, elapsed_ns: int) -> None:
+        assert metrics.registry is not None, "Requirement: metrics are enabled"
+        registry = metrics.registry
+        registry.gauge("pyggp_agent_ply", role=self.role).set(ply)
+        registry.histogram("pyggp_agent_move_seconds", role=self.role).observe(elapsed_ns / ONE_S_IN_NS)
+        budget_ns = total_time_ns + self.playclock_config.delay_ns
+        if budget_ns > 0:
+            registry.gauge("pyggp_agent_time_budget_usage_ratio", role=self.role).set(elapsed_ns / budget_ns)
+
     @property
     def _net_zero_time_ns(self) -> int:
         return self.playclock_config.increment_ns + self.playclock_config.delay_ns
@@ -119,12 +134,10 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         remaining_moves = max(1, self._guess_remaining_moves()) if total_time_ns > 0 else 1
         using_time = max(0, total_time_ns // remaining_moves)
 
-        LOG_BUFFER = ONE_S_IN_NS if log.level == logging.DEBUG else 0
-        MIN_BUFFER = min_buffer + LOG_BUFFER
-        MAX_BUFFER = max_buffer + LOG_BUFFER
-
-        max_time = int(zero_time_ns * scale) - MIN_BUFFER
-        min_time = int(net_zero_time_ns * scale) - MAX_BUFFER
+        # Messages are still rendered on the calling thread, even if they are handled in the background.
+        log_buffer = ONE_S_IN_NS if log.isEnabledFor(logging.DEBUG) else 0
+        max_time = int(zero_time_ns * scale) - min_buffer - log_buffer
+        min_time = int(net_zero_time_ns * scale) - max_buffer - log_buffer
 
         timeout_ns = int((net_zero_time_ns + using_time) * scale)
         timeout_ns = max(min_time_ns, timeout_ns, min_time)
@@ -133,11 +146,23 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         timeout_ns = min(timeout_ns, max_time, max_time_ns)
         return timeout_ns
 
+    def _get_max_timeout_ns(
+        self,
+        total_time_ns: int,
+        used_time_ns: int,
+        *,
+        scale: float = 0.975,
+        min_buffer: int = ONE_S_IN_NS,
+    ) -> int:
+        # Latest time to stop without risking the clock, the bound that _get_timeout_ns clamps to.
+        zero_time_ns = total_time_ns + self.playclock_config.delay_ns - used_time_ns
+        return int(zero_time_ns * scale) - min_buffer
+
     def _guess_remaining_moves(self) -> int:
         return 128
 
     def _log_options(self, move_to_aggregation: Mapping[Move, _E], log_level: int = logging.DEBUG) -> None:
-        if log.level > log_level:
+        if not log.isEnabledFor(log_level):
             return
 
         msg_parts = []
@@ -186,7 +211,7 @@ class AbstractTreeAgent(InterpreterAgent, TreeAgent[_K, _E], Generic[_K, _E], ab
         filtered_keys: Mapping[_K, _E],
         log_level: int = logging.INFO,
     ) -> None:
-        if log.level > log_level:
+        if not log.isEnabledFor(log_level):
             return
 
         evaluation = move_to_aggregation[move]
@@ -1,17 +1,22 @@
 import abc
 import collections
+import heapq
 import logging
+import math
 import time
 from dataclasses import dataclass, field
 from typing import (
     Any,
     Callable,
+    Final,
     FrozenSet,
     Generic,
     Iterator,
     Mapping,
     MutableMapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     TypeVar,
     Union,
@@ -21,7 +26,18 @@ from typing import (
 from typing_extensions import ParamSpec, Self
 
 import pyggp.game_description_language as gdl
-from pyggp._logging import format_amount, format_id, format_ns, format_rate_ns, format_timedelta, log_time, rich
+from pyggp import metrics
+from pyggp._logging import (
+    format_amount,
+    format_id,
+    format_ns,
+    format_rate_ns,
+    format_timedelta,
+    lazy,
+    lazy_rich,
+    log_time,
+    rich,
+)
 from pyggp.agents import InterpreterAgent
 from pyggp.agents.tree_agents.agents import ONE_S_IN_NS, AbstractTreeAgent, TreeAgent
 from pyggp.agents.tree_agents.evaluators import Evaluator, final_goal_normalized_utility_evaluator
@@ -29,6 +45,7 @@ from pyggp.agents.tree_agents.mcts.evaluators import LightPlayoutEvaluator
 from pyggp.agents.tree_agents.mcts.selectors import (
     Selector,
     UCTSelector,
+    create_selector,
 )
 from pyggp.agents.tree_agents.mcts.valuations import NormalizedUtilityValuation
 from pyggp.agents.tree_agents.nodes import (
@@ -38,13 +55,14 @@ from pyggp.agents.tree_agents.nodes import (
     PerfectInformationNode,
     VisibleInformationSetNode,
 )
-from pyggp.books import Book, BookBuilder
+from pyggp.books import Book, BookBuilder, create_book
 from pyggp.cli.argument_specification import ArgumentSpecification
 from pyggp.engine_primitives import Move, Role, State, Turn, View
 from pyggp.gameclocks import GameClock
-from pyggp.interpreters import ClingoInterpreter, Interpreter
+from pyggp.interpreters import ClingoInterpreter, FactoredInterpreter, Interpreter, SymmetricInterpreter
+from pyggp.interpreters.base_interpreters import CachingInterpreter
 from pyggp.records import ImperfectInformationRecord, PerfectInformationRecord, Record
-from pyggp.repeaters import Repeater
+from pyggp.repeaters import ONE_MS_IN_NS, Repeater, get_rss_bytes
 
 log = logging.getLogger("pyggp")
 
@@ -55,6 +73,17 @@ _Total_Playouts = int
 _Utility = float
 _MCTSEvaluation = Tuple[_BookValue, _Total_Playouts, _Utility]
 
+_ITERATIONS_PER_SECOND_BUCKETS: Final[Tuple[float, ...]] = metrics.exponential_buckets(1, 4, 10)
+
+_CONTESTED_VISITS_RATIO: Final[float] = 0.9
+"Ratio of the visits of the runner-up to the visits of the best move, above which the search is extended."
+_MEMORY_PRESSURE_RATIO: Final[float] = 0.9
+"Ratio of the memory budget, above which memory is shed and the trees stop growing beyond their size at that time."
+_PRUNE_VISITS_RATIO: Final[float] = 0.01
+"Ratio of the visits of a tree, up to which its subtrees are pruned when shedding memory."
+_MEMORY_CHECK_INTERVAL_NS: Final[int] = 10 * ONE_MS_IN_NS
+"Minimal time between two checks of the memory usage."
+
 
 class MonteCarloTreeSearchAgent(TreeAgent[_K, _MCTSEvaluation]):
     step_repeater: Optional[Repeater[None]]
@@ -75,6 +104,15 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
     max_fill_time_s: float = field(default=float("inf"), repr=False)
     selector_factory: Callable[_P, Selector[float, _K]] = field(default=UCTSelector, repr=False)
     skip_book: bool = field(default=False, repr=False)
+    adaptive_time: bool = field(default=True, repr=False)
+    "Whether to stop searching once the best move is decided, and to extend searching while it is contested."
+    max_extension: float = field(default=0.5, repr=False)
+    "Maximal extension of the search, relative to the search time."
+    max_memory_bytes: Optional[int] = field(default=None, repr=False)
+    "Budget of the resident set size of the process in bytes, None for no budget."
+    _shed_rss_bytes: int = field(default=0, init=False, repr=False)
+    _max_tree_bytes: Optional[int] = field(default=None, init=False, repr=False)
+    _next_memory_check_ns: int = field(default=0, init=False, repr=False)
 
     @classmethod
     def from_cli(
@@ -85,6 +123,10 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
         interpreter: Optional[str] = None,
         selector: Optional[str] = None,
         skip_book: Union[str, bool] = False,
+        seed: Union[str, int, None] = None,
+        adaptive_time: Union[str, bool] = True,
+        max_extension: Union[str, float] = 0.5,
+        max_memory_bytes: Union[str, int, None] = None,
         *args: str,
         **kwargs: str,
     ) -> Self:
@@ -104,6 +146,14 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
             max_fill_time_s = float(max_fill_time_s)
         elif max_fill_time_s is None:
             max_fill_time_s = float("inf")
+        if isinstance(seed, str):
+            seed = int(seed)
+        if isinstance(adaptive_time, str):
+            adaptive_time = adaptive_time.casefold() in ("true", "1")
+        if isinstance(max_extension, (str, int)):
+            max_extension = float(max_extension)
+        if isinstance(max_memory_bytes, str):
+            max_memory_bytes = int(max_memory_bytes)
         return cls(
             *args,
             interpreter_factory=interpreter_factory,
@@ -112,6 +162,10 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
             max_expansion_depth=max_expansion_depth,
             max_fill_time_s=max_fill_time_s,
             skip_book=skip_book,
+            seed=seed,
+            adaptive_time=adaptive_time,
+            max_extension=max_extension,
+            max_memory_bytes=max_memory_bytes,
             **kwargs,
         )
 
@@ -136,25 +190,53 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
         )
         return f"{self.__class__.__name__}({attributes_str})"
 
-    def search(self, search_time_ns: int) -> None:
+    def search(self, search_time_ns: int, max_search_time_ns: Optional[int] = None) -> None:
         self.step_repeater.timeout_ns = search_time_ns
         with log_time(
             log,
             logging.DEBUG,
-            begin_msg=f"Starting MCTS at {rich(self.get_main_tree(logging.DEBUG))} for at most "
+            begin_msg=lambda: f"Starting MCTS at {rich(self.get_main_tree(logging.DEBUG))} for at most "
             f"{format_ns(search_time_ns)}",
             end_msg="Ended MCTS",
             abort_msg="Aborted MCTS",
         ):
             it, elapsed_ns = self.step_repeater()
+            extension_ns = self._get_extension_ns(search_time_ns, max_search_time_ns)
+            if extension_ns > 0 and self._is_contested():
+                log.debug("Extending MCTS by at most %s", lazy(format_ns, extension_ns))
+                self.step_repeater.timeout_ns = extension_ns
+                extension_it, extension_elapsed_ns = self.step_repeater()
+                it += extension_it
+                elapsed_ns += extension_elapsed_ns
+                if metrics.registry is not None:
+                    metrics.registry.counter("pyggp_mcts_extensions_total", role=self.role).inc()
 
         log.info(
             "Concluded MCTS after %s it in %s (%s it/s)",
-            format_amount(it),
-            format_ns(elapsed_ns),
-            format_rate_ns(it, elapsed_ns),
+            lazy(format_amount, it),
+            lazy(format_ns, elapsed_ns),
+            lazy(format_rate_ns, it, elapsed_ns),
         )
-        log.info("Choosing move at %s", rich(self.get_main_tree(logging.INFO)))
+        if metrics.registry is not None:
+            self._record_search_metrics(it, elapsed_ns)
+        log.info("Choosing move at %s", lazy_rich(self.get_main_tree(logging.INFO)))
+
+    def _record_search_metrics(self, it: int, elapsed_ns: int) -> None:
+        assert metrics.registry is not None, "Requirement: metrics are enabled"
+        registry = metrics.registry
+        registry.counter("pyggp_mcts_iterations_total", role=self.role).inc(it)
+        registry.counter("pyggp_mcts_search_seconds_total", role=self.role).inc(elapsed_ns / ONE_S_IN_NS)
+        if elapsed_ns > 0:
+            registry.histogram(
+                "pyggp_mcts_iterations_per_second",
+                buckets=_ITERATIONS_PER_SECOND_BUCKETS,
+                role=self.role,
+            ).observe(it * ONE_S_IN_NS / elapsed_ns)
+        tree = self.get_main_tree(logging.CRITICAL)
+        if tree is not None:
+            registry.gauge("pyggp_tree_nodes", role=self.role).set(tree.node_count)
+            registry.gauge("pyggp_tree_memory_estimate_bytes", role=self.role).set(tree.memory_estimate)
+            registry.gauge("pyggp_tree_max_height", role=self.role).set(tree.max_height)
 
     def _evaluation_as_str(self, evaluation: _MCTSEvaluation) -> str:
         book_value, total_playouts, utility = evaluation
@@ -169,6 +251,118 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
     def _can_lookup(self) -> bool:
         return False
 
+    def _should_stop_search(self) -> bool:
+        # Checked once per batch of steps, which is also often enough to keep the memory budget.
+        if self.max_memory_bytes is not None:
+            self._monitor_memory()
+        return self._can_lookup() or (self.adaptive_time and self._is_decided())
+
+    def _monitor_memory(self) -> None:
+        # Memory is shed once the budget is approached, and again whenever the process grows beyond the size at the
+        # last shedding. Freed memory is mostly reused instead of returned to the OS, hence the resident set size
+        # rarely shrinks. Instead, the trees stop growing once their estimated size reaches the size they had when the
+        # budget was approached, and grow again after shedding or re-rooting made them smaller.
+        assert self.max_memory_bytes is not None, "Requirement: max_memory_bytes is not None"
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_memory_check_ns:
+            return
+        self._next_memory_check_ns = now_ns + _MEMORY_CHECK_INTERVAL_NS
+        rss_bytes = get_rss_bytes()
+        if rss_bytes is None:
+            return
+        if metrics.registry is not None:
+            metrics.registry.gauge("pyggp_process_rss_bytes").set(rss_bytes)
+        if rss_bytes < self.max_memory_bytes * _MEMORY_PRESSURE_RATIO:
+            self._max_tree_bytes = None
+        elif rss_bytes > self._shed_rss_bytes:
+            log.info(
+                "Approaching memory budget at %sB of %sB",
+                lazy(format_amount, rss_bytes),
+                lazy(format_amount, self.max_memory_bytes),
+            )
+            self._max_tree_bytes = self._get_trees_memory_estimate()
+            self._shed_memory()
+            self._shed_rss_bytes = rss_bytes
+
+    def _is_under_memory_pressure(self) -> bool:
+        # Checked before every expansion, which is cheap, as the trees maintain their estimates incrementally.
+        return self._max_tree_bytes is not None and self._get_trees_memory_estimate() >= self._max_tree_bytes
+
+    def _get_trees_memory_estimate(self) -> int:
+        return sum(tree.memory_estimate for tree in self._get_trees())
+
+    def _shed_memory(self) -> None:
+        with log_time(
+            log,
+            logging.DEBUG,
+            begin_msg="Shedding memory",
+            end_msg="Shed memory",
+            abort_msg="Aborted shedding memory",
+        ):
+            pruned = sum(_prune(tree) for tree in self._get_trees())
+            interpreter = self.interpreter
+            if isinstance(interpreter, SymmetricInterpreter):
+                interpreter.symmetries.clear_cache()
+                interpreter = interpreter.interpreter
+            if isinstance(interpreter, FactoredInterpreter):
+                interpreter.cache.clear()
+                interpreter = interpreter.interpreter
+            if isinstance(interpreter, CachingInterpreter):
+                interpreter.cache.clear()
+            gdl.Subrelation.clear_caches()
+        log.debug("Pruned %s subtrees", pruned)
+        if metrics.registry is not None:
+            metrics.registry.counter("pyggp_mcts_memory_sheds_total", role=self.role).inc()
+            metrics.registry.counter("pyggp_mcts_pruned_subtrees_total", role=self.role).inc(pruned)
+
+    def _get_trees(self) -> Sequence[Node[float, Any]]:
+        tree = self._get_search_tree()
+        return (tree,) if tree is not None else ()
+
+    def _is_decided(self) -> bool:
+        # The best move is decided if it has more visits than the runner-up could gain in the remaining iterations, or
+        # if there are no alternatives at all.
+        tree = self._get_search_tree()
+        top_visits = self._get_top_visits()
+        if tree is None or top_visits is None:
+            return False
+        if len(top_visits) == 1:
+            decided = getattr(tree, "fully_expanded", True)
+        else:
+            best_visits, runner_up_visits = top_visits
+            decided = best_visits - runner_up_visits > self.step_repeater.get_remaining_repeats()
+        if decided and metrics.registry is not None:
+            metrics.registry.counter("pyggp_mcts_early_stops_total", role=self.role).inc()
+        return decided
+
+    def _is_contested(self) -> bool:
+        if self._can_lookup():
+            return False
+        top_visits = self._get_top_visits()
+        if top_visits is None or len(top_visits) == 1:
+            return False
+        best_visits, runner_up_visits = top_visits
+        return best_visits > 0 and runner_up_visits >= _CONTESTED_VISITS_RATIO * best_visits
+
+    def _get_extension_ns(self, search_time_ns: int, max_search_time_ns: Optional[int]) -> int:
+        if not self.adaptive_time or self.max_mcts_iterations is not None or max_search_time_ns is None:
+            return 0
+        return max(0, min(int(search_time_ns * self.max_extension), max_search_time_ns - search_time_ns))
+
+    def _get_top_visits(self) -> Optional[Sequence[int]]:
+        # Visits of the best and the runner-up move (if any), None if the root is not expanded yet.
+        tree = self._get_search_tree()
+        if tree is None or not tree.children:
+            return None
+        move_to_visits: MutableMapping[Move, int] = collections.defaultdict(int)
+        for key, child in tree.children.items():
+            move_to_visits[self._key_to_move(key)] += _get_visits(child)
+        return heapq.nlargest(2, move_to_visits.values())
+
+    @abc.abstractmethod
+    def _get_search_tree(self) -> Optional[Node[float, _K]]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def _lookup(self, key: Optional[_K] = None) -> float:
         raise NotImplementedError
@@ -178,6 +372,30 @@ class AbstractMCTSAgent(AbstractTreeAgent[_K, _MCTSEvaluation], MonteCarloTreeSe
         raise NotImplementedError
 
 
+def _get_visits(node: Node[float, Any]) -> int:
+    valuation = node.valuation
+    return valuation.total_playouts if valuation is not None and hasattr(valuation, "total_playouts") else 0
+
+
+def _prune(tree: Node[float, Any]) -> int:
+    # Collapses the subtrees of rarely visited nodes below the tree, keeping the valuations of the nodes themselves.
+    threshold = _get_visits(tree) * _PRUNE_VISITS_RATIO
+    pruned = 0
+    seen: Set[int] = set()
+    stack = list(tree.children.values()) if tree.children else []
+    while stack:
+        node = stack.pop()
+        if not node.children or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if _get_visits(node) <= threshold:
+            node.collapse()
+            pruned += 1
+        else:
+            stack.extend(node.children.values())
+    return pruned
+
+
 class SingleObserverMonteCarloTreeSearchAgent(MonteCarloTreeSearchAgent[_K]):
     tree: Optional[Node[float, _K]]
     selector: Optional[Selector[float, _K]]
@@ -207,14 +425,15 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
 
         self.tree = self._get_root()
 
-        self.selector = self.selector_factory(role=self.role)
+        self.selector = create_selector(self.selector_factory, role=self.role, rng=self.spawn_rng())
 
         self.step_repeater = Repeater(
             func=self.step,
             timeout_ns=playclock_config.delay_ns,
             max_repeats=self.max_mcts_iterations,
-            shortcircuit=self._can_lookup,
+            shortcircuit=self._should_stop_search,
             slack=1.5,
+            batched=True,
         )
 
         timeout_ns -= time.monotonic_ns()
@@ -223,12 +442,16 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
             role=self.role,
             final_state_evaluator=final_goal_normalized_utility_evaluator,
             book=self.book,
+            rng=self.spawn_rng(),
         )
 
     @abc.abstractmethod
     def _get_root(self) -> Node[float, _K]:
         raise NotImplementedError
 
+    def _get_search_tree(self) -> Optional[Node[float, _K]]:
+        return self.tree
+
     def step(self) -> None:
         assert self.tree is not None, "Requirement: tree is not None"
         assert self.selector is not None, "Requirement: selector is not None"
@@ -237,13 +460,16 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
         node = self.tree
         ply = node.depth
 
-        while node.children and (
-            self.max_expansion_depth is None or (node.depth - ply) < (self.max_expansion_depth - 1)
+        while (
+            node.children
+            and not self._can_widen(node)
+            and (self.max_expansion_depth is None or (node.depth - ply) < (self.max_expansion_depth - 1))
         ):
             key = self.selector(node)
             node = node.children[key]
 
-        node.expand(self.interpreter)
+        if not self._is_under_memory_pressure() or node is self.tree:
+            self._expand(node)
 
         utility = node.evaluate(
             interpreter=self.interpreter,
@@ -259,6 +485,13 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
             else:
                 node.valuation = NormalizedUtilityValuation.from_utility(utility)
 
+    # Disables ARG002 (Unused method argument). Because: Nodes are never widened, unless overridden.
+    def _can_widen(self, node: Node[float, _K]) -> bool:  # noqa: ARG002
+        return False
+
+    def _expand(self, node: Node[float, _K]) -> None:
+        node.expand(self.interpreter)
+
     def _can_lookup(self) -> bool:
         return False
 
@@ -273,29 +506,33 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
             evaluator=final_goal_normalized_utility_evaluator,
             min_value=0.0,
             max_value=1.0,
+            book=create_book(self.interpreter),
+            rng=self.spawn_rng(),
         )
 
         book_building_repeater = Repeater(
             func=book_builder.step,
             timeout_ns=build_time_ns,
             shortcircuit=book_builder.is_done,
+            batched=True,
         )
 
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg=f"Building book from perspective {rich(self.role)} for at most {format_ns(build_time_ns)}",
-            end_msg=f"Built book from perspective {rich(self.role)}",
+            begin_msg=lambda: f"Building book from perspective {rich(self.role)} "
+            f"for at most {format_ns(build_time_ns)}",
+            end_msg=lambda: f"Built book from perspective {rich(self.role)}",
             abort_msg="Aborted building book",
         ):
             it, elapsed_time = book_building_repeater()
         log.info(
             "%s book from perspecitve %s with %s entries in %s (%s entries/s)",
             "Finished" if book_builder.done else "Built",
-            rich(self.role),
-            format_amount(len(book_builder.book)),
-            format_ns(elapsed_time),
-            format_rate_ns(len(book_builder.book), elapsed_time),
+            lazy_rich(self.role),
+            lazy(format_amount, len(book_builder.book)),
+            lazy(format_ns, elapsed_time),
+            lazy(format_rate_ns, len(book_builder.book), elapsed_time),
         )
         return book_builder()
 
@@ -303,7 +540,7 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg=f"Developing at {rich(self.get_main_tree(logging.DEBUG))}",
+            begin_msg=lambda: f"Developing at {rich(self.get_main_tree(logging.DEBUG))}",
             end_msg="Developed to current ply and view",
             abort_msg="Aborted developing",
         ):
@@ -316,6 +553,29 @@ class AbstractSOMCTSAgent(AbstractMCTSAgent, SingleObserverMonteCarloTreeSearchA
 @dataclass
 class MCTSAgent(AbstractSOMCTSAgent[Turn]):
     tree: Optional[PerfectInformationNode[float]] = field(default=None, repr=False)
+    widening_exponent: Optional[float] = field(default=None, repr=False)
+    "Exponent of progressive widening, None to add all children of a node at once."
+    widening_constant: float = field(default=1.0, repr=False)
+    "Factor of progressive widening, nodes with n visits have ceil(widening_constant * n**widening_exponent) children."
+
+    @classmethod
+    def from_cli(
+        cls,
+        *args: str,
+        widening_exponent: Union[str, float, None] = None,
+        widening_constant: Union[str, float] = 1.0,
+        **kwargs: str,
+    ) -> Self:
+        if isinstance(widening_exponent, (str, int)):
+            widening_exponent = float(widening_exponent)
+        if isinstance(widening_constant, (str, int)):
+            widening_constant = float(widening_constant)
+        return super().from_cli(
+            *args,
+            widening_exponent=widening_exponent,
+            widening_constant=widening_constant,
+            **kwargs,
+        )
 
     def _get_root(self) -> Node[float, Turn]:
         init_state = self.interpreter.get_init_state()
@@ -323,6 +583,28 @@ class MCTSAgent(AbstractSOMCTSAgent[Turn]):
             state=init_state,
         )
 
+    # Disables mypy override. Because: The tree of MCTSAgent only consists of PerfectInformationNodes.
+    def _can_widen(self, node: PerfectInformationNode[float]) -> bool:  # type: ignore[override]
+        # The root is always expanded fully, such that all moves are considered when choosing one. This includes roots
+        # that were widened before the tree was re-rooted to them.
+        return (
+            self.widening_exponent is not None
+            and node.children is not None
+            and not node.fully_expanded
+            and (node is self.tree or len(node.children) < self._get_width(node))
+        )
+
+    # Disables mypy override. Because: The tree of MCTSAgent only consists of PerfectInformationNodes.
+    def _expand(self, node: PerfectInformationNode[float]) -> None:  # type: ignore[override]
+        if self.widening_exponent is None or node is self.tree:
+            node.expand(self.interpreter)
+        else:
+            node.widen(self.interpreter, width=self._get_width(node), rng=self.rng)
+
+    def _get_width(self, node: Node[float, Turn]) -> int:
+        assert self.widening_exponent is not None, "Requirement: widening_exponent is not None"
+        return max(1, math.ceil(self.widening_constant * _get_visits(node) ** self.widening_exponent))
+
     def _can_lookup(self) -> bool:
         return self.book is not None and self.tree.state in self.book
 
@@ -361,7 +643,7 @@ class MCTSAgent(AbstractSOMCTSAgent[Turn]):
         return key[self.role]
 
     def get_main_tree(self, target_log_level: int) -> Optional[Node[float, _K]]:
-        if log.level > target_log_level:
+        if not log.isEnabledFor(target_log_level):
             return None
         return self.tree
 
@@ -419,7 +701,7 @@ class SingleObserverInformationSetMCTSAgent(AbstractSOMCTSAgent[Tuple[State, _Ac
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg="Filling tree at "
+            begin_msg=lambda: "Filling tree at "
             f"{rich(self.get_main_tree(logging.DEBUG))} for at most {format_ns(fill_time_ns)}",
             end_msg="Filled tree",
             abort_msg="Aborted filling tree",
@@ -435,7 +717,7 @@ class SingleObserverInformationSetMCTSAgent(AbstractSOMCTSAgent[Tuple[State, _Ac
     def step(self) -> None:
         node = self.tree
         ply = node.depth
-        determinization: State = node.get_determinization()
+        determinization: State = node.get_determinization(self.rng)
 
         while (
             node.children is not None
@@ -446,9 +728,10 @@ class SingleObserverInformationSetMCTSAgent(AbstractSOMCTSAgent[Tuple[State, _Ac
         ):
             key = self.selector(node=node, state=determinization)
             node = node.children[key]
-            determinization = node.get_determinization()
+            determinization = node.get_determinization(self.rng)
 
-        node.branch(interpreter=self.interpreter, state=determinization)
+        if not self._is_under_memory_pressure() or node is self.tree:
+            node.branch(interpreter=self.interpreter, state=determinization)
 
         utility = node.evaluate(
             interpreter=self.interpreter,
@@ -491,7 +774,7 @@ class SingleObserverInformationSetMCTSAgent(AbstractSOMCTSAgent[Tuple[State, _Ac
 
     def get_key_to_evaluation(self) -> Mapping[Tuple[State, _Action], _MCTSEvaluation]:
         while not self.tree.children:
-            determinization = self.tree.get_determinization()
+            determinization = self.tree.get_determinization(self.rng)
             if self.interpreter.is_terminal(determinization):
                 continue
             self.tree.branch(interpreter=self.interpreter, state=determinization)
@@ -539,7 +822,7 @@ class SingleObserverInformationSetMCTSAgent(AbstractSOMCTSAgent[Tuple[State, _Ac
         return key[1]
 
     def get_main_tree(self, target_log_level: int) -> Optional[Node[float, _K]]:
-        if log.level > target_log_level:
+        if not log.isEnabledFor(target_log_level):
             return
         return self.tree
 
@@ -582,14 +865,17 @@ class MultiObserverInformationSetMCTSAgent(
         self.roles = self.interpreter.get_roles()
         self.trees = self._get_roots()
 
-        self.selectors = {role: self.selector_factory(role=role) for role in self.roles}
+        self.selectors = {
+            role: create_selector(self.selector_factory, role=role, rng=self.spawn_rng()) for role in self.roles
+        }
 
         self.step_repeater = Repeater(
             func=self.step,
             timeout_ns=playclock_config.delay_ns,
             max_repeats=self.max_mcts_iterations,
-            shortcircuit=self._can_lookup,
+            shortcircuit=self._should_stop_search,
             slack=1.5,
+            batched=True,
         )
         self.fill_repeater = Repeater(
             func=self.fill,
@@ -613,6 +899,7 @@ class MultiObserverInformationSetMCTSAgent(
                 role=role,
                 final_state_evaluator=final_goal_normalized_utility_evaluator,
                 book=self.books.get(role) if self.books is not None else None,
+                rng=self.spawn_rng(),
             )
             for role in self.roles
         }
@@ -641,6 +928,12 @@ class MultiObserverInformationSetMCTSAgent(
             roots[role] = root
         return roots
 
+    def _get_search_tree(self) -> Optional[Node[float, _K]]:
+        return self.trees[self.role] if self.trees is not None else None
+
+    def _get_trees(self) -> Sequence[Node[float, Any]]:
+        return tuple(self.trees.values()) if self.trees is not None else ()
+
     def _fully_enumerated(self, tree: ImperfectInformationNode[float], *args: Any, **kwargs: Any) -> bool:
         return tree.fully_enumerated
 
@@ -674,31 +967,34 @@ class MultiObserverInformationSetMCTSAgent(
             evaluator=final_goal_normalized_utility_evaluator,
             min_value=0.0,
             max_value=1.0,
+            book=create_book(self.interpreter),
+            rng=self.spawn_rng(),
         )
 
         book_building_repeater = Repeater(
             func=book_builder.step,
             timeout_ns=timeout_ns,
             shortcircuit=book_builder.is_done,
+            batched=True,
         )
 
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg=f"Building book from perspective "
+            begin_msg=lambda: f"Building book from perspective "
             f"{rich(role)} for role {rich(self.role)} for at most {format_ns(timeout_ns)}",
-            end_msg=f"Built book from perspective {rich(role)} for role {rich(self.role)}",
+            end_msg=lambda: f"Built book from perspective {rich(role)} for role {rich(self.role)}",
             abort_msg="Aborted building book",
         ):
             it, elapsed_time = book_building_repeater()
         log.info(
             "%s book from perspective %s for %s with %s entries in %s (%s entries/s)",
             "Finished" if book_builder.done else "Built",
-            rich(role),
-            rich(self.role),
-            format_amount(len(book_builder.book)),
-            format_ns(elapsed_time),
-            format_rate_ns(len(book_builder.book), elapsed_time),
+            lazy_rich(role),
+            lazy_rich(self.role),
+            lazy(format_amount, len(book_builder.book)),
+            lazy(format_ns, elapsed_time),
+            lazy(format_rate_ns, len(book_builder.book), elapsed_time),
         )
         return book_builder()
 
@@ -708,7 +1004,7 @@ class MultiObserverInformationSetMCTSAgent(
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg=f"Developing at {rich(self.get_main_tree(logging.DEBUG))}",
+            begin_msg=lambda: f"Developing at {rich(self.get_main_tree(logging.DEBUG))}",
             end_msg="Developed to current ply and view",
             abort_msg="Aborted developing",
         ):
@@ -732,7 +1028,7 @@ class MultiObserverInformationSetMCTSAgent(
         with log_time(
             log=log,
             level=logging.DEBUG,
-            begin_msg="Filling tree at "
+            begin_msg=lambda: "Filling tree at "
             f"{rich(self.get_main_tree(logging.DEBUG))} for at most {format_ns(fill_time_ns)}",
             end_msg="Filled tree",
             abort_msg="Aborted filling tree",
@@ -759,7 +1055,7 @@ class MultiObserverInformationSetMCTSAgent(
     def step(self) -> None:
         tree = self.trees[self.role]
         ply = tree.depth
-        determinization = tree.get_determinization()
+        determinization = tree.get_determinization(self.rng)
         trees = self._recenter_trees(ply=ply, determinization=determinization)
         assert all(node.depth == tree.depth for node in trees.values()), "Assumption: all trees are at the same depth"
         while (
@@ -793,7 +1089,8 @@ class MultiObserverInformationSetMCTSAgent(
 
             determinization = self.interpreter.get_next_state(determinization, turn)
 
-        tree.branch(interpreter=self.interpreter, state=determinization)
+        if not self._is_under_memory_pressure() or tree is self.trees[self.role]:
+            tree.branch(interpreter=self.interpreter, state=determinization)
 
         utilities = self._evaluate(determinization=determinization, tree=tree, trees=trees)
 
@@ -931,7 +1228,7 @@ class MultiObserverInformationSetMCTSAgent(
 
     def get_key_to_evaluation(self) -> Mapping[Tuple[State, _Action], _MCTSEvaluation]:
         while not self.trees[self.role].children:
-            determinization = self.trees[self.role].get_determinization()
+            determinization = self.trees[self.role].get_determinization(self.rng)
             if self.interpreter.is_terminal(determinization):
                 continue
             self.trees[self.role].branch(interpreter=self.interpreter, state=determinization)
@@ -994,6 +1291,6 @@ class MultiObserverInformationSetMCTSAgent(
         return move
 
     def get_main_tree(self, target_log_level: int) -> Optional[Node[float, _K]]:
-        if log.level > target_log_level:
+        if not log.isEnabledFor(target_log_level):
             return
         return self.trees[self.role]
@@ -2,8 +2,9 @@
 
 import random
 from dataclasses import dataclass, field
-from typing import Any, Optional, TypeVar
+from typing import Any, Final, Optional, Tuple, TypeVar
 
+from pyggp import metrics
 from pyggp.agents.tree_agents.evaluators import Evaluator
 from pyggp.books import Book
 from pyggp.engine_primitives import Role, State, Turn
@@ -11,6 +12,8 @@ from pyggp.interpreters import Interpreter
 
 _U_co = TypeVar("_U_co", covariant=True)
 
+_PLAYOUT_LENGTH_BUCKETS: Final[Tuple[float, ...]] = metrics.exponential_buckets(1, 2, 12)
+
 
 @dataclass
 class LightPlayoutEvaluator(Evaluator[_U_co]):
@@ -21,6 +24,8 @@ class LightPlayoutEvaluator(Evaluator[_U_co]):
     final_state_evaluator: Evaluator[_U_co]
     "Evaluator for the final state."
     book: Optional[Book[_U_co]] = field(default=None, repr=False)
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    "Random number generator for the moves."
     accesses: int = field(default=0, repr=False)
     hits: int = field(default=0, repr=False)
 
@@ -35,20 +40,36 @@ class LightPlayoutEvaluator(Evaluator[_U_co]):
         **kwargs: Any,
     ) -> _U_co:
         self.accesses += 1
+        length = 0
         while not interpreter.is_terminal(state) and (self.book is None or state not in self.book):
             roles_in_control = Interpreter.get_roles_in_control(state)
             role_move_pairing = []
 
             for role in roles_in_control:
                 legal_moves = interpreter.get_legal_moves_by_role(state, role)
-                move = random.choice(tuple(legal_moves))
+                move = self.rng.choice(tuple(legal_moves))
                 role_move_pairing.append((role, move))
 
             turn = Turn(role_move_pairing)
             state = interpreter.get_next_state(state, turn)
+            length += 1
+
+        hit = self.book is not None and state in self.book
+        if metrics.registry is not None:
+            self._record_metrics(length, hit=hit)
 
-        if self.book is not None and state in self.book:
+        if hit:
             self.hits += 1
             return self.book[state]
 
         return self.final_state_evaluator(state, *args, role=self.role, interpreter=interpreter, **kwargs)
+
+    def _record_metrics(self, length: int, *, hit: bool) -> None:
+        assert metrics.registry is not None, "Requirement: metrics are enabled"
+        metrics.registry.histogram("pyggp_playout_length", buckets=_PLAYOUT_LENGTH_BUCKETS, role=self.role).observe(
+            length,
+        )
+        if self.book is not None:
+            metrics.registry.counter("pyggp_book_accesses_total", role=self.role).inc()
+            if hit:
+                metrics.registry.counter("pyggp_book_hits_total", role=self.role).inc()
@@ -6,9 +6,10 @@ a move.
 """
 
 import abc
+import inspect
 import math
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Final, Generic, Mapping, Optional, Protocol, SupportsFloat, Tuple, TypeVar
 
 from typing_extensions import ParamSpec
@@ -157,7 +158,56 @@ class UCTSelector(Selector[_U_co, _K]):
         return max(key_to_uct, key=key_to_uct.get)
 
 
+@dataclass(frozen=True)
+class RandomSelector(Selector[_U_co, _K]):
+    """Selects a key uniformly at random, among the keys of the given state if any."""
+
+    role: Role
+    rng: random.Random = field(default_factory=random.Random, compare=False, repr=False)
+    "Random number generator."
+
+    # Disables ARG002 (Unused method argument). Because: Selectors are called with the arguments of the protocol.
+    def __call__(
+        self,
+        node: Node[_U_co, _K],
+        state: Optional[State] = None,
+        *args: Any,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002
+    ) -> _K:
+        assert node.children is not None, "Requirement: node.children is not None"
+        keys = tuple(node.children)
+        if state is not None:
+            keys = tuple(key for key in keys if key[0] == state) or keys
+        return self.rng.choice(keys)
+
+
+def create_selector(
+    selector_factory: Callable[..., Selector[_U_co, _K]],
+    role: Role,
+    rng: random.Random,
+) -> Selector[_U_co, _K]:
+    """Create a selector, passing a random number generator to factories that take one.
+
+    Args:
+        selector_factory: Factory of the selector, called with the role
+        role: Role of the selector
+        rng: Random number generator of the selector
+
+    Returns:
+        Selector for the given role
+
+    """
+    try:
+        parameters = inspect.signature(selector_factory).parameters
+    except (TypeError, ValueError):
+        return selector_factory(role=role)
+    if "rng" in parameters:
+        return selector_factory(role=role, rng=rng)
+    return selector_factory(role=role)
+
+
 random_selector: FunctionSelector[Any, Any, Any] = FunctionSelector(select_func=random.choice)
+"Selects a key uniformly at random with the global random number generator, see `RandomSelector` for a seedable one."
 best_selector: FunctionSelector[Any, Any, Any] = FunctionSelector(
     select_func=_select_maximum,
     get_keys_func=_map_keys_to_valuation,
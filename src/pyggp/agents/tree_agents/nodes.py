@@ -5,6 +5,7 @@ Nodes can be used to represent the game tree.
 """
 
 import abc
+import contextlib
 import logging
 import random
 from dataclasses import dataclass, field
@@ -14,9 +15,11 @@ from typing import (
     Final,
     Generic,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     MutableSequence,
+    NamedTuple,
     Optional,
     Protocol,
     Set,
@@ -77,6 +80,18 @@ class Node(Protocol[_U, _K]):
     def max_height(self) -> int:
         """Maximum height of the node in the tree defined by the distance to the leaves."""
 
+    @property
+    def node_count(self) -> int:
+        """Number of unique nodes in the subtree, including the node itself."""
+
+    @property
+    def transition_count(self) -> int:
+        """Number of transitions (entries of children) in the subtree."""
+
+    @property
+    def memory_estimate(self) -> int:
+        """Rough estimate of the memory used by the subtree in bytes, excluding states and valuations."""
+
     @property
     def root(self) -> "Node[_U, Any]":
         """Root of the tree."""
@@ -85,6 +100,9 @@ class Node(Protocol[_U, _K]):
 
     def trim(self) -> None: ...
 
+    def collapse(self) -> None:
+        """Removes the subtree below the node, such that it is a leaf again, keeping its own valuation."""
+
     def evaluate(
         self,
         interpreter: Interpreter,
@@ -97,32 +115,130 @@ class Node(Protocol[_U, _K]):
     def is_in_control(self, role: Role) -> bool: ...
 
 
+# Rough sizes in bytes of a node and of an entry of children, as measured on CPython 3.12.
+_NODE_SIZE_ESTIMATE: Final[int] = 300
+_TRANSITION_SIZE_ESTIMATE: Final[int] = 60
+
+
+class _Statistics(NamedTuple):
+    avg_height: float
+    max_height: int
+    node_count: int
+    transition_count: int
+
+
 class _AbstractNode(Node[_U, _K], Generic[_U, _K], abc.ABC):
+    # The statistics of the subtree are maintained incrementally, such that reading them is O(1). Children are only
+    # accounted for if they are added via _link_child and removed via _unlink_child within _restructuring, children
+    # that are inserted into children directly are ignored. The class attributes double as defaults for leaves.
+    _arity: int = 0
+    _height_sum: float = 0.0
+    _avg_height: float = 0.0
+    _max_height: int = 0
+    _node_count: int = 1
+    _transition_count: int = 0
+    _stale_max_height: bool = False
+    # Number of entries of the parent's children that refer to this node.
+    _edge_count: int = 0
+
     @property
     def arity(self) -> int:
-        if self.children is None:
-            return 0
-        unique_children = []
-        for child in self.children.values():
-            if child not in unique_children:
-                unique_children.append(child)
-        return len(unique_children)
+        return self._arity
 
     @property
     def avg_height(self) -> float:
-        if self.children is None or not self.children:
-            return 0.0
-        unique_children = []
-        for child in self.children.values():
-            if child not in unique_children:
-                unique_children.append(child)
-        return 1.0 + sum(child.avg_height for child in unique_children) / len(unique_children)
+        return self._avg_height
 
     @property
     def max_height(self) -> int:
-        if self.children is None or not self.children:
-            return 0
-        return 1 + max(child.max_height for child in self.children.values())
+        return self._max_height
+
+    @property
+    def node_count(self) -> int:
+        return self._node_count
+
+    @property
+    def transition_count(self) -> int:
+        return self._transition_count
+
+    @property
+    def memory_estimate(self) -> int:
+        return self._node_count * _NODE_SIZE_ESTIMATE + self._transition_count * _TRANSITION_SIZE_ESTIMATE
+
+    @property
+    def _statistics(self) -> _Statistics:
+        return _Statistics(self._avg_height, self._max_height, self._node_count, self._transition_count)
+
+    def _get_linked_children(self) -> Iterator["_AbstractNode[_U, Any]"]:
+        if self.children is None:
+            return
+        seen: Set[int] = set()
+        for child in self.children.values():
+            if isinstance(child, _AbstractNode) and child._edge_count > 0 and id(child) not in seen:
+                seen.add(id(child))
+                yield child
+
+    def _link_child(self, key: _K, child: "_AbstractNode[_U, Any]") -> None:
+        assert self.children is not None, "Requirement: self.children is not None"
+        previous = self.children.get(key)
+        if previous is child:
+            return
+        if previous is not None:
+            self._unlink_child(key)
+        self.children[key] = child
+        self._transition_count += 1
+        child._edge_count += 1
+        if child._edge_count == 1:
+            self._arity += 1
+            self._height_sum += child._avg_height
+            self._max_height = max(self._max_height, child._max_height + 1)
+            self._node_count += child._node_count
+            self._transition_count += child._transition_count
+
+    def _unlink_child(self, key: _K) -> None:
+        assert self.children is not None, "Requirement: self.children is not None"
+        child = self.children.pop(key)
+        if not isinstance(child, _AbstractNode) or child._edge_count == 0:
+            return
+        self._transition_count -= 1
+        child._edge_count -= 1
+        if child._edge_count == 0:
+            self._arity -= 1
+            self._height_sum -= child._avg_height
+            self._node_count -= child._node_count
+            self._transition_count -= child._transition_count
+            if child._max_height + 1 == self._max_height:
+                self._stale_max_height = True
+
+    @contextlib.contextmanager
+    def _restructuring(self) -> Iterator[None]:
+        """Propagates changes of the statistics to the ancestors after (un)linking children."""
+        previous = self._statistics
+        try:
+            yield
+        finally:
+            self._propagate_statistics(previous)
+
+    def _propagate_statistics(self, previous: _Statistics) -> None:
+        node: _AbstractNode[_U, Any] = self
+        while True:
+            if node._stale_max_height:
+                node._max_height = max((child._max_height + 1 for child in node._get_linked_children()), default=0)
+                node._stale_max_height = False
+            node._avg_height = 1.0 + node._height_sum / node._arity if node._arity > 0 else 0.0
+            current = node._statistics
+            parent = node.parent
+            if current == previous or not isinstance(parent, _AbstractNode) or node._edge_count == 0:
+                return
+            parent_previous = parent._statistics
+            parent._height_sum += current.avg_height - previous.avg_height
+            parent._node_count += current.node_count - previous.node_count
+            parent._transition_count += current.transition_count - previous.transition_count
+            if current.max_height + 1 > parent._max_height:
+                parent._max_height = current.max_height + 1
+            elif current.max_height < previous.max_height and previous.max_height + 1 == parent._max_height:
+                parent._stale_max_height = True
+            node, previous = parent, parent_previous
 
     @property
     def root(self) -> "Node[_U, Any]":
@@ -131,6 +247,17 @@ class _AbstractNode(Node[_U, _K], Generic[_U, _K], abc.ABC):
             node = node.parent
         return node
 
+    def collapse(self) -> None:
+        if self.children is None:
+            return
+        with self._restructuring():
+            for key in tuple(self.children):
+                self._unlink_child(key)
+        self._forget_children()
+
+    def _forget_children(self) -> None:
+        self.children = None
+
 
 @dataclass(unsafe_hash=True)
 class PerfectInformationNode(_AbstractNode[_U, Turn], Generic[_U]):
@@ -145,6 +272,13 @@ class PerfectInformationNode(_AbstractNode[_U, Turn], Generic[_U]):
         repr=False,
         hash=False,
     )
+    unexpanded_turns: Optional[MutableSequence[Turn]] = field(default=None, repr=False, hash=False, compare=False)
+    "Turns that are not yet children of a widened node, None if the node is not widened."
+
+    @property
+    def fully_expanded(self) -> bool:
+        """Whether all turns are children of the node."""
+        return self.children is not None and not self.unexpanded_turns
 
     def __rich__(self) -> str:
         valuation_str = f"valuation={rich(self.valuation)}"
@@ -152,24 +286,61 @@ class PerfectInformationNode(_AbstractNode[_U, Turn], Generic[_U]):
         max_height_str = f"max_height={self.max_height}"
         avg_height_str = f"avg_height={self.avg_height:.2f}"
         arity_str = f"arity={self.arity}"
-        information_str = f"\\[{valuation_str}, {depth_str}, {max_height_str}, {avg_height_str}, {arity_str}]"
+        node_count_str = f"nodes={self.node_count}"
+        information_str = (
+            f"\\[{valuation_str}, {depth_str}, {max_height_str}, {avg_height_str}, {arity_str}, {node_count_str}]"
+        )
         return f"{self.__class__.__name__}{information_str}()"
 
     def expand(self, interpreter: Interpreter) -> Mapping[Turn, Self]:
         if self.children is None:
-            self.children = {
-                # Disables mypy. Because: mypy cannot infer that class is Self.
-                turn: PerfectInformationNode(  # type: ignore[misc]
-                    state=next_state,
-                    parent=self,
-                    depth=self.depth + 1,
-                )
-                for turn, next_state in interpreter.get_all_next_states(self.state)
-            }
+            self.children = {}
+            with self._restructuring():
+                for turn, next_state in interpreter.get_all_next_states(self.state):
+                    self._link_child(turn, self._get_child(next_state))
+        elif self.unexpanded_turns:
+            self.widen(interpreter, width=len(self.children) + len(self.unexpanded_turns))
+
+        assert self.children is not None, "Guarantee: self.children is not None"
+        assert self.fully_expanded, "Guarantee: self.fully_expanded"
+        return self.children
+
+    def widen(self, interpreter: Interpreter, width: int, rng: Optional[random.Random] = None) -> Mapping[Turn, Self]:
+        """Adds children until the node has at least the given number of them, or all turns are children.
+
+        Only the next states of the added turns are computed, instead of those of all turns as in `expand`.
+
+        Args:
+            interpreter: Interpreter
+            width: Number of children to widen the node to
+            rng: Random number generator to shuffle the order of the turns with, if any
+
+        Returns:
+            Children of the node
+
+        """
+        if self.children is None:
+            self.children = {}
+            self.unexpanded_turns = list(interpreter.get_all_turns(self.state))
+            if rng is not None:
+                rng.shuffle(self.unexpanded_turns)
+        if self.unexpanded_turns and len(self.children) < width:
+            with self._restructuring():
+                while self.unexpanded_turns and len(self.children) < width:
+                    turn = self.unexpanded_turns.pop()
+                    self._link_child(turn, self._get_child(interpreter.get_next_state(self.state, turn)))
 
         assert self.children is not None, "Guarantee: self.children is not None"
         return self.children
 
+    def _get_child(self, state: State) -> Self:
+        # Disables mypy. Because: mypy cannot infer that class is Self.
+        return PerfectInformationNode(state=state, parent=self, depth=self.depth + 1)  # type: ignore[return-value]
+
+    def _forget_children(self) -> None:
+        self.children = None
+        self.unexpanded_turns = None
+
     def trim(self) -> None:
         """Removes all impossible to reach children."""
         if not self.children or self.turn is None:
@@ -180,8 +351,9 @@ class PerfectInformationNode(_AbstractNode[_U, Turn], Generic[_U]):
             if self.turn != turn:
                 to_delete.append(turn)
 
-        for turn in to_delete:
-            del self.children[turn]
+        with self._restructuring():
+            for turn in to_delete:
+                self._unlink_child(turn)
 
     def evaluate(
         self,
@@ -262,8 +434,13 @@ class InformationSetNode(Node[_U, Tuple[State, _A]], Protocol[_U, _A]):
     def descend(self, state: State, turn: Turn) -> Optional["InformationSetNode[_U, Any]"]:
         """Descends the tree an edge consistent with the given state and turn or returns None if impossible."""
 
-    def get_determinization(self) -> State:
-        """Retrieves a possible state."""
+    def get_determinization(self, rng: Optional[random.Random] = None) -> State:
+        """Retrieves a possible state.
+
+        Args:
+            rng: Random number generator, the global one if None
+
+        """
 
     def cut(self, interpreter: Interpreter) -> None:
         """Remove impossible states from possible_states using local information."""
@@ -285,12 +462,13 @@ class _AbstractInformationSetNode(InformationSetNode[_U, _A], _AbstractNode[_U,
         max_height_str = f"max_height={self.max_height}"
         avg_height_str = f"avg_height={self.avg_height:.2f}"
         arity_str = f"arity={self.arity}"
+        node_count_str = f"nodes={self.node_count}"
         fully_expanded_str = f"fully_expanded, " if self.fully_expanded else ""
         transitions_str = f"transitions={len(self.children) if self.children else 0}"
         fully_enumerated_str = f"fully_enumerated, " if self.fully_enumerated else ""
         possible_states_str = f"possible_states={len(self.possible_states)}"
         information_str = (
-            f"\\[{valuation_str}, {depth_str}, {max_height_str}, {avg_height_str}, {arity_str}, "
+            f"\\[{valuation_str}, {depth_str}, {max_height_str}, {avg_height_str}, {arity_str}, {node_count_str}, "
             f"{fully_expanded_str}{transitions_str}, {fully_enumerated_str}{possible_states_str}]"
         )
         return f"{self.__class__.__name__}{information_str}()"
@@ -409,14 +587,15 @@ class _AbstractInformationSetNode(InformationSetNode[_U, _A], _AbstractNode[_U,
                 if turn is not None:
                     next_state = development[step + 1].state
                     node._initialize_children()
-                    node._branch_by(
-                        interpreter=interpreter,
-                        state=state,
-                        turn=turn,
-                        next_state=next_state,
-                        fully_enumerated=False,
-                        fully_expanded=False,
-                    )
+                    with node._restructuring():
+                        node._branch_by(
+                            interpreter=interpreter,
+                            state=state,
+                            turn=turn,
+                            next_state=next_state,
+                            fully_enumerated=False,
+                            fully_expanded=False,
+                        )
                     node = node.descend(state, turn)
 
                 if node is None or node.depth == ply:
@@ -432,6 +611,11 @@ class _AbstractInformationSetNode(InformationSetNode[_U, _A], _AbstractNode[_U,
         if self.children is None:
             self._reset_children()
 
+    def _forget_children(self) -> None:
+        self._reset_children()
+        self.children = None
+        self.fully_expanded = False
+
     @abc.abstractmethod
     def _reset_children(self) -> None:
         raise NotImplementedError
@@ -554,12 +738,12 @@ class _AbstractInformationSetNode(InformationSetNode[_U, _A], _AbstractNode[_U,
             states={ply: state for ply, state in states.items()},
         )
 
-    def get_determinization(self) -> State:
+    def get_determinization(self, rng: Optional[random.Random] = None) -> State:
         if getattr(self, "_possible_state_seq", None) is None or len(self._possible_state_seq) != len(
             self.possible_states,
         ):
             self._possible_state_seq = tuple(self.possible_states)
-        return random.choice(self._possible_state_seq)
+        return (rng if rng is not None else random).choice(self._possible_state_seq)
 
     def is_in_control(self, role: Role) -> bool:
         assert any(role in Interpreter.get_roles_in_control(state) for state in self.possible_states) == all(
@@ -588,30 +772,6 @@ class HiddenInformationSetNode(_AbstractInformationSetNode[_U, Turn], Generic[_U
     visible_child: Optional["VisibleInformationSetNode[_U]"] = field(default=None, repr=False, hash=False)
     hidden_child: Optional["HiddenInformationSetNode[_U]"] = field(default=None, repr=False, hash=False)
 
-    @property
-    def arity(self) -> int:
-        return int(self.visible_child is not None) + int(self.hidden_child is not None)
-
-    @property
-    def avg_height(self) -> float:
-        if self.visible_child is None and self.hidden_child is None:
-            return 0.0
-        if self.visible_child is None:
-            return 1.0 + self.hidden_child.avg_height
-        if self.hidden_child is None:
-            return 1.0 + self.visible_child.avg_height
-        return 1.0 + (self.visible_child.avg_height + self.hidden_child.avg_height) / 2.0
-
-    @property
-    def max_height(self) -> int:
-        if self.visible_child is None and self.hidden_child is None:
-            return 0
-        if self.visible_child is None:
-            return 1 + self.hidden_child.max_height
-        if self.hidden_child is None:
-            return 1 + self.visible_child.max_height
-        return 1 + max(self.visible_child.max_height, self.hidden_child.max_height)
-
     def _can_walk(self, ply: int, view: View) -> bool:
         return (
             ply <= self.depth
@@ -631,16 +791,17 @@ class HiddenInformationSetNode(_AbstractInformationSetNode[_U, Turn], Generic[_U
     def expand(self, interpreter: Interpreter) -> Mapping[Tuple[State, Turn], "ImperfectInformationNode[_U]"]:
         if not self.fully_expanded or self.children is None:
             self._initialize_children()
-            for possible_state in self.possible_states:
-                for turn, next_state in interpreter.get_all_next_states(possible_state):
-                    self._branch_by(
-                        interpreter=interpreter,
-                        state=possible_state,
-                        turn=turn,
-                        next_state=next_state,
-                        fully_expanded=False,
-                        fully_enumerated=self.fully_enumerated,
-                    )
+            with self._restructuring():
+                for possible_state in self.possible_states:
+                    for turn, next_state in interpreter.get_all_next_states(possible_state):
+                        self._branch_by(
+                            interpreter=interpreter,
+                            state=possible_state,
+                            turn=turn,
+                            next_state=next_state,
+                            fully_expanded=False,
+                            fully_enumerated=self.fully_enumerated,
+                        )
             self.fully_expanded = self.fully_enumerated
 
         assert self.children is not None, "Guarantee: self.children is not None"
@@ -656,15 +817,16 @@ class HiddenInformationSetNode(_AbstractInformationSetNode[_U, Turn], Generic[_U
     def branch(self, interpreter: Interpreter, state: State) -> None:
         if self.children is None or (self.children is not None and not self.fully_expanded):
             self._initialize_children()
-            for turn, next_state in interpreter.get_all_next_states(state):
-                self._branch_by(
-                    interpreter=interpreter,
-                    state=state,
-                    turn=turn,
-                    next_state=next_state,
-                    fully_expanded=False,
-                    fully_enumerated=False,
-                )
+            with self._restructuring():
+                for turn, next_state in interpreter.get_all_next_states(state):
+                    self._branch_by(
+                        interpreter=interpreter,
+                        state=state,
+                        turn=turn,
+                        next_state=next_state,
+                        fully_expanded=False,
+                        fully_enumerated=False,
+                    )
             if self.fully_enumerated and all(
                 any(possible_state == state for (state, _) in self.children) for possible_state in self.possible_states
             ):
@@ -711,7 +873,7 @@ class HiddenInformationSetNode(_AbstractInformationSetNode[_U, Turn], Generic[_U
                 )
             child = self.visible_child
         child.possible_states.add(next_state)
-        self.children[key] = child
+        self._link_child(key, child)
 
     def descend(self, state: State, turn: Turn) -> Optional["InformationSetNode[_U, Any]"]:
         if self.children is None:
@@ -734,8 +896,9 @@ class HiddenInformationSetNode(_AbstractInformationSetNode[_U, Turn], Generic[_U
                     to_delete.add(key)
             self.hidden_child = None
 
-        for key in to_delete:
-            del self.children[key]
+        with self._restructuring():
+            for key in to_delete:
+                self._unlink_child(key)
 
     def cut(self, interpreter: Interpreter) -> None:
         if self.children is None or not self.children or self.visible_child is None or self.visible_child.view is None:
@@ -782,42 +945,6 @@ class VisibleInformationSetNode(_AbstractInformationSetNode[_U, Move], Generic[_
         hash=False,
     )
 
-    @property
-    def arity(self) -> int:
-        visible_children = 0 if self.view_to_visiblechild is None else len(self.view_to_visiblechild)
-        hidden_children = 0 if self.move_to_hiddenchild is None else len(self.move_to_hiddenchild)
-        return visible_children + hidden_children
-
-    @property
-    def avg_height(self) -> float:
-        if self.children is None or not self.children:
-            return 0
-        total_visible_avg_height = 0
-        if self.view_to_visiblechild:
-            total_visible_avg_height = sum(child.avg_height for child in self.view_to_visiblechild.values())
-        total_hidden_avg_height = 0
-        if self.move_to_hiddenchild:
-            total_hidden_avg_height = sum(child.avg_height for child in self.move_to_hiddenchild.values())
-        total_avg_height = total_visible_avg_height + total_hidden_avg_height
-        if total_avg_height == 0:
-            return total_avg_height
-        return 1 + (total_avg_height / self.arity)
-
-    @property
-    def max_height(self) -> int:
-        if self.children is None or not self.children:
-            return 0
-        max_visible_height = 0
-        if self.view_to_visiblechild:
-            max_visible_height = max(child.max_height for child in self.view_to_visiblechild.values())
-        max_hidden_height = 0
-        if self.move_to_hiddenchild:
-            max_hidden_height = max(child.max_height for child in self.move_to_hiddenchild.values())
-        max_height = max(max_visible_height, max_hidden_height)
-        if max_height == 0:
-            return max_height
-        return 1 + max_height
-
     def _can_walk(self, ply: int, view: View) -> bool:
         return ply <= self.depth or (
             self.children
@@ -843,16 +970,17 @@ class VisibleInformationSetNode(_AbstractInformationSetNode[_U, Move], Generic[_
     def expand(self, interpreter: Interpreter) -> Mapping[Tuple[State, Move], "ImperfectInformationNode[_U]"]:
         if not self.fully_expanded or self.children is None:
             self._initialize_children()
-            for possible_state in self.possible_states:
-                for turn, next_state in interpreter.get_all_next_states(possible_state):
-                    self._branch_by(
-                        interpreter=interpreter,
-                        state=possible_state,
-                        turn=turn,
-                        next_state=next_state,
-                        fully_expanded=False,
-                        fully_enumerated=self.fully_enumerated,
-                    )
+            with self._restructuring():
+                for possible_state in self.possible_states:
+                    for turn, next_state in interpreter.get_all_next_states(possible_state):
+                        self._branch_by(
+                            interpreter=interpreter,
+                            state=possible_state,
+                            turn=turn,
+                            next_state=next_state,
+                            fully_expanded=False,
+                            fully_enumerated=self.fully_enumerated,
+                        )
             self.fully_expanded = self.fully_enumerated
 
         assert self.children is not None, "Guarantee: self.children is not None (expanded)"
@@ -866,15 +994,16 @@ class VisibleInformationSetNode(_AbstractInformationSetNode[_U, Move], Generic[_
     def branch(self, interpreter: Interpreter, state: State) -> None:
         if self.children is None or (self.children is not None and not self.fully_expanded):
             self._initialize_children()
-            for turn, next_state in interpreter.get_all_next_states(state):
-                self._branch_by(
-                    interpreter=interpreter,
-                    state=state,
-                    turn=turn,
-                    next_state=next_state,
-                    fully_expanded=False,
-                    fully_enumerated=False,
-                )
+            with self._restructuring():
+                for turn, next_state in interpreter.get_all_next_states(state):
+                    self._branch_by(
+                        interpreter=interpreter,
+                        state=state,
+                        turn=turn,
+                        next_state=next_state,
+                        fully_expanded=False,
+                        fully_enumerated=False,
+                    )
             if self.fully_enumerated and all(
                 any(possible_state == state for (state, _) in self.children) for possible_state in self.possible_states
             ):
@@ -927,7 +1056,7 @@ class VisibleInformationSetNode(_AbstractInformationSetNode[_U, Move], Generic[_
                 self.view_to_visiblechild[view] = child
             child = self.view_to_visiblechild[view]
         child.possible_states.add(next_state)
-        self.children[key] = child
+        self._link_child(key, child)
 
     def descend(self, state: State, turn: Turn) -> Optional["InformationSetNode[_U, Any]"]:
         if self.children is None or self.role not in turn:
@@ -946,8 +1075,9 @@ class VisibleInformationSetNode(_AbstractInformationSetNode[_U, Move], Generic[_
             if (self.move is not None and move != self.move) or state not in self.possible_states:
                 to_delete.append((state, move))
 
-        for key in to_delete:
-            del self.children[key]
+        with self._restructuring():
+            for key in to_delete:
+                self._unlink_child(key)
 
     def cut(self, interpreter: Interpreter) -> None:
         if self.view is None:
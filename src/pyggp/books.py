@@ -2,10 +2,13 @@ import random
 from collections import deque
 from dataclasses import dataclass, field
 from typing import (
+    TYPE_CHECKING,
     Deque,
+    Dict,
     FrozenSet,
     Generic,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -15,9 +18,13 @@ from typing import (
     Union,
 )
 
-from pyggp.agents.tree_agents.evaluators import Evaluator
 from pyggp.engine_primitives import RANDOM, Role, State, Turn
-from pyggp.interpreters import Interpreter
+from pyggp.interpreters import Interpreter, SymmetricInterpreter
+from pyggp.symmetries import SymmetryGroup
+
+if TYPE_CHECKING:
+    # The agents depend on this module.
+    from pyggp.agents.tree_agents.evaluators import Evaluator
 
 _U_co = TypeVar("_U_co", covariant=True)
 
@@ -25,6 +32,51 @@ Book = Mapping[State, _U_co]
 MutableBook = MutableMapping[State, _U_co]
 
 
+class CanonicalBook(MutableMapping[State, _U_co]):
+    """Book that holds one entry for all states that are images of each other under the symmetries of a game.
+
+    Keys are canonicalized before each lookup, iterating the book yields canonical states only.
+
+    """
+
+    def __init__(self, symmetries: SymmetryGroup) -> None:
+        self.symmetries: SymmetryGroup = symmetries
+        self._entries: Dict[State, _U_co] = {}
+
+    def __getitem__(self, state: State) -> _U_co:
+        return self._entries[self.symmetries.canonicalize(state)[0]]
+
+    def __setitem__(self, state: State, value: _U_co) -> None:
+        self._entries[self.symmetries.canonicalize(state)[0]] = value
+
+    def __delitem__(self, state: State) -> None:
+        del self._entries[self.symmetries.canonicalize(state)[0]]
+
+    def __contains__(self, state: object) -> bool:
+        return isinstance(state, frozenset) and self.symmetries.canonicalize(state)[0] in self._entries
+
+    def __iter__(self) -> Iterator[State]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def create_book(interpreter: Interpreter) -> MutableBook[_U_co]:
+    """Create an empty book for the game of an interpreter.
+
+    Args:
+        interpreter: Interpreter of the game
+
+    Returns:
+        Canonical book if the interpreter knows the symmetries of the game, plain book otherwise
+
+    """
+    if isinstance(interpreter, SymmetricInterpreter):
+        return CanonicalBook(interpreter.symmetries)
+    return {}
+
+
 @dataclass
 class BookBuilder(Generic[_U_co]):
     @dataclass(frozen=True)
@@ -39,7 +91,7 @@ class BookBuilder(Generic[_U_co]):
 
     interpreter: Interpreter
     role: Role
-    evaluator: Evaluator[_U_co]
+    evaluator: "Evaluator[_U_co]"
     min_value: _U_co
     max_value: _U_co
     allies: Optional[FrozenSet[Role]] = field(default=None)
@@ -47,6 +99,7 @@ class BookBuilder(Generic[_U_co]):
     book: MutableBook[_U_co] = field(default_factory=dict)
     _queue: Optional[Deque["_QueueItem"]] = field(default=None)
     done: bool = field(default=False)
+    rng: random.Random = field(default_factory=random.Random, repr=False)
 
     def __call__(self) -> Book[_U_co]:
         return self.book
@@ -90,7 +143,7 @@ class BookBuilder(Generic[_U_co]):
 
             for role in roles_in_control:
                 legal_moves = self.interpreter.get_legal_moves_by_role(final_state, role)
-                move = random.choice(tuple(legal_moves))
+                move = self.rng.choice(tuple(legal_moves))
                 role_move_pairing.append((role, move))
 
             turn = Turn(role_move_pairing)
@@ -1,16 +1,19 @@
 import functools
 import logging
 import pathlib
+import random
 import sys
-from typing import Callable, Collection, Final, Iterable, Iterator, Optional, Sequence, Tuple, TypeVar
+from typing import Any, Callable, Collection, Final, Iterable, Iterator, Mapping, Optional, Sequence, Tuple, TypeVar
 
 import rich.progress as rich_progress
 
 import pyggp.game_description_language as gdl
-from pyggp.agents import Agent, ArbitraryAgent, HumanAgent, RandomAgent
+from pyggp.agents import Agent, ArbitraryAgent, HumanAgent, InterpreterAgent, RandomAgent
 from pyggp.cli.argument_specification import ArgumentSpecification
 from pyggp.engine_primitives import Role
 from pyggp.exceptions.cli_exceptions import AgentNotFoundCLIError, RolesMismatchCLIError, RulesetNotFoundCLIError
+from pyggp.metrics import JSONLinesSink, MetricsSink, PrometheusTextSink
+from pyggp.ruleset_cache import PrecompiledRuleset, RulesetCache
 
 log: logging.Logger = logging.getLogger("pyggp")
 
@@ -89,7 +92,7 @@ def determine_file_path(path: pathlib.Path) -> pathlib.Path:
     return base_path.joinpath(path)
 
 
-def load_ruleset(files: Sequence[pathlib.Path]) -> gdl.Ruleset:
+def read_rules_str(files: Sequence[pathlib.Path]) -> str:
     rules_strs = []
     for file in rich_progress.track(files, description="Loading files", transient=True):
         path = determine_file_path(file)
@@ -98,13 +101,43 @@ def load_ruleset(files: Sequence[pathlib.Path]) -> gdl.Ruleset:
             log.debug("Loaded %s", path)
         except OSError as read_error:
             raise RulesetNotFoundCLIError(path) from read_error
-    rules_str = "\n".join(rules_strs)
+    return "\n".join(rules_strs)
+
+
+def parse_ruleset(rules_str: str) -> gdl.Ruleset:
     tree = gdl.ruleset_parser.parse(rules_str)
     ruleset = gdl.transformer.transform(tree)
     assert isinstance(ruleset, gdl.Ruleset)
     return ruleset
 
 
+def load_ruleset(files: Sequence[pathlib.Path]) -> gdl.Ruleset:
+    return parse_ruleset(read_rules_str(files))
+
+
+def load_precompiled_ruleset(
+    files: Sequence[pathlib.Path],
+    ruleset_cache: Optional[RulesetCache] = None,
+) -> Tuple[PrecompiledRuleset, Optional[str]]:
+    rules_str = read_rules_str(files)
+    if ruleset_cache is None:
+        return PrecompiledRuleset(ruleset=parse_ruleset(rules_str)), None
+    key = RulesetCache.get_key(rules_str)
+    precompiled = ruleset_cache.load(key)
+    if precompiled is None:
+        precompiled = PrecompiledRuleset(ruleset=parse_ruleset(rules_str))
+        ruleset_cache.store(key, precompiled)
+    if precompiled.is_complete:
+        return precompiled, None
+    return precompiled, key
+
+
+def get_metrics_sink(path: pathlib.Path) -> MetricsSink:
+    if path.suffix == ".prom":
+        return PrometheusTextSink(path)
+    return JSONLinesSink(path)
+
+
 _BUILTIN_AGENTS = {
     "human": HumanAgent,
     "random": RandomAgent,
@@ -119,18 +152,46 @@ def get_role_from_str(string: str) -> Role:
     return Role(transformation)
 
 
-def load_agentfactory_by_specification(spec: ArgumentSpecification) -> Callable[[], Agent]:
+def load_agentfactory_by_specification(spec: ArgumentSpecification, seed: Optional[int] = None) -> Callable[[], Agent]:
+    kwargs = spec.kwargs
     name_casefold = spec.name.casefold()
     for builtin_agent_name, builtin_agent_type in _BUILTIN_AGENTS.items():
         if name_casefold == builtin_agent_name.casefold():
-            return functools.partial(
-                builtin_agent_type, *spec.args, **spec.kwargs
-            )  # FIXME: this doesn't load nested specs
+            kwargs = _with_seed(builtin_agent_type, kwargs, seed)
+            return functools.partial(builtin_agent_type, *spec.args, **kwargs)  # FIXME: this doesn't load nested specs
     try:
         agent_type = spec.load()
     except (ValueError, ModuleNotFoundError, AttributeError):
         raise AgentNotFoundCLIError(spec) from None
-    return functools.partial(getattr(agent_type, "from_cli", agent_type), *spec.args, **spec.kwargs)
+    kwargs = _with_seed(agent_type, kwargs, seed)
+    return functools.partial(getattr(agent_type, "from_cli", agent_type), *spec.args, **kwargs)
+
+
+def _with_seed(agent_type: Any, kwargs: Mapping[str, Any], seed: Optional[int]) -> Mapping[str, Any]:
+    if (
+        seed is None
+        or "seed" in kwargs
+        or not (isinstance(agent_type, type) and issubclass(agent_type, InterpreterAgent))
+    ):
+        return kwargs
+    return {**kwargs, "seed": seed}
+
+
+def get_role_seeds(roles: Iterable[Role], seed: int) -> Mapping[Role, int]:
+    """Derive a seed per role from a single seed.
+
+    Args:
+        roles: Roles
+        seed: Seed to derive from
+
+    Returns:
+        Seeds by role
+
+    """
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Seeds are
+    # not used for cryptography.
+    rng = random.Random(seed)  # noqa: S311
+    return {role: rng.getrandbits(32) for role in sorted(roles, key=str)}
 
 
 def check_roles(required_roles: Collection[Role], received_roles: Collection[Role]) -> None:
@@ -9,6 +9,7 @@ from typing import (
     Iterable,
     Mapping,
     MutableMapping,
+    Optional,
     Sequence,
 )
 
@@ -18,14 +19,15 @@ import typer
 from exceptiongroup import ExceptionGroup
 
 import pyggp.game_description_language as gdl
-from pyggp._logging import log_time, rich
+from pyggp._logging import lazy_rich, log_time, rich
 from pyggp.actors import LocalActor
 from pyggp.agents import Agent, HumanAgent
 from pyggp.cli._common import (
     check_roles,
     get_role_from_str,
+    get_role_seeds,
     load_agentfactory_by_specification,
-    load_ruleset,
+    load_precompiled_ruleset,
     parse_registry,
 )
 from pyggp.cli.argument_specification import ArgumentSpecification
@@ -38,8 +40,9 @@ from pyggp.gameclocks import (
     DEFAULT_START_CLOCK_CONFIGURATION,
     GameClock,
 )
-from pyggp.interpreters import Interpreter
+from pyggp.interpreters import ClingoRegroundingInterpreter, Interpreter
 from pyggp.match import Match
+from pyggp.ruleset_cache import PrecompiledRuleset, RulesetCache
 from pyggp.visualizers import SimpleVisualizer, Visualizer
 
 log: logging.Logger = logging.getLogger("pyggp")
@@ -92,14 +95,17 @@ def handle_match_command_args(
     visualizer_str: str,
     interpreter_str: str,
     default_agent_str: str,
+    ruleset_cache: Optional[RulesetCache] = None,
+    seed: Optional[int] = None,
 ) -> MatchCommandParams:
     log.debug("Handling [bold]match[/bold] command arguments")
     log.debug("Loading ruleset")
     try:
-        ruleset = load_ruleset(files)
+        precompiled, ruleset_key = load_precompiled_ruleset(files, ruleset_cache)
     except RulesetNotFoundCLIError as ruleset_not_found_error:
         log.exception(ruleset_not_found_error, exc_info=False)
         raise typer.Exit(1) from None
+    ruleset = precompiled.ruleset
     log.debug("Loaded ruleset")
 
     try:
@@ -119,21 +125,29 @@ def handle_match_command_args(
         "from_cli",
         getattr(interpreter_type, "from_ruleset", interpreter_type),
     )
+    precompiled_kwargs = (
+        precompiled.interpreter_kwargs
+        if isinstance(interpreter_type, type) and issubclass(interpreter_type, ClingoRegroundingInterpreter)
+        else {}
+    )
     interpreter_factory = functools.partial(
         interpreter_constructor,
         *interpreter_spec.args,
         ruleset=ruleset,
+        **precompiled_kwargs,
         **interpreter_spec.kwargs,
     )
 
     with log_time(
         level=logging.DEBUG,
         log=log,
-        begin_msg=f"Instantiating {rich(interpreter_spec)}",
-        end_msg=f"Instantiated {rich(interpreter_spec)}",
+        begin_msg=lambda: f"Instantiating {rich(interpreter_spec)}",
+        end_msg=lambda: f"Instantiated {rich(interpreter_spec)}",
         abort_msg="Aborted instantiation of interpreter",
     ):
         interpreter = interpreter_factory()
+    if ruleset_cache is not None and ruleset_key is not None:
+        _complete_ruleset_cache_entry(ruleset_cache, ruleset_key, precompiled, interpreter)
     roles = interpreter.get_roles()
 
     try:
@@ -164,8 +178,10 @@ def handle_match_command_args(
     log.debug("Mapped roles to agent names")
 
     log.debug("Mapping agent specifications to agent factories")
+    role_to_seed = get_role_seeds(role_to_agentspec, seed) if seed is not None else {}
     role_to_agentfactory: Mapping[Role, Callable[[], Agent]] = {
-        role: load_agentfactory_by_specification(agentspec) for role, agentspec in role_to_agentspec.items()
+        role: load_agentfactory_by_specification(agentspec, seed=role_to_seed.get(role))
+        for role, agentspec in role_to_agentspec.items()
     }
     log.debug("Mapped agent specifications to agent factories")
 
@@ -231,6 +247,22 @@ def handle_match_command_args(
     )
 
 
+def _complete_ruleset_cache_entry(
+    ruleset_cache: RulesetCache,
+    key: str,
+    precompiled: PrecompiledRuleset,
+    interpreter: Interpreter,
+) -> None:
+    if not isinstance(interpreter, ClingoRegroundingInterpreter):
+        return
+    updated = PrecompiledRuleset(
+        ruleset=precompiled.ruleset,
+        shape_container=interpreter.shape_container,
+        temporal_rule_container=interpreter.temporal_rule_container,
+    )
+    ruleset_cache.store(key, updated)
+
+
 # Disables mypy type-arg. Because exceptiongroup seems not to be typed correctly.
 def _match_error_handler(excgroup: ExceptionGroup) -> None:  # type: ignore[type-arg]
     for exc in excgroup.exceptions:
@@ -241,7 +273,7 @@ def run_match(
     match: Match,
     visualizer: Visualizer,
 ) -> None:
-    log.info("Starting %s", rich(match))
+    log.info("Starting %s", lazy_rich(match))
     aborted = True
     # Disables PyCharms PyTypeChecker. Because exceptiongroup seems not to be typed correctly.
     # noinspection PyTypeChecker
@@ -279,10 +311,10 @@ def run_match(
             visualizer.update_abort()
 
     if not aborted:
-        log.info("Concluded %s", rich(match))
+        log.info("Concluded %s", lazy_rich(match))
         match.conclude()
     else:
-        log.info("Aborted %s", rich(match))
+        log.info("Aborted %s", lazy_rich(match))
         match.abort()
 
     for move_nr, state in enumerate(match.states):
@@ -311,7 +343,7 @@ def run_local_match(
             is_human_actor = isinstance(agent, HumanAgent)
             is_clairvoyant = role in clairvoyant_roles
             actor = LocalActor(agent=agent, is_human_actor=is_human_actor, is_clairvoyant=is_clairvoyant)
-            log.debug("Associating role %s with %s and with %s", rich(role), rich(agent), rich(actor))
+            log.debug("Associating role %s with %s and with %s", lazy_rich(role), lazy_rich(agent), lazy_rich(actor))
             role_actor_map[role] = actor
 
         match = Match(
@@ -323,4 +355,4 @@ def run_local_match(
         )
         run_match(match, visualizer)
 
-    log.debug("Ran %s locally", rich(match))
+    log.debug("Ran %s locally", lazy_rich(match))
@@ -1,20 +1,26 @@
 """Defines the CLI commands."""
 
+import contextlib
 import logging
 import pathlib
-from typing import List
+import random
+from typing import List, Optional
 
 import typer
 
-from pyggp._logging import rich
+from pyggp import metrics
+from pyggp._logging import background_logging, lazy_rich
 from pyggp.cli._common import (
     determine_log_level,
+    get_metrics_sink,
 )
 from pyggp.cli._main import sys_info_callback, version_callback
 from pyggp.cli._match import (
     handle_match_command_args,
     run_local_match,
 )
+from pyggp.ruleset_cache import RulesetCache
+from pyggp.shared_cache import DEFAULT_CAPACITY, SharedCacheServer
 
 log: logging.Logger = logging.getLogger("pyggp")
 
@@ -57,6 +63,21 @@ def match(
     visualizer: str = typer.Option(None, "--visualizer", show_default=False),
     interpreter: str = typer.Option("pyggp.interpreters.ClingoInterpreter", "-i", "--interpreter", show_default=True),
     default_agent: str = typer.Option("Human", "-d", "--default-agent", show_default=True),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Cache parsed and analyzed rulesets on disk"),
+    cache_dir: Optional[pathlib.Path] = typer.Option(None, "--cache-dir", show_default=False),
+    metrics_file: Optional[pathlib.Path] = typer.Option(
+        None,
+        "--metrics-file",
+        help="Write performance metrics to this file (Prometheus text format if suffixed .prom, else JSON lines)",
+        show_default=False,
+    ),
+    seed: Optional[int] = typer.Option(
+        None,
+        "--seed",
+        help="Seed the random number generators of all agents that do not specify a seed themselves "
+        "(reproducible if PYTHONHASHSEED is set)",
+        show_default=False,
+    ),
     verbose: int = typer.Option(0, "--verbose", "-v", count=True, show_default=False),
     quiet: int = typer.Option(0, "--quiet", "-q", count=True, show_default=False),
 ) -> None:
@@ -74,6 +95,10 @@ def match(
         "visualizer=%s, "
         "interpreter=%s, "
         "default_agent=%s, "
+        "cache=%s, "
+        "cache_dir=%s, "
+        "metrics_file=%s, "
+        "seed=%s, "
         "log_level=%s",
         registry,
         files,
@@ -83,6 +108,10 @@ def match(
         visualizer,
         interpreter,
         default_agent,
+        cache,
+        cache_dir,
+        metrics_file,
+        seed,
         logging.getLevelName(log_level),
     )
 
@@ -95,16 +124,61 @@ def match(
         visualizer_str=visualizer,
         interpreter_str=interpreter,
         default_agent_str=default_agent,
+        ruleset_cache=(RulesetCache(cache_dir) if cache_dir is not None else RulesetCache()) if cache else None,
+        seed=seed,
     )
 
-    log.debug("Starting match with the following parameters: %s", rich(match_params))
+    log.debug("Starting match with the following parameters: %s", lazy_rich(match_params))
+
+    if seed is not None:
+        random.seed(seed)
+
+    if metrics_file is not None:
+        metrics.enable(sinks=(get_metrics_sink(metrics_file),))
+    with background_logging(log):
+        try:
+            run_local_match(
+                ruleset=match_params.ruleset,
+                interpreter=match_params.interpreter,
+                role_to_agentfactory=match_params.role_to_agentfactory,
+                role_to_startclockconfiguration=match_params.role_to_startclockconfiguration,
+                role_to_playclockconfiguration=match_params.role_to_playclockconfiguration,
+                clairvoyant_roles=match_params.clairvoyant_roles,
+                visualizer=match_params.visualizer,
+            )
+        finally:
+            metrics.flush()
+
+
+@app.command("cache-server")
+def cache_server(
+    socket_path: pathlib.Path = typer.Argument(..., metavar="SOCKET", show_default=False),
+    capacity: int = typer.Option(
+        DEFAULT_CAPACITY,
+        "--capacity",
+        help="Capacity in bytes of the cached results",
+        show_default=True,
+    ),
+    verbose: int = typer.Option(0, "--verbose", "-v", count=True, show_default=False),
+    quiet: int = typer.Option(0, "--quiet", "-q", count=True, show_default=False),
+) -> None:
+    """Serve a cache of interpreter results that is shared by the processes on this machine.
+
+    Interpreters use the cache when given shared_cache="SOCKET", for example:
+    -i 'pyggp.interpreters.ClingoInterpreter(shared_cache="/run/user/1000/pyggp.sock")'. Interpreters only connect to
+    sockets of their own user, hence the socket is best placed in a directory of that user, such as $XDG_RUNTIME_DIR.
+
+    """
+    log_level = determine_log_level(verbose=verbose, quiet=quiet)
 
-    run_local_match(
-        ruleset=match_params.ruleset,
-        interpreter=match_params.interpreter,
-        role_to_agentfactory=match_params.role_to_agentfactory,
-        role_to_startclockconfiguration=match_params.role_to_startclockconfiguration,
-        role_to_playclockconfiguration=match_params.role_to_playclockconfiguration,
-        clairvoyant_roles=match_params.clairvoyant_roles,
-        visualizer=match_params.visualizer,
+    log.setLevel(log_level)
+    log.debug(
+        "Received [bold]cache-server[/bold] command socket_path=%s, capacity=%s, log_level=%s",
+        socket_path,
+        capacity,
+        logging.getLevelName(log_level),
     )
+
+    server = SharedCacheServer(path=socket_path, capacity=capacity)
+    with background_logging(log), contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
@@ -104,3 +104,31 @@ class GoalNotIntegerInterpreterError(InvalidGDLInterpreterError):
 
 class PlyOutsideOfBoundsError(InterpreterError):
     """Ply is outside of bound."""
+
+
+class UnsupportedRulesInterpreterError(InterpreterError):
+    """Rules use constructs that ground programs cannot be analyzed with."""
+
+    def __init__(self, reason: Optional[str] = None) -> None:
+        self.reason = reason
+        message = "Rules use unsupported constructs"
+        if reason is not None:
+            message = f"Rules use unsupported constructs: {reason}"
+        super().__init__(message)
+
+
+class UncompilableInterpreterError(InterpreterError):
+    """Ruleset cannot be compiled to Python."""
+
+    def __init__(self, reason: Optional[str] = None) -> None:
+        message = "Ruleset cannot be compiled"
+        if reason is not None:
+            message = f"Ruleset cannot be compiled: {reason}"
+        super().__init__(message)
+
+
+class MismatchInterpreterError(InterpreterError):
+    """Interpreter disagrees with its reference interpreter."""
+
+    def __init__(self, method: str, actual: object, expected: object) -> None:
+        super().__init__(f"Mismatch in {method}: got {actual!r}, but reference returned {expected!r}")
@@ -0,0 +1,39 @@
+"""Exceptions regarding serialization."""
+
+from typing import Optional
+
+from pyggp.game_description_language.subrelations import Symbol
+
+
+class SerializationError(Exception):
+    """Base class for exceptions regarding serialization."""
+
+
+class UnknownSymbolSerializationError(SerializationError):
+    """Symbol is not part of the symbol table of the codec."""
+
+    def __init__(self, symbol: Optional[Symbol] = None) -> None:
+        """Initializes UnknownSymbolSerializationError.
+
+        Args:
+            symbol: Symbol that is not part of the symbol table
+
+        """
+        symbol_message = f" '{symbol}'" if symbol is not None else ""
+        message = f"Symbol{symbol_message} is not part of the symbol table"
+        super().__init__(message)
+
+
+class MalformedDataSerializationError(SerializationError):
+    """Data to decode is malformed."""
+
+    def __init__(self, reason: Optional[str] = None) -> None:
+        """Initializes MalformedDataSerializationError.
+
+        Args:
+            reason: Additional information about the reason for the error
+
+        """
+        reason_message = f" ({reason})" if reason is not None else ""
+        message = f"Malformed data{reason_message}"
+        super().__init__(message)
@@ -1,8 +1,23 @@
 """Provides all subrelations of GDL."""
 
 import operator
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, ClassVar, NamedTuple, Optional, Sequence, Union
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    ClassVar,
+    FrozenSet,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import cachetools
 import cachetools.keys as cachetools_keys
@@ -22,15 +37,86 @@ if TYPE_CHECKING:
 else:
     SymbolCache = cachetools.LRUCache
 
+_intern_table: "weakref.WeakValueDictionary[Tuple[Any, ...], Any]" = weakref.WeakValueDictionary()
+
+
+class _ControlIndex(NamedTuple):
+    fluents: FrozenSet["Subrelation"] = frozenset()
+    "All control/1 subrelations that were interned so far."
+    arguments: Mapping["Subrelation", "Subrelation"] = {}
+    "Argument of each control/1 subrelation."
+
+
+# The index is replaced as a whole on each addition, such that readers need no lock.
+_control_index: _ControlIndex = _ControlIndex()
+_control_index_lock: threading.Lock = threading.Lock()
+# Arguments of each combination of control/1 subrelations that occurred, usually one per role and one for all roles.
+_control_arguments: MutableMapping[FrozenSet["Subrelation"], FrozenSet["Subrelation"]] = {}
+
+
+class _InterningMeta(type):
+    """Metaclass that interns all instances of its classes.
+
+    Structurally equal instances are the same object, as long as one of them is alive. The hash of an instance is
+    computed once on construction and stored in the attribute `_hash`.
+
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        # Disables mypy attr-defined. Because every class with this metaclass defines _get_intern_values.
+        values = cls._get_intern_values(*args, **kwargs)  # type: ignore[attr-defined]
+        key = (cls, *values)
+        instance = _intern_table.get(key)
+        if instance is None:
+            instance = super().__call__(*values)
+            # The name instead of the class keeps hashes, and therefore the iteration order of sets, reproducible.
+            object.__setattr__(instance, "_hash", hash((cls.__qualname__, *values)))
+            interned = _intern_table.setdefault(key, instance)
+            if interned is instance:
+                # Disables SLF001 (Private member accessed). Because: The hook is private to interned classes.
+                instance._on_interned()  # noqa: SLF001
+            instance = interned
+        return instance
+
+
+class _Interned(metaclass=_InterningMeta):
+    """Base class of all interned classes.
+
+    Subclasses declare their fields in `__slots__` and therefore have no per-instance `__dict__`. As `__slots__`
+    conflict with class level defaults, subclasses must not declare defaults for their fields, but provide them via
+    `_get_intern_values`.
+
+    """
+
+    __slots__ = ("__weakref__", "_hash")
+
+    _hash: int
+    "Precomputed hash of the instance."
+
+    def _on_interned(self) -> None:
+        """Called once for each new instance, after it was interned."""
+
+
+def get_interned_count() -> int:
+    """Get the number of currently interned primitives, relations, and subrelations.
+
+    Returns:
+        Number of interned primitives, relations, and subrelations
+
+    """
+    return len(_intern_table)
+
 
 @dataclass(frozen=True, order=True)
-class Primitive:
+class Primitive(_Interned):
     """Base class of primitives.
 
     Primitives include variables, numbers, and strings.
 
     """
 
+    __slots__ = ()
+
     # region Attributes and Properties
 
     @property
@@ -140,6 +226,8 @@ class Primitive:
 class Variable(Primitive):
     """Representation of a variable."""
 
+    __slots__ = ("name",)
+
     # region Attributes and Properties
     name: str
     "Name of the variable."
@@ -173,6 +261,10 @@ class Variable(Primitive):
         message = "Variables cannot be created from clingo symbols."
         raise TypeError(message)
 
+    @staticmethod
+    def _get_intern_values(name: str) -> Tuple[str]:
+        return (name,)
+
     # endregion
 
     # region Magic Methods
@@ -201,6 +293,35 @@ class Variable(Primitive):
         """
         return f"[italic yellow]{self.infix_str}[/italic yellow]"
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two variables are equal.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if the variables are equal, False otherwise
+
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, Variable), "Assumption: other is of the same class as self."
+        return self._hash == other._hash and self.name == other.name
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the variable.
+
+        Returns:
+            Hash of the variable
+
+        """
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return self.__class__, (self.name,)
+
     # endregion
 
     # region Methods
@@ -247,6 +368,8 @@ class Variable(Primitive):
 class Number(Primitive):
     """Representation of a (whole) number."""
 
+    __slots__ = ("number",)
+
     # region Attributes and Properties
 
     number: int
@@ -280,6 +403,10 @@ class Number(Primitive):
             raise TypeError(message)
         return cls(symbol.number)
 
+    @staticmethod
+    def _get_intern_values(number: int) -> Tuple[int]:
+        return (number,)
+
     # endregion
 
     # region Magic Methods
@@ -302,6 +429,35 @@ class Number(Primitive):
         """
         return f"[blue]{self.infix_str}[/blue]"
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two numbers are equal.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if the numbers are equal, False otherwise
+
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, Number), "Assumption: other is of the same class as self."
+        return self._hash == other._hash and self.number == other.number
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the number.
+
+        Returns:
+            Hash of the number
+
+        """
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int]]:
+        return self.__class__, (self.number,)
+
     # endregion
 
     # region Methods
@@ -322,6 +478,8 @@ class Number(Primitive):
 class String(Primitive):
     """Representation of a string."""
 
+    __slots__ = ("string",)
+
     # region Attributes and Properties
 
     string: str
@@ -355,6 +513,10 @@ class String(Primitive):
             raise TypeError(message)
         return cls(symbol.string)
 
+    @staticmethod
+    def _get_intern_values(string: str) -> Tuple[str]:
+        return (string,)
+
     # endregion
 
     # region Magic Methods
@@ -377,6 +539,35 @@ class String(Primitive):
         """
         return f"[green]{self.infix_str}[/green]"
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two strings are equal.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if the strings are equal, False otherwise
+
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, String), "Assumption: other is of the same class as self."
+        return self._hash == other._hash and self.string == other.string
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the string.
+
+        Returns:
+            Hash of the string
+
+        """
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return self.__class__, (self.string,)
+
     # endregion
 
     # region Methods
@@ -394,9 +585,11 @@ class String(Primitive):
 
 
 @dataclass(frozen=True, order=True)
-class Relation:
+class Relation(_Interned):
     """Representation of a relation."""
 
+    __slots__ = ("arguments", "name")
+
     # region Inner Classes
 
     class Signature(NamedTuple):
@@ -439,10 +632,10 @@ class Relation:
 
     # region Attributes and Properties
 
-    name: Optional[str] = None
-    "Name of the relation."
-    arguments: Sequence["Subrelation"] = field(default_factory=tuple)
-    "Arguments of the relation."
+    name: Optional[str]
+    "Name of the relation, defaults to None."
+    arguments: Sequence["Subrelation"]
+    "Arguments of the relation, defaults to the empty tuple."
 
     @property
     def arity(self) -> int:
@@ -493,6 +686,13 @@ class Relation:
         """
         return cls.from_symbols(None, *arguments)
 
+    @staticmethod
+    def _get_intern_values(
+        name: Optional[str] = None,
+        arguments: Sequence["Subrelation"] = (),
+    ) -> Tuple[Optional[str], Tuple["Subrelation", ...]]:
+        return name, tuple(arguments)
+
     @classmethod
     def from_clingo_symbol(cls, symbol: clingo.Symbol) -> Self:
         """Create a relation from a clingo symbol.
@@ -536,6 +736,35 @@ class Relation:
             return f"[dark_orange]{self.name}[/dark_orange]"
         return f"[purple]{self.name}[/purple]({', '.join(subrelation.__rich__() for subrelation in self.arguments)})"
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two relations are equal.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if the relations are equal, False otherwise
+
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, Relation), "Assumption: other is of the same class as self."
+        return self._hash == other._hash and self.name == other.name and self.arguments == other.arguments
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the relation.
+
+        Returns:
+            Hash of the relation
+
+        """
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Optional[str], Sequence["Subrelation"]]]:
+        return self.__class__, (self.name, self.arguments)
+
     # endregion
 
     # region Methods
@@ -617,21 +846,24 @@ See Also:
 
 
 @dataclass(frozen=True)
-class Subrelation:
+class Subrelation(_Interned):
     """Representation of a subrelation.
 
     A subrelation is either a primitive or a relation.
 
     """
 
+    __slots__ = ("symbol",)
+
     # region Attributes and Properties
 
-    symbol: Symbol = field(default_factory=Relation)
-    "Symbol of the subrelation."
+    symbol: Symbol
+    "Symbol of the subrelation, defaults to the empty relation."
     _as_clingo_symbol_cache: ClassVar[SymbolCache] = cachetools.LRUCache(
         maxsize=500_000,
         getsizeof=as_clingo_symbol_sizeof,
     )
+    _as_clingo_symbol_lock: ClassVar[threading.RLock] = threading.RLock()
 
     @property
     def infix_str(self) -> str:
@@ -668,7 +900,11 @@ class Subrelation:
     # region Constructors
 
     @classmethod
-    @cachetools.cached(cache=cachetools.LRUCache(maxsize=500_000, getsizeof=from_clingo_symbol_sizeof), info=True)
+    @cachetools.cached(
+        cache=cachetools.LRUCache(maxsize=500_000, getsizeof=from_clingo_symbol_sizeof),
+        lock=threading.RLock(),
+        info=True,
+    )
     def from_clingo_symbol(cls, symbol: clingo.Symbol) -> Self:
         """Create a subrelation from a clingo symbol.
 
@@ -686,6 +922,24 @@ class Subrelation:
         ), f"Assumption: There are only 3 symbol types. Unknown symbol type {symbol.type}."
         return cls(Primitive.from_clingo_symbol(symbol))
 
+    @staticmethod
+    def _get_intern_values(symbol: Optional[Symbol] = None) -> Tuple[Symbol]:
+        if symbol is None:
+            return (Relation(),)
+        return (symbol,)
+
+    def _on_interned(self) -> None:
+        # Disables PLW0603 (Using the global statement). Because: The index is shared by all subrelations.
+        global _control_index  # noqa: PLW0603
+        if not self.matches_signature(name="control", arity=1):
+            return
+        assert isinstance(self.symbol, Relation), "Guarantee: Only relations match signatures"
+        with _control_index_lock:
+            _control_index = _ControlIndex(
+                fluents=_control_index.fluents.union((self,)),
+                arguments={**_control_index.arguments, self: self.symbol.arguments[0]},
+            )
+
     # endregion
 
     # region Magic Methods
@@ -717,6 +971,35 @@ class Subrelation:
         """
         return self.symbol.__rich__()
 
+    def __eq__(self, other: object) -> bool:
+        """Check whether two subrelations are equal.
+
+        Args:
+            other: Object to compare against
+
+        Returns:
+            True if the subrelations are equal, False otherwise
+
+        """
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, Subrelation), "Assumption: other is of the same class as self."
+        return self._hash == other._hash and self.symbol == other.symbol
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the subrelation.
+
+        Returns:
+            Hash of the subrelation
+
+        """
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Symbol]]:
+        return self.__class__, (self.symbol,)
+
     def __lt__(self, other: Self) -> bool:
         """Check if a subrelation is less than another subrelation.
 
@@ -783,6 +1066,27 @@ class Subrelation:
         """
         return self.symbol.unifies(other.symbol)
 
+    @staticmethod
+    def get_control_arguments(subrelations: AbstractSet["Subrelation"]) -> FrozenSet["Subrelation"]:
+        """Get the arguments of the control/1 subrelations in a set, e.g. the roles in control of a state.
+
+        Looks up an index of all interned control/1 subrelations, instead of checking each subrelation of the set.
+
+        Args:
+            subrelations: Set of subrelations
+
+        Returns:
+            Arguments of the control/1 subrelations in the set
+
+        """
+        index = _control_index
+        fluents = index.fluents.intersection(subrelations)
+        arguments = _control_arguments.get(fluents)
+        if arguments is None:
+            arguments = frozenset(index.arguments[fluent] for fluent in fluents)
+            _control_arguments[fluents] = arguments
+        return arguments
+
     def matches_signature(self, name: Optional[str] = None, arity: int = 0) -> bool:
         """Check if the subrelation is a relation with the given name and arity.
 
@@ -796,7 +1100,11 @@ class Subrelation:
         """
         return isinstance(self.symbol, Relation) and self.symbol.matches_signature(name, arity)
 
-    @cachetools.cachedmethod(cache=operator.attrgetter("_as_clingo_symbol_cache"), key=cachetools_keys.hashkey)
+    @cachetools.cachedmethod(
+        cache=operator.attrgetter("_as_clingo_symbol_cache"),
+        key=cachetools_keys.hashkey,
+        lock=operator.attrgetter("_as_clingo_symbol_lock"),
+    )
     def as_clingo_symbol(self) -> clingo.Symbol:
         """Convert to semantically equivalent clingo symbol.
 
@@ -815,6 +1123,17 @@ class Subrelation:
         """
         return self.symbol.as_clingo_ast()
 
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Clear the caches of conversions from and to clingo symbols.
+
+        Interned subrelations are unaffected, as they are only kept alive by their references.
+
+        """
+        with cls._as_clingo_symbol_lock:
+            cls._as_clingo_symbol_cache.clear()
+        cls.from_clingo_symbol.cache_clear()
+
     # endregion
 
 
@@ -1,2 +1,8 @@
 from pyggp.interpreters.base_interpreters import ClingoInterpreter, ClingoRegroundingInterpreter, Interpreter
+from pyggp.interpreters.compiled_interpreter import CompiledInterpreter
+from pyggp.interpreters.concurrent_interpreter import ConcurrentClingoInterpreter
 from pyggp.interpreters.dark_split_corridor_34_interpreter import DarkSplitCorridor34Interpreter
+from pyggp.interpreters.factored_interpreter import FactoredInterpreter
+from pyggp.interpreters.instrumented_interpreter import InstrumentedInterpreter
+from pyggp.interpreters.symmetric_interpreter import SymmetricInterpreter
+from pyggp.interpreters.verifying_interpreter import VerifyingInterpreter
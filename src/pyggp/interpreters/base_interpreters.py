@@ -2,15 +2,16 @@
 
 import abc
 import collections
+import contextlib
 import functools
 import itertools
 import logging
 import multiprocessing
 from dataclasses import dataclass, field
 from typing import (
-    TYPE_CHECKING,
     Any,
     Callable,
+    ContextManager,
     DefaultDict,
     FrozenSet,
     Iterable,
@@ -28,8 +29,6 @@ from typing import (
     cast,
 )
 
-import cachetools
-import cachetools.keys as cachetools_keys
 import clingo
 import clingo.ast as clingo_ast
 import rich.markup as rich_markup
@@ -37,10 +36,17 @@ from typing_extensions import Self
 
 import pyggp._clingo as clingo_helper
 import pyggp.game_description_language as gdl
-from pyggp._caching import (
-    get_roles_in_control_sizeof,
+from pyggp import metrics
+from pyggp._clingo_interpreter.base import (
+    _get_ctl,
+    _get_model,
+    _get_models,
+    _ground,
+    _transform,
+    _transform_model,
+    _transform_pair,
+    _translate_model,
 )
-from pyggp._clingo_interpreter.base import _get_ctl, _get_model, _transform_model
 from pyggp._clingo_interpreter.control_containers import ControlContainer, _set_state, _set_turn
 from pyggp._clingo_interpreter.developments import (
     _create_developments_ctl,
@@ -54,6 +60,7 @@ from pyggp._clingo_interpreter.possible_states import (
 )
 from pyggp._clingo_interpreter.shape_containers import ShapeContainer
 from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp._clingo_interpreter.translation_containers import TranslationContainer
 from pyggp._logging import rich
 from pyggp.engine_primitives import Development, Move, ParallelMode, Role, State, Turn, View
 from pyggp.exceptions.interpreter_exceptions import (
@@ -70,20 +77,10 @@ from pyggp.exceptions.interpreter_exceptions import (
     UnsatTerminalInterpreterError,
 )
 from pyggp.records import Record
-
-if TYPE_CHECKING:
-    # TODO: Remove this when python 3.8 is no longer supported.
-    RolesInControlCache = cachetools.Cache[State, FrozenSet[Role]]
-else:
-    RolesInControlCache = cachetools.Cache
+from pyggp.shared_cache import SharedInterpreterCache
 
 log: logging.Logger = logging.getLogger("pyggp")
 
-_get_roles_in_control_cache: RolesInControlCache = cachetools.LRUCache(
-    maxsize=50_000_000,
-    getsizeof=get_roles_in_control_sizeof,
-)
-
 
 class Interpreter(Protocol):
     """An interpreter for a GDL ruleset.
@@ -152,6 +149,17 @@ class Interpreter(Protocol):
 
         """
 
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        """Yields all legal turns from the given state or view, without computing the follow states.
+
+        Args:
+            current: View or state to get turns from
+
+        Yields:
+            Turns
+
+        """
+
     def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
         """Return each role's view of the state.
 
@@ -300,11 +308,6 @@ class Interpreter(Protocol):
         """
 
     @staticmethod
-    @cachetools.cached(
-        cache=_get_roles_in_control_cache,
-        key=cachetools_keys.hashkey,
-        info=True,
-    )
     def get_roles_in_control(current: Union[State, View]) -> FrozenSet[Role]:
         """Return the roles in control from the given state or view.
 
@@ -315,12 +318,7 @@ class Interpreter(Protocol):
             Roles in control from the given state or view.
 
         """
-        return frozenset(
-            Role(subrelation.symbol.arguments[0])
-            for subrelation in current
-            if isinstance(subrelation.symbol, gdl.Relation)
-            and subrelation.symbol.matches_signature(name="control", arity=1)
-        )
+        return cast(FrozenSet[Role], gdl.Subrelation.get_control_arguments(current))
 
     @staticmethod
     def get_ranks(goals: Mapping[Role, Optional[int]]) -> Mapping[Role, int]:
@@ -400,6 +398,20 @@ class AbstractInterpreter(Interpreter):
         Yields:
             Pairs of turns and states
 
+        """
+        for turn in self.get_all_turns(current):
+            next_state = self.get_next_state(current, turn)
+            yield turn, next_state
+
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        """Yields all legal turns from the given state or view, without computing the follow states.
+
+        Args:
+            current: View or state to get turns from
+
+        Yields:
+            Turns
+
         """
         if self.is_terminal(current):
             return
@@ -412,9 +424,7 @@ class AbstractInterpreter(Interpreter):
                 role_move_pairs.add((role, move))
             all_role_move_pairs.add(frozenset(role_move_pairs))
         for turn_role_move_pairs in itertools.product(*all_role_move_pairs):
-            turn = Turn(turn_role_move_pairs)
-            next_state = self.get_next_state(current, turn)
-            yield turn, next_state
+            yield Turn(turn_role_move_pairs)
 
     @abc.abstractmethod
     def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
@@ -586,11 +596,6 @@ class AbstractInterpreter(Interpreter):
             yield development[shift].state
 
     @staticmethod
-    @cachetools.cached(
-        cache=_get_roles_in_control_cache,
-        key=cachetools_keys.hashkey,
-        info=True,
-    )
     def get_roles_in_control(current: Union[State, View]) -> FrozenSet[Role]:
         """Return the roles in control from the given state or view.
 
@@ -601,12 +606,7 @@ class AbstractInterpreter(Interpreter):
             Roles in control from the given state or view.
 
         """
-        return frozenset(
-            Role(subrelation.symbol.arguments[0])
-            for subrelation in current
-            if isinstance(subrelation.symbol, gdl.Relation)
-            and subrelation.symbol.matches_signature(name="control", arity=1)
-        )
+        return cast(FrozenSet[Role], gdl.Subrelation.get_control_arguments(current))
 
     @staticmethod
     def get_ranks(goals: Mapping[Role, Optional[int]]) -> Mapping[Role, int]:
@@ -644,6 +644,12 @@ def _get_single_nested_defaultdict_factory(
     return functools.partial(collections.defaultdict, functools.partial(collections.defaultdict, factory))
 
 
+def _record_cache_access(table: str, *, hit: bool) -> None:
+    assert metrics.registry is not None, "Requirement: metrics are enabled"
+    result = "hit" if hit else "miss"
+    metrics.registry.counter("pyggp_interpreter_cache_accesses_total", table=table, result=result).inc()
+
+
 @dataclass
 class CachingInterpreter(AbstractInterpreter, abc.ABC):
     @dataclass
@@ -669,16 +675,18 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
             self.goal.clear()
             self.terminal.clear()
 
+    # The caches may be cleared by another thread at any time, hence each lookup reads the cache once, and does not
+    # check for a key before reading it.
     cache: CacheContainer = field(default_factory=CacheContainer)
     disable_cache: bool = field(default=False)
+    shared_cache: Optional[SharedInterpreterCache] = field(default=None, repr=False)
 
     def get_roles(self) -> FrozenSet[Role]:
-        if self.cache.roles is None:
+        roles = self.cache.roles
+        if roles is None:
             roles = self._get_roles()
             if not self.disable_cache:
                 self.cache.roles = roles
-        else:
-            roles = self.cache.roles
         return roles
 
     @abc.abstractmethod
@@ -686,12 +694,11 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
         raise NotImplementedError
 
     def get_init_state(self) -> State:
-        if self.cache.init is None:
+        init_state = self.cache.init
+        if init_state is None:
             init_state = self._get_init_state()
             if not self.disable_cache:
                 self.cache.init = init_state
-        else:
-            init_state = self.cache.init
         return init_state
 
     @abc.abstractmethod
@@ -700,21 +707,20 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
         current_len = 0
+        next_state = None
         if not self.disable_cache:
             current_len = len(current)
             if not isinstance(turn, Turn):
                 turn = Turn(turn)
-        if (
-            self.disable_cache
-            or current_len not in self.cache.next
-            or current not in self.cache.next[current_len]
-            or turn not in self.cache.next[current_len][current]
-        ):
-            next_state = self._get_next_state(current, turn)
+            next_state = self.cache.next.get(current_len, {}).get(current, {}).get(turn)
+        if next_state is None:
+            next_state = self._compute_shared("next", self._get_next_state, current, turn)
+            if metrics.registry is not None:
+                _record_cache_access("next", hit=False)
             if not self.disable_cache:
                 self.cache.next[current_len][current][turn] = next_state
-        else:
-            next_state = self.cache.next[current_len][current][turn]
+        elif metrics.registry is not None:
+            _record_cache_access("next", hit=True)
         return next_state
 
     @abc.abstractmethod
@@ -723,19 +729,32 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
         current_len = len(current)
-        if (
-            self.disable_cache
-            or current_len not in self.cache.all_next
-            or current not in self.cache.all_next[current_len]
-        ):
-            all_next_states = self._get_all_next_states(current)
+        cached = None if self.disable_cache else self.cache.all_next.get(current_len, {}).get(current)
+        if cached is None:
+            if metrics.registry is not None:
+                _record_cache_access("all_next", hit=False)
             if not self.disable_cache:
-                for turn, next_state in all_next_states:
-                    self.cache.all_next[current_len][current].add((turn, next_state))
+                shared_turn_state_pairs = None
+                if self.shared_cache is not None:
+                    shared_turn_state_pairs = self.shared_cache.get("all_next", current)
+                if shared_turn_state_pairs is not None:
+                    self.cache.all_next[current_len][current] = shared_turn_state_pairs
+                    yield from shared_turn_state_pairs
+                    return
+                # Only complete enumerations are cached, callers may stop iterating early.
+                turn_state_pairs = set()
+                for turn, next_state in self._get_all_next_states(current):
+                    turn_state_pairs.add((turn, next_state))
                     yield turn, next_state
+                self.cache.all_next[current_len][current] = turn_state_pairs
+                if self.shared_cache is not None:
+                    self.shared_cache.put("all_next", current, value=turn_state_pairs)
                 return
+            all_next_states = self._get_all_next_states(current)
         else:
-            all_next_states = self.cache.all_next[current_len][current]
+            all_next_states = cached
+            if metrics.registry is not None:
+                _record_cache_access("all_next", hit=True)
         yield from all_next_states
 
     def _get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
@@ -745,12 +764,15 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
         if not self.has_incomplete_information:
             return {role: cast(View, current) for role in self.get_roles()}
         current_len = len(current)
-        if self.disable_cache or current_len not in self.cache.sees or current not in self.cache.sees[current_len]:
-            sees = self._get_sees(current)
+        sees = None if self.disable_cache else self.cache.sees.get(current_len, {}).get(current)
+        if sees is None:
+            sees = self._compute_shared("sees", self._get_sees, current)
+            if metrics.registry is not None:
+                _record_cache_access("sees", hit=False)
             if not self.disable_cache:
                 self.cache.sees[current_len][current] = sees
-        else:
-            sees = self.cache.sees[current_len][current]
+        elif metrics.registry is not None:
+            _record_cache_access("sees", hit=True)
         return sees
 
     @abc.abstractmethod
@@ -759,12 +781,15 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
         current_len = len(current)
-        if self.disable_cache or current_len not in self.cache.legal or current not in self.cache.legal[current_len]:
-            legal_moves = self._get_legal_moves(current)
+        legal_moves = None if self.disable_cache else self.cache.legal.get(current_len, {}).get(current)
+        if legal_moves is None:
+            legal_moves = self._compute_shared("legal", self._get_legal_moves, current)
+            if metrics.registry is not None:
+                _record_cache_access("legal", hit=False)
             if not self.disable_cache:
                 self.cache.legal[current_len][current] = legal_moves
-        else:
-            legal_moves = self.cache.legal[current_len][current]
+        elif metrics.registry is not None:
+            _record_cache_access("legal", hit=True)
         return legal_moves
 
     def _get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
@@ -772,17 +797,17 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
         current_len = len(current)
-        if (
-            self.disable_cache
-            or role not in self.cache.legal_by_role
-            or current_len not in self.cache.legal_by_role[role]
-            or current not in self.cache.legal_by_role[role][current_len]
-        ):
-            legal_moves = self._get_legal_moves_by_role(current, role)
+        legal_moves = (
+            None if self.disable_cache else self.cache.legal_by_role.get(role, {}).get(current_len, {}).get(current)
+        )
+        if legal_moves is None:
+            legal_moves = self._compute_shared("legal_by_role", self._get_legal_moves_by_role, current, role)
+            if metrics.registry is not None:
+                _record_cache_access("legal_by_role", hit=False)
             if not self.disable_cache:
                 self.cache.legal_by_role[role][current_len][current] = legal_moves
-        else:
-            legal_moves = self.cache.legal_by_role[role][current_len][current]
+        elif metrics.registry is not None:
+            _record_cache_access("legal_by_role", hit=True)
         return legal_moves
 
     def _get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
@@ -790,12 +815,15 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
         current_len = len(current)
-        if self.disable_cache or current_len not in self.cache.goal or current not in self.cache.goal[current_len]:
-            goals = self._get_goals(current)
+        goals = None if self.disable_cache else self.cache.goal.get(current_len, {}).get(current)
+        if goals is None:
+            goals = self._compute_shared("goal", self._get_goals, current)
+            if metrics.registry is not None:
+                _record_cache_access("goal", hit=False)
             if not self.disable_cache:
                 self.cache.goal[current_len][current] = goals
-        else:
-            goals = self.cache.goal[current_len][current]
+        elif metrics.registry is not None:
+            _record_cache_access("goal", hit=True)
         return goals
 
     @abc.abstractmethod
@@ -804,22 +832,31 @@ class CachingInterpreter(AbstractInterpreter, abc.ABC):
 
     def is_terminal(self, current: Union[State, View]) -> bool:
         current_len = len(current)
-        if (
-            self.disable_cache
-            or current_len not in self.cache.terminal
-            or current not in self.cache.terminal[current_len]
-        ):
-            terminal = self._is_terminal(current)
+        terminal = None if self.disable_cache else self.cache.terminal.get(current_len, {}).get(current)
+        if terminal is None:
+            terminal = self._compute_shared("terminal", self._is_terminal, current)
+            if metrics.registry is not None:
+                _record_cache_access("terminal", hit=False)
             if not self.disable_cache:
                 self.cache.terminal[current_len][current] = terminal
-        else:
-            terminal = self.cache.terminal[current_len][current]
+        elif metrics.registry is not None:
+            _record_cache_access("terminal", hit=True)
         return terminal
 
     @abc.abstractmethod
     def _is_terminal(self, current: Union[State, View]) -> bool:
         raise NotImplementedError
 
+    def _compute_shared(self, table: str, compute: Callable[..., _V], current: Union[State, View], *args: Any) -> _V:
+        # Consults the shared cache on misses of the local cache, and shares what was computed.
+        if self.shared_cache is None or self.disable_cache:
+            return compute(current, *args)
+        result = self.shared_cache.get(table, current, *args)
+        if result is None:
+            result = compute(current, *args)
+            self.shared_cache.put(table, current, *args, value=result)
+        return result
+
 
 _StateToRulesCache = MutableMapping[int, MutableMapping[Union[State, View], MutableSequence[clingo_ast.AST]]]
 _SubrelationToRuleCache = MutableMapping[gdl.Subrelation, clingo_ast.AST]
@@ -849,16 +886,22 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
     clingo_ast_cache: ClingoASTCache = field(default_factory=ClingoASTCache)
 
     @classmethod
-    def from_ruleset(
+    # Disables PLR0913 (Too many arguments). Because: All but the ruleset are optional keyword arguments.
+    def from_ruleset(  # noqa: PLR0913
         cls,
         ruleset: gdl.Ruleset,
         *args: Any,
         disable_cache: bool = False,
         parallel_mode: Optional[ParallelMode] = None,
+        shape_container: Optional[ShapeContainer] = None,
+        temporal_rule_container: Optional[TemporalRuleContainer] = None,
+        shared_cache: Optional[SharedInterpreterCache] = None,
         **kwargs: Any,
     ) -> Self:
-        shape_container = ShapeContainer.from_ruleset(ruleset)
-        temporal_rule_container = TemporalRuleContainer.from_ruleset(ruleset)
+        if shape_container is None:
+            shape_container = ShapeContainer.from_ruleset(ruleset)
+        if temporal_rule_container is None:
+            temporal_rule_container = TemporalRuleContainer.from_ruleset(ruleset)
         if parallel_mode is None:
             cpu_count = multiprocessing.cpu_count()
             parallel_mode = (max(2, min(64, cpu_count)), "compete")
@@ -868,6 +911,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             temporal_rule_container=temporal_rule_container,
             parallel_mode=parallel_mode,
             disable_cache=disable_cache,
+            shared_cache=shared_cache,
         )
 
     @classmethod
@@ -876,11 +920,14 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
         ruleset: gdl.Ruleset,
         *args: str,
         disable_cache: Union[str, bool] = False,
+        shared_cache: Union[str, SharedInterpreterCache, None] = None,
         **kwargs: str,
     ) -> Self:
         if isinstance(disable_cache, str):
             disable_cache = disable_cache.casefold() == "true" or disable_cache == "1"
-        return cls.from_ruleset(ruleset, *args, disable_cache=disable_cache, **kwargs)
+        if isinstance(shared_cache, str):
+            shared_cache = SharedInterpreterCache.connect(ruleset, shared_cache)
+        return cls.from_ruleset(ruleset, *args, disable_cache=disable_cache, shared_cache=shared_cache, **kwargs)
 
     def __rich__(self) -> str:
         state_shape = self.shape_container.state_shape
@@ -904,7 +951,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             context="roles",
             rules=(*self.clingo_ast_cache.roles, clingo_helper.SHOW_ROLE),
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model, unpack=0)
         try:
@@ -921,7 +968,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             context="init",
             rules=(*self.clingo_ast_cache.init, clingo_helper.SHOW_INIT),
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model, unpack=0)
         try:
@@ -940,7 +987,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             current=current,
             turn=turn,
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model, unpack=0)
         try:
@@ -960,7 +1007,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             rules=(*self.clingo_ast_cache.sees, clingo_helper.SHOW_SEES),
             current=current,
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model)
         sees: DefaultDict[Role, Set[gdl.Subrelation]] = collections.defaultdict(set)
@@ -981,7 +1028,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             rules=(*self.clingo_ast_cache.legal, clingo_helper.SHOW_LEGAL),
             current=current,
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model)
         legal: DefaultDict[Role, Set[Move]] = collections.defaultdict(set)
@@ -1002,7 +1049,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             rules=(*self.clingo_ast_cache.goal, clingo_helper.SHOW_GOAL),
             current=current,
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model)
         goals: DefaultDict[Role, MutableSequence[int]] = collections.defaultdict(list)
@@ -1028,7 +1075,7 @@ class ClingoRegroundingInterpreter(CachingInterpreter):
             rules=(*self.clingo_ast_cache.terminal, clingo_helper.SHOW_TERMINAL),
             current=current,
         )
-        ctl.ground()
+        _ground(ctl)
         model = _get_model(ctl)
         subrelations = _transform_model(model)
         try:
@@ -1142,19 +1189,27 @@ class ClingoInterpreter(ClingoRegroundingInterpreter):
     """An interpreter for a GDL ruleset using clingo."""
 
     control_container: ControlContainer = field(default_factory=ControlContainer, repr=False)
+    translation_container: TranslationContainer = field(default_factory=TranslationContainer, repr=False)
 
     @classmethod
-    def from_ruleset(
+    # Disables PLR0913 (Too many arguments). Because: All but the ruleset are optional keyword arguments.
+    def from_ruleset(  # noqa: PLR0913
         cls,
         ruleset: gdl.Ruleset,
         *args: Any,
         parallel_mode: Optional[ParallelMode] = None,
         disable_cache: bool = False,
+        shape_container: Optional[ShapeContainer] = None,
+        temporal_rule_container: Optional[TemporalRuleContainer] = None,
+        shared_cache: Optional[SharedInterpreterCache] = None,
         **kwargs: Any,
     ) -> Self:
         control_container = ControlContainer.from_ruleset(ruleset)
-        shape_container = ShapeContainer.from_control_container(control_container)
-        temporal_rule_container = TemporalRuleContainer.from_ruleset(ruleset)
+        if shape_container is None:
+            shape_container = ShapeContainer.from_control_container(control_container)
+        translation_container = TranslationContainer.from_shape_container(shape_container)
+        if temporal_rule_container is None:
+            temporal_rule_container = TemporalRuleContainer.from_ruleset(ruleset)
         if parallel_mode is None:
             cpu_count = multiprocessing.cpu_count()
             parallel_mode = (max(2, min(64, cpu_count)), "compete")
@@ -1163,48 +1218,100 @@ class ClingoInterpreter(ClingoRegroundingInterpreter):
             parallel_mode=parallel_mode,
             control_container=control_container,
             shape_container=shape_container,
+            translation_container=translation_container,
             temporal_rule_container=temporal_rule_container,
             disable_cache=disable_cache,
+            shared_cache=shared_cache,
         )
 
+    def _checkout_control_container(self) -> ContextManager[ControlContainer]:
+        # Controls are mutated while solving, hence each control container is used by one query at a time.
+        return contextlib.nullcontext(self.control_container)
+
     def _get_roles(self) -> FrozenSet[Role]:
-        model = _get_model(self.control_container.role)
-        subrelations = _transform_model(model, unpack=0)
-        roles = (Role(subrelation) for subrelation in subrelations)
-        try:
-            return frozenset(roles)
-        except UnsatInterpreterError:
-            raise UnsatRolesInterpreterError from UnsatInterpreterError
+        with self._checkout_control_container() as control_container:
+            model = _get_model(control_container.role)
+            subrelations = _transform_model(model, unpack=0)
+            roles = (Role(subrelation) for subrelation in subrelations)
+            try:
+                return frozenset(roles)
+            except UnsatInterpreterError:
+                raise UnsatRolesInterpreterError from UnsatInterpreterError
 
     def _get_init_state(self) -> State:
-        model = _get_model(self.control_container.init)
-        subrelations = _transform_model(model, unpack=0)
-        try:
-            return State(frozenset(subrelations))
-        except UnsatInterpreterError:
-            raise UnsatInitInterpreterError from UnsatInterpreterError
+        with self._checkout_control_container() as control_container:
+            model = _get_model(control_container.init)
+            subrelations = _transform_model(model, unpack=0)
+            try:
+                return State(frozenset(subrelations))
+            except UnsatInterpreterError:
+                raise UnsatInitInterpreterError from UnsatInterpreterError
 
     def _get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
-        with _set_state(
-            self.control_container.next,
-            self.control_container.next_state_to_literal,
+        with self._checkout_control_container() as control_container, _set_state(
+            control_container.next,
+            control_container.next_state_to_literal,
             current,
-        ) as _ctl, _set_turn(_ctl, self.control_container.next_action_to_literal, turn) as ctl:
+        ) as _ctl, _set_turn(_ctl, control_container.next_action_to_literal, turn) as ctl:
             model = _get_model(ctl)
-            subrelations = _transform_model(model, unpack=0)
+            subrelations = _translate_model(
+                model,
+                self.translation_container.next_symbol_to_state,
+                functools.partial(_transform, unpack=0),
+            )
             try:
-                return State(frozenset(subrelations))
+                next_state = frozenset(subrelations)
             except UnsatInterpreterError:
                 raise UnsatNextInterpreterError from UnsatInterpreterError
+            latches = control_container.latches
+            return State(next_state.union(current.intersection(latches)) if latches else next_state)
+
+    def _get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        # Enumerates all turns and their next states in a single solve, where each model is one turn.
+        if self.is_terminal(current):
+            return
+        with self._checkout_control_container() as control_container:
+            if not control_container.all_next_lock.acquire(blocking=False):
+                # The control is still busy enumerating the successors of another state.
+                yield from super()._get_all_next_states(current)
+                return
+            try:
+                with _set_state(
+                    control_container.all_next,
+                    control_container.all_next_state_to_literal,
+                    current,
+                ) as ctl:
+                    latched = current.intersection(control_container.latches)
+                    for symbols in _get_models(ctl):
+                        does_symbols = [symbol for symbol in symbols if symbol.name == "does"]
+                        next_symbols = [symbol for symbol in symbols if symbol.name != "does"]
+                        role_move_pairs = _translate_model(
+                            does_symbols,
+                            self.translation_container.does_symbol_to_action,
+                            _transform_pair,
+                        )
+                        subrelations = _translate_model(
+                            next_symbols,
+                            self.translation_container.next_symbol_to_state,
+                            functools.partial(_transform, unpack=0),
+                        )
+                        yield Turn(role_move_pairs), State(latched.union(subrelations))
+            finally:
+                control_container.all_next_lock.release()
 
     def _get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
         if not self.has_incomplete_information:
             return {role: View(current) for role in self.get_roles()}
-        with _set_state(self.control_container.sees, self.control_container.sees_state_to_literal, current) as ctl:
+        with self._checkout_control_container() as control_container, _set_state(
+            control_container.sees,
+            control_container.sees_state_to_literal,
+            current,
+        ) as ctl:
             model = _get_model(ctl)
-            subrelations = _transform_model(model)
-            role_subrelation_pairs = (
-                (Role(subrelation.symbol.arguments[0]), subrelation.symbol.arguments[1]) for subrelation in subrelations
+            role_subrelation_pairs = _translate_model(
+                model,
+                self.translation_container.sees_symbol_to_view,
+                _transform_pair,
             )
             try:
                 sees: Mapping[Role, Set[gdl.Subrelation]] = collections.defaultdict(set)
@@ -1215,12 +1322,16 @@ class ClingoInterpreter(ClingoRegroundingInterpreter):
                 raise UnsatSeesInterpreterError from UnsatInterpreterError
 
     def _get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
-        with _set_state(self.control_container.legal, self.control_container.legal_state_to_literal, current) as ctl:
+        with self._checkout_control_container() as control_container, _set_state(
+            control_container.legal,
+            control_container.legal_state_to_literal,
+            current,
+        ) as ctl:
             model = _get_model(ctl)
-            subrelations = _transform_model(model)
-            role_move_pairs = (
-                (Role(subrelation.symbol.arguments[0]), Move(subrelation.symbol.arguments[1]))
-                for subrelation in subrelations
+            role_move_pairs = _translate_model(
+                model,
+                self.translation_container.legal_symbol_to_action,
+                _transform_pair,
             )
             try:
                 legal_moves: Mapping[Role, Set[Move]] = collections.defaultdict(set)
@@ -1231,7 +1342,11 @@ class ClingoInterpreter(ClingoRegroundingInterpreter):
                 raise UnsatLegalInterpreterError from UnsatInterpreterError
 
     def _get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
-        with _set_state(self.control_container.goal, self.control_container.goal_state_to_literal, current) as ctl:
+        with self._checkout_control_container() as control_container, _set_state(
+            control_container.goal,
+            control_container.goal_state_to_literal,
+            current,
+        ) as ctl:
             model = _get_model(ctl)
             subrelations = _transform_model(model)
             role_goal_pairs = (
@@ -1253,9 +1368,9 @@ class ClingoInterpreter(ClingoRegroundingInterpreter):
                 raise UnsatGoalInterpreterError from UnsatInterpreterError
 
     def _is_terminal(self, current: Union[State, View]) -> bool:
-        with _set_state(
-            self.control_container.terminal,
-            self.control_container.terminal_state_to_literal,
+        with self._checkout_control_container() as control_container, _set_state(
+            control_container.terminal,
+            control_container.terminal_state_to_literal,
             current,
         ) as ctl:
             model = _get_model(ctl)
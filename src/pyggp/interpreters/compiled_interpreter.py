@@ -0,0 +1,129 @@
+"""Interpreter that answers queries by code compiled from the ruleset.
+
+The queries of the clingo interpreter set the externals of a control, and solve. For small and medium games, most of
+that time is spent in the overhead of solving, rather than in the actual inference. This interpreter compiles the
+ruleset to Python code over integer bitsets (see `pyggp._clingo_interpreter.compilation`), and answers the queries of
+a state by calling the compiled functions. Rulesets that cannot be compiled are answered by clingo, as are the roles,
+the initial state, developments, and possible states.
+
+"""
+
+import logging
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Iterator, Mapping, MutableMapping, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.compilation import CompiledProgram
+from pyggp.engine_primitives import Move, Role, State, Turn, View
+from pyggp.exceptions.interpreter_exceptions import (
+    GoalNotIntegerInterpreterError,
+    MultipleGoalsInterpreterError,
+    UncompilableInterpreterError,
+    UnsatGoalInterpreterError,
+    UnsatLegalInterpreterError,
+    UnsatNextInterpreterError,
+    UnsatSeesInterpreterError,
+    UnsatTerminalInterpreterError,
+)
+from pyggp.interpreters.base_interpreters import CachingInterpreter, ClingoInterpreter
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+
+@dataclass
+class CompiledInterpreter(ClingoInterpreter):
+    """An interpreter for a GDL ruleset using code compiled from the ruleset, and clingo where it cannot be compiled."""
+
+    program: Optional[CompiledProgram] = field(default=None, repr=False)
+    "Compiled program, None if the ruleset cannot be compiled."
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: Any,
+        cache_directory: Optional[pathlib.Path] = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a compiled interpreter from a ruleset.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the clingo interpreter
+            cache_directory: Directory of the compiled rulesets, see `CompiledProgram.from_ruleset`
+            kwargs: Keyword arguments for the clingo interpreter
+
+        Returns:
+            Compiled interpreter for the given ruleset
+
+        """
+        interpreter = super().from_ruleset(ruleset, *args, **kwargs)
+        try:
+            program = CompiledProgram.from_ruleset(ruleset, directory=cache_directory)
+        except UncompilableInterpreterError:
+            log.warning("Falling back to clingo, as the ruleset cannot be compiled", exc_info=True)
+            return interpreter
+        interpreter.program = program
+        return interpreter
+
+    @classmethod
+    def from_cli(cls, ruleset: gdl.Ruleset, *args: str, cache_directory: Optional[str] = None, **kwargs: str) -> Self:
+        directory = pathlib.Path(cache_directory) if cache_directory is not None else None
+        return super().from_cli(ruleset, *args, cache_directory=directory, **kwargs)
+
+    def _get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
+        if self.program is None:
+            return super()._get_next_state(current, turn)
+        next_state = self.program.get_next_state(current, turn)
+        if next_state is None:
+            raise UnsatNextInterpreterError
+        return next_state
+
+    def _get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        if self.program is None:
+            return super()._get_all_next_states(current)
+        # Enumerating the turns and computing each next state is cheaper than a single solve.
+        # Disables SLF001 (Private member accessed). Because: This is the implementation of the base class.
+        return CachingInterpreter._get_all_next_states(self, current)  # noqa: SLF001
+
+    def _get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
+        if self.program is None or not self.has_incomplete_information:
+            return super()._get_sees(current)
+        sees = self.program.get_sees(current)
+        if sees is None:
+            raise UnsatSeesInterpreterError
+        return sees
+
+    def _get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
+        if self.program is None:
+            return super()._get_legal_moves(current)
+        legal_moves = self.program.get_legal_moves(current)
+        if legal_moves is None:
+            raise UnsatLegalInterpreterError
+        return legal_moves
+
+    def _get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
+        if self.program is None:
+            return super()._get_goals(current)
+        role_goal_pairs = self.program.get_goals(current)
+        if role_goal_pairs is None:
+            raise UnsatGoalInterpreterError
+        goals: MutableMapping[Role, Optional[int]] = {}
+        for role, goal in role_goal_pairs:
+            if role in goals:
+                raise MultipleGoalsInterpreterError
+            if goal is None:
+                raise GoalNotIntegerInterpreterError
+            goals[role] = goal
+        return {role: goals.get(role, None) for role in self.get_roles()}
+
+    def _is_terminal(self, current: Union[State, View]) -> bool:
+        if self.program is None:
+            return super()._is_terminal(current)
+        is_terminal = self.program.is_terminal(current)
+        if is_terminal is None:
+            raise UnsatTerminalInterpreterError
+        return is_terminal
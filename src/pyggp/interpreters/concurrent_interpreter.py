@@ -0,0 +1,98 @@
+"""Interpreter that can be shared by threads.
+
+The clingo interpreter keeps a control per query and mutates its externals while solving, hence it cannot answer
+queries from more than one thread. The concurrent interpreter holds a pool of replicas of its controls instead, and each
+query checks out a replica for its duration. As clingo releases the GIL while grounding and solving, queries from
+different threads run in parallel.
+
+"""
+
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Iterator, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.control_containers import ControlContainer, ControlContainerPool
+from pyggp.engine_primitives import State, Turn, View
+from pyggp.interpreters.base_interpreters import ClingoInterpreter
+
+
+@dataclass
+class ConcurrentClingoInterpreter(ClingoInterpreter):
+    """A clingo interpreter that can be shared by threads.
+
+    Queries check out one of the replicas in the pool, a thread waits if all replicas are checked out. The caches are
+    shared by all threads. The successors of a state are enumerated eagerly, such that no replica is held by a
+    suspended iterator.
+
+    """
+
+    pool: ControlContainerPool = field(default_factory=ControlContainerPool, repr=False)
+    "Replicas of the control container."
+
+    def __post_init__(self) -> None:
+        if self.pool.size == 0:
+            self.pool = ControlContainerPool.from_ruleset(
+                self.ruleset,
+                size=1,
+                control_containers=(self.control_container,),
+            )
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: Any,
+        pool_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a concurrent interpreter from a ruleset.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the clingo interpreter
+            pool_size: Number of replicas, defaults to the number of CPUs (at most 8)
+            kwargs: Keyword arguments for the clingo interpreter
+
+        Returns:
+            Concurrent interpreter for the given ruleset
+
+        """
+        interpreter = super().from_ruleset(ruleset, *args, **kwargs)
+        if pool_size is None:
+            pool_size = max(1, min(8, multiprocessing.cpu_count()))
+        interpreter.pool = ControlContainerPool.from_ruleset(
+            ruleset,
+            size=pool_size,
+            control_containers=(interpreter.control_container,),
+        )
+        return interpreter
+
+    @classmethod
+    def from_cli(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: str,
+        pool_size: Union[str, int, None] = None,
+        **kwargs: str,
+    ) -> Self:
+        if isinstance(pool_size, str):
+            pool_size = int(pool_size)
+        return super().from_cli(ruleset, *args, pool_size=pool_size, **kwargs)
+
+    # endregion
+
+    # region Methods
+
+    def _checkout_control_container(self) -> ContextManager[ControlContainer]:
+        return self.pool.checkout()
+
+    def _get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        with self.pool.checkout():
+            return iter(tuple(super()._get_all_next_states(current)))
+
+    # endregion
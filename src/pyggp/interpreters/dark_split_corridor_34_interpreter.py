@@ -24,6 +24,7 @@ from pyggp.engine_primitives import Development, Move, Role, State, Turn, View
 from pyggp.interpreters import ClingoInterpreter
 from pyggp.interpreters.base_interpreters import CachingInterpreter, Interpreter
 from pyggp.records import Record
+from pyggp.shared_cache import SharedInterpreterCache
 
 left: Final[Role] = Role(gdl.Subrelation(gdl.Relation("left")))
 right: Final[Role] = Role(gdl.Subrelation(gdl.Relation("right")))
@@ -600,6 +601,7 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
         ruleset: gdl.Ruleset,
         *args: Any,
         disable_cache: bool = False,
+        shared_cache: Optional[SharedInterpreterCache] = None,
         **kwargs: Any,
     ) -> Self:
         ref_interpreter = ClingoInterpreter.from_ruleset(ruleset, *args, disable_cache=True, **kwargs)
@@ -607,6 +609,7 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
             ruleset=ruleset,
             ref_interpreter=ref_interpreter,
             disable_cache=disable_cache,
+            shared_cache=shared_cache,
         )
 
     @classmethod
@@ -615,11 +618,14 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
         ruleset: gdl.Ruleset,
         *args: str,
         disable_cache: Union[str, bool] = False,
+        shared_cache: Union[str, SharedInterpreterCache, None] = None,
         **kwargs: str,
     ) -> Self:
         if isinstance(disable_cache, str):
             disable_cache = disable_cache.casefold() == "true" or disable_cache == "1"
-        return cls.from_ruleset(ruleset, *args, disable_cache=disable_cache, **kwargs)
+        if isinstance(shared_cache, str):
+            shared_cache = SharedInterpreterCache.connect(ruleset, shared_cache)
+        return cls.from_ruleset(ruleset, *args, disable_cache=disable_cache, shared_cache=shared_cache, **kwargs)
 
     @property
     def has_incomplete_information(self) -> bool:
@@ -634,9 +640,7 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
     def _get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
         state = dsc34.State.from_pyggp_state(current)
         state.apply(turn)
-        ret = state.into_pyggp_state()
-        assert self.ref_interpreter.get_next_state(current, turn) == ret
-        return ret
+        return state.into_pyggp_state()
 
     def _get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
         state = dsc34.State.from_pyggp_state(current)
@@ -644,15 +648,11 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
 
     def _get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
         state = dsc34.State.from_pyggp_state(current)
-        ret = state.into_pyggp_view()
-        assert self.ref_interpreter.get_sees(current) == ret
-        return ret
+        return state.into_pyggp_view()
 
     def _get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
         state = dsc34.State.from_pyggp_state(current)
-        ret = state.moves(role)
-        # assert self.ref_interpreter.get_legal_moves_by_role(current, role) == ret
-        return ret
+        return state.moves(role)
 
     def _get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
         found_ats = 0
@@ -672,12 +672,10 @@ class DarkSplitCorridor34Interpreter(CachingInterpreter):
         for subrelation in current:
             if subrelation.symbol.name == "at":
                 if subrelation.symbol.arguments[1] in finish_line:
-                    assert self.ref_interpreter.is_terminal(current)
                     return True
                 found_ats += 1
                 if found_ats >= 2:
                     break
-        assert not self.ref_interpreter.is_terminal(current)
         return False
 
     def get_developments(
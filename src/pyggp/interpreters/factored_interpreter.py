@@ -0,0 +1,309 @@
+"""Interpreter wrapper that caches the answers of independent parts of states separately.
+
+Games such as the split corridor games consist of sub-boards that never interact. The wrapped interpreter sees every
+combination of sub-board positions as a new state, hence its caches grow with the product of the sub-boards' state
+spaces. This wrapper caches the next state of each factor (see `pyggp._clingo_interpreter.factor_containers`) by the
+factor's part of the state and the moves it depends on, and the other queries by the part of the state they depend on.
+Hence, the caches grow with the sum of the factors' state spaces, and a state whose parts have all been seen before is
+answered without solving, even if the state itself has never been seen.
+
+"""
+
+import collections
+import itertools
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.factor_containers import Action, FactorContainer
+from pyggp._logging import rich
+from pyggp.engine_primitives import Development, Move, Role, State, Turn, View
+from pyggp.interpreters.base_interpreters import ClingoInterpreter, Interpreter
+from pyggp.records import Record
+
+_FactorKey = Tuple[FrozenSet[gdl.Subrelation], FrozenSet[Action]]
+_SupportCache = Dict[FrozenSet[gdl.Subrelation], Any]
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class FactoredInterpreter(Interpreter):
+    """Answers queries of the wrapped interpreter from caches keyed by parts of states.
+
+    Cached are `get_next_state`, `get_all_next_states`, `get_all_turns`, `get_sees`, `get_legal_moves`, `is_legal`,
+    `get_goals` and `is_terminal`, including their by-role variants. States with fluents that are not part of any
+    factor, developments and possible states are delegated as is.
+
+    """
+
+    @dataclass
+    class CacheContainer:
+        next: List[Dict[_FactorKey, FrozenSet[gdl.Subrelation]]] = field(default_factory=list)
+        sees: DefaultDict[Role, _SupportCache] = field(default_factory=lambda: collections.defaultdict(dict))
+        legal: DefaultDict[Role, _SupportCache] = field(default_factory=lambda: collections.defaultdict(dict))
+        goal: DefaultDict[Role, _SupportCache] = field(default_factory=lambda: collections.defaultdict(dict))
+        terminal: _SupportCache = field(default_factory=dict)
+
+        def clear(self) -> None:
+            for factor_cache in self.next:
+                factor_cache.clear()
+            self.sees.clear()
+            self.legal.clear()
+            self.goal.clear()
+            self.terminal.clear()
+
+    interpreter: Interpreter
+    "Wrapped interpreter."
+    factor_container: FactorContainer
+    "Factors of the game."
+    cache: CacheContainer = field(default_factory=CacheContainer)
+    _fluents: FrozenSet[gdl.Subrelation] = field(default_factory=frozenset, init=False, repr=False)
+    _fluent_to_factor: Mapping[gdl.Subrelation, int] = field(default_factory=dict, init=False, repr=False)
+    _action_to_factors: Mapping[Action, Sequence[int]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._fluent_to_factor = {
+            fluent: index for index, factor in enumerate(self.factor_container.factors) for fluent in factor
+        }
+        self._fluents = frozenset(self._fluent_to_factor)
+        action_to_factors: DefaultDict[Action, List[int]] = collections.defaultdict(list)
+        for index, actions in enumerate(self.factor_container.factor_actions):
+            for action in actions:
+                action_to_factors[action].append(index)
+        self._action_to_factors = {action: tuple(indices) for action, indices in action_to_factors.items()}
+        while len(self.cache.next) < len(self.factor_container.factors):
+            self.cache.next.append({})
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: Any,
+        disable_cache: bool = True,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a factored clingo interpreter from a ruleset.
+
+        The caches of the wrapped interpreter are disabled by default, as they would hold every combination of parts.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the wrapped interpreter
+            disable_cache: Whether to disable the caches of the wrapped interpreter
+            kwargs: Keyword arguments for the wrapped interpreter
+
+        Returns:
+            Factored interpreter for the given ruleset
+
+        """
+        interpreter = ClingoInterpreter.from_ruleset(ruleset, *args, disable_cache=disable_cache, **kwargs)
+        factor_container = FactorContainer.from_ruleset(ruleset, interpreter.shape_container)
+        return cls(interpreter=interpreter, factor_container=factor_container)
+
+    @classmethod
+    def from_cli(cls, ruleset: gdl.Ruleset, *args: str, disable_cache: Union[str, bool] = True, **kwargs: str) -> Self:
+        if isinstance(disable_cache, str):
+            disable_cache = disable_cache.casefold() == "true" or disable_cache == "1"
+        interpreter = ClingoInterpreter.from_cli(ruleset, *args, disable_cache=disable_cache, **kwargs)
+        factor_container = FactorContainer.from_ruleset(ruleset, interpreter.shape_container)
+        return cls(interpreter=interpreter, factor_container=factor_container)
+
+    # endregion
+
+    # region Magic Methods
+
+    def __rich__(self) -> str:
+        interpreter_str = f"interpreter={rich(self.interpreter)}"
+        factors_str = f"factors={len(self.factor_container.factors)}"
+        return f"{self.__class__.__name__}({interpreter_str}, {factors_str})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ruleset(self) -> gdl.Ruleset:
+        """Ruleset of the wrapped interpreter."""
+        return self.interpreter.ruleset
+
+    @property
+    def has_incomplete_information(self) -> bool:
+        """Whether the game has incomplete information."""
+        return self.interpreter.has_incomplete_information
+
+    # endregion
+
+    # region Methods
+
+    def get_roles(self) -> FrozenSet[Role]:
+        return self.interpreter.get_roles()
+
+    def get_init_state(self) -> State:
+        return self.interpreter.get_init_state()
+
+    def get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
+        parts = self._get_parts(current)
+        if parts is None:
+            return self.interpreter.get_next_state(current, turn)
+        keys = self._get_keys(parts, turn)
+        next_state = self._get_cached_next_state(keys)
+        if next_state is None:
+            next_state = self.interpreter.get_next_state(current, turn)
+            self._set_cached_next_state(keys, next_state)
+        return next_state
+
+    def get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        parts = self._get_parts(current)
+        if parts is None:
+            return self.interpreter.get_all_next_states(current)
+        turn_key_pairs = tuple((turn, self._get_keys(parts, turn)) for turn in self.get_all_turns(current))
+        turn_state_pairs = tuple((turn, self._get_cached_next_state(keys)) for turn, keys in turn_key_pairs)
+        if all(next_state is not None for _, next_state in turn_state_pairs):
+            return iter(turn_state_pairs)
+        return self._get_all_next_states(current, parts)
+
+    def _get_all_next_states(
+        self,
+        current: Union[State, View],
+        parts: Sequence[FrozenSet[gdl.Subrelation]],
+    ) -> Iterator[Tuple[Turn, State]]:
+        for turn, next_state in self.interpreter.get_all_next_states(current):
+            self._set_cached_next_state(self._get_keys(parts, turn), next_state)
+            yield turn, next_state
+
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        if self.is_terminal(current):
+            return
+        role_move_pairs = (
+            tuple((role, move) for move in self.get_legal_moves_by_role(current, role))
+            for role in Interpreter.get_roles_in_control(current)
+        )
+        for turn_role_move_pairs in itertools.product(*role_move_pairs):
+            yield Turn(turn_role_move_pairs)
+
+    def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
+        if self.has_incomplete_information:
+            return {role: self.get_sees_by_role(current, role) for role in self.get_roles()}
+        return self.interpreter.get_sees(current)
+
+    def get_sees_by_role(self, current: Union[State, View], role: Role) -> View:
+        support = self.factor_container.sees_supports.get(role, frozenset())
+        return self._get_cached(
+            self.cache.sees[role],
+            current,
+            support,
+            lambda: self.interpreter.get_sees_by_role(current, role),
+        )
+
+    def get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
+        return {role: self.get_legal_moves_by_role(current, role) for role in self.get_roles()}
+
+    def is_legal(self, current: Union[State, View], role: Role, move: Move) -> bool:
+        return move in self.get_legal_moves_by_role(current, role)
+
+    def get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
+        support = self.factor_container.legal_supports.get(role, frozenset())
+        return self._get_cached(
+            self.cache.legal[role],
+            current,
+            support,
+            lambda: self.interpreter.get_legal_moves_by_role(current, role),
+        )
+
+    def get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
+        return {role: self.get_goal_by_role(current, role) for role in self.get_roles()}
+
+    def get_goal_by_role(self, current: Union[State, View], role: Role) -> Optional[int]:
+        support = self.factor_container.goal_supports.get(role, frozenset())
+        return self._get_cached(
+            self.cache.goal[role],
+            current,
+            support,
+            lambda: self.interpreter.get_goal_by_role(current, role),
+        )
+
+    def is_terminal(self, current: Union[State, View]) -> bool:
+        return self._get_cached(
+            self.cache.terminal,
+            current,
+            self.factor_container.terminal_support,
+            lambda: self.interpreter.is_terminal(current),
+        )
+
+    def get_developments(
+        self,
+        record: Record,
+        *,
+        last_ply_is_final_state: Optional[bool] = None,
+    ) -> Iterator[Development]:
+        return self.interpreter.get_developments(record, last_ply_is_final_state=last_ply_is_final_state)
+
+    def get_possible_states(self, record: Record, ply: int, *, is_final: Optional[bool] = None) -> Iterator[State]:
+        return self.interpreter.get_possible_states(record, ply, is_final=is_final)
+
+    def _get_parts(self, current: Union[State, View]) -> Optional[Sequence[FrozenSet[gdl.Subrelation]]]:
+        parts: List[List[gdl.Subrelation]] = [[] for _ in self.cache.next]
+        for fluent in current:
+            index = self._fluent_to_factor.get(fluent)
+            if index is None:
+                return None
+            parts[index].append(fluent)
+        return tuple(frozenset(part) for part in parts)
+
+    def _get_keys(self, parts: Sequence[FrozenSet[gdl.Subrelation]], turn: Mapping[Role, Move]) -> Sequence[_FactorKey]:
+        actions: List[List[Action]] = [[] for _ in parts]
+        for action in turn.items():
+            for index in self._action_to_factors.get(action, ()):
+                actions[index].append(action)
+        return tuple(zip(parts, (frozenset(factor_actions) for factor_actions in actions)))
+
+    def _get_cached_next_state(self, keys: Sequence[_FactorKey]) -> Optional[State]:
+        next_parts = []
+        for factor_cache, key in zip(self.cache.next, keys):
+            next_part = factor_cache.get(key)
+            if next_part is None:
+                return None
+            next_parts.append(next_part)
+        return State(frozenset().union(*next_parts))
+
+    def _set_cached_next_state(self, keys: Sequence[_FactorKey], next_state: State) -> None:
+        parts = self._get_parts(next_state)
+        if parts is None:
+            return
+        for factor_cache, key, part in zip(self.cache.next, keys, parts):
+            factor_cache[key] = part
+
+    def _get_cached(
+        self,
+        cache: _SupportCache,
+        current: Union[State, View],
+        support: FrozenSet[gdl.Subrelation],
+        compute: Callable[[], _T],
+    ) -> _T:
+        if not self._fluents.issuperset(current):
+            return compute()
+        key = support.intersection(current)
+        if key not in cache:
+            cache[key] = compute()
+        return cache[key]
+
+    # endregion
@@ -0,0 +1,227 @@
+"""Interpreter wrapper that profiles calls inside real matches.
+
+The wrapper records, for sampled calls of the methods that dominate search, the wall time, the time clingo spent
+grounding and solving, and the size of the result. The remainder of the wall time is spent in Python, mostly on
+transforming models. Measurements are recorded as metrics, hence nothing is recorded while metrics are disabled.
+
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Iterator, Mapping, Optional, Tuple, TypeVar, Union
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp._clingo_interpreter.base import SolverStatistics, probe_solver
+from pyggp._logging import rich
+from pyggp.engine_primitives import Development, Move, Role, State, Turn, View
+from pyggp.interpreters.base_interpreters import ClingoInterpreter, Interpreter
+from pyggp.records import Record
+
+_T = TypeVar("_T")
+
+RESULT_SIZE_BUCKETS: Tuple[float, ...] = metrics.exponential_buckets(1, 2, 16)
+"Buckets of the histogram of result sizes."
+
+
+@dataclass
+class InstrumentedInterpreter(Interpreter):
+    """Records the performance of sampled calls of the wrapped interpreter as metrics.
+
+    Profiled are `get_next_state`, `get_legal_moves_by_role`, `is_terminal`, `get_developments` and
+    `get_possible_states`, all other methods are delegated as is. Developments and possible states are yielded lazily,
+    their measurements cover the time spent producing them, but not the time the caller spends in between.
+
+    """
+
+    interpreter: Interpreter
+    "Wrapped interpreter."
+    sample_rate: float = field(default=1.0)
+    "Probability that a call is profiled."
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    "Random number generator for sampling."
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(cls, ruleset: gdl.Ruleset, *args: Any, sample_rate: float = 1.0, **kwargs: Any) -> Self:
+        """Create an instrumented clingo interpreter from a ruleset.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the wrapped interpreter
+            sample_rate: Probability that a call is profiled
+            kwargs: Keyword arguments for the wrapped interpreter
+
+        Returns:
+            Instrumented interpreter for the given ruleset
+
+        """
+        return cls(interpreter=ClingoInterpreter.from_ruleset(ruleset, *args, **kwargs), sample_rate=sample_rate)
+
+    @classmethod
+    def from_cli(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: str,
+        sample_rate: Union[str, float] = 1.0,
+        **kwargs: str,
+    ) -> Self:
+        return cls(interpreter=ClingoInterpreter.from_cli(ruleset, *args, **kwargs), sample_rate=float(sample_rate))
+
+    # endregion
+
+    # region Magic Methods
+
+    def __rich__(self) -> str:
+        interpreter_str = f"interpreter={rich(self.interpreter)}"
+        sample_rate_str = f"sample_rate={self.sample_rate}"
+        return f"{self.__class__.__name__}({interpreter_str}, {sample_rate_str})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ruleset(self) -> gdl.Ruleset:
+        """Ruleset of the wrapped interpreter."""
+        return self.interpreter.ruleset
+
+    @property
+    def has_incomplete_information(self) -> bool:
+        """Whether the game has incomplete information."""
+        return self.interpreter.has_incomplete_information
+
+    # endregion
+
+    # region Methods
+
+    def get_roles(self) -> FrozenSet[Role]:
+        return self.interpreter.get_roles()
+
+    def get_init_state(self) -> State:
+        return self.interpreter.get_init_state()
+
+    def get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
+        registry = self._get_sampling_registry()
+        if registry is None:
+            return self.interpreter.get_next_state(current, turn)
+        statistics = SolverStatistics()
+        start = time.perf_counter()
+        with probe_solver(statistics):
+            next_state = self.interpreter.get_next_state(current, turn)
+        _record(registry, "get_next_state", time.perf_counter() - start, statistics, len(next_state))
+        return next_state
+
+    def get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        return self.interpreter.get_all_next_states(current)
+
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        return self.interpreter.get_all_turns(current)
+
+    def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
+        return self.interpreter.get_sees(current)
+
+    def get_sees_by_role(self, current: Union[State, View], role: Role) -> View:
+        return self.interpreter.get_sees_by_role(current, role)
+
+    def get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
+        return self.interpreter.get_legal_moves(current)
+
+    def is_legal(self, current: Union[State, View], role: Role, move: Move) -> bool:
+        return self.interpreter.is_legal(current, role, move)
+
+    def get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
+        registry = self._get_sampling_registry()
+        if registry is None:
+            return self.interpreter.get_legal_moves_by_role(current, role)
+        statistics = SolverStatistics()
+        start = time.perf_counter()
+        with probe_solver(statistics):
+            legal_moves = self.interpreter.get_legal_moves_by_role(current, role)
+        _record(registry, "get_legal_moves_by_role", time.perf_counter() - start, statistics, len(legal_moves))
+        return legal_moves
+
+    def get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
+        return self.interpreter.get_goals(current)
+
+    def get_goal_by_role(self, current: Union[State, View], role: Role) -> Optional[int]:
+        return self.interpreter.get_goal_by_role(current, role)
+
+    def is_terminal(self, current: Union[State, View]) -> bool:
+        registry = self._get_sampling_registry()
+        if registry is None:
+            return self.interpreter.is_terminal(current)
+        statistics = SolverStatistics()
+        start = time.perf_counter()
+        with probe_solver(statistics):
+            terminal = self.interpreter.is_terminal(current)
+        _record(registry, "is_terminal", time.perf_counter() - start, statistics, int(terminal))
+        return terminal
+
+    def get_developments(
+        self,
+        record: Record,
+        *,
+        last_ply_is_final_state: Optional[bool] = None,
+    ) -> Iterator[Development]:
+        developments = self.interpreter.get_developments(record, last_ply_is_final_state=last_ply_is_final_state)
+        registry = self._get_sampling_registry()
+        if registry is None:
+            return developments
+        return _profile_iterator(registry, "get_developments", developments)
+
+    def get_possible_states(self, record: Record, ply: int, *, is_final: Optional[bool] = None) -> Iterator[State]:
+        possible_states = self.interpreter.get_possible_states(record, ply, is_final=is_final)
+        registry = self._get_sampling_registry()
+        if registry is None:
+            return possible_states
+        return _profile_iterator(registry, "get_possible_states", possible_states)
+
+    def _get_sampling_registry(self) -> Optional[metrics.MetricsRegistry]:
+        registry = metrics.registry
+        if registry is None or (self.sample_rate < 1.0 and self.rng.random() >= self.sample_rate):
+            return None
+        return registry
+
+    # endregion
+
+
+def _profile_iterator(registry: metrics.MetricsRegistry, method: str, iterator: Iterator[_T]) -> Iterator[_T]:
+    statistics = SolverStatistics()
+    elapsed_s = 0.0
+    size = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                with probe_solver(statistics):
+                    item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed_s += time.perf_counter() - start
+            size += 1
+            yield item
+    finally:
+        _record(registry, method, elapsed_s, statistics, size)
+
+
+def _record(
+    registry: metrics.MetricsRegistry,
+    method: str,
+    elapsed_s: float,
+    statistics: SolverStatistics,
+    size: int,
+) -> None:
+    registry.counter("pyggp_interpreter_sampled_calls_total", method=method).inc()
+    registry.counter("pyggp_interpreter_solves_total", method=method).inc(statistics.solves)
+    registry.histogram("pyggp_interpreter_call_seconds", method=method).observe(elapsed_s)
+    registry.histogram("pyggp_interpreter_ground_seconds", method=method).observe(statistics.grounding_s)
+    registry.histogram("pyggp_interpreter_solve_seconds", method=method).observe(statistics.solving_s)
+    transform_s = max(0.0, elapsed_s - statistics.grounding_s - statistics.solving_s)
+    registry.histogram("pyggp_interpreter_transform_seconds", method=method).observe(transform_s)
+    registry.histogram("pyggp_interpreter_result_size", buckets=RESULT_SIZE_BUCKETS, method=method).observe(size)
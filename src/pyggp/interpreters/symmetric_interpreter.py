@@ -0,0 +1,203 @@
+"""Interpreter wrapper that exploits the symmetries of a game.
+
+States that are images of each other under a symmetry of the game are answered by the same query of the wrapped
+interpreter: queries are asked about the canonical state, and the answers are mapped back. Hence, the caches of the
+wrapped interpreter only hold canonical states, which on square boards are up to an eighth of all states.
+
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp._logging import rich
+from pyggp.engine_primitives import Development, Move, Role, State, Turn, View
+from pyggp.interpreters.base_interpreters import ClingoInterpreter, Interpreter
+from pyggp.records import Record
+from pyggp.symmetries import (
+    DEFAULT_PLAYOUTS,
+    Symmetry,
+    SymmetryGroup,
+    as_symmetry_group,
+    detect_symmetries,
+    get_universe,
+)
+
+
+@dataclass
+class SymmetricInterpreter(Interpreter):
+    """Answers queries of the wrapped interpreter about canonical states only.
+
+    Canonicalized are `get_next_state`, `get_all_next_states`, `get_sees`, `get_legal_moves`, `is_legal`, `get_goals`
+    and `is_terminal`, including their by-role variants. Developments and possible states are delegated as is.
+
+    """
+
+    interpreter: Interpreter
+    "Wrapped interpreter."
+    symmetries: SymmetryGroup
+    "Symmetries of the game."
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: Any,
+        symmetries: Union[SymmetryGroup, Iterable[Symmetry], None] = None,
+        playouts: int = DEFAULT_PLAYOUTS,
+        rng: Optional[random.Random] = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a symmetric clingo interpreter from a ruleset.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the wrapped interpreter
+            symmetries: Declared symmetries of the game, detected if not given
+            playouts: Number of random playouts to verify detected symmetries along
+            rng: Random number generator for the playouts
+            kwargs: Keyword arguments for the wrapped interpreter
+
+        Returns:
+            Symmetric interpreter for the given ruleset
+
+        """
+        interpreter = ClingoInterpreter.from_ruleset(ruleset, *args, **kwargs)
+        if symmetries is None:
+            symmetry_group = detect_symmetries(interpreter, playouts=playouts, rng=rng)
+        else:
+            symmetry_group = as_symmetry_group(symmetries, get_universe(interpreter.shape_container))
+        return cls(interpreter=interpreter, symmetries=symmetry_group)
+
+    @classmethod
+    def from_cli(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: str,
+        playouts: Union[str, int] = DEFAULT_PLAYOUTS,
+        seed: Union[str, int, None] = None,
+        **kwargs: str,
+    ) -> Self:
+        interpreter = ClingoInterpreter.from_cli(ruleset, *args, **kwargs)
+        # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: The
+        # playouts are not used for cryptography.
+        rng = random.Random(int(seed)) if seed is not None else None  # noqa: S311
+        return cls(interpreter=interpreter, symmetries=detect_symmetries(interpreter, playouts=int(playouts), rng=rng))
+
+    # endregion
+
+    # region Magic Methods
+
+    def __rich__(self) -> str:
+        interpreter_str = f"interpreter={rich(self.interpreter)}"
+        symmetries_str = f"symmetries={len(self.symmetries)}"
+        return f"{self.__class__.__name__}({interpreter_str}, {symmetries_str})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ruleset(self) -> gdl.Ruleset:
+        """Ruleset of the wrapped interpreter."""
+        return self.interpreter.ruleset
+
+    @property
+    def has_incomplete_information(self) -> bool:
+        """Whether the game has incomplete information."""
+        return self.interpreter.has_incomplete_information
+
+    # endregion
+
+    # region Methods
+
+    def get_roles(self) -> FrozenSet[Role]:
+        return self.interpreter.get_roles()
+
+    def get_init_state(self) -> State:
+        return self.interpreter.get_init_state()
+
+    def get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_next_state(current, turn)
+        next_state = self.interpreter.get_next_state(canonical, symmetry.apply_turn(turn))
+        return self.symmetries.get_inverse(symmetry).apply_state(next_state)
+
+    def get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_all_next_states(current)
+        inverse = self.symmetries.get_inverse(symmetry)
+        return (
+            (inverse.apply_turn(turn), inverse.apply_state(next_state))
+            for turn, next_state in self.interpreter.get_all_next_states(canonical)
+        )
+
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_all_turns(current)
+        inverse = self.symmetries.get_inverse(symmetry)
+        return (inverse.apply_turn(turn) for turn in self.interpreter.get_all_turns(canonical))
+
+    def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_sees(current)
+        inverse = self.symmetries.get_inverse(symmetry)
+        return {role: inverse.apply_view(view) for role, view in self.interpreter.get_sees(canonical).items()}
+
+    def get_sees_by_role(self, current: Union[State, View], role: Role) -> View:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_sees_by_role(current, role)
+        return self.symmetries.get_inverse(symmetry).apply_view(self.interpreter.get_sees_by_role(canonical, role))
+
+    def get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_legal_moves(current)
+        inverse = self.symmetries.get_inverse(symmetry)
+        return {role: inverse.apply_moves(moves) for role, moves in self.interpreter.get_legal_moves(canonical).items()}
+
+    def is_legal(self, current: Union[State, View], role: Role, move: Move) -> bool:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        return self.interpreter.is_legal(canonical, role, symmetry.apply_move(move))
+
+    def get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
+        canonical, symmetry = self.symmetries.canonicalize(current)
+        if symmetry.is_identity:
+            return self.interpreter.get_legal_moves_by_role(current, role)
+        legal_moves = self.interpreter.get_legal_moves_by_role(canonical, role)
+        return self.symmetries.get_inverse(symmetry).apply_moves(legal_moves)
+
+    def get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
+        canonical, _ = self.symmetries.canonicalize(current)
+        return self.interpreter.get_goals(canonical)
+
+    def get_goal_by_role(self, current: Union[State, View], role: Role) -> Optional[int]:
+        canonical, _ = self.symmetries.canonicalize(current)
+        return self.interpreter.get_goal_by_role(canonical, role)
+
+    def is_terminal(self, current: Union[State, View]) -> bool:
+        canonical, _ = self.symmetries.canonicalize(current)
+        return self.interpreter.is_terminal(canonical)
+
+    def get_developments(
+        self,
+        record: Record,
+        *,
+        last_ply_is_final_state: Optional[bool] = None,
+    ) -> Iterator[Development]:
+        return self.interpreter.get_developments(record, last_ply_is_final_state=last_ply_is_final_state)
+
+    def get_possible_states(self, record: Record, ply: int, *, is_final: Optional[bool] = None) -> Iterator[State]:
+        return self.interpreter.get_possible_states(record, ply, is_final=is_final)
+
+    # endregion
@@ -0,0 +1,262 @@
+"""Interpreter wrapper that cross-checks sampled calls against a reference interpreter.
+
+Specialized interpreters, such as the compiled interpreter or hand-written interpreters of single games, are only
+correct if they agree with the rules. This wrapper answers all queries by the wrapped interpreter, and for sampled calls
+also asks the reference interpreter, usually a clingo interpreter, and reports if the answers differ. With a sample rate
+of 1 every call is verified, as in tests, and with a small sample rate the wrapped interpreter runs at almost full
+speed, while mismatches are still found over the course of many matches.
+
+"""
+
+import importlib
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, FrozenSet, Iterator, Mapping, Optional, Tuple, Type, TypeVar, Union
+
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp._logging import rich
+from pyggp.engine_primitives import Development, Move, Role, State, Turn, View
+from pyggp.exceptions.interpreter_exceptions import MismatchInterpreterError
+from pyggp.interpreters.base_interpreters import ClingoInterpreter, Interpreter
+from pyggp.interpreters.compiled_interpreter import CompiledInterpreter
+from pyggp.records import Record
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class VerifyingInterpreter(Interpreter):
+    """Answers queries by the wrapped interpreter, and verifies sampled calls against a reference interpreter.
+
+    Verified are `get_roles`, `get_init_state`, `get_next_state`, `get_all_next_states`, `get_all_turns`, `get_sees`,
+    `get_legal_moves`, `is_legal`, `get_goals` and `is_terminal`, including their by-role variants. Developments and
+    possible states are delegated as is.
+
+    Mismatches are logged, counted as the metric `pyggp_interpreter_mismatches_total`, and raised as
+    `MismatchInterpreterError` if `raise_on_mismatch` is set. A call that raises on only one side, or raises different
+    exceptions on both sides, is a mismatch as well. Otherwise, exceptions of the wrapped interpreter are re-raised.
+
+    """
+
+    interpreter: Interpreter
+    "Wrapped interpreter."
+    reference: Interpreter
+    "Reference interpreter."
+    sample_rate: float = field(default=1.0)
+    "Probability that a call is verified."
+    raise_on_mismatch: bool = field(default=True)
+    "Whether to raise on a mismatch, or to only report it."
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+    "Random number generator for sampling."
+    mismatches: int = field(default=0, init=False)
+    "Number of mismatches found so far."
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: Any,
+        interpreter_type: Type[Interpreter] = CompiledInterpreter,
+        sample_rate: float = 1.0,
+        raise_on_mismatch: bool = True,
+        rng: Optional[random.Random] = None,
+        **kwargs: Any,
+    ) -> Self:
+        """Create a verifying interpreter from a ruleset, with a clingo interpreter as reference.
+
+        Args:
+            ruleset: Ruleset to create the interpreter from
+            args: Arguments for the wrapped interpreter
+            interpreter_type: Type of the wrapped interpreter
+            sample_rate: Probability that a call is verified
+            raise_on_mismatch: Whether to raise on a mismatch, or to only report it
+            rng: Random number generator for sampling
+            kwargs: Keyword arguments for the wrapped interpreter
+
+        Returns:
+            Verifying interpreter for the given ruleset
+
+        """
+        if rng is None:
+            # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because:
+            # The sampling is not used for cryptography.
+            rng = random.Random()  # noqa: S311
+        return cls(
+            interpreter=interpreter_type.from_ruleset(ruleset, *args, **kwargs),
+            reference=ClingoInterpreter.from_ruleset(ruleset, disable_cache=True),
+            sample_rate=sample_rate,
+            raise_on_mismatch=raise_on_mismatch,
+            rng=rng,
+        )
+
+    @classmethod
+    def from_cli(
+        cls,
+        ruleset: gdl.Ruleset,
+        *args: str,
+        interpreter: str = "pyggp.interpreters.CompiledInterpreter",
+        sample_rate: Union[str, float] = 1.0,
+        raise_on_mismatch: Union[str, bool] = True,
+        seed: Union[str, int, None] = None,
+        **kwargs: str,
+    ) -> Self:
+        modulename, classname = interpreter.rsplit(".", 1)
+        interpreter_type = getattr(importlib.import_module(modulename), classname)
+        factory = getattr(interpreter_type, "from_cli", interpreter_type.from_ruleset)
+        if isinstance(raise_on_mismatch, str):
+            raise_on_mismatch = raise_on_mismatch.casefold() == "true" or raise_on_mismatch == "1"
+        # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: The
+        # sampling is not used for cryptography.
+        rng = random.Random(int(seed)) if seed is not None else random.Random()  # noqa: S311
+        return cls(
+            interpreter=factory(ruleset, *args, **kwargs),
+            reference=ClingoInterpreter.from_ruleset(ruleset, disable_cache=True),
+            sample_rate=float(sample_rate),
+            raise_on_mismatch=raise_on_mismatch,
+            rng=rng,
+        )
+
+    # endregion
+
+    # region Magic Methods
+
+    def __rich__(self) -> str:
+        interpreter_str = f"interpreter={rich(self.interpreter)}"
+        sample_rate_str = f"sample_rate={self.sample_rate}"
+        return f"{self.__class__.__name__}({interpreter_str}, {sample_rate_str})"
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def ruleset(self) -> gdl.Ruleset:
+        """Ruleset of the wrapped interpreter."""
+        return self.interpreter.ruleset
+
+    @property
+    def has_incomplete_information(self) -> bool:
+        """Whether the game has incomplete information."""
+        return self.interpreter.has_incomplete_information
+
+    # endregion
+
+    # region Methods
+
+    def get_roles(self) -> FrozenSet[Role]:
+        return self._verify("get_roles", lambda interpreter: interpreter.get_roles())
+
+    def get_init_state(self) -> State:
+        return self._verify("get_init_state", lambda interpreter: interpreter.get_init_state())
+
+    def get_next_state(self, current: Union[State, View], turn: Mapping[Role, Move]) -> State:
+        return self._verify("get_next_state", lambda interpreter: interpreter.get_next_state(current, turn))
+
+    def get_all_next_states(self, current: Union[State, View]) -> Iterator[Tuple[Turn, State]]:
+        if not self._is_sampled():
+            return self.interpreter.get_all_next_states(current)
+        turn_state_pairs = self._verify(
+            "get_all_next_states",
+            lambda interpreter: frozenset(interpreter.get_all_next_states(current)),
+            sampled=True,
+        )
+        return iter(turn_state_pairs)
+
+    def get_all_turns(self, current: Union[State, View]) -> Iterator[Turn]:
+        if not self._is_sampled():
+            return self.interpreter.get_all_turns(current)
+        turns = self._verify(
+            "get_all_turns",
+            lambda interpreter: frozenset(interpreter.get_all_turns(current)),
+            sampled=True,
+        )
+        return iter(turns)
+
+    def get_sees(self, current: Union[State, View]) -> Mapping[Role, View]:
+        return self._verify("get_sees", lambda interpreter: interpreter.get_sees(current))
+
+    def get_sees_by_role(self, current: Union[State, View], role: Role) -> View:
+        return self._verify("get_sees_by_role", lambda interpreter: interpreter.get_sees_by_role(current, role))
+
+    def get_legal_moves(self, current: Union[State, View]) -> Mapping[Role, FrozenSet[Move]]:
+        return self._verify("get_legal_moves", lambda interpreter: interpreter.get_legal_moves(current))
+
+    def is_legal(self, current: Union[State, View], role: Role, move: Move) -> bool:
+        return self._verify("is_legal", lambda interpreter: interpreter.is_legal(current, role, move))
+
+    def get_legal_moves_by_role(self, current: Union[State, View], role: Role) -> FrozenSet[Move]:
+        return self._verify(
+            "get_legal_moves_by_role",
+            lambda interpreter: interpreter.get_legal_moves_by_role(current, role),
+        )
+
+    def get_goals(self, current: Union[State, View]) -> Mapping[Role, Optional[int]]:
+        return self._verify("get_goals", lambda interpreter: interpreter.get_goals(current))
+
+    def get_goal_by_role(self, current: Union[State, View], role: Role) -> Optional[int]:
+        return self._verify("get_goal_by_role", lambda interpreter: interpreter.get_goal_by_role(current, role))
+
+    def is_terminal(self, current: Union[State, View]) -> bool:
+        return self._verify("is_terminal", lambda interpreter: interpreter.is_terminal(current))
+
+    def get_developments(
+        self,
+        record: Record,
+        *,
+        last_ply_is_final_state: Optional[bool] = None,
+    ) -> Iterator[Development]:
+        return self.interpreter.get_developments(record, last_ply_is_final_state=last_ply_is_final_state)
+
+    def get_possible_states(self, record: Record, ply: int, *, is_final: Optional[bool] = None) -> Iterator[State]:
+        return self.interpreter.get_possible_states(record, ply, is_final=is_final)
+
+    def _is_sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or self.rng.random() < self.sample_rate
+
+    def _verify(self, method: str, call: Callable[[Interpreter], _T], *, sampled: bool = False) -> _T:
+        if not sampled and not self._is_sampled():
+            return call(self.interpreter)
+        actual, actual_error = _call(call, self.interpreter)
+        expected, expected_error = _call(call, self.reference)
+        if actual_error is None and expected_error is None:
+            if actual != expected:
+                self._report(method, actual, expected)
+            return actual
+        if type(actual_error) is not type(expected_error):
+            self._report(
+                method,
+                actual if actual_error is None else actual_error,
+                expected if expected_error is None else expected_error,
+                cause=actual_error,
+            )
+        if actual_error is not None:
+            raise actual_error
+        return actual
+
+    def _report(self, method: str, actual: object, expected: object, *, cause: Optional[Exception] = None) -> None:
+        self.mismatches += 1
+        if metrics.registry is not None:
+            metrics.registry.counter("pyggp_interpreter_mismatches_total", method=method).inc()
+        error = MismatchInterpreterError(method, actual, expected)
+        if self.raise_on_mismatch:
+            raise error from cause
+        log.error("%s", error)
+
+    # endregion
+
+
+def _call(call: Callable[[Interpreter], _T], interpreter: Interpreter) -> Tuple[Optional[_T], Optional[Exception]]:
+    # Disables BLE001 (Do not catch blind exception). Because: Any exception is an answer to compare with the other
+    # interpreter's answer.
+    try:
+        return call(interpreter), None
+    except Exception as error:  # noqa: BLE001
+        return None, error
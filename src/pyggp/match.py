@@ -28,7 +28,7 @@ import rich.progress as rich_progress
 from typing_extensions import TypeAlias
 
 import pyggp.game_description_language as gdl
-from pyggp._logging import format_id, format_timedelta, rich
+from pyggp._logging import format_id, format_timedelta, lazy, lazy_rich, rich
 from pyggp.actors import Actor
 from pyggp.engine_primitives import Move, Role, State, Turn, View
 from pyggp.exceptions.actor_exceptions import ActorError, TimeoutActorError
@@ -105,20 +105,24 @@ class _SignalProcessor(Generic[R, S, A], abc.ABC):
         log.debug(
             "Will send [italic]%s[/italic] to %s",
             self.signal_name,
-            ", ".join(f"[yellow italic]{rich(role)}[/yellow italic]" for role in self.roles),
+            lazy(lambda: ", ".join(f"[yellow italic]{rich(role)}[/yellow italic]" for role in self.roles)),
         )
         role_timeout_map = {}
         for role in self.roles:
             args = self._get_signal_args(role)
-            log.debug("Sending [italic]%s[/italic] to [yellow italic]%s[/yellow italic]", self.signal_name, rich(role))
+            log.debug(
+                "Sending [italic]%s[/italic] to [yellow italic]%s[/yellow italic]",
+                self.signal_name,
+                lazy_rich(role),
+            )
             future = self._signal(**args)
             self.role_future_map[role] = future
             role_timeout = self._get_timeout(role)
             role_timeout_map[role] = role_timeout
             log.debug(
                 "Actor of [yellow italic]%s[/yellow italic] has [green]%s[/green] to respond",
-                rich(role),
-                format_timedelta(role_timeout),
+                lazy_rich(role),
+                lazy(format_timedelta, role_timeout),
                 extra={"highlighter": None},
             )
             display_total = role_timeout if role_timeout != float("inf") else 60.0 * 60.0 * 24.0
@@ -129,7 +133,7 @@ class _SignalProcessor(Generic[R, S, A], abc.ABC):
         log.debug(
             "Waiting for a response to [italic]%s[/italic] for a maximum of [green]%s[/green]",
             self.signal_name,
-            format_timedelta(self.total_time),
+            lazy(format_timedelta, self.total_time),
             extra={"highlighter": None},
         )
         self.monitor_clock = GameClock.from_configuration(
@@ -182,7 +186,7 @@ class _SignalProcessor(Generic[R, S, A], abc.ABC):
                     log.debug(
                         "Received response ([italic]%s[/italic]) from [yellow italic]%s[/yellow italic]",
                         self.signal_name,
-                        rich(role),
+                        lazy_rich(role),
                     )
                 else:
                     done = False
@@ -540,7 +544,7 @@ class Match:
         log.info(
             "Executing ply ply=%s, playclocks=%s",
             ply,
-            rich({role: actor.playclock for role, actor in self.role_to_actor.items()}),
+            lazy_rich({role: actor.playclock for role, actor in self.role_to_actor.items()}),
         )
         roles_in_control = Interpreter.get_roles_in_control(current_state)
         humans_in_control = any(self.role_to_actor[role].is_human_actor for role in roles_in_control)
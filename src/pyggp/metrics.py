@@ -0,0 +1,381 @@
+"""Metrics for monitoring the performance of agents and interpreters.
+
+Metrics are disabled by default. While disabled, `registry` is None and instrumented code only pays for checking
+that. Enabling metrics installs a `MetricsRegistry`, which holds counters, gauges and histograms. Flushing writes a
+snapshot of all metrics to the sinks of the registry.
+
+Examples:
+    >>> registry = MetricsRegistry()
+    >>> registry.counter("pyggp_example_total", role="x").inc(2)
+    >>> registry.counter("pyggp_example_total", role="x").value
+    2.0
+    >>> histogram = registry.histogram("pyggp_example_seconds", buckets=(0.1, 1.0))
+    >>> histogram.observe(0.5)
+    >>> histogram.bucket_counts
+    [0, 1, 0]
+
+"""
+
+import bisect
+import contextlib
+import json
+import logging
+import math
+import os
+import pathlib
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Sequence, Tuple, Union
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+Labels = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+"Default buckets of histograms, suited for durations in seconds."
+
+
+def exponential_buckets(start: float, factor: float, count: int) -> Tuple[float, ...]:
+    """Get exponentially growing upper bounds of buckets.
+
+    Args:
+        start: Upper bound of the first bucket
+        factor: Factor between consecutive upper bounds
+        count: Number of buckets
+
+    Returns:
+        Upper bounds of the buckets
+
+    Examples:
+        >>> exponential_buckets(1, 2, 4)
+        (1, 2, 4, 8)
+
+    """
+    return tuple(start * factor**exponent for exponent in range(count))
+
+
+@dataclass
+class Counter:
+    """Monotonically increasing value."""
+
+    kind: ClassVar[str] = "counter"
+    "Type of the metric."
+    name: str
+    "Name of the metric."
+    labels: Labels = field(default=())
+    "Labels of the metric."
+    value: float = field(default=0.0)
+    "Current value."
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter.
+
+        Args:
+            amount: Non-negative amount to increase by
+
+        """
+        self.value += amount
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {"name": self.name, "type": self.kind, "labels": dict(self.labels), "value": self.value}
+
+
+@dataclass
+class Gauge:
+    """Arbitrary value."""
+
+    kind: ClassVar[str] = "gauge"
+    "Type of the metric."
+    name: str
+    "Name of the metric."
+    labels: Labels = field(default=())
+    "Labels of the metric."
+    value: float = field(default=0.0)
+    "Current value."
+
+    def set(self, value: float) -> None:
+        """Set the gauge.
+
+        Args:
+            value: New value
+
+        """
+        self.value = value
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {"name": self.name, "type": self.kind, "labels": dict(self.labels), "value": self.value}
+
+
+@dataclass
+class Histogram:
+    """Distribution of observed values."""
+
+    kind: ClassVar[str] = "histogram"
+    "Type of the metric."
+    name: str
+    "Name of the metric."
+    labels: Labels = field(default=())
+    "Labels of the metric."
+    buckets: Tuple[float, ...] = field(default=DEFAULT_BUCKETS)
+    "Sorted upper bounds of the buckets, the implicit last bucket is unbounded."
+    bucket_counts: List[int] = field(default_factory=list)
+    "Number of observations per bucket (not cumulative)."
+    count: int = field(default=0)
+    "Number of observations."
+    sum: float = field(default=0.0)
+    "Sum of observations."
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Args:
+            value: Observed value
+
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self) -> Mapping[str, Any]:
+        return {
+            "name": self.name,
+            "type": self.kind,
+            "labels": dict(self.labels),
+            "buckets": list(self.buckets),
+            "bucket_counts": list(self.bucket_counts),
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class MetricsSink(Protocol):
+    def write(self, metrics: Sequence[Metric]) -> None:
+        """Write a snapshot of metrics.
+
+        Args:
+            metrics: Metrics to write
+
+        """
+
+
+@dataclass(frozen=True)
+class JSONLinesSink:
+    """Appends one line of JSON per snapshot to a file."""
+
+    path: pathlib.Path
+    "Path of the file."
+
+    def write(self, metrics: Sequence[Metric]) -> None:
+        snapshot = {"timestamp": time.time(), "metrics": [metric.as_dict() for metric in metrics]}
+        with self.path.open("a") as file:
+            file.write(json.dumps(snapshot))
+            file.write("\n")
+
+
+@dataclass(frozen=True)
+class PrometheusTextSink:
+    """Replaces a file with the latest snapshot in the Prometheus text exposition format.
+
+    The file is replaced atomically, such that it can be picked up by the textfile collector of the node exporter.
+
+    """
+
+    path: pathlib.Path
+    "Path of the file."
+
+    def write(self, metrics: Sequence[Metric]) -> None:
+        text = format_prometheus_text(metrics)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        tmp_path = pathlib.Path(tmp_name)
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(text)
+            tmp_path.replace(self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    pairs = ",".join(
+        '{}="{}"'.format(key, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for key, value in labels
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def format_prometheus_text(metrics: Sequence[Metric]) -> str:
+    """Format metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: Metrics to format
+
+    Returns:
+        Metrics in the Prometheus text exposition format
+
+    Examples:
+        >>> print(format_prometheus_text([Counter("pyggp_example_total", (("role", "x"),), 2.0)]), end="")
+        # TYPE pyggp_example_total counter
+        pyggp_example_total{role="x"} 2.0
+
+    """
+    lines = []
+    typed = set()
+    for metric in sorted(metrics, key=lambda metric: (metric.name, metric.labels)):
+        if metric.name not in typed:
+            typed.add(metric.name)
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+        if isinstance(metric, Histogram):
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip((*metric.buckets, math.inf), metric.bucket_counts):
+                cumulative_count += bucket_count
+                labels = _format_labels((*metric.labels, ("le", _format_value(upper_bound))))
+                lines.append(f"{metric.name}_bucket{labels} {cumulative_count}")
+            labels = _format_labels(metric.labels)
+            lines.append(f"{metric.name}_sum{labels} {_format_value(metric.sum)}")
+            lines.append(f"{metric.name}_count{labels} {metric.count}")
+        else:
+            lines.append(f"{metric.name}{_format_labels(metric.labels)} {_format_value(metric.value)}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+@dataclass
+class MetricsRegistry:
+    """Collection of metrics, identified by name and labels."""
+
+    sinks: Sequence[MetricsSink] = field(default=())
+    "Sinks that snapshots are written to on flush."
+    metrics: MutableMapping[Tuple[str, Labels], Metric] = field(default_factory=dict, repr=False)
+    "Metrics by name and labels."
+
+    def counter(self, name: str, **labels: Any) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: Name of the metric
+            labels: Labels of the metric, values are converted to strings
+
+        Returns:
+            Counter
+
+        """
+        key = (name, _get_labels(labels))
+        metric = self.metrics.get(key)
+        if metric is None:
+            metric = Counter(name=name, labels=key[1])
+            self.metrics[key] = metric
+        assert isinstance(metric, Counter), f"Requirement: {name} is a counter"
+        return metric
+
+    def gauge(self, name: str, **labels: Any) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: Name of the metric
+            labels: Labels of the metric, values are converted to strings
+
+        Returns:
+            Gauge
+
+        """
+        key = (name, _get_labels(labels))
+        metric = self.metrics.get(key)
+        if metric is None:
+            metric = Gauge(name=name, labels=key[1])
+            self.metrics[key] = metric
+        assert isinstance(metric, Gauge), f"Requirement: {name} is a gauge"
+        return metric
+
+    def histogram(self, name: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, **labels: Any) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: Name of the metric
+            buckets: Sorted upper bounds of the buckets, only used when the histogram is created
+            labels: Labels of the metric, values are converted to strings
+
+        Returns:
+            Histogram
+
+        """
+        key = (name, _get_labels(labels))
+        metric = self.metrics.get(key)
+        if metric is None:
+            metric = Histogram(name=name, labels=key[1], buckets=buckets)
+            self.metrics[key] = metric
+        assert isinstance(metric, Histogram), f"Requirement: {name} is a histogram"
+        return metric
+
+    def collect(self) -> Sequence[Metric]:
+        """Get all metrics.
+
+        Returns:
+            All metrics
+
+        """
+        return tuple(self.metrics.values())
+
+    def flush(self) -> None:
+        """Write a snapshot of all metrics to all sinks.
+
+        Failing sinks are logged and otherwise ignored.
+
+        """
+        metrics = self.collect()
+        for sink in self.sinks:
+            try:
+                sink.write(metrics)
+            except OSError:
+                log.warning("Could not write metrics to %s", sink, exc_info=True)
+
+
+def _get_labels(labels: Mapping[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+registry: Optional[MetricsRegistry] = None
+"Registry of the metrics, None if disabled."
+
+
+def enable(sinks: Sequence[MetricsSink] = ()) -> MetricsRegistry:
+    """Enable metrics.
+
+    Args:
+        sinks: Sinks that snapshots are written to on flush
+
+    Returns:
+        Registry of the metrics
+
+    """
+    # Disables PLW0603 (Using the global statement). Because: The registry is deliberately process-wide.
+    global registry  # noqa: PLW0603
+    registry = MetricsRegistry(sinks=sinks)
+    return registry
+
+
+def disable() -> None:
+    """Disable metrics, dropping all recorded values."""
+    # Disables PLW0603 (Using the global statement). Because: The registry is deliberately process-wide.
+    global registry  # noqa: PLW0603
+    registry = None
+
+
+def flush() -> None:
+    """Write a snapshot of all metrics to all sinks, if enabled."""
+    if registry is not None:
+        registry.flush()
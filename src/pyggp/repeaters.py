@@ -1,22 +1,57 @@
 import itertools
 import logging
 import math
+import os
+import pathlib
+import sys
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Deque, Final, Generic, Optional, Tuple, TypeVar
+from typing import Callable, Deque, Final, Generic, Optional, Sequence, Tuple, TypeVar
 
 import more_itertools
 from typing_extensions import ParamSpec
 
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
 ONE_S_IN_NS: Final[int] = 1_000_000_000
+ONE_MS_IN_NS: Final[int] = 1_000_000
 INV_GOLDEN_RATIO: Final[float] = 2.0 / (1.0 + math.sqrt(5.0))
 
 log = logging.getLogger("pyggp")
 
+StopPredicate = Callable[[], bool]
+"Predicate that is true if a repeater should stop, e.g. `threading.Event.is_set` for external cancellation."
+
+
+@dataclass
+class _MovingAverage:
+    # Average of the last tail values. Uniform averages are updated in O(1), weighted ones in O(tail).
+    tail: int
+    weights: Optional[Tuple[float, ...]] = None
+    values: Deque[float] = field(init=False, repr=False)
+    total: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.values = deque(maxlen=self.tail)
+        if self.weights is not None:
+            self.weights = self.weights[: self.tail]
+
+    def add(self, value: float) -> float:
+        if len(self.values) == self.tail:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+        if self.weights is None:
+            return self.total / len(self.values)
+        return more_itertools.dotproduct(self.weights, self.values) / sum(self.weights[: len(self.values)])
+
 
 @dataclass
 class Repeater(Generic[T]):
@@ -27,6 +62,12 @@ class Repeater(Generic[T]):
     tail: int = 100
     weights: Optional[Tuple[float, ...]] = None
     slack: float = 1.0
+    stop_predicates: Sequence[StopPredicate] = ()
+    "Additional conditions to stop on, checked as often as shortcircuit."
+    batched: bool = False
+    "Whether to call func in batches, checking the clock and the stop conditions only once per batch."
+    batch_time_ns: int = ONE_MS_IN_NS
+    "Targeted duration of a batch."
     _start_ns: int = field(init=False, repr=False, default=0)
     _calls: int = field(init=False, repr=False, default=0)
     _avg_delta_ns: float = field(init=False, repr=False, default=0.0)
@@ -40,23 +81,47 @@ class Repeater(Generic[T]):
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> Tuple[int, int]:
         if self.timeout_ns == 0:
             return 0, 0
-        weights = self.weights
-        if weights is None:
-            weights = tuple(itertools.repeat(1, self.tail))
-        weights = weights[: self.tail]
-        deltas_ns: Deque[int] = deque(maxlen=self.tail)
+        average = _MovingAverage(tail=self.tail, weights=self.weights)
         self._start_ns = time.monotonic_ns()
         self._calls = 0
         self._avg_delta_ns = 0.0
+        if self.batched:
+            self._repeat_batched(average, *args, **kwargs)
+        else:
+            self._repeat(average, *args, **kwargs)
+
+        return self._calls, (time.monotonic_ns() - self._start_ns)
+
+    def _repeat(self, average: _MovingAverage, *args: P.args, **kwargs: P.kwargs) -> None:
         while self.should_loop(*args, **kwargs):
             last_delta_ns = time.monotonic_ns()
             self.func(*args, **kwargs)
             last_delta_ns = time.monotonic_ns() - last_delta_ns
-            deltas_ns.append(last_delta_ns)
-            self._avg_delta_ns = more_itertools.dotproduct(weights, deltas_ns) / sum(weights[: len(deltas_ns)])
+            self._avg_delta_ns = average.add(last_delta_ns)
             self._calls += 1
 
-        return self._calls, (time.monotonic_ns() - self._start_ns)
+    def _repeat_batched(self, average: _MovingAverage, *args: P.args, **kwargs: P.kwargs) -> None:
+        func = self.func
+        while self.should_loop(*args, **kwargs):
+            batch_size = self._get_batch_size()
+            batch_delta_ns = time.monotonic_ns()
+            for _ in itertools.repeat(None, batch_size):
+                func(*args, **kwargs)
+            batch_delta_ns = time.monotonic_ns() - batch_delta_ns
+            self._avg_delta_ns = average.add(batch_delta_ns / batch_size)
+            self._calls += batch_size
+
+    def _get_batch_size(self) -> int:
+        if self._avg_delta_ns <= 0:
+            return 1
+        batch_size = max(1, int(self.batch_time_ns / self._avg_delta_ns))
+        if self.timeout_ns is not None:
+            # As in should_loop, the last call has to start at least slack average calls before the timeout.
+            remaining_ns = self.timeout_ns - (time.monotonic_ns() - self._start_ns)
+            batch_size = min(batch_size, max(1, int(remaining_ns / self._avg_delta_ns - self.slack) + 1))
+        if self.max_repeats is not None:
+            batch_size = min(batch_size, self.max_repeats - self._calls)
+        return batch_size
 
     def should_loop(self, *args: P.args, **kwargs: P.kwargs) -> bool:
         return (
@@ -66,7 +131,78 @@ class Repeater(Generic[T]):
             )
             and (self.max_repeats is None or self.max_repeats > self._calls)
             and (self.shortcircuit is None or not self._shortcircuit(*args, **kwargs))
+            and not any(stop_predicate() for stop_predicate in self.stop_predicates)
         )
 
+    def get_remaining_repeats(self) -> float:
+        """Estimate how many more calls of func fit into the current run.
+
+        Returns:
+            Estimated number of remaining calls, infinite if unbounded or not yet estimable
+
+        """
+        remaining = float("inf")
+        if self.timeout_ns is not None and self._avg_delta_ns > 0:
+            elapsed_ns = time.monotonic_ns() - self._start_ns
+            remaining = max(0.0, (self.timeout_ns - elapsed_ns) / self._avg_delta_ns)
+        if self.max_repeats is not None:
+            remaining = min(remaining, self.max_repeats - self._calls)
+        return remaining
+
     def _shortcircuit(self, *args: P.args, **kwargs: P.kwargs) -> bool:
         return self.shortcircuit is not None and self.shortcircuit(*args, **kwargs)
+
+
+def get_rss_bytes() -> Optional[int]:
+    """Get the resident set size of the current process.
+
+    Uses /proc where available, and the peak resident set size otherwise.
+
+    Returns:
+        Resident set size in bytes, None if it cannot be determined
+
+    """
+    try:
+        return int(pathlib.Path("/proc/self/statm").read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes elsewhere.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def memory_ceiling(max_rss_bytes: int) -> StopPredicate:
+    """Get a stop predicate that is true once the process uses more memory than allowed.
+
+    Args:
+        max_rss_bytes: Maximal resident set size in bytes
+
+    Returns:
+        Stop predicate
+
+    """
+
+    def exceeds_memory_ceiling() -> bool:
+        rss_bytes = get_rss_bytes()
+        return rss_bytes is not None and rss_bytes > max_rss_bytes
+
+    return exceeds_memory_ceiling
+
+
+def any_of(*stop_predicates: StopPredicate) -> StopPredicate:
+    """Combine stop predicates, such that the combination is true if any of them is.
+
+    Args:
+        stop_predicates: Stop predicates to combine
+
+    Returns:
+        Combined stop predicate
+
+    """
+
+    def any_stop_predicate() -> bool:
+        return any(stop_predicate() for stop_predicate in stop_predicates)
+
+    return any_stop_predicate
@@ -0,0 +1,184 @@
+"""On-disk cache of precompiled rulesets.
+
+Parsing a ruleset, as well as analyzing its shapes and transforming its rules into temporal rules, is repeated on every
+start of the command line interface (and every tournament worker). The cache stores the results of these steps keyed by
+the hash of the ruleset's text, such that subsequent runs can skip them.
+
+Clingo controls cannot be persisted, hence interpreters still ground their controls on creation.
+
+"""
+
+import contextlib
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from typing import Any, Mapping, Optional
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp._version import __version__
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def get_default_cache_directory() -> pathlib.Path:
+    """Get the default directory of the ruleset cache.
+
+    Uses `$PYGGP_CACHE_DIR` if set, otherwise `$XDG_CACHE_HOME/pyggp` or `~/.cache/pyggp`.
+
+    Returns:
+        Default directory of the ruleset cache
+
+    """
+    if "PYGGP_CACHE_DIR" in os.environ:
+        return pathlib.Path(os.environ["PYGGP_CACHE_DIR"])
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if cache_home:
+        return pathlib.Path(cache_home) / "pyggp"
+    return pathlib.Path.home() / ".cache" / "pyggp"
+
+
+@dataclass(frozen=True)
+class PrecompiledRuleset:
+    """A ruleset together with the results of its (costly) analyses."""
+
+    ruleset: gdl.Ruleset
+    "Parsed ruleset."
+    shape_container: Optional[ShapeContainer] = None
+    "Shapes of the ruleset, if already computed."
+    temporal_rule_container: Optional[TemporalRuleContainer] = None
+    "Temporal rules of the ruleset, if already computed."
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all analyses are present."""
+        return self.shape_container is not None and self.temporal_rule_container is not None
+
+    @property
+    def interpreter_kwargs(self) -> Mapping[str, Any]:
+        """Keyword arguments for `from_ruleset` of clingo based interpreters."""
+        kwargs = {}
+        if self.shape_container is not None:
+            kwargs["shape_container"] = self.shape_container
+        if self.temporal_rule_container is not None:
+            kwargs["temporal_rule_container"] = self.temporal_rule_container
+        return kwargs
+
+    def __getstate__(self) -> Mapping[str, Any]:
+        # Clingo ASTs cannot be pickled, hence the temporal rules are stored as strings.
+        temporal_rule_strs = (
+            self.temporal_rule_container.as_strs() if self.temporal_rule_container is not None else None
+        )
+        return {
+            "ruleset": self.ruleset,
+            "shape_container": self.shape_container,
+            "temporal_rule_strs": temporal_rule_strs,
+        }
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        temporal_rule_strs = state["temporal_rule_strs"]
+        temporal_rule_container = (
+            TemporalRuleContainer.from_strs(*temporal_rule_strs) if temporal_rule_strs is not None else None
+        )
+        object.__setattr__(self, "ruleset", state["ruleset"])
+        object.__setattr__(self, "shape_container", state["shape_container"])
+        object.__setattr__(self, "temporal_rule_container", temporal_rule_container)
+
+
+@dataclass(frozen=True)
+class RulesetCache:
+    """On-disk cache of precompiled rulesets."""
+
+    directory: pathlib.Path = field(default_factory=get_default_cache_directory)
+    "Directory of the cache."
+
+    # region Methods
+
+    @staticmethod
+    def get_key(rules_str: str) -> str:
+        """Get the key of a ruleset.
+
+        The key also depends on the version of pyggp, as the representations of the cached objects may change.
+
+        Args:
+            rules_str: Text of the ruleset
+
+        Returns:
+            Key of the ruleset
+
+        """
+        digest = hashlib.sha256()
+        digest.update(f"pyggp {__version__} cache {_CACHE_FORMAT_VERSION}\n".encode())
+        digest.update(rules_str.encode())
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[PrecompiledRuleset]:
+        """Load a precompiled ruleset.
+
+        Unreadable or corrupt entries are treated as missing.
+
+        Args:
+            key: Key of the ruleset
+
+        Returns:
+            Precompiled ruleset, or None if not cached
+
+        """
+        path = self._get_path(key)
+        try:
+            with path.open("rb") as file:
+                # Disables S301 (Unsafe pickle usage). Because: The cache is only written by pyggp itself.
+                precompiled = pickle.load(file)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        # Disables BLE001 (Blind except). Because: Whatever is wrong with the cache, it is not fatal.
+        except Exception:  # noqa: BLE001
+            log.warning("Ignoring corrupt ruleset cache entry %s", path, exc_info=True)
+            return None
+        if not isinstance(precompiled, PrecompiledRuleset):
+            log.warning("Ignoring corrupt ruleset cache entry %s", path)
+            return None
+        log.debug("Loaded ruleset cache entry %s", path)
+        return precompiled
+
+    def store(self, key: str, precompiled: PrecompiledRuleset) -> None:
+        """Store a precompiled ruleset.
+
+        The entry is written atomically, concurrent readers either see the old or the new entry. Failures are logged
+        and otherwise ignored.
+
+        Args:
+            key: Key of the ruleset
+            precompiled: Precompiled ruleset
+
+        """
+        path = self._get_path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{key}.")
+        except OSError:
+            log.warning("Could not store ruleset cache entry %s", path, exc_info=True)
+            return
+        tmp_path = pathlib.Path(tmp_name)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(precompiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError):
+            log.warning("Could not store ruleset cache entry %s", path, exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            return
+        log.debug("Stored ruleset cache entry %s", path)
+
+    def _get_path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.pickle"
+
+    # endregion
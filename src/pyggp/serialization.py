@@ -0,0 +1,463 @@
+"""Compact binary serialization of states, views, moves, and turns.
+
+Everything is encoded as a flat sequence of 32-bit integer tokens. The lowest two bits of a token determine its kind,
+the remaining bits hold an index into the symbol table of the codec:
+
+- `SUBRELATION`: Index of a prebuilt subrelation (e.g. from the state shape).
+- `RELATION`: Index of a relation signature, followed by the tokens of its arguments.
+- `STRING`: Index of a string.
+- `NUMBER`: Followed by one token holding the value of the number.
+
+Collections (states, views, turns, and batches thereof) are prefixed by their length. As GDL has no arithmetic, all
+names and strings that can ever occur during a match are part of the ruleset, hence the symbol table is derived from
+the ruleset alone and is identical for every process that uses the same ruleset.
+
+"""
+
+import logging
+import sys
+import threading
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, MutableMapping, Sequence, Set, Tuple
+
+import cachetools
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp.engine_primitives import Move, Role, State, Turn
+from pyggp.exceptions.serialization_exceptions import MalformedDataSerializationError, UnknownSymbolSerializationError
+from pyggp.game_description_language.subrelations import Symbol
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+_ARRAY_TYPECODE = "i"
+_TOKEN_SIZE = 4
+_TOKEN_KIND_BITS = 2
+_TOKEN_KIND_MASK = (1 << _TOKEN_KIND_BITS) - 1
+
+SUBRELATION = 0
+"Kind of token that refers to a prebuilt subrelation."
+RELATION = 1
+"Kind of token that refers to a relation signature, followed by its arguments."
+STRING = 2
+"Kind of token that refers to a string."
+NUMBER = 3
+"Kind of token that is followed by the value of a number."
+
+assert array(_ARRAY_TYPECODE).itemsize == _TOKEN_SIZE, "Assumption: C ints are 32 bits wide."
+
+
+def _collect_symbols(
+    relation: gdl.Relation,
+    signatures: Set[gdl.Relation.Signature],
+    strings: Set[str],
+) -> None:
+    signatures.add(relation.signature)
+    for argument in relation.arguments:
+        symbol = argument.symbol
+        if isinstance(symbol, gdl.Relation):
+            _collect_symbols(symbol, signatures, strings)
+        elif isinstance(symbol, gdl.String):
+            strings.add(symbol.string)
+
+
+def _signature_key(signature: gdl.Relation.Signature) -> Tuple[str, int]:
+    return signature.name or "", signature.arity
+
+
+@dataclass
+class Codec:
+    """Encodes and decodes states, views, moves, and turns of one ruleset.
+
+    The encoding is deterministic, independent of the platform, and only depends on the symbol table. Codecs created
+    from the same ruleset (and the same prebuilt subrelations) are therefore interchangeable.
+
+    """
+
+    # region Attributes and Properties
+
+    signatures: Sequence[gdl.Relation.Signature] = field(default_factory=tuple)
+    "Relation signatures of the symbol table."
+    strings: Sequence[str] = field(default_factory=tuple)
+    "Strings of the symbol table."
+    subrelations: Sequence[gdl.Subrelation] = field(default_factory=tuple)
+    "Prebuilt subrelations of the symbol table, encoded as a single token each."
+    cache_size: int = field(default=100_000, repr=False, compare=False)
+    "Number of encoded subrelations that are remembered, besides the prebuilt ones."
+    _signature_to_token: Dict[gdl.Relation.Signature, int] = field(init=False, repr=False, compare=False)
+    _string_to_token: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _subrelation_to_tokens: Dict[gdl.Subrelation, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    _decoded_strings: Sequence[gdl.Subrelation] = field(init=False, repr=False, compare=False)
+    _encoded: MutableMapping[gdl.Subrelation, Tuple[int, ...]] = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._signature_to_token = {
+            signature: (index << _TOKEN_KIND_BITS) | RELATION for index, signature in enumerate(self.signatures)
+        }
+        self._string_to_token = {
+            string: (index << _TOKEN_KIND_BITS) | STRING for index, string in enumerate(self.strings)
+        }
+        self._decoded_strings = tuple(gdl.Subrelation(gdl.String(string)) for string in self.strings)
+        self._subrelation_to_tokens = {
+            subrelation: ((index << _TOKEN_KIND_BITS) | SUBRELATION,)
+            for index, subrelation in enumerate(self.subrelations)
+        }
+        self._encoded = cachetools.LRUCache(maxsize=self.cache_size)
+
+    # endregion
+
+    # region Constructors
+
+    @classmethod
+    def from_ruleset(cls, ruleset: gdl.Ruleset, subrelations: Iterable[gdl.Subrelation] = ()) -> Self:
+        """Create a codec from a ruleset.
+
+        Args:
+            ruleset: Ruleset to derive the symbol table from
+            subrelations: Subrelations that are encoded as a single token each (e.g. the state shape)
+
+        Returns:
+            Codec for the ruleset
+
+        """
+        signatures: Set[gdl.Relation.Signature] = set()
+        strings: Set[str] = set()
+        for rule in ruleset.rules:
+            _collect_symbols(rule.head, signatures, strings)
+            for literal in rule.body:
+                _collect_symbols(literal.atom, signatures, strings)
+        return cls(
+            signatures=tuple(sorted(signatures, key=_signature_key)),
+            strings=tuple(sorted(strings)),
+            subrelations=tuple(sorted(frozenset(subrelations), key=str)),
+        )
+
+    # endregion
+
+    # region Methods
+
+    def encode_move(self, move: Move) -> bytes:
+        """Encode a move.
+
+        Roles can be encoded with this method as well.
+
+        Args:
+            move: Move to encode
+
+        Returns:
+            Encoded move
+
+        """
+        tokens: List[int] = []
+        self._encode_subrelation(move, tokens)
+        return _to_bytes(tokens)
+
+    def decode_move(self, data: bytes) -> Move:
+        """Decode a move.
+
+        Roles can be decoded with this method as well.
+
+        Args:
+            data: Encoded move
+
+        Returns:
+            Decoded move
+
+        """
+        tokens = _from_bytes(data)
+        try:
+            move, index = self._decode_subrelation(tokens, 0)
+        except IndexError as exception:
+            raise MalformedDataSerializationError(reason="truncated data or index out of range") from exception
+        _check_exhausted(tokens, index)
+        return Move(move)
+
+    def encode_state(self, state: State) -> bytes:
+        """Encode a state.
+
+        Views can be encoded with this method as well.
+
+        Args:
+            state: State to encode
+
+        Returns:
+            Encoded state
+
+        """
+        tokens: List[int] = []
+        self._encode_state(state, tokens)
+        return _to_bytes(tokens)
+
+    def decode_state(self, data: bytes) -> State:
+        """Decode a state.
+
+        Views can be decoded with this method as well.
+
+        Args:
+            data: Encoded state
+
+        Returns:
+            Decoded state
+
+        """
+        tokens = _from_bytes(data)
+        try:
+            state, index = self._decode_state(tokens, 0)
+        except IndexError as exception:
+            raise MalformedDataSerializationError(reason="truncated data or index out of range") from exception
+        _check_exhausted(tokens, index)
+        return state
+
+    def encode_turn(self, turn: Turn) -> bytes:
+        """Encode a turn.
+
+        Args:
+            turn: Turn to encode
+
+        Returns:
+            Encoded turn
+
+        """
+        tokens: List[int] = []
+        self._encode_turn(turn, tokens)
+        return _to_bytes(tokens)
+
+    def decode_turn(self, data: bytes) -> Turn:
+        """Decode a turn.
+
+        Args:
+            data: Encoded turn
+
+        Returns:
+            Decoded turn
+
+        """
+        tokens = _from_bytes(data)
+        try:
+            turn, index = self._decode_turn(tokens, 0)
+        except IndexError as exception:
+            raise MalformedDataSerializationError(reason="truncated data or index out of range") from exception
+        _check_exhausted(tokens, index)
+        return turn
+
+    def encode_states(self, states: Iterable[State]) -> bytes:
+        """Encode a batch of states (or views).
+
+        Args:
+            states: States to encode
+
+        Returns:
+            Encoded states
+
+        """
+        tokens: List[int] = [0]
+        for state in states:
+            self._encode_state(state, tokens)
+            tokens[0] += 1
+        return _to_bytes(tokens)
+
+    def decode_states(self, data: bytes) -> Tuple[State, ...]:
+        """Decode a batch of states (or views).
+
+        Args:
+            data: Encoded states
+
+        Returns:
+            Decoded states, in the order they were encoded
+
+        """
+        tokens = _from_bytes(data)
+        states: List[State] = []
+        try:
+            index = 1
+            for _ in range(tokens[0]):
+                state, index = self._decode_state(tokens, index)
+                states.append(state)
+        except IndexError as exception:
+            raise MalformedDataSerializationError(reason="truncated data or index out of range") from exception
+        _check_exhausted(tokens, index)
+        return tuple(states)
+
+    def encode_turns(self, turns: Iterable[Turn]) -> bytes:
+        """Encode a batch of turns.
+
+        Args:
+            turns: Turns to encode
+
+        Returns:
+            Encoded turns
+
+        """
+        tokens: List[int] = [0]
+        for turn in turns:
+            self._encode_turn(turn, tokens)
+            tokens[0] += 1
+        return _to_bytes(tokens)
+
+    def decode_turns(self, data: bytes) -> Tuple[Turn, ...]:
+        """Decode a batch of turns.
+
+        Args:
+            data: Encoded turns
+
+        Returns:
+            Decoded turns, in the order they were encoded
+
+        """
+        tokens = _from_bytes(data)
+        turns: List[Turn] = []
+        try:
+            index = 1
+            for _ in range(tokens[0]):
+                turn, index = self._decode_turn(tokens, index)
+                turns.append(turn)
+        except IndexError as exception:
+            raise MalformedDataSerializationError(reason="truncated data or index out of range") from exception
+        _check_exhausted(tokens, index)
+        return tuple(turns)
+
+    def encode_state_key(self, state: State) -> bytes:
+        """Encode a state canonically, such that equal states have equal encodings in every process.
+
+        Views can be encoded with this method as well. The iteration order of states depends on the hashes of their
+        subrelations, which differ between processes, hence the encoded subrelations are sorted.
+
+        Args:
+            state: State to encode
+
+        Returns:
+            Canonically encoded state
+
+        """
+        tokens: List[int] = [len(state)]
+        for encoded in sorted(self._get_encoded(subrelation) for subrelation in state):
+            tokens.extend(encoded)
+        return _to_bytes(tokens)
+
+    def encode_turn_key(self, turn: Turn) -> bytes:
+        """Encode a turn canonically, such that equal turns have equal encodings in every process.
+
+        Args:
+            turn: Turn to encode
+
+        Returns:
+            Canonically encoded turn
+
+        """
+        tokens: List[int] = [len(turn)]
+        for encoded in sorted(self._get_encoded(role) + self._get_encoded(move) for role, move in turn.items()):
+            tokens.extend(encoded)
+        return _to_bytes(tokens)
+
+    def _encode_state(self, state: State, tokens: List[int]) -> None:
+        tokens.append(len(state))
+        for subrelation in state:
+            self._encode_subrelation(subrelation, tokens)
+
+    def _encode_turn(self, turn: Turn, tokens: List[int]) -> None:
+        tokens.append(len(turn))
+        for role, move in turn.items():
+            self._encode_subrelation(role, tokens)
+            self._encode_subrelation(move, tokens)
+
+    def _encode_subrelation(self, subrelation: gdl.Subrelation, tokens: List[int]) -> None:
+        tokens.extend(self._get_encoded(subrelation))
+
+    def _get_encoded(self, subrelation: gdl.Subrelation) -> Tuple[int, ...]:
+        encoded = self._subrelation_to_tokens.get(subrelation)
+        if encoded is not None:
+            return encoded
+        with self._lock:
+            encoded = self._encoded.get(subrelation)
+        if encoded is None:
+            subtokens: List[int] = []
+            self._encode_symbol(subrelation.symbol, subtokens)
+            encoded = tuple(subtokens)
+            with self._lock:
+                self._encoded[subrelation] = encoded
+        return encoded
+
+    def _encode_symbol(self, symbol: Symbol, tokens: List[int]) -> None:
+        if isinstance(symbol, gdl.Relation):
+            token = self._signature_to_token.get(symbol.signature)
+            if token is None:
+                raise UnknownSymbolSerializationError(symbol)
+            tokens.append(token)
+            for argument in symbol.arguments:
+                self._encode_symbol(argument.symbol, tokens)
+        elif isinstance(symbol, gdl.Number):
+            tokens.append(NUMBER)
+            tokens.append(symbol.number)
+        elif isinstance(symbol, gdl.String):
+            token = self._string_to_token.get(symbol.string)
+            if token is None:
+                raise UnknownSymbolSerializationError(symbol)
+            tokens.append(token)
+        else:
+            raise UnknownSymbolSerializationError(symbol)
+
+    def _decode_state(self, tokens: Sequence[int], index: int) -> Tuple[State, int]:
+        length = tokens[index]
+        index += 1
+        subrelations: List[gdl.Subrelation] = []
+        for _ in range(length):
+            subrelation, index = self._decode_subrelation(tokens, index)
+            subrelations.append(subrelation)
+        return State(frozenset(subrelations)), index
+
+    def _decode_turn(self, tokens: Sequence[int], index: int) -> Tuple[Turn, int]:
+        length = tokens[index]
+        index += 1
+        pairs: List[Tuple[Role, Move]] = []
+        for _ in range(length):
+            role, index = self._decode_subrelation(tokens, index)
+            move, index = self._decode_subrelation(tokens, index)
+            pairs.append((Role(role), Move(move)))
+        return Turn(pairs), index
+
+    def _decode_subrelation(self, tokens: Sequence[int], index: int) -> Tuple[gdl.Subrelation, int]:
+        token = tokens[index]
+        kind = token & _TOKEN_KIND_MASK
+        if kind == NUMBER:
+            return gdl.Subrelation(gdl.Number(tokens[index + 1])), index + 2
+        payload = token >> _TOKEN_KIND_BITS
+        if payload < 0:
+            raise MalformedDataSerializationError(reason=f"negative index {payload}")
+        if kind == SUBRELATION:
+            return self.subrelations[payload], index + 1
+        if kind == STRING:
+            return self._decoded_strings[payload], index + 1
+        assert kind == RELATION, "Assumption: There are only 4 kinds of tokens."
+        name, arity = self.signatures[payload]
+        index += 1
+        arguments: List[gdl.Subrelation] = []
+        for _ in range(arity):
+            argument, index = self._decode_subrelation(tokens, index)
+            arguments.append(argument)
+        return gdl.Subrelation(gdl.Relation(name=name, arguments=tuple(arguments))), index
+
+    # endregion
+
+
+def _to_bytes(tokens: List[int]) -> bytes:
+    encoded = array(_ARRAY_TYPECODE, tokens)
+    if sys.byteorder != "little":
+        encoded.byteswap()
+    return encoded.tobytes()
+
+
+def _from_bytes(data: bytes) -> List[int]:
+    if len(data) % _TOKEN_SIZE != 0:
+        raise MalformedDataSerializationError(reason=f"length is not a multiple of {_TOKEN_SIZE}")
+    decoded = array(_ARRAY_TYPECODE)
+    decoded.frombytes(data)
+    if sys.byteorder != "little":
+        decoded.byteswap()
+    return decoded.tolist()
+
+
+def _check_exhausted(tokens: Sequence[int], index: int) -> None:
+    if index != len(tokens):
+        raise MalformedDataSerializationError(reason=f"{len(tokens) - index} trailing tokens")
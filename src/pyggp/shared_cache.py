@@ -0,0 +1,484 @@
+"""Cache of interpreter results that is shared by the processes on one machine.
+
+Agents and tournament workers that play the same game repeatedly compute the same results, particularly for the
+positions early in the game. The cache server holds such results in a bounded least recently used table and serves them
+to any number of processes over a Unix socket. Keys are canonical encodings of the queries, values are encoded with
+the codec of the ruleset as well (see `pyggp.serialization.Codec`), hence nothing that is received is ever executed.
+Clients only connect to sockets of their own user, that are inaccessible to other users.
+
+The cache is an optimization only. If the server is not reachable, interpreters compute all results themselves.
+
+"""
+
+import contextlib
+import logging
+import os
+import pathlib
+import socket
+import socketserver
+import stat
+import struct
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Union
+
+import cachetools
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp.engine_primitives import State, Turn, View
+from pyggp.exceptions.serialization_exceptions import MalformedDataSerializationError, SerializationError
+from pyggp.ruleset_cache import RulesetCache
+from pyggp.serialization import Codec
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+DEFAULT_CAPACITY: int = 256 * 1024 * 1024
+"Default capacity in bytes of the values of the shared cache."
+
+_REQUEST_HEADER = struct.Struct("!cII")
+_RESPONSE_HEADER = struct.Struct("!BI")
+_GET = b"G"
+_PUT = b"P"
+_NAMESPACE_SIZE = 16
+_PEER_CREDENTIALS = struct.Struct("3i")
+
+_LENGTH = struct.Struct("!I")
+_INTEGER = struct.Struct("!q")
+_NONE = b"N"
+_FALSE = b"F"
+_TRUE = b"T"
+_INTEGER_TAG = b"I"
+_SUBRELATION = b"S"
+_STATE = b"Z"
+_TURN = b"U"
+_SET = b"C"
+_TUPLE = b"P"
+_MAPPING = b"M"
+_SCALAR_TAGS = (_NONE, _FALSE, _TRUE, _INTEGER_TAG)
+
+
+def _receive(sock: socket.socket, size: int) -> bytes:
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        chunk_size = sock.recv_into(view[received:])
+        if chunk_size == 0:
+            raise ConnectionResetError
+        received += chunk_size
+    return bytes(data)
+
+
+class _SharedCacheRequestHandler(socketserver.StreamRequestHandler):
+    server: "_SharedCacheUnixServer"
+
+    def handle(self) -> None:
+        while True:
+            header = self.rfile.read(_REQUEST_HEADER.size)
+            if len(header) < _REQUEST_HEADER.size:
+                return
+            operation, key_size, value_size = _REQUEST_HEADER.unpack(header)
+            key = self.rfile.read(key_size)
+            value = self.rfile.read(value_size)
+            if len(key) < key_size or len(value) < value_size:
+                return
+            if operation == _GET:
+                cached = self.server.cache_server.get(key)
+                if cached is None:
+                    self.wfile.write(_RESPONSE_HEADER.pack(0, 0))
+                else:
+                    self.wfile.write(_RESPONSE_HEADER.pack(1, len(cached)) + cached)
+            elif operation == _PUT:
+                self.server.cache_server.put(key, value)
+            else:
+                log.warning("Closing connection to shared cache after unknown operation %r", operation)
+                return
+
+
+class _SharedCacheUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, cache_server: "SharedCacheServer") -> None:
+        self.cache_server = cache_server
+        super().__init__(str(cache_server.path), _SharedCacheRequestHandler)
+
+
+@dataclass
+class SharedCacheServer:
+    """Serves a bounded table of results to the processes on one machine via a Unix socket.
+
+    The least recently used entries are evicted once the values exceed the capacity.
+
+    """
+
+    path: pathlib.Path
+    "Path of the Unix socket."
+    capacity: int = DEFAULT_CAPACITY
+    "Capacity in bytes of the values."
+    _table: "cachetools.LRUCache[bytes, bytes]" = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._table = cachetools.LRUCache(maxsize=self.capacity, getsizeof=len)
+
+    # region Methods
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Get the value of a key.
+
+        Args:
+            key: Key
+
+        Returns:
+            Value, or None if not cached
+
+        """
+        with self._lock:
+            return self._table.get(key)
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Put a value, values larger than the capacity are ignored.
+
+        Args:
+            key: Key
+            value: Value
+
+        """
+        with self._lock, contextlib.suppress(ValueError):
+            self._table[key] = value
+
+    def serve_forever(self) -> None:
+        """Serve until interrupted."""
+        with self._bind() as server:
+            server.serve_forever()
+
+    @contextlib.contextmanager
+    def serving(self) -> Iterator[Self]:
+        """Serve in a background thread for the duration of the context.
+
+        Yields:
+            This server
+
+        """
+        with self._bind() as server:
+            thread = threading.Thread(target=server.serve_forever, name="pyggp-shared-cache", daemon=True)
+            thread.start()
+            try:
+                yield self
+            finally:
+                server.shutdown()
+                thread.join()
+
+    @contextlib.contextmanager
+    def _bind(self) -> Iterator[_SharedCacheUnixServer]:
+        if self.path.exists():
+            # A socket is left behind if a server is killed, it is only reused if no server is listening.
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(str(self.path))
+                except OSError:
+                    self.path.unlink()
+                else:
+                    message = f"Shared cache server is already listening on {self.path}"
+                    raise FileExistsError(message)
+        server = _SharedCacheUnixServer(self)
+        try:
+            self.path.chmod(0o600)
+            log.info("Serving shared cache on %s (capacity=%s bytes)", self.path, self.capacity)
+            yield server
+        finally:
+            server.server_close()
+            with contextlib.suppress(OSError):
+                self.path.unlink()
+
+    # endregion
+
+
+@dataclass
+class SharedCacheClient:
+    """Connects to a shared cache server.
+
+    Each thread uses its own connection. If the server is not reachable, the client logs a warning and becomes
+    unavailable, all further lookups miss.
+
+    """
+
+    path: pathlib.Path
+    "Path of the Unix socket."
+    timeout: float = 1.0
+    "Timeout of a request in seconds."
+    available: bool = field(default=True, init=False)
+    "Whether the server was reachable so far."
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False, compare=False)
+
+    # region Methods
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Get the value of a key.
+
+        Args:
+            key: Key
+
+        Returns:
+            Value, or None if not cached or the server is unavailable
+
+        """
+        if not self.available:
+            return None
+        try:
+            sock = self._get_socket()
+            sock.sendall(_REQUEST_HEADER.pack(_GET, len(key), 0) + key)
+            found, size = _RESPONSE_HEADER.unpack(_receive(sock, _RESPONSE_HEADER.size))
+            return _receive(sock, size) if found else None
+        except OSError:
+            self._fail()
+            return None
+
+    def put(self, key: bytes, value: bytes) -> None:
+        """Put a value.
+
+        Args:
+            key: Key
+            value: Value
+
+        """
+        if not self.available:
+            return
+        try:
+            self._get_socket().sendall(_REQUEST_HEADER.pack(_PUT, len(key), len(value)) + key + value)
+        except OSError:
+            self._fail()
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+        sock: Optional[socket.socket] = getattr(self._local, "socket", None)
+        if sock is not None:
+            sock.close()
+            self._local.socket = None
+
+    def _get_socket(self) -> socket.socket:
+        sock: Optional[socket.socket] = getattr(self._local, "socket", None)
+        if sock is None:
+            self._check_path()
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.path))
+                self._check_peer(sock)
+            except OSError:
+                sock.close()
+                raise
+            self._local.socket = sock
+        return sock
+
+    def _check_path(self) -> None:
+        # Another user may have bound the path first, such a server is never trusted.
+        path_stat = self.path.stat()
+        if path_stat.st_uid != os.getuid():
+            message = f"Shared cache socket {self.path} is owned by another user"
+            raise PermissionError(message)
+        if stat.S_IMODE(path_stat.st_mode) & 0o077:
+            message = f"Shared cache socket {self.path} is accessible to other users"
+            raise PermissionError(message)
+
+    def _check_peer(self, sock: socket.socket) -> None:
+        # The path may have been replaced after it was checked, hence also check the process that accepted.
+        if not hasattr(socket, "SO_PEERCRED"):
+            return
+        _, uid, _ = _PEER_CREDENTIALS.unpack(
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size),
+        )
+        if uid != os.getuid():
+            message = f"Shared cache server on {self.path} is run by another user"
+            raise PermissionError(message)
+
+    def _fail(self) -> None:
+        if self.available:
+            log.warning("Shared cache on %s is unavailable, results are computed locally", self.path, exc_info=True)
+        self.available = False
+        self.close()
+
+    # endregion
+
+
+@dataclass
+class SharedInterpreterCache:
+    """Shares the results of interpreters of one ruleset via a shared cache server.
+
+    Results are keyed by the name of their table and the canonical encoding of the query, prefixed by a namespace
+    derived from the ruleset. Hence, interpreters of different rulesets can use the same server.
+
+    """
+
+    client: SharedCacheClient
+    "Client of the shared cache server."
+    codec: Codec
+    "Codec of the ruleset."
+    namespace: bytes = b""
+    "Prefix of all keys."
+
+    # region Constructors
+
+    @classmethod
+    def connect(cls, ruleset: gdl.Ruleset, path: Union[str, pathlib.Path]) -> Self:
+        """Create a shared interpreter cache for a ruleset.
+
+        Connecting is deferred until the first lookup.
+
+        Args:
+            ruleset: Ruleset of the interpreter
+            path: Path of the Unix socket of the shared cache server
+
+        Returns:
+            Shared interpreter cache
+
+        """
+        namespace = bytes.fromhex(RulesetCache.get_key(str(ruleset)))[:_NAMESPACE_SIZE]
+        return cls(client=SharedCacheClient(pathlib.Path(path)), codec=Codec.from_ruleset(ruleset), namespace=namespace)
+
+    # endregion
+
+    # region Methods
+
+    def get(self, table: str, current: Union[State, View], *args: Any) -> Optional[Any]:
+        """Get a result.
+
+        Args:
+            table: Name of the table, i.e. the kind of query
+            current: Queried state or view
+            args: Further arguments of the query, either turns or roles
+
+        Returns:
+            Result, or None if not cached
+
+        """
+        key = self._get_key(table, current, args)
+        data = None if key is None else self.client.get(key)
+        if metrics.registry is not None:
+            result = "miss" if data is None else "hit"
+            metrics.registry.counter("pyggp_interpreter_shared_cache_accesses_total", table=table, result=result).inc()
+        if data is None:
+            return None
+        try:
+            return self._decode(data)
+        # Disables BLE001 (Blind except). Because: Whatever is wrong with the entry, it is not fatal.
+        except Exception:  # noqa: BLE001
+            log.warning("Ignoring corrupt shared cache entry of table %s", table, exc_info=True)
+            return None
+
+    def put(self, table: str, current: Union[State, View], *args: Any, value: Any) -> None:
+        """Put a result.
+
+        Args:
+            table: Name of the table, i.e. the kind of query
+            current: Queried state or view
+            args: Further arguments of the query, either turns or roles
+            value: Result
+
+        """
+        key = self._get_key(table, current, args)
+        if key is None:
+            return
+        try:
+            data = self._encode(value)
+        except SerializationError:
+            log.debug("Not sharing result of table %s, as it cannot be encoded", table, exc_info=True)
+            return
+        self.client.put(key, data)
+
+    def _get_key(self, table: str, current: Union[State, View], args: Any) -> Optional[bytes]:
+        try:
+            parts = [self.namespace, table.encode(), b":", self.codec.encode_state_key(current)]
+            for arg in args:
+                parts.append(self.codec.encode_turn_key(arg) if isinstance(arg, Turn) else self.codec.encode_move(arg))
+        except SerializationError:
+            log.debug("Not sharing result of table %s, as the query cannot be encoded", table, exc_info=True)
+            return None
+        return b"".join(parts)
+
+    def _encode(self, value: Any) -> bytes:
+        parts: List[bytes] = []
+        self._encode_value(value, parts)
+        return b"".join(parts)
+
+    def _encode_value(self, value: Any, parts: List[bytes]) -> None:
+        if value is None or isinstance(value, int):
+            parts.append(_encode_scalar(value))
+        elif isinstance(value, gdl.Subrelation):
+            _append_encoded(_SUBRELATION, self.codec.encode_move(value), parts)
+        elif isinstance(value, Turn):
+            _append_encoded(_TURN, self.codec.encode_turn(value), parts)
+        elif isinstance(value, (set, frozenset)) and all(isinstance(element, gdl.Subrelation) for element in value):
+            _append_encoded(_STATE, self.codec.encode_state(value), parts)
+        elif isinstance(value, (set, frozenset, tuple)):
+            parts.append((_TUPLE if isinstance(value, tuple) else _SET) + _LENGTH.pack(len(value)))
+            for element in value:
+                self._encode_value(element, parts)
+        elif isinstance(value, Mapping):
+            parts.append(_MAPPING + _LENGTH.pack(len(value)))
+            for key, element in value.items():
+                self._encode_value(key, parts)
+                self._encode_value(element, parts)
+        else:
+            message = f"Cannot encode value of type {type(value).__name__}"
+            raise SerializationError(message)
+
+    def _decode(self, data: bytes) -> Any:
+        value, index = self._decode_value(data, 0)
+        if index != len(data):
+            raise MalformedDataSerializationError(reason=f"{len(data) - index} trailing bytes")
+        return value
+
+    def _decode_value(self, data: bytes, index: int) -> Tuple[Any, int]:
+        tag = data[index : index + 1]
+        index += 1
+        if tag in _SCALAR_TAGS:
+            return _decode_scalar(tag, data, index)
+        if tag in (_SUBRELATION, _TURN, _STATE):
+            (size,) = _LENGTH.unpack_from(data, index)
+            index += _LENGTH.size
+            encoded = data[index : index + size]
+            if len(encoded) < size:
+                raise MalformedDataSerializationError(reason="truncated data")
+            decoders = {
+                _SUBRELATION: self.codec.decode_move,
+                _TURN: self.codec.decode_turn,
+                _STATE: self.codec.decode_state,
+            }
+            return decoders[tag](encoded), index + size
+        if tag in (_SET, _TUPLE, _MAPPING):
+            (length,) = _LENGTH.unpack_from(data, index)
+            index += _LENGTH.size
+            elements: List[Any] = []
+            for _ in range(2 * length if tag == _MAPPING else length):
+                element, index = self._decode_value(data, index)
+                elements.append(element)
+            if tag == _MAPPING:
+                return dict(zip(elements[::2], elements[1::2])), index
+            return (frozenset(elements) if tag == _SET else tuple(elements)), index
+        raise MalformedDataSerializationError(reason=f"unknown tag {tag!r}")
+
+    # endregion
+
+
+def _encode_scalar(value: Optional[int]) -> bytes:
+    if value is None:
+        return _NONE
+    if isinstance(value, bool):
+        return _TRUE if value else _FALSE
+    return _INTEGER_TAG + _INTEGER.pack(value)
+
+
+def _decode_scalar(tag: bytes, data: bytes, index: int) -> Tuple[Optional[int], int]:
+    if tag == _NONE:
+        return None, index
+    if tag == _INTEGER_TAG:
+        return _INTEGER.unpack_from(data, index)[0], index + _INTEGER.size
+    return tag == _TRUE, index
+
+
+def _append_encoded(tag: bytes, encoded: bytes, parts: List[bytes]) -> None:
+    parts.append(tag + _LENGTH.pack(len(encoded)))
+    parts.append(encoded)
@@ -0,0 +1,751 @@
+"""Symmetries of games and canonicalization of states.
+
+Many games are played on boards with symmetries, e.g. the mirror images and rotations of a tic-tac-toe board. States
+that are images of each other under a symmetry have the same value and their successors are images of each other as
+well, hence caches and books only need to hold one of them, the canonical state.
+
+A symmetry is a permutation of the subrelations of the game (fluents, moves and percepts) that maps the game onto itself
+and leaves all roles in place. Candidates are derived from the shapes of the game: coordinates (sets of numbers or
+constants that occur at the same position of relations) are reflected, and pairs of coordinates with the same values are
+swapped. Most candidates are refuted cheaply along a few random playouts. The remaining candidates are verified against
+the ground rules of each query: clingo searches for a state (and turn), on which the query disagrees with the query of
+its image. Candidates for which there is no such state are symmetries of the game, including its unreachable states.
+Games whose ground programs cannot be analyzed have no detected symmetries. Symmetries that are known beforehand can be
+declared instead.
+
+"""
+
+import collections
+import itertools
+import logging
+import random
+import threading
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import cachetools
+import clingo
+from typing_extensions import Self
+
+import pyggp.game_description_language as gdl
+from pyggp import _clingo as clingo_helper
+from pyggp._clingo_interpreter.control_containers import GroundProgram, get_dependencies, get_ground_externals
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp.engine_primitives import Move, Role, State, Turn, View
+from pyggp.exceptions.interpreter_exceptions import UnsupportedRulesInterpreterError
+
+if TYPE_CHECKING:
+    # The interpreters depend on this module.
+    from pyggp.interpreters import Interpreter
+
+log: logging.Logger = logging.getLogger("pyggp")
+
+_Step = Tuple[Optional[str], int, int]
+_Path = Tuple[_Step, ...]
+_Signature = Tuple[str, int]
+
+_INPUT_SIGNATURES: Sequence[_Signature] = (("true", 1), ("does", 2))
+
+DEFAULT_PLAYOUTS: int = 16
+"Default number of random playouts to verify candidates along."
+DEFAULT_MAX_PLIES: int = 256
+"Default maximal length of a verifying playout."
+MAX_GROUP_SIZE: int = 1024
+"Maximal number of symmetries in a group, larger groups are truncated."
+
+
+@dataclass(frozen=True)
+class Symmetry:
+    """Permutation of the subrelations of a game.
+
+    Subrelations that are not part of the mapping are mapped onto themselves.
+
+    """
+
+    mapping: Mapping[gdl.Subrelation, gdl.Subrelation] = field(default_factory=dict, compare=False)
+    "Image of each subrelation that is not mapped onto itself."
+    _key: FrozenSet[Tuple[gdl.Subrelation, gdl.Subrelation]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        key = frozenset((source, image) for source, image in self.mapping.items() if source != image)
+        object.__setattr__(self, "_key", key)
+
+    # region Constructors
+
+    @classmethod
+    def from_function(
+        cls,
+        universe: Iterable[gdl.Subrelation],
+        function: Callable[[gdl.Subrelation], gdl.Subrelation],
+    ) -> Self:
+        """Create a symmetry from a function.
+
+        Args:
+            universe: Subrelations the function is applied to
+            function: Image of a subrelation
+
+        Returns:
+            Symmetry that maps the universe like the function
+
+        """
+        mapping = {subrelation: function(subrelation) for subrelation in universe}
+        return cls({source: image for source, image in mapping.items() if source != image})
+
+    # endregion
+
+    # region Properties
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether the symmetry maps every subrelation onto itself."""
+        return not self._key
+
+    # endregion
+
+    # region Methods
+
+    def __call__(self, subrelation: gdl.Subrelation) -> gdl.Subrelation:
+        return self.mapping.get(subrelation, subrelation)
+
+    def apply_state(self, state: State) -> State:
+        """Apply the symmetry to a state.
+
+        Args:
+            state: State
+
+        Returns:
+            Image of the state
+
+        """
+        mapping = self.mapping
+        return State(frozenset(mapping.get(subrelation, subrelation) for subrelation in state))
+
+    def apply_view(self, view: View) -> View:
+        """Apply the symmetry to a view.
+
+        Args:
+            view: View
+
+        Returns:
+            Image of the view
+
+        """
+        return View(self.apply_state(view))
+
+    def apply_move(self, move: Move) -> Move:
+        """Apply the symmetry to a move.
+
+        Args:
+            move: Move
+
+        Returns:
+            Image of the move
+
+        """
+        return Move(self.mapping.get(move, move))
+
+    def apply_moves(self, moves: Iterable[Move]) -> FrozenSet[Move]:
+        """Apply the symmetry to moves.
+
+        Args:
+            moves: Moves
+
+        Returns:
+            Images of the moves
+
+        """
+        return frozenset(self.apply_move(move) for move in moves)
+
+    def apply_turn(self, turn: Mapping[Role, Move]) -> Turn:
+        """Apply the symmetry to a turn, roles are left in place.
+
+        Args:
+            turn: Turn
+
+        Returns:
+            Image of the turn
+
+        """
+        return Turn((role, self.apply_move(move)) for role, move in turn.items())
+
+    def compose(self, other: "Symmetry") -> "Symmetry":
+        """Compose with another symmetry, the other symmetry is applied first.
+
+        Args:
+            other: Symmetry that is applied first
+
+        Returns:
+            Composed symmetry
+
+        """
+        sources = set(self.mapping) | set(other.mapping)
+        mapping = {source: self(other(source)) for source in sources}
+        return Symmetry({source: image for source, image in mapping.items() if source != image})
+
+    def invert(self) -> "Symmetry":
+        """Invert the symmetry.
+
+        Returns:
+            Inverse symmetry
+
+        """
+        return Symmetry({image: source for source, image in self.mapping.items()})
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Symmetry):
+            return NotImplemented
+        return self._key == other._key
+
+    # endregion
+
+
+IDENTITY: Symmetry = Symmetry()
+"Symmetry that maps every subrelation onto itself."
+
+
+@dataclass
+class SymmetryGroup:
+    """Group of symmetries of a game, used to canonicalize states.
+
+    The canonical state of a state is its image with the least rank, where subrelations are ranked by their string
+    representation. Hence, the canonical state is the same in every process.
+
+    """
+
+    elements: Sequence[Symmetry] = field(default_factory=lambda: (IDENTITY,))
+    "Symmetries of the group, the identity comes first."
+    universe: Collection[gdl.Subrelation] = field(default_factory=frozenset, repr=False)
+    "Subrelations of the game, states with other subrelations are not canonicalized."
+    cache_size: int = field(default=100_000, repr=False)
+    "Number of canonicalized states that are remembered."
+    _inverses: Mapping[Symmetry, Symmetry] = field(init=False, repr=False)
+    _ranks: Sequence[Mapping[gdl.Subrelation, int]] = field(init=False, repr=False)
+    _cache: MutableMapping[State, Tuple[State, int]] = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        rank = {subrelation: index for index, subrelation in enumerate(sorted(self.universe, key=str))}
+        self._inverses = {element: element.invert() for element in self.elements}
+        self._ranks = tuple(
+            {subrelation: rank[element(subrelation)] for subrelation in rank} for element in self.elements
+        )
+        self._cache = cachetools.LRUCache(maxsize=self.cache_size)
+
+    # region Constructors
+
+    @classmethod
+    def from_generators(cls, generators: Iterable[Symmetry], universe: Iterable[gdl.Subrelation]) -> Self:
+        """Create the group that is generated by the given symmetries.
+
+        Args:
+            generators: Symmetries that generate the group
+            universe: Subrelations of the game
+
+        Returns:
+            Group of all compositions of the generators
+
+        """
+        generators = tuple(generator for generator in generators if not generator.is_identity)
+        elements: List[Symmetry] = [IDENTITY]
+        seen: Set[Symmetry] = {IDENTITY}
+        frontier: List[Symmetry] = [IDENTITY]
+        while frontier:
+            next_frontier: List[Symmetry] = []
+            for element, generator in itertools.product(frontier, generators):
+                composed = generator.compose(element)
+                if composed in seen:
+                    continue
+                if len(elements) >= MAX_GROUP_SIZE:
+                    log.warning("Truncated group of symmetries to %s elements", MAX_GROUP_SIZE)
+                    return cls(elements=tuple(elements), universe=frozenset(universe))
+                seen.add(composed)
+                elements.append(composed)
+                next_frontier.append(composed)
+            frontier = next_frontier
+        return cls(elements=tuple(elements), universe=frozenset(universe))
+
+    # endregion
+
+    # region Magic Methods
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    # endregion
+
+    # region Methods
+
+    def canonicalize(self, state: State) -> Tuple[State, Symmetry]:
+        """Canonicalize a state.
+
+        Args:
+            state: State or view
+
+        Returns:
+            Canonical state, and the symmetry that maps the state onto it
+
+        """
+        if len(self.elements) == 1:
+            return state, IDENTITY
+        with self._lock:
+            cached = self._cache.get(state)
+        if cached is None:
+            cached = self._canonicalize(state)
+            with self._lock:
+                self._cache[state] = cached
+        canonical, index = cached
+        return canonical, self.elements[index]
+
+    def clear_cache(self) -> None:
+        """Forget all canonicalized states."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_inverse(self, element: Symmetry) -> Symmetry:
+        """Get the inverse of an element of the group.
+
+        Args:
+            element: Element of the group
+
+        Returns:
+            Inverse of the element
+
+        """
+        return self._inverses[element]
+
+    def _canonicalize(self, state: State) -> Tuple[State, int]:
+        best_index = 0
+        best_key: Optional[List[int]] = None
+        for index, ranks in enumerate(self._ranks):
+            try:
+                key = sorted(ranks[subrelation] for subrelation in state)
+            except KeyError:
+                return state, 0
+            if best_key is None or key < best_key:
+                best_index, best_key = index, key
+        if best_index == 0:
+            return state, 0
+        return self.elements[best_index].apply_state(state), best_index
+
+    # endregion
+
+
+def get_universe(shape_container: ShapeContainer) -> FrozenSet[gdl.Subrelation]:
+    """Get all subrelations of a game.
+
+    Args:
+        shape_container: Shapes of the game
+
+    Returns:
+        Fluents, moves and percepts of the game
+
+    """
+    moves = (move for moves in shape_container.action_shape.values() for move in moves)
+    percepts = (percept for percepts in shape_container.sees_shape.values() for percept in percepts)
+    return frozenset(itertools.chain(shape_container.state_shape, moves, percepts))
+
+
+def get_candidates(universe: Iterable[gdl.Subrelation], roles: Collection[Role] = ()) -> Sequence[Symmetry]:
+    """Get candidate symmetries of a game from its subrelations.
+
+    Coordinates are values at the same position of relations that are either all numbers or all constants, ordered by
+    value or name respectively. Candidates reflect a coordinate everywhere it occurs, reflect a coordinate wherever it
+    occurs at the same argument of the same relation, or swap two arguments of a relation if they range over the same
+    coordinate.
+
+    Args:
+        universe: Subrelations of the game
+        roles: Roles of the game, which are never moved
+
+    Returns:
+        Candidate symmetries, not verified
+
+    """
+    universe = frozenset(universe)
+    domains: Dict[_Path, Set[gdl.Subrelation]] = collections.defaultdict(set)
+    for subrelation in universe:
+        _collect_domains(subrelation, (), domains)
+    coordinates: Dict[_Path, Tuple[gdl.Subrelation, ...]] = {}
+    for path, domain in domains.items():
+        coordinate = _get_coordinate(domain, roles)
+        if coordinate is not None:
+            coordinates[path] = coordinate
+
+    candidates: List[Symmetry] = [
+        Symmetry.from_function(universe, lambda subrelation, value_map=value_map: _transform(subrelation, value_map))
+        for value_map in _get_reflections(coordinates)
+    ]
+    candidates.extend(
+        Symmetry.from_function(universe, lambda subrelation, swap=swap: _swap(subrelation, swap))
+        for swap in _get_swaps(coordinates)
+    )
+    unique_candidates = tuple(dict.fromkeys(candidate for candidate in candidates if not candidate.is_identity))
+    return tuple(
+        candidate for candidate in unique_candidates if all(image in universe for image in candidate.mapping.values())
+    )
+
+
+def verify_candidates(
+    interpreter: "Interpreter",
+    candidates: Iterable[Symmetry],
+    *,
+    playouts: int = DEFAULT_PLAYOUTS,
+    max_plies: int = DEFAULT_MAX_PLIES,
+    rng: Optional[random.Random] = None,
+) -> Sequence[Symmetry]:
+    """Keep the candidates that commute with the game.
+
+    A candidate is kept if it maps the initial state onto itself, and if for every state along the playouts, the
+    legal moves, percepts, goals and terminality of its image are the images of those of the state, and the image of
+    the next state is the next state of the images of the state and the turn. The candidates that remain are kept if
+    they map the ground rules of each query onto themselves.
+
+    Args:
+        interpreter: Interpreter of the game
+        candidates: Candidate symmetries
+        playouts: Number of random playouts
+        max_plies: Maximal length of a playout
+        rng: Random number generator
+
+    Returns:
+        Candidates that are symmetries of the game
+
+    """
+    if rng is None:
+        # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: The
+        # playouts are not used for cryptography.
+        rng = random.Random()  # noqa: S311
+    init_state = interpreter.get_init_state()
+    remaining = [candidate for candidate in candidates if candidate.apply_state(init_state) == init_state]
+    for _ in range(playouts):
+        state = init_state
+        for _ in range(max_plies):
+            if not remaining:
+                return ()
+            turn = _get_random_turn(interpreter, state, rng)
+            next_state = interpreter.get_next_state(state, turn) if turn is not None else None
+            remaining = [
+                candidate for candidate in remaining if _commutes(interpreter, candidate, state, turn, next_state)
+            ]
+            if next_state is None:
+                break
+            state = next_state
+    if not remaining:
+        return ()
+    try:
+        programs = _get_ground_programs(interpreter.ruleset)
+    except UnsupportedRulesInterpreterError as error:
+        log.warning("Discarding %s candidate symmetries, as the rules cannot be analyzed: %s", len(remaining), error)
+        return ()
+    return tuple(
+        candidate
+        for candidate in remaining
+        if all(_maps_program_onto_itself(program, outputs, candidate) for program, outputs in programs)
+    )
+
+
+def detect_symmetries(
+    interpreter: "Interpreter",
+    *,
+    shape_container: Optional[ShapeContainer] = None,
+    playouts: int = DEFAULT_PLAYOUTS,
+    max_plies: int = DEFAULT_MAX_PLIES,
+    rng: Optional[random.Random] = None,
+) -> SymmetryGroup:
+    """Detect the symmetries of a game.
+
+    Args:
+        interpreter: Interpreter of the game
+        shape_container: Shapes of the game, derived from the ruleset if not given
+        playouts: Number of random playouts to verify candidates along
+        max_plies: Maximal length of a playout
+        rng: Random number generator
+
+    Returns:
+        Group generated by the verified candidates
+
+    """
+    if shape_container is None:
+        shape_container = getattr(interpreter, "shape_container", None) or ShapeContainer.from_ruleset(
+            interpreter.ruleset,
+        )
+    universe = get_universe(shape_container)
+    candidates = get_candidates(universe, roles=interpreter.get_roles())
+    generators = verify_candidates(interpreter, candidates, playouts=playouts, max_plies=max_plies, rng=rng)
+    group = SymmetryGroup.from_generators(generators, universe)
+    log.debug(
+        "Detected %s symmetries from %s of %s candidates",
+        len(group),
+        len(generators),
+        len(candidates),
+    )
+    return group
+
+
+def _collect_domains(
+    subrelation: gdl.Subrelation,
+    path: _Path,
+    domains: MutableMapping[_Path, Set[gdl.Subrelation]],
+) -> None:
+    symbol = subrelation.symbol
+    if isinstance(symbol, gdl.Relation) and symbol.arguments:
+        arity = len(symbol.arguments)
+        for index, argument in enumerate(symbol.arguments):
+            _collect_domains(argument, (*path, (symbol.name, arity, index)), domains)
+    else:
+        domains[path].add(subrelation)
+
+
+def _get_coordinate(
+    domain: Collection[gdl.Subrelation],
+    roles: Collection[gdl.Subrelation],
+) -> Optional[Tuple[gdl.Subrelation, ...]]:
+    if len(domain) < 2 or any(value in roles for value in domain):  # noqa: PLR2004
+        return None
+    if all(isinstance(value.symbol, gdl.Number) for value in domain):
+        return tuple(sorted(domain, key=lambda value: value.symbol.number))
+    if all(isinstance(value.symbol, gdl.Relation) and value.symbol.name is not None for value in domain):
+        return tuple(sorted(domain, key=lambda value: value.symbol.name))
+    return None
+
+
+def _get_reflections(
+    coordinates: Mapping[_Path, Tuple[gdl.Subrelation, ...]],
+) -> Sequence[Mapping[_Path, Mapping[gdl.Subrelation, gdl.Subrelation]]]:
+    value_maps: List[Mapping[_Path, Mapping[gdl.Subrelation, gdl.Subrelation]]] = []
+    paths_by_coordinate: Dict[Tuple[gdl.Subrelation, ...], List[_Path]] = collections.defaultdict(list)
+    for path, coordinate in coordinates.items():
+        paths_by_coordinate[coordinate].append(path)
+    for coordinate, paths in paths_by_coordinate.items():
+        reflection = dict(zip(coordinate, reversed(coordinate)))
+        value_maps.append({path: reflection for path in paths})
+        paths_by_argument: Dict[Tuple[Optional[str], int], List[_Path]] = collections.defaultdict(list)
+        for path in paths:
+            if path:
+                name, _, index = path[-1]
+                paths_by_argument[(name, index)].append(path)
+        if len(paths_by_argument) > 1:
+            value_maps.extend(
+                {path: reflection for path in argument_paths} for argument_paths in paths_by_argument.values()
+            )
+    return value_maps
+
+
+def _get_swaps(coordinates: Mapping[_Path, Tuple[gdl.Subrelation, ...]]) -> Sequence[Tuple[Optional[str], int, int]]:
+    swaps: Set[Tuple[Optional[str], int, int]] = set()
+    for path, coordinate in coordinates.items():
+        if not path:
+            continue
+        *parent, (name, arity, index) = path
+        for other_index in range(index + 1, arity):
+            if coordinates.get((*parent, (name, arity, other_index))) == coordinate:
+                swaps.add((name, index, other_index))
+    return sorted(swaps, key=str)
+
+
+def _transform(
+    subrelation: gdl.Subrelation,
+    value_map: Mapping[_Path, Mapping[gdl.Subrelation, gdl.Subrelation]],
+    path: _Path = (),
+) -> gdl.Subrelation:
+    symbol = subrelation.symbol
+    if isinstance(symbol, gdl.Relation) and symbol.arguments:
+        arity = len(symbol.arguments)
+        arguments = tuple(
+            _transform(argument, value_map, (*path, (symbol.name, arity, index)))
+            for index, argument in enumerate(symbol.arguments)
+        )
+        return gdl.Subrelation(gdl.Relation(name=symbol.name, arguments=arguments))
+    reflection = value_map.get(path)
+    if reflection is None:
+        return subrelation
+    return reflection.get(subrelation, subrelation)
+
+
+def _swap(subrelation: gdl.Subrelation, swap: Tuple[Optional[str], int, int]) -> gdl.Subrelation:
+    symbol = subrelation.symbol
+    if not isinstance(symbol, gdl.Relation) or not symbol.arguments:
+        return subrelation
+    arguments = [_swap(argument, swap) for argument in symbol.arguments]
+    name, index, other_index = swap
+    if symbol.name == name and other_index < len(arguments):
+        arguments[index], arguments[other_index] = arguments[other_index], arguments[index]
+    return gdl.Subrelation(gdl.Relation(name=symbol.name, arguments=tuple(arguments)))
+
+
+def _get_random_turn(interpreter: "Interpreter", state: State, rng: random.Random) -> Optional[Turn]:
+    if interpreter.is_terminal(state):
+        return None
+    roles_in_control = sorted(interpreter.get_roles_in_control(state), key=str)
+    moves = {role: sorted(interpreter.get_legal_moves_by_role(state, role), key=str) for role in roles_in_control}
+    if not all(moves.values()):
+        return None
+    return Turn((role, rng.choice(moves[role])) for role in roles_in_control)
+
+
+def _commutes(
+    interpreter: "Interpreter",
+    candidate: Symmetry,
+    state: State,
+    turn: Optional[Turn],
+    next_state: Optional[State],
+) -> bool:
+    image = candidate.apply_state(state)
+    if interpreter.is_terminal(image) != interpreter.is_terminal(state):
+        return False
+    if interpreter.get_goals(image) != interpreter.get_goals(state):
+        return False
+    legal_moves = interpreter.get_legal_moves(state)
+    image_legal_moves = interpreter.get_legal_moves(image)
+    if {role: candidate.apply_moves(moves) for role, moves in legal_moves.items() if moves} != {
+        role: moves for role, moves in image_legal_moves.items() if moves
+    }:
+        return False
+    if interpreter.has_incomplete_information:
+        sees = interpreter.get_sees(state)
+        if {role: candidate.apply_view(view) for role, view in sees.items()} != interpreter.get_sees(image):
+            return False
+    if turn is None or next_state is None:
+        return True
+    return interpreter.get_next_state(image, candidate.apply_turn(turn)) == candidate.apply_state(next_state)
+
+
+def _get_ground_programs(ruleset: gdl.Ruleset) -> Sequence[Tuple[GroundProgram, Sequence[_Signature]]]:
+    # Grounded from the dependency cones of the queries, as the controls of the clingo interpreter are.
+    next_program = GroundProgram.from_rules(
+        get_dependencies(ruleset, ruleset.next_rules, ruleset.init_rules, ruleset.role_rules, ruleset.legal_rules),
+        clingo_helper.EXTERNALS,
+    )
+    externals = (
+        *get_ground_externals(next_program.ctl, name="true", arity=1),
+        *get_ground_externals(next_program.ctl, name="does", arity=2),
+    )
+    programs = [(next_program, (("next", 1),))]
+    for name, arity, rules in (
+        ("legal", 2, ruleset.legal_rules),
+        ("terminal", 0, ruleset.terminal_rules),
+        ("goal", 2, ruleset.goal_rules),
+        ("sees", 2, ruleset.sees_rules),
+    ):
+        programs.append((GroundProgram.from_rules(rules, externals), ((name, arity),)))
+    return programs
+
+
+def _maps_program_onto_itself(
+    program: GroundProgram,
+    outputs: Sequence[_Signature],
+    candidate: Symmetry,
+) -> bool:
+    # Copy A of the ground program reads the inputs (true and does atoms), copy B reads the image of each input instead.
+    # Hence, the candidate commutes with the query, iff for all inputs, each output of B is true iff the image of the
+    # output is true in A. The inputs are chosen freely, and clingo searches for inputs on which this does not hold.
+    inputs = {
+        atom: literal
+        for atom, literal in _get_literals(program, _INPUT_SIGNATURES).items()
+        if literal not in program.rules
+    }
+    output_literals = _get_literals(program, outputs)
+    inverse = candidate.invert()
+
+    ctl = clingo.Control(("--models=1",))
+    with ctl.backend() as backend:
+        false = backend.add_atom()
+        choices = {literal: backend.add_atom() for literal in inputs.values()}
+        backend.add_rule(list(choices.values()), choice=True)
+        atoms = {0: false, **choices}
+        image_atoms = {
+            0: false,
+            **{
+                literal: choices.get(inputs.get(_apply_arguments(candidate, atom), 0), false)
+                for atom, literal in inputs.items()
+            },
+        }
+        pairs = [(_add_copy(backend, program, atoms), _add_copy(backend, program, image_atoms))]
+        for atom, literal in output_literals.items():
+            image_literal = output_literals.get(_apply_arguments(candidate, atom), 0)
+            pairs.append((_get_atom(backend, image_atoms, literal), _get_atom(backend, atoms, image_literal)))
+            preimage_literal = output_literals.get(_apply_arguments(inverse, atom), 0)
+            pairs.append((_get_atom(backend, image_atoms, preimage_literal), _get_atom(backend, atoms, literal)))
+        differs = backend.add_atom()
+        for atom, other_atom in pairs:
+            backend.add_rule([differs], [atom, -other_atom])
+            backend.add_rule([differs], [-atom, other_atom])
+        backend.add_rule([], [-differs])
+    return not ctl.solve().satisfiable
+
+
+def _get_literals(program: GroundProgram, signatures: Iterable[_Signature]) -> Dict[gdl.Subrelation, int]:
+    return {
+        gdl.Subrelation.from_clingo_symbol(symbolic_atom.symbol): symbolic_atom.literal
+        for name, arity in signatures
+        for symbolic_atom in program.ctl.symbolic_atoms.by_signature(name=name, arity=arity)
+    }
+
+
+def _add_copy(backend: clingo.Backend, program: GroundProgram, atoms: Dict[int, int]) -> int:
+    # Returns the atom that is true iff a constraint of the copy is violated.
+    for head, bodies in program.rules.items():
+        for body in bodies:
+            backend.add_rule([_get_atom(backend, atoms, head)], _translate(backend, atoms, body))
+    violated = backend.add_atom()
+    for body in program.constraints:
+        backend.add_rule([violated], _translate(backend, atoms, body))
+    return violated
+
+
+def _get_atom(backend: clingo.Backend, atoms: Dict[int, int], literal: int) -> int:
+    if literal not in atoms:
+        atoms[literal] = backend.add_atom()
+    return atoms[literal]
+
+
+def _translate(backend: clingo.Backend, atoms: Dict[int, int], body: Sequence[int]) -> List[int]:
+    return [
+        _get_atom(backend, atoms, literal) if literal > 0 else -_get_atom(backend, atoms, -literal) for literal in body
+    ]
+
+
+def _apply_arguments(symmetry: Symmetry, atom: gdl.Subrelation) -> gdl.Subrelation:
+    symbol = atom.symbol
+    if not isinstance(symbol, gdl.Relation) or not symbol.arguments:
+        return atom
+    return gdl.Subrelation(
+        gdl.Relation(name=symbol.name, arguments=tuple(symmetry(argument) for argument in symbol.arguments)),
+    )
+
+
+def as_symmetry_group(
+    symmetries: Union[SymmetryGroup, Iterable[Symmetry]],
+    universe: Iterable[gdl.Subrelation],
+) -> SymmetryGroup:
+    """Get the group of declared symmetries.
+
+    Args:
+        symmetries: Group, or symmetries that generate it
+        universe: Subrelations of the game
+
+    Returns:
+        Group of the symmetries
+
+    """
+    if isinstance(symmetries, SymmetryGroup):
+        return symmetries
+    return SymmetryGroup.from_generators(symmetries, universe)
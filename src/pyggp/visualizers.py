@@ -294,7 +294,7 @@ class ClingoStringVisualizer(SimpleVisualizer):
         for path in paths:
             p = Visualizer.determine_filepath(path)
             ctl.load(str(p))
-            log.debug(f"Loaded %s", p)
+            log.debug("Loaded %s", p)
         ctl.ground()
         debug_level = int(kwargs.pop("debug_level", 0))
         path = pathlib.Path(file) if file is not None else None
@@ -0,0 +1,47 @@
+"""Helpers shared by the tests."""
+
+import pathlib
+from typing import FrozenSet, Optional, Union
+
+import pyggp.game_description_language as gdl
+from pyggp.engine_primitives import State, View
+from pyggp.interpreters import Interpreter
+
+GAMES_DIRECTORY: pathlib.Path = pathlib.Path(__file__).parent.parent / "src" / "games"
+"Directory of the bundled games, independent of the working directory."
+
+
+def get_ruleset(name: str) -> gdl.Ruleset:
+    """Parse a bundled game, e.g. `tic_tac_toe.gdl`."""
+    return gdl.parse((GAMES_DIRECTORY / name).read_text())
+
+
+def get_reachable_states(interpreter: Interpreter, max_depth: Optional[int] = None) -> FrozenSet[State]:
+    """Get the states that are reachable in at most max_depth plies, or all reachable states if max_depth is None."""
+    states = {interpreter.get_init_state()}
+    frontier = list(states)
+    depth = 0
+    while frontier and (max_depth is None or depth < max_depth):
+        next_frontier = []
+        for state in frontier:
+            for _, next_state in interpreter.get_all_next_states(state):
+                if next_state not in states:
+                    states.add(next_state)
+                    next_frontier.append(next_state)
+        frontier = next_frontier
+        depth += 1
+    return frozenset(states)
+
+
+def query(interpreter: Interpreter, state: Union[State, View]) -> tuple:
+    """Ask all queries about a state, such that interpreters can be compared by their answers."""
+    return (
+        interpreter.get_legal_moves(state),
+        {role: interpreter.get_legal_moves_by_role(state, role) for role in interpreter.get_roles()},
+        interpreter.get_sees(state),
+        interpreter.get_goals(state),
+        interpreter.is_terminal(state),
+        frozenset(interpreter.get_all_next_states(state)),
+        frozenset(interpreter.get_all_turns(state)),
+        {turn: interpreter.get_next_state(state, turn) for turn in interpreter.get_all_turns(state)},
+    )
@@ -0,0 +1,108 @@
+import json
+import pathlib
+
+import pytest
+
+from prof.benchmarks import (
+    Benchmark,
+    compare,
+    get_benchmarks,
+    get_games_directory,
+    get_results_document,
+    main,
+    run_benchmark,
+)
+
+
+def _get_document(throughput: float, peak_rss_bytes: int) -> dict:
+    return {
+        "results": [
+            {"name": "a", "throughput_median": throughput, "peak_rss_bytes": peak_rss_bytes},
+            {"name": "b", "throughput_median": 1.0, "peak_rss_bytes": None},
+        ],
+    }
+
+
+def test_get_games_directory_is_independent_of_working_directory(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    assert (get_games_directory() / "tic_tac_toe.gdl").is_file()
+
+
+def test_get_benchmarks_skips_invalid_combinations() -> None:
+    benchmarks = list(
+        get_benchmarks(
+            games=("tic_tac_toe", "phantom_connect(4,4,4)"),
+            interpreters=("pyggp.interpreters.ClingoInterpreter",),
+            agents=("pyggp.agents.MCTSAgent", "pyggp.agents.SOISMCTSAgent"),
+            operations=("step", "fill"),
+            sizes={"step": 3},
+        ),
+    )
+
+    assert [benchmark.name for benchmark in benchmarks] == [
+        "tic_tac_toe/ClingoInterpreter/MCTSAgent/step",
+        "tic_tac_toe/ClingoInterpreter/SOISMCTSAgent/step",
+        "phantom_connect(4,4,4)/ClingoInterpreter/SOISMCTSAgent/step",
+        "phantom_connect(4,4,4)/ClingoInterpreter/-/fill",
+    ]
+    assert benchmarks[0].size == 3
+
+
+@pytest.mark.parametrize(
+    ("operation", "agent"),
+    [("step", "pyggp.agents.MCTSAgent"), ("develop", None), ("book", None), ("playout", None)],
+)
+def test_run_benchmark_is_reproducible(operation, agent) -> None:
+    benchmark = Benchmark(
+        game="tic_tac_toe",
+        interpreter="pyggp.interpreters.ClingoInterpreter",
+        operation=operation,
+        size=4,
+        agent=agent,
+    )
+    result = run_benchmark(benchmark, warmup=0, repeat=2)
+
+    assert len(result.times_s) == 2
+    assert result.work[0] == result.work[1] > 0
+    assert all(throughput > 0 for throughput in result.throughputs)
+    document = get_results_document([result], seed=0, warmup=0, repeat=2)
+    assert json.loads(json.dumps(document))["results"][0]["name"] == benchmark.name
+
+
+def test_run_fill_benchmark() -> None:
+    benchmark = Benchmark(
+        game="phantom_connect(4,4,4)",
+        interpreter="pyggp.interpreters.ClingoInterpreter",
+        operation="fill",
+        size=2,
+    )
+    result = run_benchmark(benchmark, warmup=0, repeat=1)
+
+    assert result.unit == "states"
+    assert result.work[0] > 1
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = _get_document(throughput=100.0, peak_rss_bytes=1000)
+
+    assert not any(comparison.is_regression for comparison in compare(baseline, _get_document(95.0, 1050)))
+    (slower, _) = compare(baseline, _get_document(80.0, 1000))
+    assert slower.is_regression
+    assert slower.throughput_ratio == pytest.approx(0.8)
+    (larger, _) = compare(baseline, _get_document(100.0, 2000))
+    assert larger.is_regression
+    assert not compare(baseline, {"results": []})
+
+
+def test_compare_command_exit_code(tmp_path: pathlib.Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    candidate = tmp_path / "candidate.json"
+    baseline.write_text(json.dumps(_get_document(100.0, 1000)))
+    candidate.write_text(json.dumps(_get_document(50.0, 1000)))
+
+    assert main(["compare", str(baseline), str(baseline)]) == 0
+    assert main(["compare", str(baseline), str(candidate)]) == 1
@@ -0,0 +1,124 @@
+import pathlib
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.compilation import CompiledProgram, compile_ruleset, get_key
+from pyggp.engine_primitives import Move, Role, State
+from pyggp.exceptions.interpreter_exceptions import UncompilableInterpreterError
+
+_RULES_STR = """
+role(p1). role(p2).
+adjacent(1, 2). adjacent(2, 3). adjacent(3, 1).
+init(on(1)). init(control(p1)).
+connected(1) :- true(on(1)).
+connected(Y) :- connected(X), adjacent(X, Y), true(on(Y)).
+next(on(X)) :- true(on(X)).
+next(on(X)) :- does(p1, switch(X)).
+next(control(p2)) :- true(control(p1)).
+next(control(p1)) :- true(control(p2)).
+legal(p1, switch(X)) :- true(control(p1)), adjacent(X, Y), not true(on(X)).
+legal(p1, noop) :- true(control(p2)).
+legal(p2, noop).
+sees(R, on(X)) :- role(R), true(on(X)), connected(X).
+goal(p1, 100) :- connected(3).
+goal(p1, 0) :- not connected(3).
+goal(p2, 0).
+terminal :- connected(3).
+"""
+
+
+def _subrelation(string: str) -> gdl.Subrelation:
+    return gdl.parse_subrelation(string)
+
+
+def _state(*strings: str) -> State:
+    return State(frozenset(_subrelation(string) for string in strings))
+
+
+def test_compile_ruleset_is_deterministic() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    assert compile_ruleset(ruleset) == compile_ruleset(ruleset)
+
+
+def test_get_key_depends_on_rules() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    other_ruleset = gdl.parse(_RULES_STR.replace("adjacent(3, 1)", "adjacent(3, 2)"))
+
+    assert get_key(ruleset) == get_key(gdl.parse(_RULES_STR))
+    assert get_key(ruleset) != get_key(other_ruleset)
+
+
+def test_get_next_state(tmp_path: pathlib.Path) -> None:
+    program = CompiledProgram.from_ruleset(gdl.parse(_RULES_STR), directory=tmp_path)
+    turn = {
+        Role(_subrelation("p1")): Move(_subrelation("switch(2)")),
+        Role(_subrelation("p2")): Move(_subrelation("noop")),
+    }
+
+    actual = program.get_next_state(_state("on(1)", "control(p1)"), turn)
+
+    assert actual == _state("on(1)", "on(2)", "control(p2)")
+
+
+def test_recursion_is_computed_to_fixpoint(tmp_path: pathlib.Path) -> None:
+    program = CompiledProgram.from_ruleset(gdl.parse(_RULES_STR), directory=tmp_path)
+    p1 = Role(_subrelation("p1"))
+
+    assert program.is_terminal(_state("on(1)", "on(2)", "on(3)")) is True
+    assert program.is_terminal(_state("on(1)", "on(3)")) is False
+    assert program.get_sees(_state("on(1)", "on(3)")) == {
+        p1: _state("on(1)"),
+        Role(_subrelation("p2")): _state("on(1)"),
+    }
+    assert set(program.get_goals(_state("on(1)", "on(2)", "on(3)"))) == {(p1, 100), (Role(_subrelation("p2")), 0)}
+
+
+def test_get_legal_moves(tmp_path: pathlib.Path) -> None:
+    program = CompiledProgram.from_ruleset(gdl.parse(_RULES_STR), directory=tmp_path)
+
+    actual = program.get_legal_moves(_state("on(1)", "control(p1)"))
+
+    assert actual == {
+        Role(_subrelation("p1")): frozenset((Move(_subrelation("switch(2)")), Move(_subrelation("switch(3)")))),
+        Role(_subrelation("p2")): frozenset((Move(_subrelation("noop")),)),
+    }
+
+
+def test_unstratified_ruleset_is_uncompilable() -> None:
+    ruleset = gdl.parse(
+        """
+        role(p1).
+        init(on).
+        legal(p1, noop).
+        next(on) :- true(on).
+        p :- true(on), not q.
+        q :- true(on), not p.
+        terminal :- p.
+        goal(p1, 100).
+        """,
+    )
+
+    with pytest.raises(UncompilableInterpreterError):
+        compile_ruleset(ruleset)
+
+
+def test_from_ruleset_reuses_cache(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    CompiledProgram.from_ruleset(ruleset, directory=tmp_path)
+    (path,) = tmp_path.glob("*.py")
+    path.write_text(path.read_text().replace("def terminal(s):", "def terminal(s):\n    return 1"))
+
+    program = CompiledProgram.from_ruleset(ruleset, directory=tmp_path)
+
+    assert program.is_terminal(_state("on(1)")) is True
+
+
+def test_from_ruleset_ignores_corrupt_cache(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    tmp_path.joinpath(f"pyggp_compiled_{get_key(ruleset)}.py").write_text("not python")
+
+    program = CompiledProgram.from_ruleset(ruleset, directory=tmp_path)
+
+    assert program.is_terminal(_state("on(1)")) is False
@@ -0,0 +1,89 @@
+from typing import List
+
+import clingo
+import pytest
+from clingo import ast as clingo_ast
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.control_containers import ControlContainer, GroundProgram
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp.exceptions.interpreter_exceptions import UnsupportedRulesInterpreterError
+
+_RULES_STR = """
+role(p).
+succ(1, 2). succ(2, 3).
+init(cell(1)).
+legal(p, step) :- true(cell(X)), succ(X, Y).
+next(cell(Y)) :- true(cell(X)), succ(X, Y), does(p, step).
+reached(3) :- true(cell(3)).
+terminal :- reached(3).
+goal(p, 100) :- terminal.
+goal(p, 0) :- not terminal.
+"""
+
+
+def _get_signatures(ctl: clingo.Control) -> frozenset:
+    return frozenset((name, arity) for name, arity, _ in ctl.symbolic_atoms.signatures)
+
+
+def test_from_ruleset_grounds_dependencies_only() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    control_container = ControlContainer.from_ruleset(ruleset)
+
+    assert ("reached", 1) not in _get_signatures(control_container.next)
+    assert ("succ", 2) not in _get_signatures(control_container.terminal)
+    assert ("reached", 1) in _get_signatures(control_container.goal)
+    assert ("legal", 2) not in _get_signatures(control_container.goal)
+
+
+def test_from_ruleset_declares_all_externals() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    control_container = ControlContainer.from_ruleset(ruleset)
+
+    expected = ShapeContainer.from_ruleset(ruleset)
+    for ctl in (control_container.legal, control_container.goal, control_container.terminal):
+        true_atoms = frozenset(atom.symbol for atom in ctl.symbolic_atoms.by_signature("true", 1))
+        assert true_atoms == frozenset(
+            clingo.Function("true", (subrelation.as_clingo_symbol(),)) for subrelation in expected.state_shape
+        )
+        assert all(atom.is_external for atom in ctl.symbolic_atoms.by_signature("true", 1))
+        assert len(tuple(ctl.symbolic_atoms.by_signature("does", 2))) == 1
+
+
+def _parse_program(program_str: str) -> List[clingo_ast.AST]:
+    rules: List[clingo_ast.AST] = []
+    clingo_ast.parse_string(program_str, rules.append)
+    return rules
+
+
+def test_ground_program_records_rules_and_constraints() -> None:
+    program = GroundProgram.from_rules((), _parse_program("#external c. a :- c, not b. b :- not a. :- a, b."))
+
+    ((_, a),) = program.get_atoms("a", 0)
+    ((_, b),) = program.get_atoms("b", 0)
+    ((_, c),) = program.get_atoms("c", 0)
+    assert {head: [frozenset(body) for body in bodies] for head, bodies in program.rules.items()} == {
+        a: [frozenset((-b, c))],
+        b: [frozenset((-a,))],
+    }
+    assert [frozenset(body) for body in program.constraints] == [frozenset((a, b))]
+
+
+@pytest.mark.parametrize(
+    "program_str",
+    [
+        "{ a }.",
+        "a ; b.",
+        "#external b. #external c. a :- 1 { b; c }.",
+    ],
+)
+def test_ground_program_rejects_unsupported_rules(program_str: str) -> None:
+    with pytest.raises(UnsupportedRulesInterpreterError):
+        GroundProgram.from_rules((), _parse_program(program_str))
+
+
+def test_ground_program_rejects_too_many_rules() -> None:
+    with pytest.raises(UnsupportedRulesInterpreterError):
+        GroundProgram.from_rules((), _parse_program("n(1..3). #external b(1..3). a(X) :- n(X), b(X)."), max_rules=2)
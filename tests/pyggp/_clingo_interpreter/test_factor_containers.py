@@ -0,0 +1,89 @@
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.factor_containers import FactorContainer
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp.engine_primitives import Move, Role
+from tests.helpers import get_ruleset
+
+_RULES_STR = """
+role(left). role(right).
+side(left). side(right).
+succ(1, 2).
+init(at(S, 1)) :- side(S).
+init(control(left)).
+next(control(right)) :- true(control(left)).
+next(control(left)) :- true(control(right)).
+legal(R, step) :- true(control(R)), true(at(R, 1)).
+legal(R, noop) :- role(R), not true(control(R)).
+legal(R, noop) :- true(control(R)), true(at(R, 2)).
+next(at(S, P)) :- true(at(S, Q)), succ(Q, P), does(S, step).
+next(at(S, P)) :- true(at(S, P)), side(S), not does(S, step).
+terminal :- true(at(left, 2)), true(at(right, 2)).
+goal(R, 100) :- role(R), terminal.
+goal(R, 0) :- role(R), not terminal.
+"""
+
+
+def _subrelation(string: str) -> gdl.Subrelation:
+    return gdl.parse_subrelation(string)
+
+
+def _get_factor_container(ruleset: gdl.Ruleset) -> FactorContainer:
+    return FactorContainer.from_ruleset(ruleset, ShapeContainer.from_ruleset(ruleset))
+
+
+def test_from_ruleset_factors() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    actual = _get_factor_container(ruleset)
+
+    expected_factors = (
+        frozenset((_subrelation("at(left, 1)"), _subrelation("at(left, 2)"))),
+        frozenset((_subrelation("at(right, 1)"), _subrelation("at(right, 2)"))),
+        frozenset((_subrelation("control(left)"), _subrelation("control(right)"))),
+    )
+    assert actual.factors == expected_factors
+    assert actual.is_factored
+
+
+def test_from_ruleset_factor_actions() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    actual = _get_factor_container(ruleset)
+
+    left = Role(_subrelation("left"))
+    right = Role(_subrelation("right"))
+    assert actual.factor_actions == (
+        frozenset(((left, Move(_subrelation("step"))),)),
+        frozenset(((right, Move(_subrelation("step"))),)),
+        frozenset(),
+    )
+
+
+def test_from_ruleset_supports() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    actual = _get_factor_container(ruleset)
+
+    left = Role(_subrelation("left"))
+    assert actual.terminal_support == frozenset((_subrelation("at(left, 2)"), _subrelation("at(right, 2)")))
+    assert actual.goal_supports[left] == actual.terminal_support
+    assert actual.legal_supports[left] == frozenset(
+        (_subrelation("control(left)"), _subrelation("at(left, 1)"), _subrelation("at(left, 2)")),
+    )
+
+
+def test_from_ruleset_split_corridor() -> None:
+    ruleset = get_ruleset("phantom_split_corridor(3,4).gdl")
+
+    actual = _get_factor_container(ruleset)
+
+    assert len(actual.factors) == 3
+    assert not any(left.intersection(right) for left, right in zip(actual.factors, actual.factors[1:]))
+
+
+def test_from_ruleset_tic_tac_toe_is_not_factored() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+
+    actual = _get_factor_container(ruleset)
+
+    assert not actual.is_factored
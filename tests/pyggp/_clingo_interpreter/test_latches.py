@@ -0,0 +1,73 @@
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.control_containers import ControlContainer
+from pyggp._clingo_interpreter.latches import get_latch_rules, get_unread_fluents
+from pyggp.engine_primitives import Move, Role, State, Turn
+from pyggp.interpreters import ClingoInterpreter, ClingoRegroundingInterpreter
+
+_RULES_STR = """
+role(p).
+cell(1). cell(2).
+init(step(0)). init(control(p)).
+next(control(p)) :- true(control(p)).
+legal(p, mark(X)) :- cell(X), not true(marked(X)).
+next(marked(X)) :- cell(X), true(marked(X)).
+next(marked(X)) :- does(p, mark(X)).
+next(step(1)) :- true(step(0)).
+next(flicker) :- true(flicker), not true(step(1)).
+next(gone(X)) :- true(gone(X)), cell(X), true(step(0)).
+terminal :- true(marked(1)), true(marked(2)).
+goal(p, 100) :- terminal.
+"""
+
+
+def _subrelation(string: str) -> gdl.Subrelation:
+    return gdl.parse_subrelation(string)
+
+
+def _get_next_rules(ruleset: gdl.Ruleset) -> tuple:
+    return tuple(rule for rule in ruleset.rules if rule.head.name == "next")
+
+
+def test_get_latch_rules() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    actual = get_latch_rules(ruleset)
+
+    assert actual == _get_next_rules(ruleset)[:2]
+
+
+def test_get_unread_fluents() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    state_shape = (_subrelation("marked(1)"), _subrelation("step(0)"), _subrelation("step(1)"))
+
+    actual = get_unread_fluents(_get_next_rules(ruleset)[2:], state_shape)
+
+    assert actual == frozenset({_subrelation("marked(1)")})
+
+
+def test_from_ruleset_detects_ground_latches() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    control_container = ControlContainer.from_ruleset(ruleset)
+
+    assert control_container.latches == frozenset(
+        {_subrelation("control(p)"), _subrelation("marked(1)"), _subrelation("marked(2)")},
+    )
+
+
+def test_get_next_state_carries_over_latches() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = ClingoInterpreter.from_ruleset(ruleset, disable_cache=True)
+    expected_interpreter = ClingoRegroundingInterpreter.from_ruleset(ruleset, disable_cache=True)
+    state = State(
+        frozenset(
+            {_subrelation("control(p)"), _subrelation("marked(1)"), _subrelation("step(1)"), _subrelation("flicker")},
+        ),
+    )
+    turn = Turn({Role(_subrelation("p")): Move(_subrelation("mark(2)"))})
+
+    actual = interpreter.get_next_state(state, turn)
+
+    assert actual == expected_interpreter.get_next_state(state, turn)
+    assert actual == frozenset({_subrelation("control(p)"), _subrelation("marked(1)"), _subrelation("marked(2)")})
+    assert dict(interpreter.get_all_next_states(state)) == {turn: actual}
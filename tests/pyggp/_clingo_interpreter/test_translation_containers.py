@@ -0,0 +1,43 @@
+import clingo
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.base import _transform, _transform_pair, _translate_model
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp._clingo_interpreter.translation_containers import TranslationContainer
+from pyggp.engine_primitives import Move, Role
+
+
+def test_from_shape_container() -> None:
+    rules = """
+    role(p1). role(p2).
+    init(cell(1)). init(control(p1)).
+    next(cell(2)) :- true(cell(1)).
+    legal(R, noop) :- role(R).
+    sees(R, cell(X)) :- role(R), true(cell(X)).
+    """
+    ruleset = gdl.parse(rules)
+    shape_container = ShapeContainer.from_ruleset(ruleset)
+    translation_container = TranslationContainer.from_shape_container(shape_container)
+
+    next_symbol = clingo.Function("next", (clingo.Function("cell", (clingo.Number(2),)),))
+    assert translation_container.next_symbol_to_state[next_symbol] == gdl.parse_subrelation("cell(2)")
+    legal_symbol = clingo.Function("legal", (clingo.Function("p1"), clingo.Function("noop")))
+    assert translation_container.legal_symbol_to_action[legal_symbol] == (
+        Role(gdl.parse_subrelation("p1")),
+        Move(gdl.parse_subrelation("noop")),
+    )
+    sees_symbol = clingo.Function("sees", (clingo.Function("p2"), clingo.Function("cell", (clingo.Number(1),))))
+    assert translation_container.sees_symbol_to_view[sees_symbol] == (
+        Role(gdl.parse_subrelation("p2")),
+        gdl.parse_subrelation("cell(1)"),
+    )
+
+
+def test_translate_model_falls_back() -> None:
+    known = clingo.Function("legal", (clingo.Function("p1"), clingo.Function("a")))
+    unknown = clingo.Function("legal", (clingo.Function("p1"), clingo.Function("b")))
+    prebuilt = (Role(gdl.parse_subrelation("p1")), Move(gdl.parse_subrelation("a")))
+    actual = tuple(_translate_model((known, unknown), {known: prebuilt}, _transform_pair))
+    assert actual == (prebuilt, (gdl.parse_subrelation("p1"), gdl.parse_subrelation("b")))
+    assert actual[0] is prebuilt
+    assert tuple(_translate_model((clingo.Function("a"),), {}, _transform)) == (gdl.parse_subrelation("a"),)
@@ -36,3 +36,15 @@ def test_conclude_match() -> None:
     assert agent.ruleset is None
     assert agent.startclock_config is None
     assert agent.playclock_config is None
+
+
+@mock.patch.object(InterpreterAgent, "__abstractmethods__", set())
+def test_spawn_rng_is_reproducible_with_seed() -> None:
+    agent1 = InterpreterAgent(seed=0)
+    agent2 = InterpreterAgent(seed=0)
+
+    rng1 = agent1.spawn_rng()
+    rng2 = agent2.spawn_rng()
+
+    assert [rng1.random() for _ in range(8)] == [rng2.random() for _ in range(8)]
+    assert agent1.spawn_rng().random() != rng1.random()
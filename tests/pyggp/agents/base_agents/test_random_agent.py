@@ -1,3 +1,4 @@
+from typing import Sequence
 from unittest import mock
 
 import pyggp.game_description_language as gdl
@@ -23,3 +24,18 @@ def test_calculate_move() -> None:
     actual = agent.calculate_move(0, 0, view)
     expected = legal_moves
     assert actual in expected
+
+
+def test_calculate_move_is_reproducible_with_seed() -> None:
+    interpreter = mock.Mock(spec=Interpreter)
+    interpreter.get_legal_moves_by_role.return_value = frozenset(
+        Move(gdl.Subrelation(gdl.Relation(f"m{nr}"))) for nr in range(16)
+    )
+    view = View(State(frozenset()))
+
+    def get_moves(agent: RandomAgent) -> Sequence[Move]:
+        agent.interpreter = interpreter
+        agent.role = mock.Mock(spec=Role)
+        return [agent.calculate_move(ply, 0, view) for ply in range(8)]
+
+    assert get_moves(RandomAgent(seed=0)) == get_moves(RandomAgent(seed=0))
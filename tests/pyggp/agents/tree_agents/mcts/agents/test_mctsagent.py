@@ -0,0 +1,192 @@
+import math
+from typing import Any, Iterator
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp.agents import MCTSAgent
+from pyggp.agents.tree_agents.agents import ONE_S_IN_NS
+from pyggp.agents.tree_agents.mcts.selectors import RandomSelector
+from pyggp.engine_primitives import Role
+from pyggp.gameclocks import DEFAULT_NO_TIMEOUT_CONFIGURATION
+from pyggp.interpreters import ClingoRegroundingInterpreter
+
+
+@pytest.fixture
+def registry() -> Iterator[metrics.MetricsRegistry]:
+    yield metrics.enable()
+    metrics.disable()
+
+
+def _prepare_agent(rules: str, **kwargs: Any) -> MCTSAgent:
+    return _prepare_agent_for_ruleset(
+        gdl.parse(
+            "role(p). role(q). init(control(p)). next(done(M)) :- does(p, M). terminal :- true(done(M)). "
+            "goal(q, 50) :- terminal. " + rules,
+        ),
+        **kwargs,
+    )
+
+
+def _prepare_agent_for_ruleset(ruleset: gdl.Ruleset, **kwargs: Any) -> MCTSAgent:
+    interpreter = ClingoRegroundingInterpreter(
+        ruleset=ruleset,
+        temporal_rule_container=TemporalRuleContainer.from_ruleset(ruleset),
+    )
+    agent = MCTSAgent(interpreter=interpreter, skip_book=True, seed=0, **kwargs)
+    agent.prepare_match(
+        Role(gdl.Subrelation(gdl.Relation("p"))),
+        ruleset,
+        DEFAULT_NO_TIMEOUT_CONFIGURATION,
+        DEFAULT_NO_TIMEOUT_CONFIGURATION,
+    )
+    return agent
+
+
+def test_search_stops_without_alternatives() -> None:
+    agent = _prepare_agent("legal(p, win) :- true(control(p)). goal(p, 100) :- terminal.")
+
+    agent.search(60 * ONE_S_IN_NS)
+
+    assert agent.tree.valuation.total_playouts == 1
+
+
+def test_search_stops_once_decided() -> None:
+    rules = (
+        "legal(p, win) :- true(control(p)). legal(p, lose) :- true(control(p)). "
+        "goal(p, 100) :- true(done(win)). goal(p, 0) :- true(done(lose))."
+    )
+    adaptive_agent = _prepare_agent(rules, max_mcts_iterations=1000)
+    agent = _prepare_agent(rules, max_mcts_iterations=1000, adaptive_time=False)
+
+    adaptive_agent.search(60 * ONE_S_IN_NS)
+    agent.search(60 * ONE_S_IN_NS)
+
+    assert adaptive_agent.tree.valuation.total_playouts < 1000
+    assert agent.tree.valuation.total_playouts == 1000
+    key_to_evaluation = adaptive_agent.get_key_to_evaluation()
+    best_key = max(key_to_evaluation, key=key_to_evaluation.get)
+    assert str(adaptive_agent._key_to_move(best_key)) == "win"
+
+
+def test_search_is_extended_while_contested(registry) -> None:
+    agent = _prepare_agent(
+        "legal(p, a) :- true(control(p)). legal(p, b) :- true(control(p)). goal(p, 100) :- terminal.",
+    )
+    for _ in range(20):
+        agent.step()
+
+    assert agent._is_contested()
+
+    agent.search(ONE_S_IN_NS // 20, max_search_time_ns=ONE_S_IN_NS // 10)
+
+    assert registry.counter("pyggp_mcts_extensions_total", role=agent.role).value == 1
+
+
+def test_search_with_random_selector_is_reproducible() -> None:
+    rules = " ".join(f"legal(p, {move}) :- true(control(p))." for move in "abcdef")
+    key_to_total_playouts = []
+    for _ in range(2):
+        agent = _prepare_agent(rules, selector_factory=RandomSelector, max_mcts_iterations=60, adaptive_time=False)
+        agent.search(60 * ONE_S_IN_NS)
+        key_to_total_playouts.append(
+            {str(key): child.valuation.total_playouts for key, child in agent.tree.children.items()},
+        )
+
+    assert key_to_total_playouts[0] == key_to_total_playouts[1]
+    assert len(set(key_to_total_playouts[0].values())) > 1
+
+
+def test_search_sheds_memory_and_stops_growing_over_budget(registry) -> None:
+    ruleset = gdl.parse(
+        "role(p). role(q). init(control(p)). init(step(0)). "
+        "succ(0, 1). succ(1, 2). succ(2, 3). succ(3, 4). succ(4, 5). succ(5, 6). succ(6, 7). succ(7, 8). "
+        "legal(p, a) :- true(control(p)). legal(p, b) :- true(control(p)). "
+        "next(step(M)) :- true(step(N)), succ(N, M). next(control(p)) :- true(control(p)). "
+        "terminal :- true(step(8)). goal(p, 100) :- terminal. goal(q, 50) :- terminal.",
+    )
+    agent = _prepare_agent_for_ruleset(ruleset, max_mcts_iterations=100, adaptive_time=False)
+    agent.search(60 * ONE_S_IN_NS)
+    node_count = agent.tree.node_count
+    agent.max_memory_bytes = 1
+
+    agent.search(60 * ONE_S_IN_NS)
+
+    assert agent.tree.valuation.total_playouts == 200
+    assert registry.counter("pyggp_mcts_memory_sheds_total", role=agent.role).value >= 1
+    assert registry.counter("pyggp_mcts_pruned_subtrees_total", role=agent.role).value >= 1
+    assert agent._is_under_memory_pressure()
+    node_count = agent.tree.node_count
+    for _ in range(20):
+        agent.step()
+    assert agent.tree.node_count == node_count
+
+
+def test_tree_grows_again_after_memory_is_freed() -> None:
+    ruleset = gdl.parse(
+        "role(p). role(q). init(control(p)). init(step(0)). "
+        "succ(0, 1). succ(1, 2). succ(2, 3). succ(3, 4). succ(4, 5). succ(5, 6). succ(6, 7). succ(7, 8). "
+        "legal(p, a) :- true(control(p)). legal(p, b) :- true(control(p)). "
+        "next(step(M)) :- true(step(N)), succ(N, M). next(control(p)) :- true(control(p)). "
+        "terminal :- true(step(8)). goal(p, 100) :- terminal. goal(q, 50) :- terminal.",
+    )
+    agent = _prepare_agent_for_ruleset(ruleset, max_mcts_iterations=100, adaptive_time=False)
+    agent.search(60 * ONE_S_IN_NS)
+    agent.max_memory_bytes = 1
+    agent.search(60 * ONE_S_IN_NS)
+    assert agent._is_under_memory_pressure()
+    turn, child = max(agent.tree.children.items(), key=lambda item: item[1].node_count)
+
+    agent.descend(turn)
+    agent.update(1, child.state, 60 * ONE_S_IN_NS)
+    node_count = agent.tree.node_count
+    for _ in range(20):
+        agent.step()
+
+    assert agent.tree.node_count > node_count
+
+
+def test_search_with_progressive_widening() -> None:
+    moves = " ".join(f"legal(p, m{move}) :- true(control(p))." for move in range(8))
+    ruleset = gdl.parse(
+        "role(p). role(q). init(control(p)). init(step(0)). succ(0, 1). succ(1, 2). succ(2, 3). "
+        f"{moves} next(step(M)) :- true(step(N)), succ(N, M). next(control(p)) :- true(control(p)). "
+        "terminal :- true(step(3)). goal(p, 100) :- terminal. goal(q, 50) :- terminal.",
+    )
+    agent = _prepare_agent_for_ruleset(ruleset, max_mcts_iterations=50, adaptive_time=False, widening_exponent=0.5)
+
+    agent.search(60 * ONE_S_IN_NS)
+
+    assert agent.tree.fully_expanded
+    assert len(agent.tree.children) == 8
+    for child in agent.tree.children.values():
+        if child.children is not None:
+            visits = child.valuation.total_playouts
+            assert len(child.children) <= max(1, math.ceil(visits**0.5))
+
+
+def test_search_expands_widened_child_fully_after_descending() -> None:
+    moves = " ".join(f"legal(p, m{move}) :- true(control(p))." for move in range(8))
+    ruleset = gdl.parse(
+        "role(p). role(q). init(control(p)). init(step(0)). succ(0, 1). succ(1, 2). succ(2, 3). "
+        f"{moves} next(step(M)) :- true(step(N)), succ(N, M). next(control(p)) :- true(control(p)). "
+        "terminal :- true(step(3)). goal(p, 100) :- terminal. goal(q, 50) :- terminal.",
+    )
+    agent = _prepare_agent_for_ruleset(ruleset, max_mcts_iterations=50, adaptive_time=False, widening_exponent=0.5)
+    agent.search(60 * ONE_S_IN_NS)
+    turn, child = next(
+        (turn, child)
+        for turn, child in agent.tree.children.items()
+        if child.children is not None and not child.fully_expanded
+    )
+
+    agent.descend(turn)
+    agent.update(1, child.state, 60 * ONE_S_IN_NS)
+    agent.search(60 * ONE_S_IN_NS)
+
+    assert agent.tree is child
+    assert agent.tree.fully_expanded
+    assert len(agent.tree.children) == 8
+    assert all(child.valuation is not None for child in agent.tree.children.values())
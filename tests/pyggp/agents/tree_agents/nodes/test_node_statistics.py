@@ -0,0 +1,175 @@
+import random
+from typing import Any, List, Tuple
+
+import pytest
+
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp.agents.tree_agents.nodes import (
+    Node,
+    PerfectInformationNode,
+    VisibleInformationSetNode,
+)
+from pyggp.engine_primitives import Turn
+from pyggp.interpreters import ClingoInterpreter, ClingoRegroundingInterpreter
+from tests.helpers import get_ruleset
+
+
+def _get_unique_children(node: Node[Any, Any]) -> List[Node[Any, Any]]:
+    if not node.children:
+        return []
+    return list({id(child): child for child in node.children.values()}.values())
+
+
+def _recompute(node: Node[Any, Any]) -> Tuple[float, int, int, int]:
+    children = _get_unique_children(node)
+    if not children:
+        return 0.0, 0, 1, 0
+    statistics = [_recompute(child) for child in children]
+    avg_height = 1.0 + sum(avg_height for avg_height, _, _, _ in statistics) / len(children)
+    max_height = 1 + max(max_height for _, max_height, _, _ in statistics)
+    node_count = 1 + sum(node_count for _, _, node_count, _ in statistics)
+    transition_count = len(node.children) + sum(transition_count for _, _, _, transition_count in statistics)
+    return avg_height, max_height, node_count, transition_count
+
+
+def _assert_statistics(node: Node[Any, Any]) -> None:
+    avg_height, max_height, node_count, transition_count = _recompute(node)
+    assert node.avg_height == pytest.approx(avg_height)
+    assert node.max_height == max_height
+    assert node.node_count == node_count
+    assert node.transition_count == transition_count
+    assert node.arity == len(_get_unique_children(node))
+    assert node.memory_estimate > 0
+
+
+def _get_random_leaf(node: Node[Any, Any], rng: random.Random) -> Node[Any, Any]:
+    while node.children:
+        node = rng.choice(_get_unique_children(node))
+    return node
+
+
+def test_leaf() -> None:
+    node = PerfectInformationNode(state=frozenset())
+    assert node.arity == 0
+    assert node.avg_height == 0.0
+    assert node.max_height == 0
+    assert node.node_count == 1
+    assert node.transition_count == 0
+
+
+def test_perfect_information_node_statistics_on_expand_and_trim() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+    interpreter = ClingoRegroundingInterpreter(
+        ruleset=ruleset,
+        temporal_rule_container=TemporalRuleContainer.from_ruleset(ruleset),
+    )
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Testing.
+    rng = random.Random(0)  # noqa: S311
+    root = PerfectInformationNode(state=interpreter.get_init_state())
+    for _ in range(40):
+        _get_random_leaf(root, rng).expand(interpreter)
+        _assert_statistics(root)
+
+    root.expand(interpreter)
+    root.turn = rng.choice(list(root.children))
+    root.trim()
+    _assert_statistics(root)
+
+    tree = root.children[root.turn]
+    tree.expand(interpreter)
+    tree.turn = rng.choice(list(tree.children))
+    tree.trim()
+    _assert_statistics(tree)
+    _assert_statistics(root)
+
+
+def test_information_set_node_statistics_on_expand_branch_and_develop() -> None:
+    interpreter = ClingoInterpreter.from_ruleset(get_ruleset("phantom_split_corridor(3,3).gdl"))
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Testing.
+    rng = random.Random(0)  # noqa: S311
+    init_state = interpreter.get_init_state()
+    role = min(interpreter.get_roles_in_control(init_state), key=str)
+    root = VisibleInformationSetNode(
+        possible_states={init_state},
+        view=interpreter.get_sees_by_role(init_state, role),
+        role=role,
+        fully_enumerated=True,
+    )
+    for _ in range(40):
+        leaf = _get_random_leaf(root, rng)
+        if leaf.possible_states:
+            leaf.branch(interpreter, rng.choice(sorted(leaf.possible_states, key=str)))
+        _assert_statistics(root)
+
+    state = init_state
+    tree = root
+    for ply in range(1, 7):
+        roles_in_control = interpreter.get_roles_in_control(state)
+        turn = Turn(
+            {
+                role_: rng.choice(sorted(interpreter.get_legal_moves_by_role(state, role_), key=str))
+                for role_ in roles_in_control
+            },
+        )
+        if role in turn:
+            tree.branch(interpreter, state)
+            tree.move = turn[role]
+            tree.trim()
+            _assert_statistics(tree)
+        state = interpreter.get_next_state(state, turn)
+        if role in interpreter.get_roles_in_control(state):
+            tree = tree.develop(interpreter, ply, interpreter.get_sees_by_role(state, role))
+            assert isinstance(tree, VisibleInformationSetNode)
+            assert tree.depth == ply
+            _assert_statistics(tree)
+
+
+def test_statistics_on_collapse_and_reexpand() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+    interpreter = ClingoRegroundingInterpreter(
+        ruleset=ruleset,
+        temporal_rule_container=TemporalRuleContainer.from_ruleset(ruleset),
+    )
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Testing.
+    rng = random.Random(0)  # noqa: S311
+    root = PerfectInformationNode(state=interpreter.get_init_state())
+    for _ in range(40):
+        _get_random_leaf(root, rng).expand(interpreter)
+
+    child = max(_get_unique_children(root), key=lambda node: node.node_count)
+    child_node_count = child.node_count
+    node_count = root.node_count
+    child.collapse()
+
+    assert child.children is None
+    assert child.node_count == 1
+    assert root.node_count == node_count - child_node_count + 1
+    _assert_statistics(root)
+
+    child.expand(interpreter)
+    _assert_statistics(root)
+
+
+def test_information_set_node_collapse() -> None:
+    interpreter = ClingoInterpreter.from_ruleset(get_ruleset("phantom_split_corridor(3,3).gdl"))
+    init_state = interpreter.get_init_state()
+    role = min(interpreter.get_roles_in_control(init_state), key=str)
+    root = VisibleInformationSetNode(
+        possible_states={init_state},
+        view=interpreter.get_sees_by_role(init_state, role),
+        role=role,
+        fully_enumerated=True,
+    )
+    root.branch(interpreter, init_state)
+    assert root.fully_expanded
+
+    root.collapse()
+
+    assert root.children is None
+    assert not root.fully_expanded
+    assert not root.view_to_visiblechild
+    _assert_statistics(root)
+
+    root.branch(interpreter, init_state)
+    assert root.children
+    _assert_statistics(root)
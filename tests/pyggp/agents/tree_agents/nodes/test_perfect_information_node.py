@@ -129,6 +129,32 @@ def test_expand(mock_interpreter) -> None:
     assert node.children == children
 
 
+def test_widen_only_computes_next_states_of_added_turns(mock_interpreter) -> None:
+    node = PerfectInformationNode(state=mock.Mock(spec=State))
+    turns = [mock.Mock(spec=Turn) for _ in range(3)]
+    next_states = {turn: mock.Mock(spec=State) for turn in turns}
+    mock_interpreter.get_all_turns.return_value = iter(turns)
+    mock_interpreter.get_next_state.side_effect = lambda _state, turn: next_states[turn]
+
+    node.widen(mock_interpreter, width=1)
+
+    assert len(node.children) == 1
+    assert not node.fully_expanded
+    assert mock_interpreter.get_next_state.call_count == 1
+
+    node.widen(mock_interpreter, width=2)
+
+    assert len(node.children) == 2
+    assert mock_interpreter.get_next_state.call_count == 2
+
+    node.expand(mock_interpreter)
+
+    assert node.fully_expanded
+    assert node.node_count == 4
+    assert {turn: child.state for turn, child in node.children.items()} == next_states
+    mock_interpreter.get_all_next_states.assert_not_called()
+
+
 def test_evaluate(
     mock_state,
     mock_evaluator,
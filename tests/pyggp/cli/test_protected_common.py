@@ -1,8 +1,20 @@
+import pathlib
 from typing import Mapping, Sequence
 
 import pytest
 
-from pyggp.cli._common import parse_registry
+import pyggp.game_description_language as gdl
+from pyggp.agents import HumanAgent, RandomAgent
+from pyggp.cli._common import (
+    get_role_seeds,
+    load_agentfactory_by_specification,
+    load_precompiled_ruleset,
+    load_ruleset,
+    parse_registry,
+)
+from pyggp.cli.argument_specification import ArgumentSpecification
+from pyggp.engine_primitives import Role
+from pyggp.ruleset_cache import RulesetCache
 
 
 @pytest.mark.parametrize(
@@ -18,3 +30,44 @@ def test_parse_registry(registry: Sequence[str], expected: Mapping[str, str]) ->
     actual_iterator = parse_registry(registry, default_value="")
     actual = dict(actual_iterator)
     assert actual == expected
+
+
+def test_load_precompiled_ruleset(tmp_path: pathlib.Path) -> None:
+    file = tmp_path / "game.gdl"
+    file.write_text("role(p1). init(cell(1)).")
+    ruleset_cache = RulesetCache(tmp_path / "cache")
+
+    precompiled, key = load_precompiled_ruleset([file], ruleset_cache)
+    assert precompiled.ruleset == load_ruleset([file])
+    assert key == RulesetCache.get_key(file.read_text())
+    assert ruleset_cache.load(key) == precompiled
+
+    cached, cached_key = load_precompiled_ruleset([file], ruleset_cache)
+    assert cached == precompiled
+    assert cached_key == key
+
+    uncached, uncached_key = load_precompiled_ruleset([file])
+    assert uncached == precompiled
+    assert uncached_key is None
+
+
+def test_load_agentfactory_by_specification_seeds_agents() -> None:
+    seeded_agent = load_agentfactory_by_specification(ArgumentSpecification.from_str("Random"), seed=1)()
+    agent = load_agentfactory_by_specification(ArgumentSpecification.from_str("Random(seed=2)"), seed=1)()
+    human_agent = load_agentfactory_by_specification(ArgumentSpecification.from_str("Human"), seed=1)()
+
+    assert isinstance(seeded_agent, RandomAgent)
+    assert seeded_agent.seed == 1
+    assert isinstance(agent, RandomAgent)
+    assert agent.seed == 2
+    assert isinstance(human_agent, HumanAgent)
+
+
+def test_get_role_seeds() -> None:
+    roles = [Role(gdl.Subrelation(gdl.Relation(name))) for name in ("x", "o")]
+
+    role_seeds = get_role_seeds(roles, 0)
+
+    assert role_seeds == get_role_seeds(reversed(roles), 0)
+    assert role_seeds != get_role_seeds(roles, 1)
+    assert len(set(role_seeds.values())) == len(roles)
@@ -1,6 +1,10 @@
+import copy
+import pickle
+
+import clingo
 import pytest
 
-from pyggp.game_description_language.subrelations import Number, Relation, String, Subrelation
+from pyggp.game_description_language.subrelations import Number, Relation, String, Subrelation, Variable
 
 
 @pytest.mark.parametrize(
@@ -47,3 +51,75 @@ def test_dunder_lt(subrelation1: Subrelation, subrelation2: Subrelation, expecte
 def test_dunder_gt(subrelation1: Subrelation, subrelation2: Subrelation, expected: bool) -> None:
     actual = subrelation1 > subrelation2
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    ("factory1", "factory2"),
+    [
+        (lambda: Subrelation(Relation("a")), lambda: Subrelation(Relation(name="a", arguments=()))),
+        (lambda: Subrelation(), lambda: Subrelation(Relation())),
+        (
+            lambda: Subrelation(Relation("a", (Subrelation(Number(1)), Subrelation(String("b"))))),
+            lambda: Subrelation(Relation.from_symbols("a", Number(1), String("b"))),
+        ),
+        (
+            lambda: Subrelation(Relation("a", (Subrelation(Number(1)),))),
+            lambda: Subrelation.from_clingo_symbol(clingo.Function("a", (clingo.Number(1),))),
+        ),
+        (
+            lambda: Subrelation(Relation("a", [Subrelation(Variable("X"))])),
+            lambda: Subrelation(Relation.from_symbols("a", Variable("X"))),
+        ),
+    ],
+)
+def test_interned(factory1, factory2) -> None:
+    subrelation1 = factory1()
+    subrelation2 = factory2()
+    assert subrelation1 is subrelation2
+    assert isinstance(subrelation1.symbol.arguments, tuple)
+
+
+def test_interned_after_copy_and_pickle() -> None:
+    subrelation = Subrelation(Relation.from_symbols("a", Number(1), String("b"), Variable("X")))
+    assert copy.copy(subrelation) is subrelation
+    assert copy.deepcopy(subrelation) is subrelation
+    assert pickle.loads(pickle.dumps(subrelation)) is subrelation  # noqa: S301
+
+
+def test_not_interned_if_different() -> None:
+    assert Subrelation(Number(1)) is not Subrelation(String("1"))
+    assert Subrelation(String("X")) is not Subrelation(Variable("X"))
+    assert Subrelation(Relation("a")) != Subrelation(Relation("a", (Subrelation(Number(1)),)))
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Subrelation(Relation("a", (Subrelation(Number(1)),))),
+        Relation("a", (Subrelation(Number(1)),)),
+        Number(1),
+        String("a"),
+        Variable("X"),
+    ],
+)
+def test_slotted(instance) -> None:
+    assert not hasattr(instance, "__dict__")
+    assert hash(instance) == instance._hash
+
+
+def test_get_control_arguments() -> None:
+    subrelations = frozenset(
+        {
+            Subrelation(Relation.from_symbols("control", Relation("fresh_role"))),
+            Subrelation(Relation.from_symbols("control", Number(1))),
+            Subrelation(Relation.from_symbols("control", Relation("a"), Relation("b"))),
+            Subrelation(Relation.from_symbols("cell", Relation("a"))),
+            Subrelation(Relation("control")),
+            Subrelation(String("control")),
+        },
+    )
+
+    actual = Subrelation.get_control_arguments(subrelations)
+
+    assert actual == frozenset({Subrelation(Relation("fresh_role")), Subrelation(Number(1))})
+
@@ -0,0 +1,59 @@
+import pathlib
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp.engine_primitives import Move, Role
+from pyggp.interpreters import ClingoInterpreter, CompiledInterpreter
+from tests.helpers import get_reachable_states, get_ruleset, query
+
+
+@pytest.mark.parametrize(
+    ("name", "max_depth"),
+    [
+        ("tic_tac_toe.gdl", 3),
+        ("hexapawn.gdl", 3),
+        ("nim.gdl", 4),
+        ("minipoker.gdl", 4),
+        ("phantom_split_corridor(3,3).gdl", 2),
+    ],
+)
+def test_answers_queries_like_clingo_interpreter(tmp_path: pathlib.Path, name: str, max_depth: int) -> None:
+    ruleset = get_ruleset(name)
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset, disable_cache=True)
+    interpreter = CompiledInterpreter.from_ruleset(ruleset, disable_cache=True, cache_directory=tmp_path)
+    states = sorted(get_reachable_states(expected_interpreter, max_depth), key=str)
+
+    assert interpreter.program is not None
+    for state in states:
+        assert query(interpreter, state) == query(expected_interpreter, state)
+
+
+def test_stores_compiled_ruleset(tmp_path: pathlib.Path) -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+
+    CompiledInterpreter.from_ruleset(ruleset, cache_directory=tmp_path)
+
+    assert len(tuple(tmp_path.glob("*.py"))) == 1
+
+
+def test_falls_back_to_clingo(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(
+        """
+        role(p1).
+        init(on).
+        legal(p1, noop).
+        next(on) :- true(on).
+        p :- true(on), not q.
+        q :- true(on), not p.
+        terminal :- p.
+        goal(p1, 100).
+        """,
+    )
+
+    interpreter = CompiledInterpreter.from_ruleset(ruleset, cache_directory=tmp_path)
+
+    assert interpreter.program is None
+    assert interpreter.get_legal_moves(interpreter.get_init_state()) == {
+        Role(gdl.parse_subrelation("p1")): frozenset((Move(gdl.parse_subrelation("noop")),)),
+    }
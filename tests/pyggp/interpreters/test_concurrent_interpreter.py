@@ -0,0 +1,107 @@
+import concurrent.futures
+import sys
+import threading
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp.interpreters import ClingoInterpreter, ConcurrentClingoInterpreter
+from tests.helpers import get_reachable_states, query
+
+_RULES_STR = """
+role(x). role(o).
+succ(0, 1). succ(1, 2). succ(2, 3). succ(3, 4). succ(4, 5). succ(5, 6).
+init(count(0)). init(control(x)).
+legal(R, 1) :- role(R), true(control(R)), true(count(N)), succ(N, M).
+legal(R, 2) :- role(R), true(control(R)), true(count(N)), succ(N, K), succ(K, M).
+next(count(M)) :- true(count(N)), does(R, 1), succ(N, M).
+next(count(M)) :- true(count(N)), does(R, 2), succ(N, K), succ(K, M).
+next(control(o)) :- true(control(x)).
+next(control(x)) :- true(control(o)).
+sees(R, count(N)) :- role(R), true(count(N)).
+terminal :- true(count(5)).
+terminal :- true(count(6)).
+goal(x, 100) :- terminal, true(control(o)). goal(x, 0) :- terminal, true(control(x)).
+goal(o, 100) :- terminal, true(control(x)). goal(o, 0) :- terminal, true(control(o)).
+"""
+
+
+@pytest.fixture
+def ruleset() -> gdl.Ruleset:
+    return gdl.parse(_RULES_STR)
+
+
+def test_answers_queries_from_threads_like_clingo_interpreter(ruleset) -> None:
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    states = sorted(get_reachable_states(expected_interpreter), key=str)
+    expected = [query(expected_interpreter, state) for state in states]
+
+    interpreter = ConcurrentClingoInterpreter.from_ruleset(ruleset, pool_size=4, disable_cache=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        actual = list(executor.map(lambda state: query(interpreter, state), states * 8))
+
+    assert interpreter.pool.size == 4
+    assert actual == expected * 8
+
+
+def test_waits_for_replica(ruleset) -> None:
+    interpreter = ConcurrentClingoInterpreter.from_ruleset(ruleset, pool_size=1, disable_cache=True)
+    state = interpreter.get_init_state()
+    answered = threading.Event()
+
+    def query() -> None:
+        interpreter.is_terminal(state)
+        answered.set()
+
+    with interpreter.pool.checkout():
+        thread = threading.Thread(target=query)
+        thread.start()
+        assert not answered.wait(timeout=0.1)
+        assert not interpreter.is_terminal(state)
+    thread.join()
+    assert answered.is_set()
+
+
+def test_enumerates_nested_with_single_replica(ruleset) -> None:
+    interpreter = ConcurrentClingoInterpreter.from_ruleset(ruleset, pool_size=1, disable_cache=True)
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    state = interpreter.get_init_state()
+
+    actual = {
+        turn: frozenset(interpreter.get_all_next_states(next_state))
+        for turn, next_state in interpreter.get_all_next_states(state)
+    }
+    expected = {
+        turn: frozenset(expected_interpreter.get_all_next_states(next_state))
+        for turn, next_state in expected_interpreter.get_all_next_states(state)
+    }
+
+    assert actual == expected
+
+
+def test_answers_queries_from_threads_while_caches_are_cleared(ruleset) -> None:
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    states = sorted(get_reachable_states(expected_interpreter), key=str)
+    expected = [query(expected_interpreter, state) for state in states]
+
+    interpreter = ConcurrentClingoInterpreter.from_ruleset(ruleset, pool_size=4)
+    done = threading.Event()
+
+    def clear() -> None:
+        while not done.is_set():
+            interpreter.cache.clear()
+
+    # Switches threads often, such that caches are cleared between the lookups of a query.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    clearer = threading.Thread(target=clear)
+    clearer.start()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            actual = list(executor.map(lambda state: query(interpreter, state), states * 32))
+    finally:
+        done.set()
+        clearer.join()
+        sys.setswitchinterval(switch_interval)
+
+    assert actual == expected * 32
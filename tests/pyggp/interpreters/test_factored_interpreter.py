@@ -0,0 +1,57 @@
+import pytest
+
+from pyggp.interpreters import ClingoInterpreter, FactoredInterpreter
+from tests.helpers import get_reachable_states, get_ruleset, query
+
+
+@pytest.mark.parametrize(
+    ("name", "max_depth"),
+    [
+        ("phantom_split_corridor(3,3).gdl", 2),
+        ("dark_split_corridor(3,4).gdl", 2),
+        ("tic_tac_toe.gdl", 2),
+    ],
+)
+def test_answers_queries_like_clingo_interpreter(name, max_depth) -> None:
+    ruleset = get_ruleset(name)
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    interpreter = FactoredInterpreter.from_ruleset(ruleset)
+    states = sorted(get_reachable_states(expected_interpreter, max_depth), key=str)
+
+    for state in states:
+        assert query(interpreter, state) == query(expected_interpreter, state)
+
+
+def test_caches_grow_with_factors() -> None:
+    ruleset = get_ruleset("phantom_split_corridor(3,3).gdl")
+    interpreter = FactoredInterpreter.from_ruleset(ruleset)
+
+    states = get_reachable_states(interpreter, 3)
+
+    assert interpreter.factor_container.is_factored
+    assert sum(len(factor_cache) for factor_cache in interpreter.cache.next) < len(states)
+
+
+def test_answers_unseen_combinations_from_cache() -> None:
+    ruleset = get_ruleset("phantom_split_corridor(3,3).gdl")
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    interpreter = FactoredInterpreter.from_ruleset(ruleset)
+    states = get_reachable_states(interpreter, 2)
+    left, right, control = interpreter.factor_container.factors
+    combinations = {
+        state.intersection(left).union(other.intersection(right), state.intersection(control))
+        for state in states
+        for other in states
+    }
+    unseen = sorted((combination for combination in combinations if combination not in states), key=str)[:32]
+
+    hits = 0
+    for combination in unseen:
+        for turn in expected_interpreter.get_all_turns(combination):
+            cache_sizes = [len(factor_cache) for factor_cache in interpreter.cache.next]
+            actual = interpreter.get_next_state(combination, turn)
+            hits += cache_sizes == [len(factor_cache) for factor_cache in interpreter.cache.next]
+            assert actual == expected_interpreter.get_next_state(combination, turn)
+
+    assert unseen
+    assert hits > 0
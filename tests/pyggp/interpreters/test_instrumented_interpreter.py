@@ -0,0 +1,96 @@
+import random
+from typing import Iterator
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp.engine_primitives import Move, Role, State, Turn, View
+from pyggp.interpreters import ClingoInterpreter, ClingoRegroundingInterpreter, InstrumentedInterpreter
+from pyggp.metrics import MetricsRegistry
+from pyggp.records import ImperfectInformationRecord
+
+_RULES_STR = """
+role(r).
+init(0). init(control(r)).
+next(control(r)) :- true(control(r)).
+next(2) :- true(1), does(r, 1). next(b) :- true(a), does(r, a).
+next(1) :- true(0), does(r, 1). next(a) :- true(0), does(r, a).
+sees(r, control(r)) :- true(control(r)).
+legal(r, 1) :- true(0). legal(r, 1) :- true(1).
+legal(r, a) :- true(0). legal(r, a) :- true(a).
+terminal :- true(2).
+terminal :- true(b).
+"""
+
+
+@pytest.fixture
+def registry() -> Iterator[MetricsRegistry]:
+    yield metrics.enable()
+    metrics.disable()
+
+
+@pytest.fixture(params=[ClingoInterpreter.from_ruleset, ClingoRegroundingInterpreter.from_ruleset])
+def interpreter(request) -> InstrumentedInterpreter:
+    return InstrumentedInterpreter(interpreter=request.param(gdl.parse(_RULES_STR)))
+
+
+def _get_call_count(registry: MetricsRegistry, method: str) -> int:
+    return registry.histogram("pyggp_interpreter_call_seconds", method=method).count
+
+
+def test_records_nothing_while_metrics_are_disabled(interpreter) -> None:
+    interpreter.is_terminal(interpreter.get_init_state())
+    assert metrics.registry is None
+
+
+def test_records_calls(registry, interpreter) -> None:
+    r = Role(gdl.parse_subrelation("r"))
+    state_0 = interpreter.get_init_state()
+    legal_moves = interpreter.get_legal_moves_by_role(state_0, r)
+    state_1 = interpreter.get_next_state(state_0, Turn({r: Move(gdl.parse_subrelation("a"))}))
+    interpreter.is_terminal(state_1)
+
+    for method in ("get_legal_moves_by_role", "get_next_state", "is_terminal"):
+        assert _get_call_count(registry, method) == 1
+        assert registry.histogram("pyggp_interpreter_solve_seconds", method=method).count == 1
+        assert registry.histogram("pyggp_interpreter_ground_seconds", method=method).count == 1
+    assert registry.counter("pyggp_interpreter_solves_total", method="get_next_state").value == 1
+    assert registry.histogram("pyggp_interpreter_result_size", method="get_legal_moves_by_role").sum == len(
+        legal_moves,
+    )
+    assert registry.histogram("pyggp_interpreter_result_size", method="get_next_state").sum == len(state_1)
+    assert registry.histogram("pyggp_interpreter_result_size", method="is_terminal").sum == 0
+
+
+def test_records_lazy_calls_once_exhausted(registry, interpreter) -> None:
+    r = Role(gdl.parse_subrelation("r"))
+    control_r = gdl.parse_subrelation("control(r)")
+    state_0 = State(frozenset({gdl.parse_subrelation("0"), control_r}))
+    view = View(State(frozenset({control_r})))
+    record = ImperfectInformationRecord(possible_states={0: frozenset({state_0})}, views={0: {r: view}, 1: {r: view}})
+
+    possible_states = interpreter.get_possible_states(record, ply=1)
+    assert _get_call_count(registry, "get_possible_states") == 0
+    assert len(set(possible_states)) == 2
+    assert _get_call_count(registry, "get_possible_states") == 1
+    assert registry.histogram("pyggp_interpreter_result_size", method="get_possible_states").sum == 2
+    assert registry.counter("pyggp_interpreter_solves_total", method="get_possible_states").value >= 1
+
+    developments = interpreter.get_developments(record)
+    next(developments)
+    developments.close()
+    assert _get_call_count(registry, "get_developments") == 1
+    assert registry.histogram("pyggp_interpreter_result_size", method="get_developments").sum == 1
+
+
+def test_samples_calls(registry) -> None:
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Testing.
+    rng = random.Random(0)  # noqa: S311
+    interpreter = InstrumentedInterpreter.from_ruleset(gdl.parse(_RULES_STR), sample_rate=0.25)
+    interpreter.rng = rng
+    state = interpreter.get_init_state()
+    for _ in range(200):
+        interpreter.is_terminal(state)
+
+    assert 25 <= _get_call_count(registry, "is_terminal") <= 75
@@ -17,7 +17,13 @@ from pyggp.exceptions.interpreter_exceptions import (
     UnsatTerminalInterpreterError,
 )
 from pyggp.game_description_language import Number, Relation, String, Subrelation
-from pyggp.interpreters import ClingoInterpreter, ClingoRegroundingInterpreter, Interpreter
+from pyggp.interpreters import (
+    ClingoInterpreter,
+    ClingoRegroundingInterpreter,
+    ConcurrentClingoInterpreter,
+    InstrumentedInterpreter,
+    Interpreter,
+)
 from pyggp.records import ImperfectInformationRecord, PerfectInformationRecord
 
 
@@ -53,7 +59,14 @@ def test_get_roles_in_control(view: View, expected: FrozenSet[Role]) -> None:
     assert actual == expected
 
 
-@pytest.fixture(params=[ClingoInterpreter.from_ruleset, ClingoRegroundingInterpreter.from_ruleset])
+@pytest.fixture(
+    params=[
+        ClingoInterpreter.from_ruleset,
+        ClingoRegroundingInterpreter.from_ruleset,
+        InstrumentedInterpreter.from_ruleset,
+        ConcurrentClingoInterpreter.from_ruleset,
+    ],
+)
 def interpreter_factory(request):
     return request.param
 
@@ -586,3 +599,57 @@ def test_get_possible_states(interpreter_factory) -> None:
     expected = frozenset({state_1a, state_1b})
 
     assert actual == expected
+
+
+_SIMULTANEOUS_RULES_STR = (
+    "role(p). role(q). init(control(p)). init(control(q)). "
+    "legal(R, a) :- role(R), true(control(R)). legal(R, b) :- role(R), true(control(R)). "
+    "next(played(R, M)) :- does(R, M). terminal :- true(played(R, M))."
+)
+
+
+def _get_turn(p_move: str, q_move: str) -> Turn:
+    return Turn(
+        {
+            Role(Subrelation(Relation("p"))): Move(Subrelation(Relation(p_move))),
+            Role(Subrelation(Relation("q"))): Move(Subrelation(Relation(q_move))),
+        },
+    )
+
+
+def _get_played_state(p_move: str, q_move: str) -> State:
+    return State(
+        frozenset(
+            {
+                Subrelation(Relation("played", (Subrelation(Relation("p")), Subrelation(Relation(p_move))))),
+                Subrelation(Relation("played", (Subrelation(Relation("q")), Subrelation(Relation(q_move))))),
+            },
+        ),
+    )
+
+
+def test_get_all_next_states(interpreter_factory) -> None:
+    ruleset = gdl.parse(_SIMULTANEOUS_RULES_STR)
+    interpreter = interpreter_factory(ruleset)
+    init_state = interpreter.get_init_state()
+
+    expected = {
+        (_get_turn(p_move, q_move), _get_played_state(p_move, q_move)) for p_move in ("a", "b") for q_move in ("a", "b")
+    }
+    assert set(interpreter.get_all_next_states(init_state)) == expected
+    assert set(interpreter.get_all_next_states(init_state)) == expected
+    assert set(interpreter.get_all_next_states(_get_played_state("a", "b"))) == set()
+
+
+def test_get_all_next_states_after_abandoned_and_nested_enumerations(interpreter_factory) -> None:
+    ruleset = gdl.parse(_SIMULTANEOUS_RULES_STR)
+    interpreter = interpreter_factory(ruleset)
+    init_state = interpreter.get_init_state()
+
+    abandoned = interpreter.get_all_next_states(init_state)
+    next(abandoned)
+    nested = set(interpreter.get_all_next_states(init_state))
+    abandoned.close()
+
+    assert len(nested) == 4
+    assert set(interpreter.get_all_next_states(init_state)) == nested
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from pyggp.books import CanonicalBook, create_book
+from pyggp.interpreters import ClingoInterpreter, SymmetricInterpreter
+from tests.helpers import get_reachable_states, get_ruleset, query
+
+
+@pytest.mark.parametrize(
+    ("name", "max_depth"),
+    [
+        ("tic_tac_toe.gdl", 3),
+        ("hexapawn.gdl", 4),
+        ("phantom_connect(4,4,4).gdl", 2),
+    ],
+)
+def test_answers_queries_like_clingo_interpreter(name, max_depth) -> None:
+    ruleset = get_ruleset(name)
+    expected_interpreter = ClingoInterpreter.from_ruleset(ruleset)
+    interpreter = SymmetricInterpreter.from_ruleset(ruleset, rng=random.Random(0))
+    states = sorted(get_reachable_states(expected_interpreter, max_depth), key=str)
+
+    assert len(interpreter.symmetries) > 1
+    for state in states:
+        assert query(interpreter, state) == query(expected_interpreter, state)
+
+
+def test_caches_canonical_states_only() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+    interpreter = SymmetricInterpreter.from_ruleset(ruleset, rng=random.Random(0))
+    interpreter.interpreter.cache.clear()
+    states = get_reachable_states(ClingoInterpreter.from_ruleset(ruleset), 2)
+
+    for state in states:
+        interpreter.is_terminal(state)
+
+    canonical_states = {interpreter.symmetries.canonicalize(state)[0] for state in states}
+    cached_states = {state for by_length in interpreter.interpreter.cache.terminal.values() for state in by_length}
+    assert cached_states == canonical_states
+    assert len(canonical_states) < len(states)
+
+
+def test_uses_declared_symmetries() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+
+    interpreter = SymmetricInterpreter.from_ruleset(ruleset, symmetries=())
+
+    assert len(interpreter.symmetries) == 1
+    assert not isinstance(create_book(interpreter.interpreter), CanonicalBook)
+    assert isinstance(create_book(interpreter), CanonicalBook)
+
+
+def test_from_cli_is_reproducible_with_seed() -> None:
+    ruleset = get_ruleset("tic_tac_toe.gdl")
+
+    interpreter = SymmetricInterpreter.from_cli(ruleset, playouts="2", seed="0")
+    other_interpreter = SymmetricInterpreter.from_cli(ruleset, playouts="2", seed="0")
+
+    assert len(interpreter.symmetries) == 8
+    assert interpreter.symmetries.elements == other_interpreter.symmetries.elements
@@ -0,0 +1,195 @@
+import random
+from dataclasses import dataclass
+from typing import Iterator, Union
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp.engine_primitives import Move, Role, State, Turn, View
+from pyggp.exceptions.interpreter_exceptions import MismatchInterpreterError, UnsatTerminalInterpreterError
+from pyggp.interpreters import ClingoInterpreter, DarkSplitCorridor34Interpreter, VerifyingInterpreter
+from pyggp.metrics import MetricsRegistry
+from tests.helpers import get_ruleset
+
+_RULES_STR = """
+role(r).
+init(0). init(control(r)).
+next(control(r)) :- true(control(r)).
+next(1) :- true(0), does(r, 1).
+next(2) :- true(1), does(r, 1).
+legal(r, 1) :- true(0). legal(r, 1) :- true(1).
+terminal :- true(2).
+goal(r, 100) :- true(2).
+goal(r, 0) :- not true(2).
+"""
+
+
+@dataclass
+class _NeverTerminalInterpreter(ClingoInterpreter):
+    def _is_terminal(self, current: Union[State, View]) -> bool:  # noqa: ARG002
+        return False
+
+
+@dataclass
+class _UnsatTerminalInterpreter(ClingoInterpreter):
+    def _is_terminal(self, current: Union[State, View]) -> bool:  # noqa: ARG002
+        raise UnsatTerminalInterpreterError
+
+
+@dataclass
+class _CountingInterpreter(ClingoInterpreter):
+    calls: int = 0
+
+    def is_terminal(self, current: Union[State, View]) -> bool:
+        self.calls += 1
+        return super().is_terminal(current)
+
+
+@pytest.fixture
+def registry() -> Iterator[MetricsRegistry]:
+    yield metrics.enable()
+    metrics.disable()
+
+
+def _get_final_state(interpreter) -> State:
+    r = Role(gdl.parse_subrelation("r"))
+    state = interpreter.get_init_state()
+    for _ in range(2):
+        state = interpreter.get_next_state(state, Turn({r: Move(gdl.parse_subrelation("1"))}))
+    return state
+
+
+def test_agrees_with_reference() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter.from_ruleset(ruleset)
+
+    state = _get_final_state(interpreter)
+
+    assert interpreter.is_terminal(state)
+    assert interpreter.get_goals(state) == {Role(gdl.parse_subrelation("r")): 100}
+    assert interpreter.mismatches == 0
+
+
+def test_raises_on_mismatch() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter(
+        interpreter=_NeverTerminalInterpreter.from_ruleset(ruleset),
+        reference=ClingoInterpreter.from_ruleset(ruleset),
+    )
+    state = _get_final_state(interpreter)
+
+    with pytest.raises(MismatchInterpreterError):
+        interpreter.is_terminal(state)
+
+
+def test_reports_mismatch(registry) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter(
+        interpreter=_NeverTerminalInterpreter.from_ruleset(ruleset),
+        reference=ClingoInterpreter.from_ruleset(ruleset),
+        raise_on_mismatch=False,
+    )
+    state = _get_final_state(interpreter)
+
+    assert not interpreter.is_terminal(state)
+    assert interpreter.mismatches == 1
+    assert registry.counter("pyggp_interpreter_mismatches_total", method="is_terminal").value == 1
+
+
+def test_reports_mismatch_if_reference_raises(registry) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter(
+        interpreter=ClingoInterpreter.from_ruleset(ruleset),
+        reference=_UnsatTerminalInterpreter.from_ruleset(ruleset),
+        raise_on_mismatch=False,
+    )
+    state = _get_final_state(interpreter)
+
+    assert interpreter.is_terminal(state)
+    assert interpreter.mismatches == 1
+    assert registry.counter("pyggp_interpreter_mismatches_total", method="is_terminal").value == 1
+
+
+def test_raises_on_mismatch_if_interpreter_raises() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter(
+        interpreter=_UnsatTerminalInterpreter.from_ruleset(ruleset),
+        reference=ClingoInterpreter.from_ruleset(ruleset),
+    )
+    state = _get_final_state(interpreter)
+
+    with pytest.raises(MismatchInterpreterError) as excinfo:
+        interpreter.is_terminal(state)
+
+    assert isinstance(excinfo.value.__cause__, UnsatTerminalInterpreterError)
+
+
+def test_reraises_if_both_raise() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = VerifyingInterpreter(
+        interpreter=_UnsatTerminalInterpreter.from_ruleset(ruleset),
+        reference=_UnsatTerminalInterpreter.from_ruleset(ruleset),
+    )
+    state = _get_final_state(interpreter)
+
+    with pytest.raises(UnsatTerminalInterpreterError):
+        interpreter.is_terminal(state)
+
+    assert interpreter.mismatches == 0
+
+
+def test_samples_calls() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    reference = _CountingInterpreter.from_ruleset(ruleset)
+    interpreter = VerifyingInterpreter(
+        interpreter=ClingoInterpreter.from_ruleset(ruleset),
+        reference=reference,
+        sample_rate=0.25,
+        rng=random.Random(0),
+    )
+    state = interpreter.get_init_state()
+
+    for _ in range(200):
+        interpreter.is_terminal(state)
+
+    assert 0 < reference.calls < 100
+
+
+def test_from_cli_is_reproducible_with_seed() -> None:
+    ruleset = gdl.parse(_RULES_STR)
+
+    def sample() -> int:
+        reference = _CountingInterpreter.from_ruleset(ruleset)
+        interpreter = VerifyingInterpreter.from_cli(
+            ruleset,
+            interpreter="pyggp.interpreters.ClingoInterpreter",
+            sample_rate="0.25",
+            seed="0",
+        )
+        interpreter.reference = reference
+        state = interpreter.get_init_state()
+        for _ in range(200):
+            interpreter.is_terminal(state)
+        return reference.calls
+
+    assert sample() == sample()
+
+
+def test_verifies_dark_split_corridor_34_interpreter() -> None:
+    ruleset = get_ruleset("dark_split_corridor(3,4).gdl")
+    interpreter = VerifyingInterpreter(
+        interpreter=DarkSplitCorridor34Interpreter.from_ruleset(ruleset, disable_cache=True),
+        reference=ClingoInterpreter.from_ruleset(ruleset, disable_cache=True),
+    )
+    rng = random.Random(0)
+
+    for _ in range(5):
+        state = interpreter.get_init_state()
+        while not interpreter.is_terminal(state):
+            interpreter.get_sees(state)
+            turn = rng.choice(sorted(interpreter.get_all_turns(state), key=str))
+            state = interpreter.get_next_state(state, turn)
+        interpreter.get_goals(state)
+
+    assert interpreter.mismatches == 0
@@ -0,0 +1,150 @@
+import pathlib
+import random
+from typing import List, Tuple
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp.engine_primitives import Move, Role, State, Turn, View
+from pyggp.exceptions.serialization_exceptions import MalformedDataSerializationError, UnknownSymbolSerializationError
+from pyggp.interpreters import ClingoRegroundingInterpreter
+from pyggp.serialization import Codec
+from tests.helpers import GAMES_DIRECTORY
+
+
+def _get_game_paths() -> List[pathlib.Path]:
+    return sorted(GAMES_DIRECTORY.glob("*.gdl"))
+
+
+def _play(ruleset: gdl.Ruleset, plies: int = 3) -> Tuple[List[State], List[View], List[Turn]]:
+    interpreter = ClingoRegroundingInterpreter(
+        ruleset=ruleset,
+        temporal_rule_container=TemporalRuleContainer.from_ruleset(ruleset),
+    )
+    # Disables S311 (Standard pseudo-random generators are not suitable for cryptographic purposes). Because: Testing.
+    rng = random.Random(0)  # noqa: S311
+    states = [interpreter.get_init_state()]
+    views: List[View] = []
+    turns: List[Turn] = []
+    for _ in range(plies):
+        state = states[-1]
+        views.extend(interpreter.get_sees(state).values())
+        if interpreter.is_terminal(state):
+            break
+        in_control = sorted(interpreter.get_roles_in_control(state), key=str)
+        legal_moves = {role: sorted(interpreter.get_legal_moves_by_role(state, role), key=str) for role in in_control}
+        turn = Turn({role: rng.choice(legal_moves[role]) for role in in_control})
+        turns.append(turn)
+        states.append(interpreter.get_next_state(state, turn))
+    return states, views, turns
+
+
+@pytest.fixture(scope="module", params=_get_game_paths(), ids=lambda path: path.stem)
+def game(request) -> Tuple[Codec, List[State], List[View], List[Turn]]:
+    ruleset = gdl.parse(request.param.read_text())
+    states, views, turns = _play(ruleset)
+    return Codec.from_ruleset(ruleset), states, views, turns
+
+
+def test_games_exist() -> None:
+    assert _get_game_paths()
+
+
+def test_roundtrip_state(game) -> None:
+    codec, states, _, _ = game
+    for state in states:
+        assert codec.decode_state(codec.encode_state(state)) == state
+
+
+def test_roundtrip_view(game) -> None:
+    codec, _, views, _ = game
+    for view in views:
+        assert codec.decode_state(codec.encode_state(view)) == view
+
+
+def test_roundtrip_turn_and_moves(game) -> None:
+    codec, _, _, turns = game
+    for turn in turns:
+        assert codec.decode_turn(codec.encode_turn(turn)) == turn
+        for role, move in turn.items():
+            assert codec.decode_move(codec.encode_move(role)) == role
+            assert codec.decode_move(codec.encode_move(move)) == move
+
+
+def test_roundtrip_batches(game) -> None:
+    codec, states, views, turns = game
+    assert codec.decode_states(codec.encode_states(states)) == tuple(states)
+    assert codec.decode_states(codec.encode_states(views)) == tuple(views)
+    assert codec.decode_turns(codec.encode_turns(turns)) == tuple(turns)
+
+
+def test_roundtrip_with_prebuilt_subrelations(game) -> None:
+    codec, states, _, _ = game
+    prebuilt_codec = Codec(
+        signatures=codec.signatures,
+        strings=codec.strings,
+        subrelations=tuple(sorted(states[0], key=str)),
+    )
+    encoded = prebuilt_codec.encode_state(states[0])
+    assert len(encoded) == 4 * (1 + len(states[0]))
+    assert prebuilt_codec.decode_state(encoded) == states[0]
+    assert prebuilt_codec.decode_states(prebuilt_codec.encode_states(states)) == tuple(states)
+
+
+def test_encoding_is_deterministic() -> None:
+    ruleset = gdl.parse('role(a). role(b). init(cell(1, "x")). next(cell(1, "x")) :- does(a, noop).')
+    state = State(frozenset({gdl.parse_subrelation('cell(1, "x")'), gdl.parse_subrelation("does(a, noop)")}))
+    codec1 = Codec.from_ruleset(ruleset)
+    codec2 = Codec.from_ruleset(gdl.Ruleset.from_rules(reversed(ruleset.rules)))
+    assert codec1.encode_state(state) == codec2.encode_state(state)
+    assert codec2.decode_state(codec1.encode_state(state)) == state
+
+
+def test_keys_are_canonical(game) -> None:
+    codec, states, views, turns = game
+    for state in (*states, *views):
+        key = codec.encode_state_key(state)
+        assert codec.decode_state(key) == state
+        assert codec.encode_state_key(State(frozenset(sorted(state, key=str, reverse=True)))) == key
+    for turn in turns:
+        key = codec.encode_turn_key(turn)
+        assert codec.decode_turn(key) == turn
+        assert codec.encode_turn_key(Turn(dict(reversed(list(turn.items()))))) == key
+
+
+def test_keys_are_stable_when_encodings_are_evicted(game) -> None:
+    codec, states, _, _ = game
+    bounded_codec = Codec(
+        signatures=codec.signatures,
+        strings=codec.strings,
+        subrelations=tuple(sorted(states[0], key=str)),
+        cache_size=2,
+    )
+    keys = [bounded_codec.encode_state_key(state) for state in states]
+    assert [bounded_codec.encode_state_key(state) for state in states] == keys
+    assert len(bounded_codec._encoded) <= 2
+
+
+def test_unknown_symbol() -> None:
+    codec = Codec.from_ruleset(gdl.parse("role(a)."))
+    with pytest.raises(UnknownSymbolSerializationError):
+        codec.encode_move(Move(gdl.parse_subrelation("b")))
+    with pytest.raises(UnknownSymbolSerializationError):
+        codec.encode_move(Move(gdl.parse_subrelation('"s"')))
+    with pytest.raises(UnknownSymbolSerializationError):
+        codec.encode_move(Move(gdl.Subrelation(gdl.Variable("X"))))
+    assert codec.decode_move(codec.encode_move(Move(gdl.Subrelation(gdl.Number(-7))))) == gdl.Subrelation(
+        gdl.Number(-7),
+    )
+
+
+def test_malformed_data() -> None:
+    codec = Codec.from_ruleset(gdl.parse("role(a)."))
+    encoded = codec.encode_turn(Turn({Role(gdl.parse_subrelation("a")): Move(gdl.parse_subrelation("a"))}))
+    with pytest.raises(MalformedDataSerializationError):
+        codec.decode_turn(encoded[:-4])
+    with pytest.raises(MalformedDataSerializationError):
+        codec.decode_turn(encoded + encoded)
+    with pytest.raises(MalformedDataSerializationError):
+        codec.decode_turn(encoded[:-1])
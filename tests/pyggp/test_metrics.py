@@ -0,0 +1,124 @@
+import json
+import pathlib
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp import metrics
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp.agents.tree_agents.mcts.evaluators import LightPlayoutEvaluator
+from pyggp.engine_primitives import Role
+from pyggp.interpreters import ClingoRegroundingInterpreter
+from pyggp.metrics import Counter, Gauge, Histogram, JSONLinesSink, MetricsRegistry, PrometheusTextSink
+
+
+@pytest.fixture
+def registry() -> Iterator[MetricsRegistry]:
+    yield metrics.enable()
+    metrics.disable()
+
+
+@pytest.fixture
+def interpreter() -> ClingoRegroundingInterpreter:
+    ruleset = gdl.parse(
+        "role(p). succ(0, 1). succ(1, 2). succ(2, 3). init(count(0)). init(control(p)). "
+        "legal(p, inc) :- true(count(N)), succ(N, M). "
+        "next(count(M)) :- true(count(N)), succ(N, M), does(p, inc). next(control(p)) :- true(control(p)). "
+        "terminal :- true(count(3)). "
+        "goal(p, 100) :- terminal.",
+    )
+    return ClingoRegroundingInterpreter(
+        ruleset=ruleset,
+        temporal_rule_container=TemporalRuleContainer.from_ruleset(ruleset),
+    )
+
+
+def test_disabled_by_default() -> None:
+    assert metrics.registry is None
+    metrics.flush()
+
+
+def test_registry_returns_same_metric_for_same_labels() -> None:
+    registry = MetricsRegistry()
+    registry.counter("a_total", role="x").inc()
+    registry.counter("a_total", role="x").inc(2)
+    registry.counter("a_total", role="y").inc()
+    registry.gauge("b", role=Role(gdl.parse_subrelation("x"))).set(3)
+
+    assert registry.counter("a_total", role="x").value == 3
+    assert registry.counter("a_total", role="y").value == 1
+    assert registry.gauge("b", role="x").value == 3
+    assert len(registry.collect()) == 3
+
+
+def test_histogram_buckets() -> None:
+    histogram = Histogram("h", buckets=(1.0, 10.0))
+    for value in (0.5, 1.0, 5.0, 50.0):
+        histogram.observe(value)
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 56.5
+
+
+def test_prometheus_text() -> None:
+    histogram = Histogram("h_seconds", labels=(("role", 'a"b'),), buckets=(1.0,))
+    histogram.observe(0.5)
+    histogram.observe(2.0)
+    text = metrics.format_prometheus_text([histogram, Gauge("g", value=1.5), Counter("c_total", value=2)])
+    assert text.splitlines() == [
+        "# TYPE c_total counter",
+        "c_total 2.0",
+        "# TYPE g gauge",
+        "g 1.5",
+        "# TYPE h_seconds histogram",
+        'h_seconds_bucket{role="a\\"b",le="1.0"} 1',
+        'h_seconds_bucket{role="a\\"b",le="+Inf"} 2',
+        'h_seconds_sum{role="a\\"b"} 2.5',
+        'h_seconds_count{role="a\\"b"} 2',
+    ]
+
+
+def test_sinks(tmp_path: pathlib.Path) -> None:
+    jsonl_path = tmp_path / "metrics.jsonl"
+    prom_path = tmp_path / "metrics.prom"
+    registry = MetricsRegistry(sinks=(JSONLinesSink(jsonl_path), PrometheusTextSink(prom_path)))
+    registry.counter("c_total").inc()
+    registry.flush()
+    registry.counter("c_total").inc()
+    registry.flush()
+
+    lines = jsonl_path.read_text().splitlines()
+    assert [json.loads(line)["metrics"][0]["value"] for line in lines] == [1.0, 2.0]
+    assert prom_path.read_text() == "# TYPE c_total counter\nc_total 2.0\n"
+    assert set(tmp_path.iterdir()) == {jsonl_path, prom_path}
+
+
+def test_failing_sink_is_ignored(tmp_path: pathlib.Path) -> None:
+    registry = MetricsRegistry(sinks=(JSONLinesSink(tmp_path / "missing" / "metrics.jsonl"),))
+    registry.counter("c_total").inc()
+    registry.flush()
+
+
+def test_caching_interpreter_records_cache_accesses(registry, interpreter) -> None:
+    state = interpreter.get_init_state()
+    interpreter.is_terminal(state)
+    interpreter.is_terminal(state)
+
+    assert registry.counter("pyggp_interpreter_cache_accesses_total", table="terminal", result="miss").value == 1
+    assert registry.counter("pyggp_interpreter_cache_accesses_total", table="terminal", result="hit").value == 1
+
+
+def test_light_playout_evaluator_records_playout_length_and_book_hits(registry, interpreter) -> None:
+    role = Role(gdl.parse_subrelation("p"))
+    state = interpreter.get_init_state()
+    evaluator = LightPlayoutEvaluator(role=role, final_state_evaluator=mock.Mock(return_value=1.0), book={})
+
+    assert evaluator(state, interpreter) == 1.0
+
+    histogram = registry.histogram("pyggp_playout_length", role=role)
+    assert histogram.count == 1
+    assert histogram.sum == 3
+    assert registry.counter("pyggp_book_accesses_total", role=role).value == 1
+    assert registry.counter("pyggp_book_hits_total", role=role).value == 0
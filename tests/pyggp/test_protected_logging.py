@@ -1,9 +1,11 @@
 import datetime
-from typing import Union
+import logging
+from typing import List, Union
+from unittest import mock
 
 import pytest
 
-from pyggp._logging import format_amount, format_timedelta, inflect
+from pyggp._logging import background_logging, format_amount, format_timedelta, inflect, lazy, log_time
 
 
 @pytest.mark.parametrize(
@@ -78,3 +80,52 @@ def test_format_timedelta(delta: Union[float, int, datetime.timedelta], expected
 def test_format_amount(amount: Union[float, int], expected: str) -> None:
     actual = format_amount(amount)
     assert actual == expected
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_lazy_is_not_computed_if_level_is_disabled() -> None:
+    logger = logging.getLogger("pyggp.test_lazy")
+    logger.setLevel(logging.INFO)
+    func = mock.Mock(return_value="expensive")
+
+    logger.debug("Value: %s", lazy(func, 1))
+
+    func.assert_not_called()
+
+
+def test_log_time_does_not_compute_messages_if_level_is_disabled() -> None:
+    logger = logging.getLogger("pyggp.test_log_time")
+    logger.setLevel(logging.INFO)
+    begin_msg = mock.Mock(return_value="Begin")
+    end_msg = mock.Mock(return_value="End")
+
+    with log_time(logger, logging.DEBUG, begin_msg=begin_msg, end_msg=end_msg):
+        pass
+
+    begin_msg.assert_not_called()
+    end_msg.assert_not_called()
+
+
+def test_background_logging_handles_records_and_restores_handlers() -> None:
+    logger = logging.getLogger("pyggp.test_background_logging")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    arg = ["before"]
+
+    with background_logging(logger):
+        assert handler not in logger.handlers
+        logger.debug("Value: %s", arg)
+        arg[0] = "after"
+
+    assert logger.handlers == [handler]
+    assert [record.getMessage() for record in handler.records] == ["Value: ['before']"]
@@ -0,0 +1,49 @@
+import threading
+
+from pyggp.repeaters import ONE_MS_IN_NS, ONE_S_IN_NS, Repeater, any_of, get_rss_bytes, memory_ceiling
+
+
+def test_get_remaining_repeats() -> None:
+    calls = []
+    repeater = Repeater(func=lambda: calls.append(repeater.get_remaining_repeats()), timeout_ns=None, max_repeats=3)
+
+    assert repeater()[0] == 3
+    assert calls == [3, 2, 1]
+
+
+def test_batched_repeater_respects_max_repeats() -> None:
+    calls = []
+    repeater = Repeater(func=lambda: calls.append(None), timeout_ns=None, max_repeats=1000, batched=True)
+
+    it, _ = repeater()
+
+    assert it == 1000
+    assert len(calls) == 1000
+
+
+def test_batched_repeater_respects_timeout() -> None:
+    repeater = Repeater(func=lambda: None, timeout_ns=ONE_MS_IN_NS * 10, batched=True)
+
+    it, elapsed_ns = repeater()
+
+    assert it > 1
+    assert elapsed_ns < ONE_S_IN_NS
+
+
+def test_stop_predicates() -> None:
+    event = threading.Event()
+    calls = []
+
+    def func() -> None:
+        calls.append(None)
+        if len(calls) == 3:
+            event.set()
+
+    repeater = Repeater(func=func, timeout_ns=None, stop_predicates=(any_of(event.is_set, memory_ceiling(2**62)),))
+
+    assert repeater()[0] == 3
+
+
+def test_memory_ceiling() -> None:
+    assert get_rss_bytes() > 0
+    assert memory_ceiling(0)()
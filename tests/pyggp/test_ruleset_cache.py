@@ -0,0 +1,101 @@
+import pathlib
+
+import pyggp.game_description_language as gdl
+from pyggp._clingo_interpreter.shape_containers import ShapeContainer
+from pyggp._clingo_interpreter.temporal_rule_containers import TemporalRuleContainer
+from pyggp.engine_primitives import Move, Role, Turn
+from pyggp.interpreters import ClingoInterpreter, ClingoRegroundingInterpreter
+from pyggp.ruleset_cache import PrecompiledRuleset, RulesetCache
+
+_RULES_STR = """
+role(p1). role(p2).
+init(cell(1)). init(control(p1)).
+next(cell(2)) :- true(cell(1)), does(p1, push).
+next(control(p2)) :- true(control(p1)).
+legal(p1, push) :- true(control(p1)).
+legal(p2, noop).
+legal(p1, noop) :- true(control(p2)).
+sees(R, cell(X)) :- role(R), true(cell(X)).
+goal(p1, 100) :- true(cell(2)).
+goal(p2, 0).
+terminal :- true(cell(2)).
+"""
+
+
+def test_get_key_depends_on_text() -> None:
+    assert RulesetCache.get_key(_RULES_STR) == RulesetCache.get_key(_RULES_STR)
+    assert RulesetCache.get_key(_RULES_STR) != RulesetCache.get_key(_RULES_STR + " ")
+
+
+def test_load_missing(tmp_path: pathlib.Path) -> None:
+    ruleset_cache = RulesetCache(tmp_path / "cache")
+    assert ruleset_cache.load(RulesetCache.get_key(_RULES_STR)) is None
+
+
+def test_load_corrupt(tmp_path: pathlib.Path) -> None:
+    ruleset_cache = RulesetCache(tmp_path)
+    key = RulesetCache.get_key(_RULES_STR)
+    tmp_path.joinpath(f"{key}.pickle").write_bytes(b"not a pickle")
+    assert ruleset_cache.load(key) is None
+
+
+def test_store_and_load(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    shape_container = ShapeContainer.from_ruleset(ruleset)
+    temporal_rule_container = TemporalRuleContainer.from_ruleset(ruleset)
+    precompiled = PrecompiledRuleset(
+        ruleset=ruleset,
+        shape_container=shape_container,
+        temporal_rule_container=temporal_rule_container,
+    )
+    ruleset_cache = RulesetCache(tmp_path / "cache")
+    key = RulesetCache.get_key(_RULES_STR)
+    ruleset_cache.store(key, precompiled)
+    actual = ruleset_cache.load(key)
+
+    assert actual is not None
+    assert actual.is_complete
+    assert actual.ruleset == ruleset
+    assert actual.shape_container == shape_container
+    assert actual.temporal_rule_container is not None
+    assert actual.temporal_rule_container.as_strs() == temporal_rule_container.as_strs()
+    assert list(tmp_path.joinpath("cache").iterdir()) == [tmp_path.joinpath("cache", f"{key}.pickle")]
+
+
+def test_store_and_load_incomplete(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    ruleset_cache = RulesetCache(tmp_path)
+    key = RulesetCache.get_key(_RULES_STR)
+    ruleset_cache.store(key, PrecompiledRuleset(ruleset=ruleset))
+    actual = ruleset_cache.load(key)
+
+    assert actual == PrecompiledRuleset(ruleset=ruleset)
+    assert not actual.is_complete
+    assert actual.interpreter_kwargs == {}
+
+
+def test_interpreters_from_precompiled(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    reference = ClingoInterpreter.from_ruleset(ruleset)
+    ruleset_cache = RulesetCache(tmp_path)
+    key = RulesetCache.get_key(_RULES_STR)
+    ruleset_cache.store(
+        key,
+        PrecompiledRuleset(
+            ruleset=ruleset,
+            shape_container=reference.shape_container,
+            temporal_rule_container=reference.temporal_rule_container,
+        ),
+    )
+    precompiled = ruleset_cache.load(key)
+    assert precompiled is not None
+
+    p1, p2 = Role(gdl.parse_subrelation("p1")), Role(gdl.parse_subrelation("p2"))
+    turn = Turn({p1: Move(gdl.parse_subrelation("push")), p2: Move(gdl.parse_subrelation("noop"))})
+    for interpreter_type in (ClingoInterpreter, ClingoRegroundingInterpreter):
+        interpreter = interpreter_type.from_ruleset(precompiled.ruleset, **precompiled.interpreter_kwargs)
+        assert interpreter.shape_container == reference.shape_container
+        init_state = interpreter.get_init_state()
+        assert init_state == reference.get_init_state()
+        assert interpreter.get_next_state(init_state, turn) == reference.get_next_state(init_state, turn)
+        assert interpreter.get_sees(init_state) == reference.get_sees(init_state)
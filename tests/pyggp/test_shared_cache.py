@@ -0,0 +1,165 @@
+import os
+import pathlib
+import pickle
+from typing import Iterator
+from unittest import mock
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp.engine_primitives import Move, Role, Turn
+from pyggp.interpreters import ClingoInterpreter
+from pyggp.shared_cache import SharedCacheClient, SharedCacheServer, SharedInterpreterCache
+
+_RULES_STR = """
+role(p1). role(p2).
+init(cell(1)). init(control(p1)).
+next(cell(2)) :- true(cell(1)), does(p1, push).
+next(control(p2)) :- true(control(p1)).
+legal(p1, push) :- true(control(p1)).
+legal(p2, noop).
+legal(p1, noop) :- true(control(p2)).
+sees(R, cell(X)) :- role(R), true(cell(X)).
+goal(p1, 100) :- true(cell(2)).
+goal(p2, 0).
+terminal :- true(cell(2)).
+"""
+
+
+@pytest.fixture
+def server(tmp_path: pathlib.Path) -> Iterator[SharedCacheServer]:
+    with SharedCacheServer(path=tmp_path / "cache.sock").serving() as server:
+        yield server
+
+
+def test_client_gets_what_was_put(server) -> None:
+    client = SharedCacheClient(server.path)
+    assert client.get(b"a") is None
+    client.put(b"a", b"1")
+    client.put(b"b", b"")
+    assert client.get(b"a") == b"1"
+    assert client.get(b"b") == b""
+    assert SharedCacheClient(server.path).get(b"a") == b"1"
+    assert client.available
+
+
+def test_server_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    with SharedCacheServer(path=tmp_path / "cache.sock", capacity=1024).serving() as server:
+        _assert_evicts_least_recently_used(SharedCacheClient(server.path))
+
+
+def _assert_evicts_least_recently_used(client: SharedCacheClient) -> None:
+    client.put(b"a", bytes(500))
+    client.put(b"b", bytes(500))
+    assert client.get(b"a") is not None
+    client.put(b"c", bytes(500))
+    client.put(b"d", bytes(2000))
+    assert client.get(b"a") is not None
+    assert client.get(b"b") is None
+    assert client.get(b"c") is not None
+    assert client.get(b"d") is None
+
+
+def test_server_replaces_stale_socket(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "cache.sock"
+    path.touch()
+    with SharedCacheServer(path=path).serving() as server:
+        client = SharedCacheClient(path)
+        client.put(b"a", b"1")
+        assert client.get(b"a") == b"1"
+        with pytest.raises(FileExistsError), SharedCacheServer(path=path).serving():
+            pass
+    assert not server.path.exists()
+
+
+def test_client_becomes_unavailable_without_server(tmp_path: pathlib.Path) -> None:
+    client = SharedCacheClient(tmp_path / "missing.sock")
+    assert client.get(b"a") is None
+    client.put(b"a", b"1")
+    assert not client.available
+
+
+def test_client_refuses_socket_accessible_to_other_users(server) -> None:
+    server.path.chmod(0o666)
+    client = SharedCacheClient(server.path)
+    client.put(b"a", b"1")
+    assert client.get(b"a") is None
+    assert not client.available
+
+
+def test_client_refuses_socket_of_other_user(server) -> None:
+    client = SharedCacheClient(server.path)
+    with mock.patch("os.getuid", return_value=os.getuid() + 1):
+        assert client.get(b"a") is None
+    assert not client.available
+
+
+def test_ignores_corrupt_entries(server) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    cache = SharedInterpreterCache.connect(ruleset, server.path)
+    state = ClingoInterpreter.from_ruleset(ruleset).get_init_state()
+    cache.put("terminal", state, value=False)
+    key = cache._get_key("terminal", state, ())
+    assert cache.get("terminal", state) is False
+
+    cache.client.put(key, pickle.dumps(0))
+
+    assert cache.get("terminal", state) is None
+
+
+def test_interpreters_share_results(server) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    p1 = Role(gdl.parse_subrelation("p1"))
+    p2 = Role(gdl.parse_subrelation("p2"))
+    turn = Turn({p1: Move(gdl.parse_subrelation("push"))})
+    interpreter = ClingoInterpreter.from_ruleset(
+        ruleset,
+        shared_cache=SharedInterpreterCache.connect(ruleset, server.path),
+    )
+    state = interpreter.get_init_state()
+    next_state = interpreter.get_next_state(state, turn)
+    expected = (
+        next_state,
+        frozenset(interpreter.get_all_next_states(state)),
+        interpreter.get_legal_moves(state),
+        interpreter.get_legal_moves_by_role(state, p2),
+        interpreter.get_sees(next_state),
+        interpreter.get_goals(next_state),
+        interpreter.is_terminal(next_state),
+    )
+
+    other_interpreter = ClingoInterpreter.from_cli(ruleset, shared_cache=str(server.path))
+    other_interpreter.get_roles()
+    computations = {
+        name: mock.Mock(side_effect=AssertionError)
+        for name in (
+            "_get_next_state",
+            "_get_all_next_states",
+            "_get_legal_moves",
+            "_get_legal_moves_by_role",
+            "_get_sees",
+            "_get_goals",
+            "_is_terminal",
+        )
+    }
+    with mock.patch.multiple(other_interpreter, **computations):
+        actual = (
+            other_interpreter.get_next_state(state, turn),
+            frozenset(other_interpreter.get_all_next_states(state)),
+            other_interpreter.get_legal_moves(state),
+            other_interpreter.get_legal_moves_by_role(state, p2),
+            other_interpreter.get_sees(next_state),
+            other_interpreter.get_goals(next_state),
+            other_interpreter.is_terminal(next_state),
+        )
+
+    assert actual == expected
+
+
+def test_interpreter_works_without_server(tmp_path: pathlib.Path) -> None:
+    ruleset = gdl.parse(_RULES_STR)
+    interpreter = ClingoInterpreter.from_cli(ruleset, shared_cache=str(tmp_path / "missing.sock"))
+    state = interpreter.get_init_state()
+    assert not interpreter.is_terminal(state)
+    assert interpreter.shared_cache is not None
+    assert not interpreter.shared_cache.client.available
@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+import pyggp.game_description_language as gdl
+from pyggp.books import CanonicalBook
+from pyggp.engine_primitives import State, Turn
+from pyggp.interpreters import ClingoInterpreter
+from pyggp.symmetries import IDENTITY, Symmetry, SymmetryGroup, detect_symmetries
+from tests.helpers import get_ruleset
+
+
+@pytest.fixture(scope="module")
+def interpreter() -> ClingoInterpreter:
+    return ClingoInterpreter.from_ruleset(get_ruleset("tic_tac_toe.gdl"))
+
+
+@pytest.fixture(scope="module")
+def symmetries(interpreter) -> SymmetryGroup:
+    return detect_symmetries(interpreter, rng=random.Random(0))
+
+
+def _play(interpreter: ClingoInterpreter, plies: int, rng: random.Random) -> State:
+    state = interpreter.get_init_state()
+    for _ in range(plies):
+        roles_in_control = interpreter.get_roles_in_control(state)
+        turn = Turn(
+            (role, rng.choice(sorted(interpreter.get_legal_moves_by_role(state, role), key=str)))
+            for role in roles_in_control
+        )
+        state = interpreter.get_next_state(state, turn)
+    return state
+
+
+def test_detects_symmetries_of_square_board(symmetries) -> None:
+    assert len(symmetries) == 8
+    assert symmetries.elements[0] == IDENTITY
+
+
+def test_detects_no_symmetries_of_asymmetric_game() -> None:
+    ruleset = gdl.parse(
+        """
+        role(p).
+        init(cell(1)).
+        legal(p, right) :- true(cell(1)).
+        legal(p, right) :- true(cell(2)).
+        next(cell(2)) :- true(cell(1)), does(p, right).
+        next(cell(3)) :- true(cell(2)), does(p, right).
+        terminal :- true(cell(3)).
+        goal(p, 100) :- terminal.
+        """,
+    )
+    interpreter = ClingoInterpreter.from_ruleset(ruleset)
+
+    assert len(detect_symmetries(interpreter, rng=random.Random(0))) == 1
+
+
+_CORRIDOR_RULES_STR = """
+role(p).
+index(1). index(2). index(3).
+init(cell(2)).
+legal(p, go(X)) :- true(cell(2)), index(X).
+next(cell(X)) :- does(p, go(X)).
+terminal :- not true(cell(2)).
+goal(p, 0) :- true(cell(2)).
+goal(p, 100) :- true(cell(1)).
+goal(p, {goal}) :- true(cell(3)).
+"""
+
+
+@pytest.mark.parametrize(("goal", "expected"), [(100, 2), (0, 1)])
+def test_verifies_candidates_against_ground_rules(goal, expected) -> None:
+    interpreter = ClingoInterpreter.from_ruleset(gdl.parse(_CORRIDOR_RULES_STR.format(goal=goal)))
+
+    assert len(detect_symmetries(interpreter, playouts=0)) == expected
+
+
+def test_canonicalize_is_invariant_under_symmetries(interpreter, symmetries) -> None:
+    rng = random.Random(0)
+    for plies in range(1, 6):
+        state = _play(interpreter, plies, rng)
+        canonical, symmetry = symmetries.canonicalize(state)
+        assert symmetry.apply_state(state) == canonical
+        for element in symmetries.elements:
+            assert symmetries.canonicalize(element.apply_state(state))[0] == canonical
+
+
+def test_canonicalize_ignores_unknown_states(symmetries) -> None:
+    state = State(frozenset({gdl.Subrelation(gdl.Relation("unknown"))}))
+
+    assert symmetries.canonicalize(state) == (state, IDENTITY)
+
+
+def test_compose_with_inverse_is_identity(symmetries) -> None:
+    for element in symmetries.elements:
+        assert element.compose(symmetries.get_inverse(element)) == IDENTITY
+        assert element.invert().compose(element).is_identity
+
+
+def test_group_is_generated_by_declared_symmetries(interpreter) -> None:
+    def _mirror(subrelation: gdl.Subrelation) -> gdl.Subrelation:
+        if subrelation.matches_signature(name="cell", arity=3):
+            x, y, mark = subrelation.symbol.arguments
+            return gdl.Subrelation(gdl.Relation("cell", (gdl.Subrelation(gdl.Number(4 - x.symbol.number)), y, mark)))
+        return subrelation
+
+    universe = interpreter.shape_container.state_shape
+    mirror = Symmetry.from_function(universe, _mirror)
+    group = SymmetryGroup.from_generators((mirror,), universe)
+
+    assert len(group) == 2
+    assert group.get_inverse(mirror) == mirror
+
+
+def test_canonical_book_shares_entries_of_symmetric_states(interpreter, symmetries) -> None:
+    book = CanonicalBook(symmetries)
+    state = _play(interpreter, 3, random.Random(1))
+    images = {element.apply_state(state) for element in symmetries.elements}
+    book[state] = 0.5
+
+    assert len(images) > 1
+    assert all(image in book for image in images)
+    assert {book[image] for image in images} == {0.5}
+    assert len(book) == 1